@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmarks realtime PCM conversion used by audio backends.
+
+Converts 10 seconds of 24 kHz mono PCM16 (model audio output) to 48 kHz stereo
+(typical device format) in chunks of given size, using a single stream
+converter (PCMConverter), and with audioop.ratecv + tostereo (previous
+implementation, fresh state per chunk) if audioop is available.
+Reports time per chunk, realtime factor and max sample jump at chunk boundaries.
+
+Usage:
+  python bin/bench_audio.py [--chunks 10,20,60,200] [--seconds 10] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pygpt_net.core.audio.backend.shared.conversions import PCMConverter  # noqa: E402
+
+try:
+    import audioop
+except ImportError:
+    audioop = None
+
+IN_RATE = 24000
+OUT_RATE = 48000
+
+
+def make_signal(seconds: int) -> bytes:
+    t = np.arange(IN_RATE * seconds) / IN_RATE
+    sig = 0.4 * np.sin(2 * np.pi * 440 * t) + 0.2 * np.sin(2 * np.pi * 1250 * t)
+    return (sig * 32767).astype("<i2").tobytes()
+
+
+def split(data: bytes, chunk_ms: int) -> list:
+    size = IN_RATE * 2 * chunk_ms // 1000
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def convert_stream(chunks: list) -> bytes:
+    converter = PCMConverter(IN_RATE, 1, OUT_RATE, 2)
+    return b"".join(converter.convert(chunk) for chunk in chunks)
+
+
+def convert_audioop(chunks: list) -> bytes:
+    out = []
+    for chunk in chunks:
+        data, _ = audioop.ratecv(chunk, 2, 1, IN_RATE, OUT_RATE, None)
+        out.append(audioop.tostereo(data, 2, 1, 1))
+    return b"".join(out)
+
+
+def max_jump(data: bytes) -> int:
+    left = np.frombuffer(data, dtype="<i2")[::2].astype(np.int32)
+    return int(np.max(np.abs(np.diff(left)))) if len(left) > 1 else 0
+
+
+def measure(fn, chunks: list, repeat: int):
+    best = None
+    out = b""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = fn(chunks)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, out
+
+
+def run(chunk_ms: int, seconds: int, repeat: int):
+    chunks = split(make_signal(seconds), chunk_ms)
+    impls = [("PCMConverter", convert_stream)]
+    if audioop is not None:
+        impls.append(("audioop", convert_audioop))
+    print("chunk: {} ms ({} chunks)".format(chunk_ms, len(chunks)))
+    for name, fn in impls:
+        elapsed, out = measure(fn, chunks, repeat)
+        print("  {:<14} {:>8.1f} us/chunk {:>8.0f}x realtime, max jump: {}".format(
+            name,
+            elapsed * 1e6 / len(chunks),
+            seconds / elapsed,
+            max_jump(out),
+        ))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="PyGPT audio conversion benchmark")
+    parser.add_argument("--chunks", default="10,20,60,200", help="comma separated chunk sizes in ms")
+    parser.add_argument("--seconds", type=int, default=10, help="signal length in seconds")
+    parser.add_argument("--repeat", type=int, default=5, help="repeats (best time is reported)")
+    args = parser.parse_args()
+    print("{} Hz mono -> {} Hz stereo, {} s".format(IN_RATE, OUT_RATE, args.seconds))
+    for chunk_ms in [int(x) for x in args.chunks.split(",") if x.strip()]:
+        run(chunk_ms, args.seconds, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmarks context list/load latency of the main SQLite database.
+
+Creates temporary databases with the full schema (all migrations applied),
+fills them with N ctx items (N / 10 conversations) and measures the queries
+executed by Ctx.load_meta (pinned, grouped, paginated ungrouped), loading items
+of a single conversation and content search.
+
+Usage:
+  python bin/bench_db.py [--rows 10000,100000,1000000] [--repeat 5] [--default-profile]
+
+--default-profile disables the connection profile (SQLite defaults: rollback
+journal, synchronous=FULL) to compare with the tuned one.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pygpt_net.core.db.database import Database  # noqa: E402
+from pygpt_net.provider.core.ctx.db_sqlite.storage import Storage  # noqa: E402
+
+
+def make_words(count: int = 20000) -> list:
+    rnd = random.Random(0)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    return ["".join(rnd.choices(letters, k=rnd.randint(4, 9))) for _ in range(count)]
+
+
+WORDS = make_words()
+
+
+class DummyConfig:
+    def __init__(self, path: str, data: dict):
+        self.path = path
+        self.data = data
+
+    def has(self, key: str) -> bool:
+        return key in self.data
+
+    def get(self, key: str, default=None):
+        return self.data.get(key, default)
+
+
+def make_db(path: str, default_profile: bool) -> Database:
+    data = {}
+    if default_profile:
+        data = {
+            "db.journal_mode": "DELETE",
+            "db.synchronous": "FULL",
+            "db.temp_store": "DEFAULT",
+            "db.cache_size": -2000,
+            "db.mmap_size": 0,
+        }
+    window = SimpleNamespace(core=SimpleNamespace())
+    window.core.config = DummyConfig(path, data)
+    db = Database(window)
+    db.echo = False
+    window.core.db = db
+    db.init()
+    db.migrate()
+    return db
+
+
+def fill(db: Database, rows: int):
+    metas = max(1, rows // 10)
+    rnd = random.Random(rows)
+    now = int(time.time())
+    raw = db.get_db().raw_connection()
+    try:
+        cur = raw.cursor()
+        cur.executemany(
+            "INSERT INTO ctx_meta (id, uuid, name, created_ts, updated_ts, is_important, group_id, root_id, "
+            "indexed_ts, is_initialized, is_deleted, is_archived) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 1, 0, 0)",
+            (
+                (i, "uuid-{}".format(i), " ".join(rnd.choices(WORDS, k=3)), now - i, now - i,
+                 1 if i % 500 == 0 else 0, (i % 50) + 1 if i % 100 == 0 else 0, 0, 0)
+                for i in range(1, metas + 1)
+            ),
+        )
+        cur.executemany(
+            "INSERT INTO ctx_item (meta_id, input, output, input_ts, output_ts) VALUES (?, ?, ?, ?, ?)",
+            (
+                ((i % metas) + 1, " ".join(rnd.choices(WORDS, k=12)), " ".join(rnd.choices(WORDS, k=40)),
+                 now - i, now - i)
+                for i in range(rows)
+            ),
+        )
+        raw.commit()
+    finally:
+        raw.close()
+    return metas
+
+
+def measure(fn, repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000
+
+
+def run(rows: int, repeat: int, default_profile: bool):
+    tmp = tempfile.mkdtemp(prefix="pygpt-bench-")
+    try:
+        db = make_db(tmp, default_profile)
+        start = time.perf_counter()
+        metas = fill(db, rows)
+        fill_time = time.perf_counter() - start
+        storage = Storage(db.window)
+        pinned = {'is_important': {"mode": "=", "value": 1}}
+        grouped = {'group_id': {"mode": ">", "value": 0}}
+        ungrouped = {
+            'is_important': {"mode": "=", "value": 0},
+            'group_id': {"mode": "NULL_OR_ZERO", "value": 0},
+        }
+
+        def load_list():
+            storage.get_meta(limit=0, filters=dict(pinned))
+            storage.get_meta(limit=0, filters=dict(grouped))
+            storage.get_meta(limit=50, filters=dict(ungrouped))
+
+        rnd = random.Random(1)
+        results = [
+            ("list (load_meta)", measure(load_list, repeat)),
+            ("load items", measure(lambda: storage.get_items(rnd.randint(1, metas)), repeat)),
+            ("search title", measure(lambda: storage.get_meta(WORDS[0], limit=50, filters=dict(ungrouped)), repeat)),
+            ("search content", measure(
+                lambda: storage.get_meta(WORDS[1][:4], limit=50, filters=dict(ungrouped), search_content=True),
+                repeat)),
+        ]
+        db.close()
+        print("rows: {:>9} (ctx: {}), fill: {:.1f}s".format(rows, metas, fill_time))
+        for name, ms in results:
+            print("  {:<18} {:>10.2f} ms".format(name, ms))
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="PyGPT database benchmark")
+    parser.add_argument("--rows", default="10000,100000,1000000", help="comma separated ctx item counts")
+    parser.add_argument("--repeat", type=int, default=5, help="repeats per query (best time is reported)")
+    parser.add_argument("--default-profile", action="store_true", help="use SQLite default pragmas")
+    args = parser.parse_args()
+    os.environ.setdefault("ENV_TEST", "1")
+    print("profile: {}".format("sqlite defaults" if args.default_profile else "tuned"))
+    for rows in [int(x) for x in args.rows.split(",") if x.strip()]:
+        run(rows, args.repeat, args.default_profile)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.06 20:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import os
@@ -14,6 +14,9 @@ import builtins
 import io
 import platform
 
+from pygpt_net import profiler
+profiler.start()  # --profile-startup, must be started before any heavy import
+
 import pygpt_net.icons_rc
 
 from pygpt_net.utils import set_env
@@ -131,6 +134,13 @@ def run(**kwargs):
 
     - Pass a list containing the tool instances as the `tools` keyword argument.
 
+    Instead of an instance, you can pass a `LazyExtension` descriptor (pygpt_net.extension) - the extension
+    module will be imported on first use, not at startup, e.g.:
+
+        LazyExtension("my_package.my_llm", "MyLLM", id="my_llm", name="My LLM", type=["llama_index"])
+
+    Run with `--profile-startup` to print the import time of each module after the app starts.
+
     Example:
     --------
     ::
@@ -201,6 +211,7 @@ def run(**kwargs):
     _preloader = _start_preloader(title="PyGPT", message=f"v{__version__}")
 
     from pygpt_net.launcher import Launcher
+    profiler.mark("launcher imported")
 
     try:
         # initialize app launcher
@@ -246,51 +257,6 @@ def run(**kwargs):
         from pygpt_net.plugin.wolfram import Plugin as WolframPlugin
         from pygpt_net.plugin.osm import Plugin as OSMPlugin
 
-        # agents (Llama-index)
-        from pygpt_net.provider.agents.llama_index.legacy.openai_assistant import OpenAIAssistantAgent
-        from pygpt_net.provider.agents.llama_index.planner_workflow import PlannerAgent as PlannerWorkflowAgent
-        from pygpt_net.provider.agents.llama_index.openai_workflow import OpenAIAgent as OpenAIWorkflowAgent
-        from pygpt_net.provider.agents.llama_index.react_workflow import ReactWorkflowAgent
-        from pygpt_net.provider.agents.llama_index.codeact_workflow import CodeActAgent
-        from pygpt_net.provider.agents.llama_index.supervisor_workflow import SupervisorAgent as LlamaSupervisorAgent
-        from pygpt_net.provider.agents.llama_index.flow_from_schema import Agent as LlamaCustomAgent  # builder schema
-
-        # agents (OpenAI-Agents)
-        from pygpt_net.provider.agents.openai.agent import Agent as OpenAIAgentsBase
-        from pygpt_net.provider.agents.openai.agent_with_experts import Agent as OpenAIAgentsExperts
-        from pygpt_net.provider.agents.openai.agent_with_experts_feedback import Agent as OpenAIAgentsExpertsFeedback
-        from pygpt_net.provider.agents.openai.agent_with_feedback import Agent as OpenAIAgentFeedback
-        from pygpt_net.provider.agents.openai.bot_researcher import Agent as OpenAIAgentBotResearcher
-        from pygpt_net.provider.agents.openai.agent_planner import Agent as OpenAIAgentPlanner
-        from pygpt_net.provider.agents.openai.evolve import Agent as OpenAIAgentsEvolve
-        from pygpt_net.provider.agents.openai.agent_b2b import Agent as OpenAIAgentsB2B
-        from pygpt_net.provider.agents.openai.supervisor import Agent as OpenAIAgentSupervisor
-        from pygpt_net.provider.agents.openai.flow_from_schema import Agent as OpenAICustomAgent  # builder schema
-
-        # LLM wrapper providers (langchain, llama-index, embeddings)
-        from pygpt_net.provider.llms.anthropic import AnthropicLLM
-        from pygpt_net.provider.llms.azure_openai import AzureOpenAILLM
-        from pygpt_net.provider.llms.deepseek_api import DeepseekApiLLM
-        from pygpt_net.provider.llms.google import GoogleLLM
-        # from pygpt_net.provider.llms.hugging_face import HuggingFaceLLM
-        from pygpt_net.provider.llms.hugging_face_api import HuggingFaceApiLLM
-        from pygpt_net.provider.llms.hugging_face_router import HuggingFaceRouterLLM
-        from pygpt_net.provider.llms.local import LocalLLM
-        from pygpt_net.provider.llms.mistral import MistralAILLM
-        from pygpt_net.provider.llms.ollama import OllamaLLM
-        from pygpt_net.provider.llms.openai import OpenAILLM
-        from pygpt_net.provider.llms.perplexity import PerplexityLLM
-        from pygpt_net.provider.llms.x_ai import xAILLM
-        from pygpt_net.provider.llms.open_router import OpenRouterLLM
-
-        # vector store providers (llama-index)
-        from pygpt_net.provider.vector_stores.chroma import ChromaProvider
-        from pygpt_net.provider.vector_stores.elasticsearch import ElasticsearchProvider
-        from pygpt_net.provider.vector_stores.pinecode import PinecodeProvider
-        from pygpt_net.provider.vector_stores.qdrant import QdrantProvider
-        from pygpt_net.provider.vector_stores.redis import RedisProvider
-        from pygpt_net.provider.vector_stores.simple import SimpleProvider
-
         # data loader providers (llama-index)
         from pygpt_net.provider.loaders.file_csv import Loader as CsvLoader
         from pygpt_net.provider.loaders.file_docx import Loader as DocxLoader
@@ -354,7 +320,18 @@ def run(**kwargs):
         from pygpt_net.tools.web_browser import WebBrowser as WebBrowserTool
         from pygpt_net.tools.agent_builder import AgentBuilder as AgentBuilderTool
 
+        from pygpt_net.core.types import (
+            AGENT_MODE_ASSISTANT,
+            AGENT_MODE_OPENAI,
+            AGENT_MODE_WORKFLOW,
+            AGENT_TYPE_LLAMA,
+            AGENT_TYPE_OPENAI,
+        )
+        from pygpt_net.extension import LazyExtension
+
+        profiler.mark("extensions imported")
         launcher.init()
+        profiler.mark("window created")
 
         # register audio providers
         launcher.add_audio_input(OpenAIWhisper())
@@ -472,35 +449,48 @@ def run(**kwargs):
             for plugin in plugins:
                 launcher.add_plugin(plugin)
 
-        # register LLMs
-        launcher.add_llm(OpenAILLM())
-        launcher.add_llm(AzureOpenAILLM())
-        launcher.add_llm(AnthropicLLM())
-        launcher.add_llm(GoogleLLM())
-        # launcher.add_llm(HuggingFaceLLM())
-        launcher.add_llm(HuggingFaceApiLLM())
-        launcher.add_llm(HuggingFaceRouterLLM())
-        launcher.add_llm(LocalLLM())
-        launcher.add_llm(MistralAILLM())
-        launcher.add_llm(OllamaLLM())
-        launcher.add_llm(DeepseekApiLLM())
-        launcher.add_llm(PerplexityLLM())
-        launcher.add_llm(xAILLM())
-        launcher.add_llm(OpenRouterLLM())
-
-        # register LLMs
+        # register LLMs (imported on first use)
+        for module, cls, id, name, type in [
+            ("openai", "OpenAILLM", "openai", "OpenAI", ["llama_index", "embeddings"]),
+            ("azure_openai", "AzureOpenAILLM", "azure_openai", "Azure OpenAI", ["llama_index", "embeddings"]),
+            ("anthropic", "AnthropicLLM", "anthropic", "Anthropic", ["llama_index", "embeddings"]),
+            ("google", "GoogleLLM", "google", "Google", ["llama_index", "embeddings"]),
+            # ("hugging_face", "HuggingFaceLLM", "huggingface", "HuggingFace", ["llama_index"]),
+            ("hugging_face_api", "HuggingFaceApiLLM", "huggingface_api", "HuggingFace API",
+             ["llama_index", "embeddings"]),
+            ("hugging_face_router", "HuggingFaceRouterLLM", "huggingface_router", "HuggingFace Router",
+             ["chat", "llama_index", "embeddings"]),
+            ("local", "LocalLLM", "local_ai", "Local model (OpenAI API compatible)", ["llama_index", "embeddings"]),
+            ("mistral", "MistralAILLM", "mistral_ai", "Mistral AI", ["llama_index", "embeddings"]),
+            ("ollama", "OllamaLLM", "ollama", "Ollama", ["llama_index", "embeddings"]),
+            ("deepseek_api", "DeepseekApiLLM", "deepseek_api", "Deepseek API", ["llama_index", "embeddings"]),
+            ("perplexity", "PerplexityLLM", "perplexity", "Perplexity", ["chat", "research"]),
+            ("x_ai", "xAILLM", "x_ai", "xAI", ["chat", "llama_index", "embeddings"]),
+            ("open_router", "OpenRouterLLM", "open_router", "OpenRouter", ["llama_index", "embeddings"]),
+        ]:
+            launcher.add_llm(LazyExtension(
+                "pygpt_net.provider.llms." + module, cls, id=id, name=name, type=type,
+            ))
+
+        # register custom LLMs
         llms = kwargs.get('llms', None)
         if isinstance(llms, list):
             for llm in llms:
                 launcher.add_llm(llm)
 
-        # register base vector store providers (llama-index)
-        launcher.add_vector_store(ChromaProvider())
-        launcher.add_vector_store(ElasticsearchProvider())
-        launcher.add_vector_store(PinecodeProvider())
-        launcher.add_vector_store(QdrantProvider())
-        launcher.add_vector_store(RedisProvider())
-        launcher.add_vector_store(SimpleProvider())
+        # register base vector store providers (llama-index, imported on first use)
+        for module, cls, id, prefix in [
+            ("chroma", "ChromaProvider", "ChromaVectorStore", "chroma_"),
+            ("elasticsearch", "ElasticsearchProvider", "ElasticsearchStore", "elastic_"),
+            ("pinecode", "PinecodeProvider", "PineconeVectorStore", "pinecode_"),
+            ("qdrant", "QdrantProvider", "QdrantVectorStore", "qdrant_"),
+            ("redis", "RedisProvider", "RedisVectorStore", "redis_"),
+            ("simple", "SimpleProvider", "SimpleVectorStore", ""),
+        ]:
+            launcher.add_vector_store(LazyExtension(
+                "pygpt_net.provider.vector_stores." + module, cls, id=id, prefix=prefix,
+                setters={"attach": "window"},  # called on register
+            ))
 
         # register custom vector store providers (llama-index)
         vector_stores = kwargs.get('vector_stores', None)
@@ -508,27 +498,48 @@ def run(**kwargs):
             for store in vector_stores:
                 launcher.add_vector_store(store)
 
-        # register base agents
-        # launcher.add_agent(OpenAIAgent())  # llama-index
-        launcher.add_agent(OpenAIWorkflowAgent())  # llama-index
-        launcher.add_agent(OpenAIAssistantAgent())  # llama-index
-        # launcher.add_agent(PlannerAgent())  # llama-index
-        launcher.add_agent(PlannerWorkflowAgent())  # llama-index
-        # launcher.add_agent(ReactAgent())  # llama-index
-        launcher.add_agent(ReactWorkflowAgent())  # llama-index
-        launcher.add_agent(CodeActAgent())  # llama-index
-        launcher.add_agent(LlamaSupervisorAgent())  # llama-index
-        launcher.add_agent(LlamaCustomAgent())  # llama-index
-        launcher.add_agent(OpenAIAgentsBase())  # openai-agents
-        launcher.add_agent(OpenAIAgentsExperts())  # openai-agents
-        launcher.add_agent(OpenAIAgentFeedback())  # openai-agents
-        launcher.add_agent(OpenAIAgentPlanner())  # openai-agents
-        launcher.add_agent(OpenAIAgentBotResearcher())  # openai-agents
-        launcher.add_agent(OpenAIAgentsExpertsFeedback())  # openai-agents
-        launcher.add_agent(OpenAIAgentsEvolve())  # openai-agents
-        launcher.add_agent(OpenAIAgentsB2B())  # openai-agents
-        launcher.add_agent(OpenAIAgentSupervisor())  # openai-agents
-        launcher.add_agent(OpenAICustomAgent())  # openai-agents
+        # register base agents (imported on first use)
+        for module, cls, id, name, type, mode in [
+            # llama-index
+            ("llama_index.openai_workflow", "OpenAIAgent", "openai", "FunctionAgent",
+             AGENT_TYPE_LLAMA, AGENT_MODE_WORKFLOW),
+            ("llama_index.legacy.openai_assistant", "OpenAIAssistantAgent", "openai_assistant",
+             "OpenAI Assistant (Legacy)", AGENT_TYPE_LLAMA, AGENT_MODE_ASSISTANT),
+            ("llama_index.planner_workflow", "PlannerAgent", "planner", "Planner",
+             AGENT_TYPE_LLAMA, AGENT_MODE_WORKFLOW),
+            ("llama_index.react_workflow", "ReactWorkflowAgent", "react", "ReAct",
+             AGENT_TYPE_LLAMA, AGENT_MODE_WORKFLOW),
+            ("llama_index.codeact_workflow", "CodeActAgent", "code_act", "CodeAct",
+             AGENT_TYPE_LLAMA, AGENT_MODE_WORKFLOW),
+            ("llama_index.supervisor_workflow", "SupervisorAgent", "supervisor", "Supervisor + worker",
+             AGENT_TYPE_LLAMA, AGENT_MODE_WORKFLOW),
+            ("llama_index.flow_from_schema", "Agent", "llama_custom", "Custom",
+             AGENT_TYPE_LLAMA, AGENT_MODE_WORKFLOW),  # builder schema
+            # openai-agents
+            ("openai.agent", "Agent", "openai_agent_base", "Simple agent",
+             AGENT_TYPE_OPENAI, AGENT_MODE_OPENAI),
+            ("openai.agent_with_experts", "Agent", "openai_agent_experts", "Agent with experts",
+             AGENT_TYPE_OPENAI, AGENT_MODE_OPENAI),
+            ("openai.agent_with_feedback", "Agent", "openai_agent_feedback", "Agent with feedback",
+             AGENT_TYPE_OPENAI, AGENT_MODE_OPENAI),
+            ("openai.agent_planner", "Agent", "openai_agent_planner", "Planner",
+             AGENT_TYPE_OPENAI, AGENT_MODE_OPENAI),
+            ("openai.bot_researcher", "Agent", "openai_agent_bot_researcher", "Research bot",
+             AGENT_TYPE_OPENAI, AGENT_MODE_OPENAI),
+            ("openai.agent_with_experts_feedback", "Agent", "openai_agent_experts_feedback",
+             "Agent with experts + feedback", AGENT_TYPE_OPENAI, AGENT_MODE_OPENAI),
+            ("openai.evolve", "Agent", "openai_agent_evolve", "Evolve",
+             AGENT_TYPE_OPENAI, AGENT_MODE_OPENAI),
+            ("openai.agent_b2b", "Agent", "openai_agent_b2b", "Bot 2 Bot",
+             AGENT_TYPE_OPENAI, AGENT_MODE_OPENAI),
+            ("openai.supervisor", "Agent", "openai_agent_supervisor", "Supervisor",
+             AGENT_TYPE_OPENAI, AGENT_MODE_OPENAI),
+            ("openai.flow_from_schema", "Agent", "openai_custom", "Custom",
+             AGENT_TYPE_OPENAI, AGENT_MODE_OPENAI),  # builder schema
+        ]:
+            launcher.add_agent(LazyExtension(
+                "pygpt_net.provider.agents." + module, cls, id=id, name=name, type=type, mode=mode,
+            ))
 
         # register custom agents
         agents = kwargs.get('agents', None)
@@ -554,6 +565,8 @@ def run(**kwargs):
             for tool in tools:
                 launcher.add_tool(tool)
 
+        profiler.mark("extensions registered")
+
         # run the app
         launcher.run()
 
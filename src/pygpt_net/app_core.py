@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.02 20:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from .config import Config
@@ -25,12 +25,14 @@ from .core.db import Database
 from .core.debug import Debug
 from .core.dispatcher import Dispatcher
 from .core.error_handler import ErrorHandler
+from .core.executor import Executor
 from .core.experts import Experts
 from .core.idx import Idx
 from .core.installer import Installer
 from .core.filesystem import Filesystem
 from .core.history import History
 from .core.image import Image
+from .core.limiter import Limiter
 from .core.llm import LLM
 from .core.models import Models
 from .core.modes import Modes
@@ -40,6 +42,7 @@ from .core.plugins import Plugins
 from .core.presets import Presets
 from .core.prompt import Prompt
 from .core.remote_store import RemoteStore
+from .core.scheduler import Scheduler
 from .core.settings import Settings
 from .core.tabs import Tabs
 from .core.text import Text
@@ -77,11 +80,13 @@ class Core:
         self.debug = Debug(window)
         self.dispatcher = Dispatcher(window)
         self.error_handler = ErrorHandler(window)
+        self.executor = Executor(window)
         self.experts = Experts(window)
         self.filesystem = Filesystem(window)
         self.history = History(window)
         self.idx = Idx(window)
         self.image = Image(window)
+        self.limiter = Limiter(window)
         self.llm = LLM(window)
         self.installer = Installer(window)
         self.models = Models(window)
@@ -92,6 +97,7 @@ class Core:
         self.presets = Presets(window)
         self.prompt = Prompt(window)        
         self.remote_store = RemoteStore(window)
+        self.scheduler = Scheduler(window)
         self.settings = Settings(window)
         self.tabs = Tabs(window)
         self.text = Text(window)
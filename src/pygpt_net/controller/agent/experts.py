@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.23 15:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from typing import Any
@@ -107,30 +107,40 @@ class Experts:
                         "stream": stream,
                     }))  # close previous render
 
+                    calls = {}
                     for expert_id in mentions:
                         if not core.experts.exists(expert_id):
                             log(f"Expert not found: {expert_id}")
                             continue
-
                         log(f"Calling: {expert_id}")
-                        ctx.sub_calls += 1
-
-                        # add to reply stack
-                        reply = ReplyContext()
+                        calls[expert_id] = mentions[expert_id]
+
+                    if not calls:
+                        return num_calls
+
+                    # add to reply stack
+                    reply = ReplyContext()
+                    reply.ctx = ctx
+                    if len(calls) > 1:
+                        # run concurrently and reply to master once, with joined results
+                        reply.type = ReplyContext.EXPERT_CALLS
+                        reply.calls = calls
+                    else:
+                        expert_id = next(iter(calls))
                         reply.type = ReplyContext.EXPERT_CALL
-                        reply.ctx = ctx
                         reply.parent_id = expert_id
-                        reply.input = mentions[expert_id]
-
-                        # send to kernel
-                        context = BridgeContext()
-                        context.ctx = ctx
-                        context.reply_context = reply
-                        dispatch(KernelEvent(KernelEvent.AGENT_CALL, {
-                            'context': context,
-                            'extra': {},
-                        }))
-                        num_calls += 1
+                        reply.input = calls[expert_id]
+                    ctx.sub_calls += len(calls)
+
+                    # send to kernel
+                    context = BridgeContext()
+                    context.ctx = ctx
+                    context.reply_context = reply
+                    dispatch(KernelEvent(KernelEvent.AGENT_CALL, {
+                        'context': context,
+                        'extra': {},
+                    }))
+                    num_calls = len(calls)
 
         return num_calls
 
@@ -159,6 +169,7 @@ class Experts:
     def stop(self):
         """Stop experts"""
         self.is_stop = True
+        self.window.core.experts.stop()  # cancel concurrent calls
 
     def unlock(self):
         """Unlock experts"""
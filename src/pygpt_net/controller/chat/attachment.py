@@ -6,11 +6,11 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.12.31 16:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import os
-from typing import List, Dict, Any, Union
+from typing import List, Dict, Any, Union, Optional
 
 from PySide6.QtCore import Slot, QObject
 
@@ -296,13 +296,15 @@ class Attachment(QObject):
     def get_context(
             self,
             ctx: CtxItem,
-            history: List[CtxItem]
+            history: List[CtxItem],
+            budget: Optional[int] = None
     ) -> str:
         """
         Get additional context for attachment
 
         :param ctx: CtxItem instance
         :param history Context items (history)
+        :param budget: max tokens of full context (None = unlimited)
         :return: Additional context
         """
         if self.mode != self.MODE_DISABLED:
@@ -312,7 +314,7 @@ class Attachment(QObject):
         self.window.core.attachments.context.reset()  # reset used files and urls
 
         # get additional context from attachments
-        content = self.window.core.attachments.context.get_context(self.mode, ctx, history)
+        content = self.window.core.attachments.context.get_context(self.mode, ctx, history, budget)
 
         # append used files and urls to context
         files = self.window.core.attachments.context.get_used_files()
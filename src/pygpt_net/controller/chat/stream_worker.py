@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.22 04:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import io
@@ -18,6 +18,7 @@ from PySide6.QtCore import QObject, Signal, Slot, QRunnable
 from openai.types.chat import ChatCompletionChunk
 
 from pygpt_net.core.events import RenderEvent
+from pygpt_net.core.executor import LANE_INTERACTIVE
 from pygpt_net.core.types.chunk import ChunkType
 from pygpt_net.item.ctx import CtxItem
 from pygpt_net.provider.api.google.utils import capture_google_usage
@@ -74,6 +75,7 @@ class WorkerState:
 
 class StreamWorker(QRunnable):
     __slots__ = ("signals", "ctx", "window", "stream")
+    lane = LANE_INTERACTIVE  # executor lane
 
     def __init__(self, ctx: CtxItem, window, parent=None):
         super().__init__()
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.18 01:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import json
@@ -15,6 +15,7 @@ from PySide6.QtCore import Signal, Slot
 
 from pygpt_net.core.bridge.context import BridgeContext
 from pygpt_net.core.events import Event, KernelEvent
+from pygpt_net.core.executor import LANE_TOOLS
 from pygpt_net.core.worker import Worker, WorkerSignals
 
 
@@ -53,7 +54,10 @@ class Command:
         if event.name in self.flush_events:
             self.window.controller.kernel.replies.clear()
 
+        dispatcher = self.window.core.dispatcher
         for id in self.window.core.plugins.get_ids():
+            if not dispatcher.is_subscribed(id, event.name):
+                continue
             force = False
             if all:
                 if execute_only:
@@ -87,8 +91,10 @@ class Command:
         self.window.core.debug.info(f"Dispatch CMD event begin: {event.name}")
         if event.name in self.flush_events:
             self.window.controller.kernel.replies.clear()
+        dispatcher = self.window.core.dispatcher
         for id in self.window.core.plugins.get_ids():
-            self.window.core.dispatcher.apply(id, event)
+            if dispatcher.is_subscribed(id, event.name):
+                dispatcher.apply(id, event)
         if event.name in self.flush_events:
             self.window.controller.kernel.replies.flush()
 
@@ -104,7 +110,7 @@ class Command:
         worker.kwargs['event'] = event
         worker.kwargs['window'] = self.window
         worker.kwargs['finished_signal'] = worker.signals.finished
-        self.window.threadpool.start(worker)
+        self.window.threadpool.start(worker, lane=LANE_TOOLS)
 
     def worker(
             self,
@@ -120,7 +126,7 @@ class Command:
         :param finished_signal: WorkerSignals: finished signal
         """
         for id in window.core.plugins.get_ids():
-            if window.controller.plugins.is_enabled(id):
+            if window.controller.plugins.is_enabled(id) and window.core.dispatcher.is_subscribed(id, event.name):
                 if event.stop or (event.name == Event.CMD_EXECUTE and self.is_stop()):
                     if self.is_stop():
                         self.stop = False  # unlock needed here
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.12.27 21:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from typing import Optional, List, Union
@@ -47,7 +47,7 @@ class Ctx:
         # current group ID
         self.group_id = None
         self.selected = []
-        self._infinite_scroll_refresh = False
+        self._loading_more = False  # guard to avoid multiple triggers while updating
 
     def handle(self, event: BaseEvent):
         """
@@ -412,55 +412,29 @@ class Ctx:
         """
         view = self.window.ui.nodes['ctx.list']
 
-        # Read raw scrollbar state BEFORE model rebuild
-        sb = None
-        prev_val = None
         if restore_scroll:
             try:
-                sb = view.verticalScrollBar()
-                prev_val = sb.value()
+                view.store_scroll_position()
             except Exception:
-                sb = None
-                prev_val = None
-
-            # In infinite-scroll mode do NOT call store/restore helpers to avoid collisions.
-            # Instead, schedule a pending scroll that will be applied while updates are disabled.
-            if self._infinite_scroll_refresh:
-                if prev_val is not None:
-                    try:
-                        view.set_pending_v_scroll(prev_val)
-                    except Exception:
-                        pass
-            else:
-                # Normal mode: keep existing helpers
-                try:
-                    view.store_scroll_position()
-                except Exception:
-                    pass
+                pass
 
         # Prepare data (with placeholder injection if current is outside of the page)
         data = self.window.core.ctx.get_meta(reload)
         data = self._inject_current_if_missing(data)
 
-        # Rebuild list (CtxList.update will apply pending scroll before enabling updates)
+        # Apply changes to list (CtxList.update will apply pending scroll before enabling updates)
         self.window.ui.contexts.ctx_list.update(
             'ctx.list',
             data,
             expand=False,
         )
 
-        # Post-fix: in normal mode let helpers restore; in infinite mode we already applied pending
         if restore_scroll:
-            if self._infinite_scroll_refresh:
-                # Optional safety re-apply to the same value after layout settles
-                if sb is not None and prev_val is not None:
-                    QTimer.singleShot(0, lambda: sb.setValue(prev_val))
-            else:
-                try:
-                    view.restore_scroll_position()
-                    QTimer.singleShot(0, view.restore_scroll_position)
-                except Exception:
-                    pass
+            try:
+                view.restore_scroll_position()
+                QTimer.singleShot(0, view.restore_scroll_position)
+            except Exception:
+                pass
 
     def refresh(self, restore_model: bool = True):
         """
@@ -1377,7 +1351,7 @@ class Ctx:
         self.edit_item_id = None
         self.group_id = None
         self.selected = []
-        self._infinite_scroll_refresh = False
+        self._loading_more = False
         self.reset_loaded_total()  # reset paging
         self.window.core.ctx.reset()
         self.setup()
@@ -1474,64 +1448,35 @@ class Ctx:
         self.window.core.config.set('ctx.records.limit.total', base if base > 0 else 0)
         self.window.core.config.save()
 
-    def load_more(self, packages: int = 1):
-        """
-        Increase total loaded limit and append new ungrouped records without rebuilding the list.
+    def can_load_more(self) -> bool:
         """
-        base = self.get_package_limit()
-        if base <= 0:
-            # Unlimited mode – nothing to do
-            return
-
-        current_total = self.get_loaded_total_limit()
-        new_total = current_total + max(1, int(packages)) * base
-        self.window.core.config.set('ctx.records.limit.total', new_total)
-        self.window.core.config.save()
-
-        # If folders are at top (default), we can safely append without rebuilding.
-        # Otherwise, fall back to safe rebuild with stable scroll restore.
-        folders_top = bool(self.window.core.config.get("ctx.records.folders.top"))
-
-        # Pull fresh meta with increased total
-        data = self.window.core.ctx.get_meta(reload=True)
-
-        if folders_top:
-            # compute which ungrouped & not pinned IDs are already visible
-            view = self.window.ui.nodes['ctx.list']
-            visible_ids = set()
-            try:
-                visible_ids = view.get_visible_unpaged_ids()
-            except Exception:
-                pass
-
-            # build candidate list in provider order
-            candidates = []
-            for mid, meta in data.items():
-                if (meta.group_id is None or meta.group_id == 0) and not meta.important:
-                    candidates.append(mid)
+        Check if next package of records can be loaded
 
-            # filter only new ones (keep order)
-            add_ids = [mid for mid in candidates if mid not in visible_ids]
+        :return: True if more records available
+        """
+        if self._loading_more or self.get_package_limit() <= 0:
+            return False  # unlimited mode – everything loaded
+        return self.window.core.ctx.has_more_meta()
 
-            # append without rebuilding
-            self.window.ui.contexts.ctx_list.append_unpaginated('ctx.list', data, add_ids)
-        else:
-            # Fallback: rare config where groups are placed after items – do a stable rebuild
-            view = self.window.ui.nodes['ctx.list']
-            try:
-                sb = view.verticalScrollBar()
-                prev_val = sb.value()
-                # mark special refresh to avoid collisions with helpers
-                self._infinite_scroll_refresh = True
-                # set pending to preserve old position during rebuild
-                view.set_pending_v_scroll(prev_val)
-            except Exception:
-                prev_val = None
+    def load_more(self, packages: int = 1):
+        """
+        Fetch next package of ungrouped records and append it to the list (loaded records are not reloaded)
 
-            try:
-                self.update_list(reload=True, restore_scroll=True)
-            finally:
-                self._infinite_scroll_refresh = False
+        :param packages: number of packages to load
+        """
+        if not self.can_load_more():
+            return
+        base = self.get_package_limit()
+        limit = max(1, int(packages)) * base
+        self._loading_more = True
+        try:
+            if self.window.core.ctx.fetch_more_meta(limit) > 0:
+                # remember loaded total (restored on next reload) only if rows were added
+                self.window.core.config.set('ctx.records.limit.total', self.get_loaded_total_limit() + limit)
+                self.window.core.config.save()
+                self.update_list()  # new rows are appended, scroll position is kept
+        finally:
+            self._loading_more = False
 
     def _inject_current_if_missing(self, data: dict) -> dict:
         """
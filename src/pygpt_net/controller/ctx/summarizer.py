@@ -6,10 +6,11 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.05 00:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from PySide6.QtCore import QObject, Signal, Slot
+from pygpt_net.core.executor import LANE_MAINTENANCE
 from pygpt_net.core.worker import Worker
 from pygpt_net.item.ctx import CtxItem
 
@@ -91,7 +92,7 @@ class Summarizer:
         self.worker.kwargs['ctx'] = ctx
         self.worker.kwargs['window'] = self.window
         self.worker.kwargs['updated_signal'] = self.worker.signals.updated
-        self.window.threadpool.start(self.worker)
+        self.window.threadpool.start(self.worker, lane=LANE_MAINTENANCE)
 
     @Slot(int, object, str)
     def handle_update(
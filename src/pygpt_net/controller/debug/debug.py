@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.22 19:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from datetime import datetime
@@ -138,6 +138,17 @@ class Debug(QObject):
             if dialog.is_active(id):
                 dialog.update_worker(id)
 
+    def update_schedule(self):
+        """Refresh debug windows every second only while any of them is active"""
+        dialog = self.window.controller.dialogs.debug
+        if self._ids is None:
+            self._ids = dialog.get_ids()
+        if any(dialog.is_active(id) for id in self._ids):
+            if not self.window.core.scheduler.has("debug.update"):
+                self.window.core.scheduler.call_every(1.0, self.on_post_update, name="debug.update")
+        else:
+            self.window.core.scheduler.remove("debug.update")
+
     def post_setup(self):
         """Post setup debug"""
         self.connect_signals()
@@ -270,6 +281,7 @@ class Debug(QObject):
                 self.window.core.tabs.toggle_debug(True)
             self.window.controller.dialogs.debug.show(id)
             self.on_post_update(True)
+        self.update_schedule()
 
         self.log('debug.' + id + ' toggled')
 
@@ -284,6 +296,7 @@ class Debug(QObject):
         """
         self.window.controller.dialogs.debug.active[id] = False
         self.window.controller.debug.update_menu()
+        self.update_schedule()
         if id == "tabs":
             self.window.core.tabs.toggle_debug(False)
 
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.05 17:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from typing import Any, Optional
@@ -108,6 +108,10 @@ class Confirm:
             elif type == 'audio.cache.clear':
                 self.window.controller.audio.clear_cache(True)
 
+            # web page cache clear
+            elif type == 'web.cache.clear':
+                self.window.controller.settings.clear_web_cache(True)
+
             # restore default CSS
             elif type == 'restore.css':
                 self.window.controller.layout.restore_default_css(force=True)
@@ -286,6 +290,8 @@ class Confirm:
                 self.window.tools.get("indexer").delete_db_idx(id, True)
             elif type == 'idx.tool.index':
                 self.window.tools.get("indexer").index_data(True)
+            elif type == 'idx.embeddings.clear':
+                self.window.tools.get("indexer").clear_embeddings(True)
 
             # prompt delete
             elif type == 'prompt.custom.delete':
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.12.27 19:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import datetime
@@ -261,6 +261,7 @@ class Indexer(QObject):
         worker.recursive = recursive
         worker.signals.finished.connect(self.handle_finished_file)
         worker.signals.error.connect(self.handle_error)
+        worker.signals.progress.connect(self.handle_progress)
         self.window.threadpool.start(worker)
         self.worker = worker
 
@@ -293,6 +294,7 @@ class Indexer(QObject):
         worker.silent = False
         worker.signals.finished.connect(self.handle_finished_file)
         worker.signals.error.connect(self.handle_error)
+        worker.signals.progress.connect(self.handle_progress)
         self.window.threadpool.start(worker)
         self.worker = worker
 
@@ -701,6 +703,22 @@ class Indexer(QObject):
         self.window.controller.idx.on_idx_end()  # on end
         self.window.controller.ctx.select_by_current()
 
+    @Slot(str, int, int)
+    def handle_progress(
+            self,
+            idx: str,
+            done: int,
+            total: int
+    ):
+        """
+        Handle indexing progress signal
+
+        :param idx: index name
+        :param done: number of processed files
+        :param total: number of files
+        """
+        self.window.update_status(f"{trans('idx.status.indexing')} {done}/{total}")
+
     @Slot(str, object, object, bool)
     def handle_finished_file(
             self,
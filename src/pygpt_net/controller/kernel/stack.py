@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.23 15:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from typing import Any
@@ -69,6 +69,12 @@ class Stack:
                 context.parent_id,  # expert id
                 context.input,  # query
             )
+        # concurrent expert calls
+        elif context.type == ReplyContext.EXPERT_CALLS:
+            self.window.core.experts.call_many(
+                context.ctx,  # master ctx
+                context.calls,  # {expert id: query}
+            )
         # cmd execute
         elif context.type == ReplyContext.CMD_EXECUTE:
             self.window.controller.plugins.apply_cmds(
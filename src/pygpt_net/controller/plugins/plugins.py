@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.17 07:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from typing import List, Dict, Any, Optional
@@ -20,6 +20,7 @@ from pygpt_net.controller.plugins.presets import Presets
 from pygpt_net.controller.plugins.settings import Settings
 from pygpt_net.core.events import Event
 from pygpt_net.item.ctx import CtxItem
+from pygpt_net.plugin.base.plugin import BasePlugin
 from pygpt_net.utils import trans
 
 
@@ -34,8 +35,8 @@ class Plugins:
         self.settings = Settings(window)
         self.presets = Presets(window)
         self.enabled = {}
-        self._ids = None
-        self._ids_with_update = None
+        self._ids_with_update = []
+        self._ids_with_post_update = []
         self._suspend_updates = 0
 
     def _begin_batch(self):
@@ -49,6 +50,7 @@ class Plugins:
         if self._suspend_updates == 0:
             self.update_info()
             self.update()
+            self.update_schedule()
 
     def setup(self):
         """Set up plugins"""
@@ -156,6 +158,7 @@ class Plugins:
         if self._suspend_updates == 0:
             self.update_info()
             self.update()
+            self.update_schedule()
 
     def disable(self, id: str, silent: bool = False):
         """
@@ -182,6 +185,7 @@ class Plugins:
         if self._suspend_updates == 0:
             self.update_info()
             self.update()
+            self.update_schedule()
 
     def is_enabled(self, id: str) -> bool:
         """
@@ -332,29 +336,43 @@ class Plugins:
                     self.window.ui.plugin_addon['schedule'].setVisible(False)
                     self.window.ui.tray.hide_schedule_menu()
 
-    def on_update(self):
-        """Called on update"""
+    def update_schedule(self):
+        """Register periodic update hooks only for enabled plugins which implement them"""
         pm = self.window.core.plugins
+        self._ids_with_update = []
+        self._ids_with_post_update = []
         for pid in pm.get_ids():
+            if not self.is_enabled(pid):
+                continue
+            cls = type(pm.get(pid))
+            if getattr(cls, "on_update", BasePlugin.on_update) is not BasePlugin.on_update:
+                self._ids_with_update.append(pid)
+            if getattr(cls, "on_post_update", BasePlugin.on_post_update) is not BasePlugin.on_post_update:
+                self._ids_with_post_update.append(pid)
+
+        scheduler = self.window.core.scheduler
+        for name, ids, interval, fn in (
+                ("plugins.update", self._ids_with_update, 0.03, self.on_update),
+                ("plugins.post_update", self._ids_with_post_update, 1.0, self.on_post_update),
+        ):
+            if ids and not scheduler.has(name):
+                scheduler.call_every(interval, fn, name=name)
+            elif not ids:
+                scheduler.remove(name)
+
+    def on_update(self):
+        """Called on update (only if any enabled plugin implements on_update)"""
+        pm = self.window.core.plugins
+        for pid in self._ids_with_update:
             if self.is_enabled(pid):
-                fn = getattr(pm.get(pid), "on_update", None)
-                if callable(fn):
-                    fn()
+                pm.get(pid).on_update()
 
     def on_post_update(self):
-        """Called on post update"""
+        """Called on post update (only if any enabled plugin implements on_post_update)"""
         pm = self.window.core.plugins
-        if self._ids is None:
-            self._ids = pm.get_ids()
-        if self._ids_with_update is None:
-            self._ids_with_update = [pid for pid in self._ids if hasattr(self.window.core.plugins.get(pid), "on_post_update")]
-        if len(self._ids_with_update) == 0:
-            return
-        for pid in self._ids_with_update:
+        for pid in self._ids_with_post_update:
             if self.is_enabled(pid):
-                fn = pm.get(pid).on_post_update
-                if callable(fn):
-                    fn()
+                pm.get(pid).on_post_update()
 
     def update_info(self):
         """Update plugins info"""
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.24 23:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from typing import Any
@@ -138,6 +138,7 @@ class Settings:
 
         window.controller.plugins.presets.save_current()
         window.core.config.save()
+        window.core.command.invalidate()
         self.close()
 
         window.update_status(trans('info.settings.saved'))
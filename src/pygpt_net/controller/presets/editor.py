@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.20 16:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import datetime
@@ -247,8 +247,6 @@ class Editor:
 
     def setup(self):
         """Setup preset editor"""
-        # update after agents register
-        self.append_extra_config()
         self.update_providers_list()
 
         # add hooks for config update in real-time
@@ -930,6 +928,7 @@ class Editor:
 
         :param id: preset id (filename)
         """
+        self.append_extra_config()  # built on first open, loads all agents
         self.opened = True
         self.current_id = id
         self.reload_all()
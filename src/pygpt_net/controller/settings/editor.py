@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.12.26 12:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import copy
@@ -233,10 +233,25 @@ class Editor:
         # update ENV
         self.window.core.config.setup_env()
 
+        # close pooled API clients if credentials, endpoints, proxy or connection limits changed
+        if any(self.config_changed(key) for key in self.before_config
+               if key.startswith(("api_", "organization_key"))):
+            self.window.core.api.pool.invalidate()
+
+        # apply executor lane limits
+        if any(self.config_changed(key) for key in self.before_config if key.startswith("executor.")):
+            self.window.core.executor.setup()
+
+        # re-create cached embedding models if credentials or embeddings config changed
+        if any(self.config_changed(key) for key in self.before_config
+               if key.startswith(("api_", "organization_key", "llama.idx.embeddings"))):
+            self.window.core.idx.llm.clear_embeddings_cache()
+
         self.before_config = copy.deepcopy(self.window.core.config.all())
         self.window.controller.settings.close_window(id)
 
         # dispatch on update event
+        self.window.core.command.invalidate()
         event = Event(Event.SETTINGS_CHANGED)
         self.window.dispatch(event, all=True)
 
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.16 20:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import os
@@ -16,7 +16,7 @@ from .editor import Editor
 from .profile import Profile
 from .workdir import Workdir
 
-from pygpt_net.utils import trans
+from pygpt_net.utils import trans, sizeof_fmt
 
 
 class Settings:
@@ -228,6 +228,27 @@ class Settings:
         else:
             self.window.update_status('Config directory not exists: {}'.format(self.window.core.config.path))
 
+    def clear_web_cache(self, force: bool = False):
+        """
+        Clear web page cache
+
+        :param force: True to force clear
+        """
+        cache = self.window.core.web.cache
+        if not force:
+            stats = cache.get_stats()
+            self.window.ui.dialogs.confirm(
+                type='web.cache.clear',
+                id=0,
+                msg=trans("web.cache.clear.confirm").format(
+                    entries=stats["entries"],
+                    size=sizeof_fmt(stats["size"]),
+                ),
+            )
+            return
+        cache.clear()
+        self.window.update_status(trans("web.cache.clear.success"))
+
     def welcome_settings(self):
         """Open settings at first launch (if no API key yet)"""
         self.open_section("api_keys")
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.12.28 04:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import copy
@@ -162,6 +162,7 @@ class WorkdirWorker(QRunnable):
         path_to = new_path
         print(f"Copying all files from {path_from} to: {path_to}")
         self.signals.updateGlobalStatus.emit("Copying files...")
+        self.window.core.db.checkpoint()  # flush WAL of current database before copy
         result = self.window.core.filesystem.copy_workdir(
             path_from,
             path_to,
@@ -265,6 +266,7 @@ class WorkdirWorker(QRunnable):
         self.signals.updateGlobalStatus.emit(trans("dialog.workdir.result.wait"))
         QApplication.processEvents()  # process events to update UI
         try:
+            self.window.core.db.checkpoint()  # flush WAL before copy
             result = self.window.core.filesystem.copy_workdir(current, self.path)
         except Exception as e:
             self.window.core.debug.log(e)
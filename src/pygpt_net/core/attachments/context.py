@@ -6,14 +6,17 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.26 01:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import copy
+import hashlib
 import os
 import shutil
+import threading
 import uuid
 
+from collections import OrderedDict
 from shutil import copyfile
 from typing import Optional, List, Dict, Any, Tuple
 
@@ -21,12 +24,17 @@ from llama_index.core import Document
 
 from pygpt_net.core.bridge import BridgeContext
 from pygpt_net.core.events import KernelEvent
-from pygpt_net.core.types import MODEL_DEFAULT_MINI
+from pygpt_net.core.types import MODEL_DEFAULT_MINI, MODE_CHAT
 from pygpt_net.item.attachment import AttachmentItem
 from pygpt_net.item.ctx import CtxMeta, CtxItem
+from pygpt_net.item.model import ModelItem
 
 
 class Context:
+    MAX_CACHED_FILES = 64  # max number of cached attachment texts (LRU)
+    MAX_CACHED_SUMMARIES = 32  # max number of cached summaries (LRU)
+    TRIM_MARKER = "\n[...]"  # appended to trimmed attachment content
+
     def __init__(self, window=None):
         """
         Context attachment core
@@ -40,6 +48,9 @@ class Context:
         self.last_used_context = None
         self.last_files = []
         self.last_urls = []
+        self.text_cache: "OrderedDict[str, Tuple[int, int, str, int]]" = OrderedDict()  # uuid -> (mtime, size, text, tokens)
+        self.summary_cache: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()  # (content, query, model) -> summary
+        self.lock = threading.Lock()
         self.summary_prompt = """
         Summarize the text below by extracting the most important information, 
         especially those that may help answer the question: 
@@ -93,7 +104,8 @@ class Context:
             self,
             mode: str,
             ctx: CtxItem,
-            history: List[CtxItem]
+            history: List[CtxItem],
+            budget: Optional[int] = None
     ) -> str:
         """
         Get context for mode
@@ -101,11 +113,12 @@ class Context:
         :param mode: Context mode
         :param ctx: CtxItem instance
         :param history: history
+        :param budget: max tokens of full context (None = unlimited)
         :return: context
         """
         content = ""
         if mode == self.window.controller.chat.attachment.MODE_FULL_CONTEXT:
-            content = self.get_context_text(ctx, filename=True)
+            content = self.get_context_text(ctx, filename=True, budget=budget)
         elif mode == self.window.controller.chat.attachment.MODE_QUERY_CONTEXT:
             content = self.query_context(ctx, history)
         elif mode == self.window.controller.chat.attachment.MODE_QUERY_CONTEXT_SUMMARY:
@@ -115,18 +128,20 @@ class Context:
     def get_context_text(
             self,
             ctx: CtxItem,
-            filename: bool = False
+            filename: bool = False,
+            budget: Optional[int] = None
     ) -> str:
         """
         Get raw text context for meta
 
         :param ctx: CtxItem instance
         :param filename: append filename
+        :param budget: max tokens of context, attachments are trimmed to fit (None = unlimited)
         :return: raw context
         """
         meta = ctx.meta
         meta_path = self.get_dir(meta)
-        context = ""
+        parts = []  # (header, text, tokens)
         if os.path.exists(meta_path) and os.path.isdir(meta_path):
             for file in meta.get_additional_ctx():
                 if ("type" not in file
@@ -140,11 +155,12 @@ class Context:
                 store_path = file["path"]
                 if "real_path" in file:
                     store_path = file["real_path"]
+                header = ""
                 if filename:
                     if file["type"] == "url":
-                        context += "URL: {}\n".format(file["path"]) + "\n"
+                        header = "URL: {}\n".format(file["path"]) + "\n"
                     else:
-                        context += "Filename: {}\n".format(file["name"]) + "\n"
+                        header = "Filename: {}\n".format(file["name"]) + "\n"
 
                 # store used files and URLs in ctx
                 if file["type"] == "url":
@@ -154,12 +170,24 @@ class Context:
                     if store_path not in self.last_files:
                         self.last_files.append(store_path)
 
-                if os.path.exists(text_path):
-                    try:
-                        with open(text_path, "r", encoding="utf-8") as f:
-                            context += f.read() + "\n\n"
-                    except Exception as e:
-                        print("Attachments: read error: {}".format(e))
+                text, tokens = self.read_text(file_id, text_path)
+                parts.append((header, text, tokens))
+
+        limits = [None] * len(parts)
+        if budget is not None:
+            total = sum(tokens for _, _, tokens in parts)
+            if total > budget:
+                limits = self.fit_budget([tokens for _, _, tokens in parts], budget)
+                if self.is_verbose():
+                    print("Attachments: context trimmed to fit budget: {} > {} tokens".format(total, budget))
+
+        context = ""
+        for (header, text, tokens), limit in zip(parts, limits):
+            context += header
+            if text is not None:
+                if limit is not None:
+                    text = self.trim_text(text, tokens, limit)
+                context += text + "\n\n"
 
         self.last_used_content = context
         self.last_used_context = context
@@ -249,7 +277,27 @@ class Context:
             print("Attachments: using summary model: {}".format(model))
 
         query = str(ctx.input)
-        content = self.get_context_text(ctx, filename=True)
+        history_data = self.prepare_context_history(history)
+        budget = self.get_token_budget(
+            model_item,
+            self.summary_prompt,
+            query,
+            *[str(item.input or "") + str(item.output or "") for item in history_data]
+        )
+        content = self.get_context_text(ctx, filename=True, budget=budget)
+
+        # use summary of the same content for the same query if available
+        key = (self.hash(content), self.hash(query.strip()), model)
+        with self.lock:
+            response = self.summary_cache.get(key)
+            if response is not None:
+                self.summary_cache.move_to_end(key)
+        if response is not None:
+            self.last_used_context = response
+            if self.is_verbose():
+                print("Attachments: using cached summary: {}".format(response))
+            return response
+
         prompt = self.summary_prompt.format(
             query=str(query).strip(),
             content=str(content).strip(),
@@ -257,7 +305,6 @@ class Context:
         if self.is_verbose():
             print("Attachments: summary prompt: {}".format(prompt))
 
-        history_data = self.prepare_context_history(history)
         ctx = CtxItem()
         bridge_context = BridgeContext(
             ctx=ctx,
@@ -275,8 +322,141 @@ class Context:
         self.last_used_context = response
         if self.is_verbose():
             print("Attachments: summary received: {}".format(response))
+        if response:
+            with self.lock:
+                self.summary_cache[key] = response
+                while len(self.summary_cache) > self.MAX_CACHED_SUMMARIES:
+                    self.summary_cache.popitem(last=False)
         return response
 
+    def read_text(
+            self,
+            file_id: str,
+            path: str
+    ) -> Tuple[Optional[str], int]:
+        """
+        Read attachment text content (cached by file uuid and mtime)
+
+        :param file_id: attachment uuid
+        :param path: text file path
+        :return: text (None if not exists), number of tokens
+        """
+        if not os.path.exists(path):
+            with self.lock:
+                self.text_cache.pop(file_id, None)
+            return None, 0
+        try:
+            stat = os.stat(path)
+            version = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            version = None  # not cached
+
+        with self.lock:
+            item = self.text_cache.get(file_id)
+            if item is not None and version is not None and item[:2] == version:
+                self.text_cache.move_to_end(file_id)
+                return item[2], item[3]
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                text = f.read()
+        except Exception as e:
+            print("Attachments: read error: {}".format(e))
+            return None, 0
+
+        tokens = self.window.core.tokens.from_str(text)
+        if version is not None:
+            with self.lock:
+                self.text_cache[file_id] = version + (text, tokens)
+                self.text_cache.move_to_end(file_id)
+                while len(self.text_cache) > self.MAX_CACHED_FILES:
+                    self.text_cache.popitem(last=False)
+        return text, tokens
+
+    def get_token_budget(
+            self,
+            model: Optional[ModelItem],
+            *texts: str,
+            history: Optional[List[CtxItem]] = None,
+            mode: str = MODE_CHAT
+    ) -> Optional[int]:
+        """
+        Get number of tokens left for attachments in model context
+
+        :param model: ModelItem instance
+        :param texts: texts already used in request (system prompt, input, etc.)
+        :param history: history items sent with request (without current item)
+        :param mode: mode used to count history tokens
+        :return: max tokens for attachments (None = unlimited)
+        """
+        config = self.window.core.config
+        if model is None or not config.get("ctx.attachment.budget", True):
+            return None
+        limit = self.window.core.models.get_num_ctx(model.id)
+        max_total = config.get("max_total_tokens")
+        if max_total and max_total < limit:
+            limit = max_total
+        used = sum(self.window.core.tokens.from_str(text, model.id) for text in texts if text)
+        used += int(config.get("context_threshold") or 0)  # reserved for response
+        if history and config.get("use_context"):
+            _, history_tokens = self.window.core.ctx.count_history(history, model.id, mode, used, limit)
+            used += history_tokens  # only items that fit in context, older are trimmed by provider
+        return max(0, limit - used)
+
+    def fit_budget(
+            self,
+            tokens: List[int],
+            budget: int
+    ) -> List[int]:
+        """
+        Split tokens budget between attachments
+
+        Smaller attachments are kept whole, the rest of the budget is split evenly
+        between the larger ones.
+
+        :param tokens: number of tokens of each attachment
+        :param budget: max total tokens
+        :return: max tokens of each attachment
+        """
+        limits = [0] * len(tokens)
+        left = max(0, budget)
+        order = sorted(range(len(tokens)), key=lambda i: tokens[i])
+        for n, i in enumerate(order):
+            share = left // (len(order) - n)
+            limits[i] = min(tokens[i], share)
+            left -= limits[i]
+        return limits
+
+    def trim_text(
+            self,
+            text: str,
+            tokens: int,
+            limit: int
+    ) -> str:
+        """
+        Trim text to max number of tokens (approx.)
+
+        :param text: text
+        :param tokens: number of tokens in text
+        :param limit: max number of tokens
+        :return: trimmed text
+        """
+        if limit >= tokens:
+            return text
+        if limit <= 0:
+            return self.TRIM_MARKER.strip()
+        chars = int(len(text) * limit / tokens)
+        return text[:chars].rstrip() + self.TRIM_MARKER
+
+    def hash(self, text: str) -> str:
+        """
+        Get content hash
+
+        :param text: text
+        :return: sha256 hex digest
+        """
+        return hashlib.sha256(text.encode("utf-8", errors="replace")).hexdigest()
+
     def prepare_context_history(
             self,
             history: List[CtxItem]
@@ -6,11 +6,13 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.11 14:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from PySide6.QtCore import Signal, QObject, QRunnable, Slot
 
+from pygpt_net.core.executor import LANE_INDEXING
+
 
 class WorkerSignals(QObject):
     success = Signal(str)
@@ -18,6 +20,8 @@ class WorkerSignals(QObject):
 
 
 class AttachmentWorker(QRunnable):
+    lane = LANE_INDEXING  # executor lane
+
     def __init__(self, *args, **kwargs):
         super().__init__()
         self.signals = WorkerSignals()
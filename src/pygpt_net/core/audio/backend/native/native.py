@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.31 04:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from typing import Optional
@@ -29,6 +29,10 @@ from ..shared import (
     qaudio_norm_factor,
     qaudio_to_s16le,
     convert_s16_pcm,
+    PCMConverter,
+    FrameBuffer,
+    create_segmenter,
+    get_buffer_size,
     build_rt_input_delta_event,
     build_output_volume_event,
 )
@@ -49,7 +53,7 @@ class NativeBackend(QObject):
         self.window = window
         self.audio_source = None
         self.audio_io_device = None
-        self.frames = []
+        self.frames = FrameBuffer()
         self.actual_audio_format = None
         self.path = None
         self.disconnected = False
@@ -59,6 +63,8 @@ class NativeBackend(QObject):
         self.selected_device = None
         self.loop = False
         self.stop_callback = None
+        self.segment_callback = None
+        self.segmenter = None  # VAD segmenter (continuous mode)
         self.player = None
         self.playback_timer = None
         self.volume_timer = None
@@ -86,6 +92,7 @@ class NativeBackend(QObject):
 
         self._rt_session: Optional[RealtimeSession] = None
         self._rt_signals = None  # set by core.audio.output on initialize()
+        self._rt_converter: Optional[PCMConverter] = None  # stream converter, kept between chunks
 
         # dedicated player wrapper (file playback + envelope metering)
         self._player = NativePlayer(window=self.window, chunk_ms=self.chunk_ms)
@@ -136,6 +143,17 @@ class NativeBackend(QObject):
         """
         self.loop = loop
 
+    def set_segment_callback(self, callback):
+        """
+        Set callback to be called with speech segments on loop recording (VAD)
+
+        :param callback: function to call with (data, rate, channels), PCM16 data
+        """
+        if callable(callback):
+            self.segment_callback = callback
+        else:
+            raise ValueError("Callback must be a callable function")
+
     def set_path(self, path: str):
         """
         Set audio input file path
@@ -153,7 +171,8 @@ class NativeBackend(QObject):
         self.init()
 
         # Clear previous frames
-        self.frames = []
+        self.frames.clear()
+        self.segmenter = None
 
         # Prepare selected device
         self.prepare_device()
@@ -175,6 +194,12 @@ class NativeBackend(QObject):
         # mark recording as active only after setup succeeded
         # This ensures process_audio_input() will start updating the UI.
         if self.audio_source is not None and self.audio_io_device is not None:
+            fmt = self.actual_audio_format
+            rate = fmt.sampleRate()
+            channels = fmt.channelCount()
+            self.frames = FrameBuffer(get_buffer_size(self.window, rate * channels * fmt.bytesPerSample(), self.loop))
+            if self.loop and self.segment_callback is not None:
+                self.segmenter = create_segmenter(self.window, rate, channels)
             self._is_recording = True
         return True
 
@@ -209,8 +234,14 @@ class NativeBackend(QObject):
             # Emit final input chunk marker for realtime consumers
             self._emit_rt_input_delta(b"", final=True)
 
+            # Emit last speech segment (VAD), segments are not saved to file
+            if self.segmenter is not None:
+                self._emit_segment(self.segmenter.flush())
+                self.segmenter = None
+                self.frames.clear()
+
             # Save frames to file (if any)
-            if self.frames:
+            elif self.frames:
                 self.save_audio_file(self.path)
                 result = True
             else:
@@ -336,11 +367,11 @@ class NativeBackend(QObject):
         device_id = int(self.window.core.config.get('audio.input.device', 0))
         self.device_changed(device_id)
 
-    def get_frames(self) -> list:
+    def get_frames(self) -> FrameBuffer:
         """
         Get recorded audio frames
 
-        :return: list of frames
+        :return: frames buffer
         """
         return self.frames
 
@@ -418,8 +449,9 @@ class NativeBackend(QObject):
         # Convert QByteArray to bytes
         data_bytes = data.data()
 
-        # Append raw data to frames list for saving
-        self.frames.append(data_bytes)
+        # Append raw data to frames buffer for saving (not needed when segmented by VAD)
+        if self.segmenter is None:
+            self.frames.append(data_bytes)
 
         # Determine the correct dtype and normalization factor
         sample_format = self.actual_audio_format.sampleFormat()
@@ -458,10 +490,15 @@ class NativeBackend(QObject):
             self._emit_rt_input_delta(s16, final=False)
         except Exception:
             # avoid interrupting UI/recording on conversion issues
+            s16 = None
             self._emit_rt_input_delta(data_bytes, final=False)
 
-        # Handle loop recording
-        if self.loop and self.stop_callback is not None:
+        # Handle loop recording: split on speech pauses (VAD) or every stop_interval
+        if self.segmenter is not None:
+            if s16:
+                for segment in self.segmenter.feed(s16):
+                    self._emit_segment(segment)
+        elif self.loop and self.stop_callback is not None:
             stop_interval = int(self.window.core.config.get('audio.input.stop_interval', 10))
             current_time = time.time()
             time_elapsed = current_time - self.start_time
@@ -470,6 +507,20 @@ class NativeBackend(QObject):
                 self.start_time = current_time
                 QTimer.singleShot(0, self.stop_callback)  # required QTimer to prevent crash!!!
 
+    def _emit_segment(self, segment: bytes):
+        """
+        Emit speech segment to segment callback (in main thread)
+
+        :param segment: PCM16 data
+        """
+        if not segment or self.segment_callback is None:
+            return
+        fmt = self.actual_audio_format
+        rate = fmt.sampleRate()
+        channels = fmt.channelCount()
+        callback = self.segment_callback
+        QTimer.singleShot(0, lambda: callback(segment, rate, channels))
+
     def update_audio_level(self, level: int):
         """
         Update the audio level bar
@@ -492,7 +543,7 @@ class NativeBackend(QObject):
         frame_rate = self.actual_audio_format.sampleRate()
         sample_format = self.actual_audio_format.sampleFormat()
 
-        raw = b''.join(self.frames)
+        raw = self.frames.get_bytes()
 
         if sample_format == QAudioFormat.SampleFormat.Int16:
             out_bytes = raw
@@ -797,6 +848,7 @@ class NativeBackend(QObject):
                 pass
             self._rt_session = None
 
+        self._rt_converter = None  # new stream, reset converter state
         session = RealtimeSession(
             device=device,
             fmt=fmt,
@@ -826,6 +878,8 @@ class NativeBackend(QObject):
         - converts channels (mono<->stereo) and sample rate,
         - keeps Int16; if device uses UInt8/Float, adapts sample width and bias.
 
+        Converter state is kept between chunks of the same stream (continuous resampling).
+
         :param data: Input PCM data (assumed S16LE)
         :param in_rate: Input sample rate
         :param in_channels: Input number of channels
@@ -849,6 +903,11 @@ class NativeBackend(QObject):
             else:
                 flag = "s16"
 
+            converter = self._rt_converter
+            if converter is None or not converter.matches(in_rate, in_channels, out_rate, out_ch, out_sw, flag):
+                converter = PCMConverter(in_rate, in_channels, out_rate, out_ch, out_sw, flag)
+                self._rt_converter = converter
+
             return convert_s16_pcm(
                 data,
                 in_rate=in_rate,
@@ -856,13 +915,15 @@ class NativeBackend(QObject):
                 out_rate=out_rate,
                 out_channels=out_ch,
                 out_width=out_sw,
-                out_format=flag
+                out_format=flag,
+                converter=converter
             )
         except Exception:
             return data
 
     def stop_realtime(self):
         """Stop realtime audio playback session (simple/friendly)."""
+        self._rt_converter = None
         s = self._rt_session
         if s is not None:
             try:
@@ -930,6 +991,7 @@ class NativeBackend(QObject):
 
             if final:
                 session.mark_final()
+                self._rt_converter = None
 
         except Exception as e:
             try:
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.31 04:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from typing import List, Tuple, Optional
@@ -24,6 +24,10 @@ from .playback import _FilePlaybackThread
 from ..shared import (
     pyaudio_to_s16le,
     convert_s16_pcm,
+    PCMConverter,
+    FrameBuffer,
+    create_segmenter,
+    get_buffer_size,
     build_rt_input_delta_event,
     build_output_volume_event,
 )
@@ -40,9 +44,11 @@ class PyaudioBackend:
         """
         self.window = window
         self.path = None
-        self.frames = []
+        self.frames = FrameBuffer()
         self.loop = False
         self.stop_callback = None
+        self.segment_callback = None
+        self.segmenter = None  # VAD segmenter (continuous mode)
         self.start_time = 0
         self.initialized = False
         self.pyaudio_instance = None
@@ -66,6 +72,7 @@ class PyaudioBackend:
         # realtime members (compatible with native backend)
         self._rt_session: Optional[RealtimeSessionPyAudio] = None
         self._rt_signals = None  # set by set_rt_signals()
+        self._rt_converter: Optional[PCMConverter] = None  # stream converter, kept between chunks
 
         # input state guard (prevents races on stop)
         self._input_active = False
@@ -114,6 +121,17 @@ class PyaudioBackend:
         """
         self.loop = loop
 
+    def set_segment_callback(self, callback):
+        """
+        Set callback to be called with speech segments on loop recording (VAD).
+
+        :param callback: function to call with (data, rate, channels), PCM16 data
+        """
+        if callable(callback):
+            self.segment_callback = callback
+        else:
+            raise ValueError("Callback must be a callable function")
+
     def set_path(self, path: str):
         """
         Set audio input file path.
@@ -129,13 +147,18 @@ class PyaudioBackend:
         :return: True if started
         """
         self.init()
-        self.frames = []
+        self.frames.clear()
         self.prepare_device()
         if self.selected_device is None:
             print("No audio input device selected")
             return False
         if self.stream is not None:
             return False
+        width = self.pyaudio_instance.get_sample_size(self.format)
+        self.frames = FrameBuffer(get_buffer_size(self.window, self.rate * self.channels * width, self.loop))
+        self.segmenter = None
+        if self.loop and self.segment_callback is not None:
+            self.segmenter = create_segmenter(self.window, self.rate, self.channels)
         self.setup_audio_input()
         self.start_time = time.time()
         return True
@@ -167,7 +190,12 @@ class PyaudioBackend:
             except Exception:
                 pass
 
-            if self.frames:
+            # emit last speech segment (VAD), segments are not saved to file
+            if self.segmenter is not None:
+                self._emit_segment(self.segmenter.flush())
+                self.segmenter = None
+                self.frames.clear()
+            elif self.frames:
                 if self.path:
                     try:
                         self.save_audio_file(self.path)
@@ -320,8 +348,10 @@ class PyaudioBackend:
         if not self._input_active:
             return None, pyaudio.paComplete
 
-        # Append raw data to the frames list for saving
-        self.frames.append(in_data)
+        # Append raw data to the frames buffer for saving (not needed when segmented by VAD)
+        segmenter = self.segmenter
+        if segmenter is None:
+            self.frames.append(in_data)
 
         # Compute input metering
         dtype = self.get_dtype_from_format(self.format)
@@ -349,10 +379,15 @@ class PyaudioBackend:
             self._emit_rt_input_delta(s16, final=False)
         except Exception:
             # fallback: emit raw buffer
+            s16 = None
             self._emit_rt_input_delta(in_data or b"", final=False)
 
-        # Handle loop recording if enabled.
-        if self.loop and self.stop_callback is not None and self._input_active:
+        # Handle loop recording if enabled: split on speech pauses (VAD) or every stop_interval.
+        if segmenter is not None:
+            if s16:
+                for segment in segmenter.feed(s16):
+                    self._emit_segment(segment)
+        elif self.loop and self.stop_callback is not None and self._input_active:
             stop_interval = int(self.window.core.config.get('audio.input.stop_interval', 10)) \
                 if self.window and hasattr(self.window, "core") else 10
             current_time = time.time()
@@ -362,6 +397,19 @@ class PyaudioBackend:
 
         return None, pyaudio.paContinue
 
+    def _emit_segment(self, segment: bytes):
+        """
+        Emit speech segment to segment callback (in main thread).
+
+        :param segment: PCM16 data
+        """
+        if not segment or self.segment_callback is None:
+            return
+        rate = self.rate
+        channels = self.channels
+        callback = self.segment_callback
+        QTimer.singleShot(0, lambda: callback(segment, rate, channels))
+
     def update_audio_level(self, level: int):
         """
         Update the audio level bar.
@@ -381,7 +429,7 @@ class PyaudioBackend:
             wf.setnchannels(self.channels)
             wf.setsampwidth(sample_width)
             wf.setframerate(self.rate)
-            wf.writeframes(b''.join(self.frames))
+            wf.writeframes(self.frames.get_bytes())
 
     def get_dtype_from_format(self, fmt):
         """
@@ -780,6 +828,7 @@ class PyaudioBackend:
                 pass
             self._rt_session = None
 
+        self._rt_converter = None  # new stream, reset converter state
         session = RealtimeSessionPyAudio(
             device_index=dev_idx,
             rate=out_rate,
@@ -807,6 +856,7 @@ class PyaudioBackend:
     ) -> bytes:
         """
         Convert raw S16LE PCM to target (rate, channels, width).
+        Converter state is kept between chunks of the same stream (continuous resampling).
 
         :param data: input PCM bytes
         :param in_rate: input sample rate
@@ -816,6 +866,10 @@ class PyaudioBackend:
         :param out_width: output sample width in bytes (1, 2, or 4)
         :return: converted PCM bytes
         """
+        converter = self._rt_converter
+        if converter is None or not converter.matches(in_rate, in_channels, out_rate, out_channels, out_width):
+            converter = PCMConverter(in_rate, in_channels, out_rate, out_channels, out_width)
+            self._rt_converter = converter
         return convert_s16_pcm(
             data,
             in_rate=in_rate,
@@ -823,11 +877,13 @@ class PyaudioBackend:
             out_rate=out_rate,
             out_channels=out_channels,
             out_width=out_width,
-            out_format="s16"
+            out_format="s16",
+            converter=converter
         )
 
     def stop_realtime(self):
         """Stop realtime audio playback session."""
+        self._rt_converter = None
         s = self._rt_session
         if s is not None:
             try:
@@ -875,6 +931,7 @@ class PyaudioBackend:
 
             if final:
                 session.mark_final()
+                self._rt_converter = None
 
         except Exception as e:
             try:
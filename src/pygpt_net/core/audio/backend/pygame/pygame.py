@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.31 04:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import time
@@ -18,7 +18,13 @@ from threading import Lock
 
 from PySide6.QtCore import QTimer
 
-from ..shared import f32_to_s16le, build_rt_input_delta_event
+from ..shared import (
+    PCMConverter,
+    FrameBuffer,
+    create_segmenter,
+    get_buffer_size,
+    build_rt_input_delta_event,
+)
 
 class PygameBackend:
     MIN_FRAMES = 25  # minimum frames to start transcription
@@ -32,9 +38,12 @@ class PygameBackend:
         """
         self.window = window
         self.path = None
-        self.frames = []      # List to store captured audio chunks (bytes)
+        self.frames = FrameBuffer()  # captured audio chunks (bytes)
+        self.last_chunk = None  # last captured chunk (level meter)
         self.loop = False
         self.stop_callback = None
+        self.segment_callback = None
+        self.segmenter = None  # VAD segmenter (continuous mode)
         self.start_time = 0
         self.playback_sound = None
 
@@ -66,6 +75,7 @@ class PygameBackend:
         self._rt_signals = None           # set with set_rt_signals()
         self._rt_queue = deque()          # queue of raw float32 chunks from SDL audio thread
         self._rt_lock = Lock()            # protects _rt_queue
+        self._rt_converter = None         # float32 -> PCM16 stream converter (reused buffers)
         self._is_recording = False        # suppress updates after stop
 
     def init(self):
@@ -113,6 +123,17 @@ class PygameBackend:
         """
         self.loop = loop
 
+    def set_segment_callback(self, callback):
+        """
+        Set a callback to be called with speech segments on loop recording (VAD).
+
+        :param callback: Function to call with (data, rate, channels), PCM16 data.
+        """
+        if callable(callback):
+            self.segment_callback = callback
+        else:
+            raise ValueError("Callback must be a callable function")
+
     def set_path(self, path: str):
         """
         Set a file path where the recorded audio will be saved.
@@ -137,8 +158,13 @@ class PygameBackend:
         :return: True if started
         """
         self.init()
-        # Clear previously recorded frames.
-        self.frames = []
+        # Clear previously recorded frames (float32 samples, bounded buffer).
+        self.frames = FrameBuffer(get_buffer_size(self.window, self.rate * self.channels * 4, self.loop))
+        self.last_chunk = None
+        self._rt_converter = None
+        self.segmenter = None
+        if self.loop and self.segment_callback is not None:
+            self.segmenter = create_segmenter(self.window, self.rate, self.channels)
 
         # Prepare the selected device (based on config or default).
         self.prepare_device()
@@ -185,11 +211,17 @@ class PygameBackend:
 
             # Emit final input chunk marker for realtime consumers
             try:
+                self._drain_rt_queue()
                 self._emit_rt_input_delta(b"", final=True)
             except Exception:
                 pass
 
-            if self.frames:
+            # Emit last speech segment (VAD), segments are not saved to file
+            if self.segmenter is not None:
+                self._emit_segment(self.segmenter.flush())
+                self.segmenter = None
+                self.frames.clear()
+            elif self.frames:
                 if self.path:
                     self.save_audio_file(self.path)
                     result = True
@@ -306,9 +338,11 @@ class PygameBackend:
         if not self._is_recording:
             return
 
-        # Append captured audio bytes to the frames list.
+        # Append captured audio bytes to the frames buffer (not needed when segmented by VAD).
         chunk = bytes(audiomemoryview)
-        self.frames.append(chunk)
+        self.last_chunk = chunk
+        if self.segmenter is None:
+            self.frames.append(chunk)
 
         # Enqueue chunk for realtime emission (processed on the Qt thread).
         try:
@@ -352,11 +386,10 @@ class PygameBackend:
         # Drain realtime queue first to keep latency low.
         self._drain_rt_queue()
 
-        if not self.frames:
-            return
-
         # Use the last captured chunk.
-        last_chunk = self.frames[-1]
+        last_chunk = self.last_chunk
+        if not last_chunk:
+            return
         try:
             # Interpret the bytes as float32 samples.
             samples = np.frombuffer(last_chunk, dtype=np.float32)
@@ -374,8 +407,8 @@ class PygameBackend:
 
         QTimer.singleShot(0, lambda: self.window.controller.audio.ui.on_input_volume_change(level_percent, self.mode))
 
-        # Handle loop recording if enabled.
-        if self.loop and self.stop_callback is not None:
+        # Handle loop recording if enabled (segmented by VAD in _drain_rt_queue).
+        if self.loop and self.stop_callback is not None and self.segmenter is None:
             stop_interval = (int(self.window.core.config.get('audio.input.stop_interval', 10))
                              if (self.window and hasattr(self.window, "core")) else 10)
             current_time = time.time()
@@ -391,7 +424,7 @@ class PygameBackend:
 
         :param filename: The path to the output WAV file.
         """
-        full_data = b"".join(self.frames)
+        full_data = self.frames.get_bytes()
         try:
             data_array = np.frombuffer(full_data, dtype=np.float32)
         except Exception as e:
@@ -592,20 +625,40 @@ class PygameBackend:
     def _drain_rt_queue(self) -> None:
         """
         Drain queued float32 chunks from the audio thread, convert to PCM16,
-        and emit a single realtime delta event.
+        emit a single realtime delta event and feed the VAD segmenter.
         """
-        if not self._rt_signals:
-            # nothing to emit
-            with self._rt_lock:
-                self._rt_queue.clear()
-            return
-
         with self._rt_lock:
             if not self._rt_queue:
                 return
             raw = b"".join(self._rt_queue)
             self._rt_queue.clear()
 
-        s16 = f32_to_s16le(raw)
+        if not self._rt_signals and self.segmenter is None:
+            return  # nothing to emit
+
+        converter = self._rt_converter
+        if converter is None:
+            converter = PCMConverter(
+                self.rate, self.channels, self.rate, self.channels, in_format="f32"
+            )
+            self._rt_converter = converter
+        s16 = converter.convert(raw)
         if s16:
-            self._emit_rt_input_delta(s16, final=False)
\ No newline at end of file
+            if self._rt_signals:
+                self._emit_rt_input_delta(s16, final=False)
+            if self.segmenter is not None:
+                for segment in self.segmenter.feed(s16):
+                    self._emit_segment(segment)
+
+    def _emit_segment(self, segment: bytes) -> None:
+        """
+        Emit speech segment to segment callback (in main thread).
+
+        :param segment: PCM16 data
+        """
+        if not segment or self.segment_callback is None:
+            return
+        rate = self.rate
+        channels = self.channels
+        callback = self.segment_callback
+        QTimer.singleShot(0, lambda: callback(segment, rate, channels))
\ No newline at end of file
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.31 23:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 # Shared helpers for audio backends
@@ -21,7 +21,16 @@ from .conversions import (
     qaudio_to_s16le,
     pyaudio_to_s16le,
     f32_to_s16le,
+    lin_to_s16le,
+    s16le_to_wav,
     convert_s16_pcm,
+    PCMConverter,
+)
+from .segmenter import (
+    FrameBuffer,
+    VadSegmenter,
+    create_segmenter,
+    get_buffer_size,
 )
 from .envelope import compute_envelope_from_file
 
@@ -33,6 +42,13 @@ __all__ = [
     "qaudio_to_s16le",
     "pyaudio_to_s16le",
     "f32_to_s16le",
+    "lin_to_s16le",
+    "s16le_to_wav",
     "convert_s16_pcm",
+    "PCMConverter",
+    "FrameBuffer",
+    "VadSegmenter",
+    "create_segmenter",
+    "get_buffer_size",
     "compute_envelope_from_file",
 ]
\ No newline at end of file
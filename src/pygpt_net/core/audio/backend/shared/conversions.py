@@ -6,11 +6,14 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.31 23:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
+import io
+import wave
+from typing import Dict, Optional
+
 import numpy as np
-import audioop
 
 def qaudio_dtype(sample_format):
     """
@@ -128,7 +131,7 @@ def pyaudio_to_s16le(raw: bytes, fmt, pa_instance=None) -> bytes:
         else:
             try:
                 sw = pa_instance.get_sample_size(fmt) if pa_instance is not None else 2
-                return audioop.lin2lin(raw, sw, 2)
+                return lin_to_s16le(raw, sw)
             except Exception:
                 return raw
     except Exception:
@@ -151,6 +154,247 @@ def f32_to_s16le(raw: bytes) -> bytes:
     except Exception:
         return b""
 
+def lin_to_s16le(raw: bytes, width: int) -> bytes:
+    """
+    Convert signed little-endian PCM of given sample width to PCM16 little-endian.
+
+    :param raw: input byte buffer
+    :param width: input sample width in bytes (1, 2, 3 or 4)
+    :return: converted byte buffer in PCM16 little-endian
+    """
+    if not raw or width == 2:
+        return raw
+    n = len(raw) // width
+    if width == 1:
+        arr = np.frombuffer(raw, dtype=np.int8, count=n).astype(np.int16) << 8
+    elif width == 3:
+        b = np.frombuffer(raw, dtype=np.uint8, count=n * 3).reshape(-1, 3)
+        arr = (b[:, 1].astype(np.uint16) | (b[:, 2].astype(np.uint16) << 8)).view(np.int16)
+    elif width == 4:
+        arr = (np.frombuffer(raw, dtype="<i4", count=n) >> 16).astype(np.int16)
+    else:
+        raise ValueError("Unsupported sample width: {}".format(width))
+    return arr.astype("<i2", copy=False).tobytes()
+
+
+def s16le_to_wav(data: bytes, rate: int, channels: int = 1) -> bytes:
+    """
+    Wrap PCM16 little-endian data in WAV container (in memory).
+
+    :param data: PCM16 data
+    :param rate: sample rate
+    :param channels: number of channels
+    :return: WAV file bytes
+    """
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wf:
+        wf.setnchannels(int(channels))
+        wf.setsampwidth(2)
+        wf.setframerate(int(rate))
+        wf.writeframes(data)
+    return buf.getvalue()
+
+
+class PCMConverter:
+    def __init__(
+            self,
+            in_rate: int,
+            in_channels: int,
+            out_rate: int,
+            out_channels: int,
+            out_width: int = 2,
+            out_format: str = "s16",
+            in_format: str = "s16"
+    ):
+        """
+        Streaming PCM converter (channel mixing, resampling, sample format)
+
+        Keeps state between chunks: incomplete input frames and resampler phase with
+        the last input frame, so a stream converted in chunks is continuous at chunk
+        boundaries. Work buffers are preallocated and reused. Use one instance per stream.
+
+        :param in_rate: input sample rate
+        :param in_channels: input channel count
+        :param out_rate: output sample rate
+        :param out_channels: output channel count
+        :param out_width: output sample width in bytes (1, 2, or 4)
+        :param out_format: output format ("s16", "u8", or "f32")
+        :param in_format: input format ("s16": S16LE, "f32": float32 LE)
+        """
+        if in_rate <= 0 or out_rate <= 0 or in_channels <= 0 or out_channels <= 0:
+            raise ValueError("Invalid PCM format")
+        self.in_rate = int(in_rate)
+        self.in_channels = int(in_channels)
+        self.out_rate = int(out_rate)
+        self.out_channels = int(out_channels)
+        self.out_width = int(out_width)
+        self.out_format = out_format
+        self.in_format = in_format
+        self.in_width = 4 if in_format == "f32" else 2
+        self.step = self.in_rate / self.out_rate  # input frames per output frame
+        self.work_channels = self.in_channels if self.in_channels == self.out_channels else 1
+        self.buffers: Dict[str, np.ndarray] = {}
+        self.tail = b""  # incomplete input frame
+        self.prev: Optional[np.ndarray] = None  # last input frame (resampler state)
+        self.pos = 0.0  # resampler phase, relative to prev frame
+
+    def matches(
+            self,
+            in_rate: int,
+            in_channels: int,
+            out_rate: int,
+            out_channels: int,
+            out_width: int = 2,
+            out_format: str = "s16",
+            in_format: str = "s16"
+    ) -> bool:
+        """
+        Check if converter is configured for given formats
+
+        :return: True if formats match
+        """
+        return (self.in_rate, self.in_channels, self.out_rate, self.out_channels,
+                self.out_width, self.out_format, self.in_format) == \
+            (int(in_rate), int(in_channels), int(out_rate), int(out_channels),
+             int(out_width), out_format, in_format)
+
+    def reset(self):
+        """Reset stream state (start of new stream)"""
+        self.tail = b""
+        self.prev = None
+        self.pos = 0.0
+
+    def buffer(self, name: str, rows: int, cols: int, dtype) -> np.ndarray:
+        """
+        Get preallocated work buffer (grown when needed)
+
+        :param name: buffer name
+        :param rows: number of rows
+        :param cols: number of columns
+        :param dtype: numpy dtype
+        :return: buffer view of shape (rows, cols)
+        """
+        size = rows * cols
+        buf = self.buffers.get(name)
+        if buf is None or buf.size < size:
+            buf = np.empty(max(size, 4096), dtype=dtype)
+            self.buffers[name] = buf
+        return buf[:size].reshape(rows, cols)
+
+    def convert(self, data: bytes) -> bytes:
+        """
+        Convert next chunk of stream
+
+        :param data: input chunk
+        :return: converted chunk
+        """
+        if self.tail:
+            data = self.tail + data
+            self.tail = b""
+        if not data:
+            return b""
+        frame = self.in_width * self.in_channels
+        usable = len(data) - len(data) % frame
+        if usable < len(data):
+            self.tail = bytes(data[usable:])
+        n = usable // frame
+        if n == 0:
+            return b""
+
+        # input -> float32 frames in int16 scale, mixed to work channels
+        src = np.frombuffer(data, dtype="<f4" if self.in_format == "f32" else "<i2", count=n * self.in_channels)
+        src = src.reshape(n, self.in_channels)
+        x = self.buffer("in", n, self.work_channels, np.float32)
+        if self.work_channels == self.in_channels:
+            np.copyto(x, src, casting="unsafe")
+        else:
+            np.mean(src, axis=1, keepdims=True, dtype=np.float32, out=x)
+        if self.in_format == "f32":
+            np.clip(x, -1.0, 1.0, out=x)
+            x *= 32767.0
+
+        if self.in_rate != self.out_rate:
+            x = self.resample(x)
+            if x is None:
+                return b""
+        return self.encode(x)
+
+    def resample(self, x: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Linear interpolation resampling with phase kept between chunks
+
+        :param x: input frames (n, channels)
+        :return: output frames or None if no output frame is due
+        """
+        n, ch = x.shape
+        if self.prev is None:
+            self.prev = x[0].copy()
+            self.pos = 0.0
+
+        # ext[0] is the last frame of previous chunk, ext[1:] is the current chunk
+        ext = self.buffer("ext", n + 1, ch, np.float32)
+        ext[0] = self.prev
+        ext[1:] = x
+        self.prev = x[-1].copy()
+
+        count = int(np.ceil((n - self.pos) / self.step)) if n > self.pos else 0
+        pos = self.pos
+        self.pos = pos + count * self.step - n
+        if count <= 0:
+            return None
+
+        ramp = self.ramp(max(count, n + 1))
+        t = self.buffer("t", count, 1, np.float64)[:, 0]
+        np.multiply(ramp[:count], self.step, out=t)
+        t += pos
+        np.minimum(t, n, out=t)
+        y = self.buffer("res", count, ch, np.float32)
+        for c in range(ch):
+            y[:, c] = np.interp(t, ramp[:n + 1], ext[:, c])
+        return y
+
+    def ramp(self, size: int) -> np.ndarray:
+        """
+        Get cached ramp (0, 1, 2, ...) of at least given size
+
+        :param size: min size
+        :return: ramp array
+        """
+        ramp = self.buffers.get("ramp")
+        if ramp is None or ramp.size < size:
+            ramp = np.arange(max(size, 4096), dtype=np.float64)
+            self.buffers["ramp"] = ramp
+        return ramp
+
+    def encode(self, x: np.ndarray) -> bytes:
+        """
+        Encode float frames (int16 scale) to output format
+
+        :param x: frames (n, work channels)
+        :return: output bytes
+        """
+        n = x.shape[0]
+        if self.out_format == "f32" and self.out_width == 4:
+            out = self.buffer("out_f32", n, self.out_channels, np.float32)
+            x *= 1.0 / 32768.0
+            np.copyto(out, x)  # broadcasts mono to all output channels
+            return out.astype("<f4", copy=False).tobytes()
+
+        np.clip(x, -32768.0, 32767.0, out=x)
+        s16 = self.buffer("out_s16", n, self.out_channels, np.int16)
+        np.copyto(s16, x, casting="unsafe")  # broadcasts mono to all output channels
+        if self.out_width == 2:
+            return s16.astype("<i2", copy=False).tobytes()
+        if self.out_width == 1:
+            s8 = (s16 >> 8).astype(np.int8)
+            if self.out_format == "u8":
+                return (s8.view(np.uint8) ^ 0x80).tobytes()  # center at 0x80
+            return s8.tobytes()
+        if self.out_width == 4:
+            return (s16.astype("<i4") << 16).tobytes()
+        raise ValueError("Unsupported sample width: {}".format(self.out_width))
+
+
 def convert_s16_pcm(
     data: bytes,
     in_rate: int,
@@ -158,7 +402,8 @@ def convert_s16_pcm(
     out_rate: int,
     out_channels: int,
     out_width: int = 2,
-    out_format: str = "s16"  # "s16" | "u8" | "f32"
+    out_format: str = "s16",  # "s16" | "u8" | "f32"
+    converter: Optional[PCMConverter] = None
 ) -> bytes:
     """
     Minimal PCM converter to target format:
@@ -167,6 +412,8 @@ def convert_s16_pcm(
     - converts width if needed,
     - applies bias for u8 or float conversion if requested.
 
+    Pass a converter instance (see PCMConverter) to keep resampler state between chunks of a stream.
+
     :param data: input byte buffer in S16LE
     :param in_rate: input sample rate
     :param in_channels: input channel count
@@ -174,38 +421,14 @@ def convert_s16_pcm(
     :param out_channels: output channel count
     :param out_width: output sample width in bytes (1, 2, or 4)
     :param out_format: output format ("s16", "u8", or "f32")
+    :param converter: stream converter (optional)
     :return: converted byte buffer
     """
     if not data:
         return b""
     try:
-        src = data
-
-        # channels
-        if in_channels != out_channels:
-            if in_channels == 2 and out_channels == 1:
-                src = audioop.tomono(src, 2, 0.5, 0.5)
-            elif in_channels == 1 and out_channels == 2:
-                src = audioop.tostereo(src, 2, 1.0, 1.0)
-            else:
-                mid = audioop.tomono(src, 2, 0.5, 0.5) if in_channels > 1 else src
-                src = audioop.tostereo(mid, 2, 1.0, 1.0) if out_channels == 2 else mid
-
-        # sample rate
-        if in_rate != out_rate:
-            src, _ = audioop.ratecv(src, 2, out_channels, in_rate, out_rate, None)
-
-        # sample width (Int16 -> other widths if needed)
-        if out_width != 2:
-            src = audioop.lin2lin(src, 2, out_width)
-
-        # sample format nuances
-        if out_format == "u8" and out_width == 1:
-            src = audioop.bias(src, 1, 128)  # center at 0x80
-        elif out_format == "f32" and out_width == 4:
-            arr = np.frombuffer(src, dtype=np.int16).astype(np.float32) / 32768.0
-            src = arr.tobytes()
-
-        return src
+        if converter is None:
+            converter = PCMConverter(in_rate, in_channels, out_rate, out_channels, out_width, out_format)
+        return converter.convert(data)
     except Exception:
-        return data
\ No newline at end of file
+        return data
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 12:00:00                  #
+# ================================================== #
+
+import math
+from collections import deque
+from typing import List, Optional
+
+import numpy as np
+
+
+class FrameBuffer:
+    def __init__(self, max_bytes: int = 0):
+        """
+        Bounded buffer of captured audio chunks (oldest chunks are dropped when full)
+
+        :param max_bytes: max buffered bytes (0 = unlimited)
+        """
+        self.max_bytes = max(0, int(max_bytes))
+        self.chunks = deque()
+        self.size = 0
+        self.dropped = 0  # dropped bytes
+
+    def append(self, chunk: bytes):
+        """
+        Append chunk
+
+        :param chunk: audio data
+        """
+        if not chunk:
+            return
+        self.chunks.append(chunk)
+        self.size += len(chunk)
+        while self.max_bytes and self.size > self.max_bytes and len(self.chunks) > 1:
+            old = self.chunks.popleft()
+            self.size -= len(old)
+            self.dropped += len(old)
+
+    def clear(self):
+        """Clear buffer"""
+        self.chunks.clear()
+        self.size = 0
+        self.dropped = 0
+
+    def get_bytes(self) -> bytes:
+        """
+        Get buffered data
+
+        :return: joined chunks
+        """
+        return b"".join(self.chunks)
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+    def __iter__(self):
+        return iter(self.chunks)
+
+    def __getitem__(self, index: int) -> bytes:
+        return self.chunks[index]
+
+
+class VadSegmenter:
+    FRAME_MS = 20  # analysis frame
+    MIN_SPEECH_MS = 250  # shorter segments are dropped (clicks, noise bursts)
+    NOISE_RATIO = 3.0  # speech must be ~10 dB above noise floor
+    NOISE_RISE = 0.02  # noise floor rise per frame (fraction of the gap)
+
+    def __init__(
+            self,
+            rate: int,
+            channels: int = 1,
+            threshold_db: float = -45.0,
+            silence_ms: int = 800,
+            prefix_ms: int = 300,
+            max_segment_s: float = 30.0
+    ):
+        """
+        Energy-based voice activity segmenter for PCM16 streams
+
+        Feed captured PCM16 chunks, get complete utterances back. A segment starts
+        on the first speech frame (with prefix_ms of audio before it), ends after
+        silence_ms of silence and is cut at max_segment_s. Silence is never returned.
+        Speech level threshold adapts to the background noise floor.
+
+        :param rate: sample rate
+        :param channels: number of channels
+        :param threshold_db: min speech level (dBFS)
+        :param silence_ms: silence that ends segment (ms)
+        :param prefix_ms: audio kept before speech start (ms)
+        :param max_segment_s: max segment length (seconds)
+        """
+        self.rate = int(rate)
+        self.channels = max(1, int(channels))
+        self.threshold = 32768.0 * math.pow(10.0, float(threshold_db) / 20.0)
+        self.frame_bytes = max(1, self.rate * self.FRAME_MS // 1000) * self.channels * 2
+        self.silence_frames = max(1, int(silence_ms) // self.FRAME_MS)
+        self.min_speech_frames = max(1, self.MIN_SPEECH_MS // self.FRAME_MS)
+        self.max_frames = max(1, int(float(max_segment_s) * 1000) // self.FRAME_MS)
+        self.prefix_frames = max(0, int(prefix_ms) // self.FRAME_MS)
+        self.prefix = deque(maxlen=self.prefix_frames)
+        self.pending = bytearray()
+        self.segment: Optional[bytearray] = None
+        self.segment_frames = 0
+        self.speech_frames = 0
+        self.silent_frames = 0
+        self.continued = False  # segment continues utterance cut at max length
+        self.noise: Optional[float] = None
+
+    def reset(self):
+        """Reset state"""
+        self.pending = bytearray()
+        self.prefix.clear()
+        self.segment = None
+        self.segment_frames = 0
+        self.speech_frames = 0
+        self.silent_frames = 0
+        self.continued = False
+        self.noise = None
+
+    def is_speaking(self) -> bool:
+        """
+        Check if segment is in progress
+
+        :return: True if speech segment is open
+        """
+        return self.segment is not None
+
+    def level(self, frame: bytes) -> float:
+        """
+        Get RMS level of frame
+
+        :param frame: PCM16 frame
+        :return: RMS (int16 scale)
+        """
+        samples = np.frombuffer(frame, dtype="<i2").astype(np.float32)
+        return float(np.sqrt(np.mean(samples * samples))) if samples.size else 0.0
+
+    def is_speech(self, rms: float) -> bool:
+        """
+        Classify frame and update noise floor (fast fall, slow rise)
+
+        :param rms: frame RMS
+        :return: True if speech
+        """
+        if self.noise is None:
+            self.noise = self.threshold / self.NOISE_RATIO  # until measured, assume floor below threshold
+        speech = rms >= self.threshold and rms >= self.noise * self.NOISE_RATIO
+        if rms < self.noise:
+            self.noise = rms
+        else:
+            # slower rise during speech, so constant loud noise is also adapted to
+            self.noise += (rms - self.noise) * (self.NOISE_RISE if not speech else self.NOISE_RISE / 10)
+        return speech
+
+    def feed(self, data: bytes) -> List[bytes]:
+        """
+        Feed PCM16 data
+
+        :param data: PCM16 data (interleaved channels)
+        :return: completed speech segments
+        """
+        segments = []
+        if not data:
+            return segments
+        self.pending += data
+        size = self.frame_bytes
+        offset = 0
+        while len(self.pending) - offset >= size:
+            frame = bytes(self.pending[offset:offset + size])
+            offset += size
+            segment = self.process(frame)
+            if segment is not None:
+                segments.append(segment)
+        del self.pending[:offset]
+        return segments
+
+    def process(self, frame: bytes) -> Optional[bytes]:
+        """
+        Process single frame
+
+        :param frame: PCM16 frame
+        :return: completed segment or None
+        """
+        speech = self.is_speech(self.level(frame))
+        if self.segment is None:
+            if not speech:
+                self.prefix.append(frame)
+                return None
+            self.segment = bytearray(b"".join(self.prefix))
+            self.prefix.clear()
+            self.segment_frames = 0
+            self.speech_frames = 0
+            self.silent_frames = 0
+
+        self.segment += frame
+        self.segment_frames += 1
+        if speech:
+            self.speech_frames += 1
+            self.silent_frames = 0
+        else:
+            self.silent_frames += 1
+
+        if self.silent_frames >= self.silence_frames:
+            trim = (self.silent_frames - self.prefix_frames) * self.frame_bytes
+            if trim > 0:
+                del self.segment[-trim:]  # keep trailing silence as long as prefix
+            return self.close()
+        if self.segment_frames >= self.max_frames:
+            segment = self.close()
+            if speech:
+                self.segment = bytearray()  # utterance continues
+                self.continued = True
+            return segment
+        return None
+
+    def close(self) -> Optional[bytes]:
+        """
+        Close current segment
+
+        :return: segment or None if too short
+        """
+        segment = self.segment
+        too_short = self.speech_frames < self.min_speech_frames and not self.continued
+        self.segment = None
+        self.segment_frames = 0
+        self.speech_frames = 0
+        self.silent_frames = 0
+        self.continued = False
+        if not segment or too_short:
+            return None
+        return bytes(segment)
+
+    def flush(self) -> Optional[bytes]:
+        """
+        Close stream and return last segment
+
+        :return: segment or None
+        """
+        if self.segment is not None and self.pending:
+            self.segment += self.pending
+        self.pending = bytearray()
+        self.prefix.clear()
+        return self.close()
+
+
+def create_segmenter(window, rate: int, channels: int) -> Optional[VadSegmenter]:
+    """
+    Create VAD segmenter for continuous recording if enabled in config
+
+    :param window: Window instance
+    :param rate: sample rate
+    :param channels: number of channels
+    :return: VadSegmenter or None if disabled
+    """
+    if window is None or not hasattr(window, "core"):
+        return None
+    config = window.core.config
+    if not config.get("audio.input.continuous.vad", True):
+        return None
+    return VadSegmenter(
+        rate=rate,
+        channels=channels,
+        threshold_db=float(config.get("audio.input.vad.threshold", -45)),
+        silence_ms=int(config.get("audio.input.vad.silence", 2000)),
+        prefix_ms=int(config.get("audio.input.vad.prefix", 300)),
+        max_segment_s=float(config.get("audio.input.vad.max_segment", 30)),
+    )
+
+
+def get_buffer_size(window, bytes_per_second: int, loop: bool = False) -> int:
+    """
+    Get max recording buffer size from config (limited only in loop recording)
+
+    :param window: Window instance
+    :param bytes_per_second: stream bytes per second
+    :param loop: loop (continuous) recording
+    :return: max bytes (0 = unlimited)
+    """
+    if not loop or window is None or not hasattr(window, "core"):
+        return 0  # normal recording is transcribed at once, beginning can't be dropped
+    seconds = int(window.core.config.get("audio.input.buffer", 600) or 0)
+    return max(0, seconds) * int(bytes_per_second)
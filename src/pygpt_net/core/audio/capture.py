@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.27 07:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from typing import List, Tuple
@@ -63,6 +63,14 @@ class Capture:
         """
         self.get_backend().set_repeat_callback(callback)
 
+    def set_segment_callback(self, callback):
+        """
+        Set callback to be called with speech segments on loop recording (VAD)
+
+        :param callback: function to call with (data, rate, channels), PCM16 data
+        """
+        self.get_backend().set_segment_callback(callback)
+
     def set_mode(self, mode: str):
         """
         Set input mode (input|control)
@@ -6,12 +6,10 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.04 00:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
-import time
 import weakref
-from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 
 from pygpt_net.core.types import (
@@ -36,7 +34,6 @@ class Bridge:
         :param window: Window instance
         """
         self.window = window
-        self.last_call = None  # last API call time, for throttling
         self.last_context = None  # last context
         self.last_context_quick = None  # last context for quick call
         self.sync_modes = (
@@ -129,7 +126,7 @@ class Bridge:
                 debug = {k: str(v) for k, v in context.to_dict().items()}
                 self.window.core.debug.debug(str(debug))
 
-        self.apply_rate_limit()  # apply RPM limit
+        delay = self.apply_rate_limit(context)  # reserve RPM/TPM limits
 
         if extra is None:
             extra = {}
@@ -143,13 +140,13 @@ class Bridge:
         # some modes must be called synchronously
         if mode in self.sync_modes or force_sync:
             self.window.core.debug.info("[bridge] Starting worker (sync)...")
+            self.window.core.limiter.wait(delay)
             worker.run()
             return True
 
-        # async call
+        # async call, delayed if rate limit reached
         self.window.core.debug.info("[bridge] Starting worker (async)...")
-        self.window.threadpool.start(worker)
-        self.worker = worker
+        self.start_worker(worker, delay)
         return True
 
     def request_next(
@@ -176,10 +173,27 @@ class Bridge:
         worker.mode = "loop_next"
 
         # async call
-        self.window.threadpool.start(worker)
-        self.worker = worker
+        self.start_worker(worker, self.apply_rate_limit(context))
         return True
 
+    def start_worker(self, worker: BridgeWorker, delay: float = 0):
+        """
+        Start worker, scheduled after delay if rate limit is reached
+
+        :param worker: BridgeWorker
+        :param delay: delay in seconds
+        """
+        self.worker = worker
+        if delay <= 0:
+            self.window.threadpool.start(worker)
+            return
+
+        def start():
+            if not self.window.controller.kernel.stopped():
+                self.window.threadpool.start(worker)
+
+        self.window.core.limiter.schedule(delay, start)
+
     def call(
             self,
             context: BridgeContext,
@@ -267,19 +281,21 @@ class Bridge:
         worker.rt_signals = self.window.controller.realtime.signals  # Realtime signals
         return worker
 
-    def apply_rate_limit(self):
-        """Apply API calls RPM limit"""
-        max_per_minute = 60
-        if self.window.core.config.has("max_requests_limit"):
-            max_per_minute = int(self.window.core.config.get("max_requests_limit")) # per minute
-        if max_per_minute <= 0:
-            return
-        interval = timedelta(minutes=1) / max_per_minute
-        now = datetime.now()
-        if self.last_call is not None:
-            time_since_last_call = now - self.last_call
-            if time_since_last_call < interval:
-                sleep_time = (interval - time_since_last_call).total_seconds()
-                self.window.core.debug.debug("RPM limit: sleep for {} seconds".format(sleep_time))
-                time.sleep(sleep_time)
-        self.last_call = now
+    def apply_rate_limit(self, context: BridgeContext) -> float:
+        """
+        Reserve API call in RPM and TPM limits of model provider
+
+        :param context: Bridge context
+        :return: delay in seconds before call can be made
+        """
+        provider = None
+        model_id = None
+        if context.model is not None:
+            provider = context.model.provider
+            model_id = context.model.id
+        limiter = self.window.core.limiter
+        texts = [context.prompt, context.system_prompt]
+        for item in context.history or []:
+            texts.append(getattr(item, "input", None))
+            texts.append(getattr(item, "output", None))
+        return limiter.reserve(provider, model_id, tokens=limiter.estimate_tokens(*texts))
@@ -6,11 +6,12 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.04 00:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from PySide6.QtCore import QObject, Signal, QRunnable, Slot
 
+from pygpt_net.core.executor import LANE_INTERACTIVE
 from pygpt_net.core.types import (
     MODE_AGENT_LLAMA,
     MODE_AGENT_OPENAI,
@@ -30,6 +31,7 @@ class BridgeSignals(QObject):
 
 class BridgeWorker(QRunnable):
     __slots__ = ('signals', 'rt_signals', 'args', 'kwargs', 'window', 'context', 'extra', 'mode')
+    lane = LANE_INTERACTIVE  # executor lane
 
     """Bridge worker"""
     def __init__(self, *args, **kwargs):
@@ -215,7 +217,14 @@ class BridgeWorker(QRunnable):
             return
         if not self.window.controller.chat.attachment.has_context(ctx.meta):
             return
-        ad_context = self.window.controller.chat.attachment.get_context(ctx, self.context.history)
+        budget = self.window.core.attachments.context.get_token_budget(
+            self.context.model,
+            self.context.system_prompt,
+            self.context.prompt,
+            history=[item for item in self.context.history or [] if item is not ctx],
+            mode=self.mode,
+        )
+        ad_context = self.window.controller.chat.attachment.get_context(ctx, self.context.history, budget)
         ad_mode = self.window.controller.chat.attachment.get_mode()
         if ad_context:
             self.context.prompt += f"\n\n{ad_context}"  # append to input text
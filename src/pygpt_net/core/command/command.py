@@ -6,13 +6,13 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.20 09:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import copy
 import json
 import re
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 
 from pygpt_net.core.types import (
     MODE_ASSISTANT,
@@ -38,6 +38,53 @@ class Command:
         :param window: Window instance
         """
         self.window = window
+        self.version = 0  # tools schema version, incremented on invalidate
+        self.schemas = {}  # (plugin id, event name, force) -> (cmd names, functions)
+        self.names = None  # cached set of enabled cmd names
+
+    def invalidate(self):
+        """Invalidate tools schema cache (plugins enabled/disabled, options, presets or settings changed)"""
+        self.version += 1
+        self.schemas = {}
+        self.names = None
+
+    def get_schemas(
+            self,
+            name: str,
+            force: bool = False
+    ) -> Tuple[List[Tuple[List[str], List[Dict[str, Any]]]], bool]:
+        """
+        Get tools schemas from enabled plugins subscribed to syntax event (cached per plugin)
+
+        :param name: event name (CMD_SYNTAX or CMD_SYNTAX_INLINE)
+        :param force: force flag passed to plugins
+        :return: list of (cmd names, functions) per plugin, True if all schemas are cacheable
+        """
+        dispatcher = self.window.core.dispatcher
+        plugins = self.window.core.plugins.plugins
+        result = []
+        cacheable = True
+        for pid, handler in dispatcher.get_routes(name):
+            key = (pid, name, force)
+            schema = self.schemas.get(key)
+            if schema is None:
+                data = {
+                    'prompt': "",
+                    'silent': True,
+                    'syntax': [],
+                    'cmd': [],
+                }
+                if force:
+                    data['force'] = True
+                dispatcher.apply(pid, Event(name, data), handler)
+                cmds = [cmd for cmd in data['cmd'] if "cmd" in cmd]
+                schema = ([cmd["cmd"] for cmd in cmds], self.cmds_to_functions(cmds))
+                if getattr(plugins.get(pid), "cache_syntax", False):
+                    self.schemas[key] = schema
+                else:
+                    cacheable = False  # runtime dependent syntax, collect on every call
+            result.append(schema)
+        return result, cacheable
 
     def append_syntax(
             self,
@@ -442,20 +489,17 @@ class Command:
         func_plugins = []
         func_agent = []
         func_experts = []
-        data = {
-            'syntax': [],
-            'cmd': [],
-        }
+        name = None
 
         if self.window.core.config.get('cmd') or all:
-            event = Event(Event.CMD_SYNTAX, data)
-            self.window.dispatch(event)
+            name = Event.CMD_SYNTAX
         elif self.window.controller.plugins.is_type_enabled("cmd.inline"):
-            event = Event(Event.CMD_SYNTAX_INLINE, data)
-            self.window.dispatch(event)
+            name = Event.CMD_SYNTAX_INLINE
 
-        cmds = copy.deepcopy(data['cmd'])
-        func_plugins = self.cmds_to_functions(cmds)
+        if name is not None:
+            schemas, _ = self.get_schemas(name)
+            for _, functions in schemas:
+                func_plugins.extend(dict(func) for func in functions)
         if self.window.controller.agent.legacy.enabled():
             func_agent = self.cmds_to_functions(self.window.controller.agent.legacy.get_functions())
         if (self.window.controller.agent.experts.enabled()
@@ -629,27 +673,18 @@ class Command:
         :param cmd: command
         :return: True if command is enabled
         """
-        enabled_cmds = set()
-
-        def collect(event_type):
-            data = {
-                'prompt': "",
-                'silent': True,
-                'force': True,
-                'syntax': [],
-                'cmd': [],
-            }
-            event = Event(event_type, data)
-            self.window.dispatch(event)
-            if event.data and "cmd" in event.data and isinstance(event.data["cmd"], list):
-                for item in event.data["cmd"]:
-                    if "cmd" in item:
-                        enabled_cmds.add(item["cmd"])
-
-        collect(Event.CMD_SYNTAX)
-        collect(Event.CMD_SYNTAX_INLINE)
-
-        return cmd in enabled_cmds
+        if self.names is None:
+            names = set()
+            cacheable = True
+            for name in (Event.CMD_SYNTAX, Event.CMD_SYNTAX_INLINE):
+                schemas, is_cacheable = self.get_schemas(name, force=True)
+                for cmds, _ in schemas:
+                    names.update(cmds)
+                cacheable = cacheable and is_cacheable
+            if not cacheable:
+                return cmd in names
+            self.names = names
+        return cmd in self.names
 
     def is_model_supports_tools(
             self,
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.15 22:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import copy
@@ -55,6 +55,9 @@ class Ctx:
         self.output = Output(window)  # context render output
         self.idx = Idx(window)  # context indexing core
         self.meta = {}
+        self.meta_more = False  # more ungrouped metas to fetch
+        self.meta_cursor = None  # (updated_ts, id) of last fetched ungrouped meta, keyset paging
+        self.meta_offset = 0  # number of fetched ungrouped metas, paging by rank
         self.current = None
         self.last_item = None
         self.assistant = None
@@ -1010,6 +1013,7 @@ class Ctx:
             context_tokens += num
             i += 1
 
+        self.store_tokens_cache(history_items)
         return i, context_tokens
 
     def get_history(
@@ -1047,9 +1051,24 @@ class Ctx:
             tokens = new_total
             items.append(item)
 
+        self.store_tokens_cache(history_items)
         items.reverse()
         return items
 
+    def store_tokens_cache(self, items: List[CtxItem]):
+        """
+        Persist token counts computed for history items (only changed ones)
+
+        :param items: ctx items
+        """
+        dirty = [item for item in items if item.tokens_cache_dirty and item.id is not None]
+        if not dirty:
+            return
+        try:
+            self.provider.update_items_tokens_cache(dirty)
+        except Exception as e:
+            self.window.core.debug.log(e)
+
     def count_prompt_items(
             self,
             model: str,
@@ -1260,6 +1279,8 @@ class Ctx:
 
         # Common filters (labels etc.)
         common_filters = self.get_parsed_filters()
+        self.meta_cursor = None
+        self.meta_offset = 0
 
         # If explicit filters target a narrow subset (legacy path), keep old behavior
         if "is_important" in self.filters or "indexed_ts" in self.filters:
@@ -1273,6 +1294,7 @@ class Ctx:
                 filters=common_filters,
                 search_content=self.is_search_content(),
             )
+            self.meta_more = False
             return
 
         # 1) Pinned (important) – unlimited
@@ -1303,32 +1325,10 @@ class Ctx:
 
         # 3) Ungrouped & not pinned – paginate directly in SQL
         #    If base_limit == 0 -> unlimited (no paging)
-        filters_ungrp = self.get_parsed_filters()
-        filters_ungrp['is_important'] = {"mode": "=", "value": 0}
-        filters_ungrp['group_id'] = {"mode": "NULL_OR_ZERO", "value": 0}  # special mode handled in Storage
-
-        if base_limit <= 0:
-            meta_ungrouped = self.provider.get_meta(
-                search_string=self.search_string,
-                order_by='updated_ts',
-                order_direction='DESC',
-                limit=0,         # unlimited
-                offset=0,
-                filters=filters_ungrp,
-                search_content=self.is_search_content(),
-            )
-        else:
-            # Always take the top-N ungrouped newest items directly from DB
-            take = max(0, int(loaded_total or 0))
-            meta_ungrouped = self.provider.get_meta(
-                search_string=self.search_string,
-                order_by='updated_ts',
-                order_direction='DESC',
-                limit=take,
-                offset=0,
-                filters=filters_ungrp,
-                search_content=self.is_search_content(),
-            )
+        take = max(0, int(loaded_total or 0)) if base_limit > 0 else 0
+        meta_ungrouped = self.get_ungrouped_meta(limit=take)
+        self.meta_more = take > 0 and len(meta_ungrouped) >= take
+        self.update_meta_cursor(meta_ungrouped)
 
         # Compose final dict with deterministic order: pinned -> grouped -> ungrouped
         combined = {}
@@ -1337,6 +1337,101 @@ class Ctx:
         combined.update(meta_ungrouped)
         self.meta = combined
 
+    def get_ungrouped_meta(
+            self,
+            limit: int = 0,
+            offset: int = 0,
+            before: Optional[Tuple[int, int]] = None
+    ) -> Dict[int, CtxMeta]:
+        """
+        Get ungrouped and not pinned ctx metas (paginated list part)
+
+        :param limit: limit (0 = unlimited)
+        :param offset: offset
+        :param before: (updated_ts, id) keyset, only metas below it in date order
+        :return: ctx metas dict, sorted descending by date
+        """
+        filters = self.get_parsed_filters()
+        filters['is_important'] = {"mode": "=", "value": 0}
+        filters['group_id'] = {"mode": "NULL_OR_ZERO", "value": 0}  # special mode handled in Storage
+        if before is not None:
+            filters['updated_ts'] = {"mode": "BEFORE", "value": before}  # special mode handled in Storage
+
+        # Take the top-N ungrouped items directly from DB: newest ones,
+        # or the most relevant ones when searching in content (full-text rank)
+        ranked = limit > 0 and bool(self.search_string) and self.is_search_content()
+        meta = self.provider.get_meta(
+            search_string=self.search_string,
+            order_by='rank' if ranked else 'updated_ts',
+            order_direction='DESC',
+            limit=limit,
+            offset=offset,
+            filters=filters,
+            search_content=self.is_search_content(),
+        )
+        if ranked:
+            # list is displayed by date, so restore date order after ranked selection
+            meta = dict(sorted(
+                meta.items(),
+                key=lambda kv: kv[1].updated or 0,
+                reverse=True,
+            ))
+        return meta
+
+    def has_more_meta(self) -> bool:
+        """
+        Check if there are more ungrouped metas to fetch (paginated list)
+
+        :return: True if next page is available
+        """
+        return self.meta_more
+
+    def update_meta_cursor(self, page: Dict[int, CtxMeta]):
+        """
+        Move paging position after fetched page of ungrouped metas
+
+        :param page: fetched metas, sorted descending by date
+        """
+        self.meta_offset += len(page)
+        if page:
+            last = next(reversed(page.values()))
+            self.meta_cursor = (int(last.updated or 0), int(last.id or 0))
+
+    def fetch_more_meta(self, limit: int) -> int:
+        """
+        Fetch next page of ungrouped metas and append it to loaded list (without reloading loaded pages)
+
+        :param limit: page size
+        :return: number of fetched metas
+        """
+        if limit <= 0 or "is_important" in self.filters or "indexed_ts" in self.filters:
+            self.meta_more = False
+            return 0
+        ranked = bool(self.search_string) and self.is_search_content()
+        fetched = 0
+        while self.meta_more and not fetched:
+            # pages already in memory (injected current, opened items) are skipped, not counted
+            if ranked:
+                page = self.get_ungrouped_meta(limit=limit, offset=self.meta_offset)  # rank has no stable key
+            else:
+                page = self.get_ungrouped_meta(limit=limit, before=self.meta_cursor)
+            self.meta_more = len(page) >= limit
+            self.update_meta_cursor(page)
+            for id, meta in page.items():
+                if id not in self.meta:
+                    self.meta[id] = meta
+                    fetched += 1
+        if fetched and self.search_string and self.is_search_content():
+            # pages are selected by rank, restore date order of whole ungrouped part
+            fixed = {id: m for id, m in self.meta.items() if m.important or m.group_id}
+            fixed.update(sorted(
+                ((id, m) for id, m in self.meta.items() if id not in fixed),
+                key=lambda kv: kv[1].updated or 0,
+                reverse=True,
+            ))
+            self.meta = fixed
+        return fetched
+
     def load_tmp_meta(self, meta_id: int):
         """
         Load tmp meta
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.05 18:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from typing import Dict, Any, Optional
@@ -21,6 +21,7 @@ class ReplyContext:
     CMD_EXECUTE_INLINE = "cmd.execute.inline"
     CMD_EXECUTE_FORCE = "cmd.execute.force"
     EXPERT_CALL = "expert.call"
+    EXPERT_CALLS = "expert.calls"
     EXPERT_RESPONSE = "expert.response"
 
     type: Optional[object] = None
@@ -31,6 +32,7 @@ class ReplyContext:
     input: str = ""
     internal: bool = False
     cmds: list = field(default_factory=list)
+    calls: dict = field(default_factory=dict)
 
     def __init__(self):
         """Reply context"""
@@ -42,6 +44,7 @@ class ReplyContext:
         self.input = ""
         self.internal = False
         self.cmds = []
+        self.calls = {}
 
     def to_dict(self) -> Dict[str, Any]:
         """
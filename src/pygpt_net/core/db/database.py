@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.22 16:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import os
@@ -14,7 +14,7 @@ import shutil
 import time
 from typing import Optional, Any, Dict
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 
 from pygpt_net.migrations import Migrations
 from .viewer import Viewer
@@ -30,6 +30,20 @@ class Database:
         self.initialized = False
         self.echo = True
 
+        # Connection profile (PRAGMAs applied on every new connection), overridable in config: db.<pragma>
+        self.profile = {
+            'journal_mode': 'WAL',
+            'synchronous': 'NORMAL',
+            'temp_store': 'MEMORY',
+            'cache_size': -20000,  # negative = size in KiB
+            'mmap_size': 268435456,  # bytes, 0 = disabled
+        }
+        self.profile_allowed = {
+            'journal_mode': ['DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF'],
+            'synchronous': ['OFF', 'NORMAL', 'FULL', 'EXTRA'],
+            'temp_store': ['DEFAULT', 'FILE', 'MEMORY'],
+        }
+
         # Tables configuration
         columns = {}
         columns["calendar_note"] = [
@@ -85,6 +99,7 @@ class Database:
             'external_id',
             'audio_id',
             'audio_expires_ts',
+            'tokens_cache_json',
         ]
         columns["ctx_meta"] = [
             'id',
@@ -229,7 +244,7 @@ class Database:
                                   'hidden_output'],
                 'timestamp_columns': ['input_ts', 'output_ts', 'audio_expires_ts'],
                 'json_columns': ['cmds_json', 'results_json', 'urls_json', 'images_json', 'files_json',
-                                 'attachments_json', 'docs_json', 'additional_ctx_json'],
+                                 'attachments_json', 'docs_json', 'additional_ctx_json', 'tokens_cache_json'],
                 'default_sort': 'id',
                 'default_order': 'DESC',
                 'primary_key': 'id',
@@ -343,10 +358,66 @@ class Database:
             echo=self.echo,
             future=True
         )
+        event.listen(self.engine, "connect", self.on_connect)
         if not self.is_installed():
             self.install()
         self.initialized = True
 
+    def get_profile(self) -> Dict[str, Any]:
+        """
+        Get connection profile (defaults overridden by config values)
+
+        :return: dict with PRAGMA name and value
+        """
+        profile = {}
+        config = self.window.core.config if self.window is not None else None
+        for key, default in self.profile.items():
+            value = default
+            if config is not None and config.has('db.' + key):
+                value = config.get('db.' + key)
+            if key in self.profile_allowed:
+                value = str(value).upper()
+                if value not in self.profile_allowed[key]:
+                    value = default
+            else:
+                try:
+                    value = int(value)
+                except (TypeError, ValueError):
+                    value = default
+            profile[key] = value
+        return profile
+
+    def on_connect(self, dbapi_conn, conn_record):
+        """
+        Apply connection profile on new DB-API connection
+
+        :param dbapi_conn: sqlite3 connection
+        :param conn_record: pool connection record
+        """
+        cursor = dbapi_conn.cursor()
+        try:
+            for key, value in self.get_profile().items():
+                cursor.execute("PRAGMA {} = {}".format(key, value))
+        except Exception as e:
+            print("[DB] Error applying connection profile: {}".format(e))
+        finally:
+            cursor.close()
+
+    def reconnect(self):
+        """Drop pooled connections, next ones are opened with current connection profile"""
+        if self.engine is not None:
+            self.engine.dispose()
+
+    def checkpoint(self):
+        """Flush WAL into main database file (before database file is copied)"""
+        if self.engine is None:
+            return
+        try:
+            with self.engine.connect() as conn:
+                conn.execute(text("PRAGMA wal_checkpoint(TRUNCATE)"))
+        except Exception as e:
+            print("[DB] Error while checkpointing database: {}".format(e))
+
     def close(self):
         """Close database connection"""
         self.engine.dispose()
@@ -435,6 +506,7 @@ class Database:
             backup_path = os.path.join(self.window.core.config.path, 'db.sqlite.backup')
             if os.path.exists(backup_path):
                 os.remove(backup_path)
+            self.checkpoint()  # flush WAL into main file
             shutil.copyfile(self.db_path, backup_path)
             return backup_path
         except Exception as e:
@@ -454,6 +526,9 @@ class Database:
                 for migration in sorted_migrations:
                     self.apply_migration(migration, conn, db_version)
 
+        # connections opened before user config was loaded use default profile
+        self.reconnect()
+
     def get_param(self, key: str) -> Optional[str]:
         """
         Get parameter from database
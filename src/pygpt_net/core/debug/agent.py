@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.14 20:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 class AgentDebug:
@@ -39,4 +39,22 @@ class AgentDebug:
         debug.add(self.id, 'stop', str(agent_legacy.stop))
         debug.add(self.id, 'finished', str(agent_legacy.finished))
         debug.add(self.id, 'allowed_cmds', str(agent_legacy.allowed_cmds))
+
+        # experts: last concurrent calls with time per expert
+        fanout = self.window.core.experts.fanout
+        debug.add(self.id, '[EXPERTS]', '')
+        debug.add(self.id, 'parallel', str(agent_config.get("experts.parallel")))
+        debug.add(self.id, 'timeout', str(agent_config.get("experts.timeout")))
+        if fanout is not None:
+            debug.add(
+                self.id,
+                'fan-out',
+                "calls: {}, active: {}, total: {:.0f} ms".format(
+                    len(fanout.calls),
+                    fanout.is_active(),
+                    fanout.get_elapsed() * 1000,
+                )
+            )
+            for expert_id, timing in fanout.get_timings().items():
+                debug.add(self.id, f'[expert] {expert_id}', timing)
         debug.end(self.id)
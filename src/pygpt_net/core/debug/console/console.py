@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.20 21:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from PySide6.QtWidgets import QApplication
@@ -98,8 +98,9 @@ class Console:
         elif msg.lower() == "mpkfa":
             self.log("GOD MODE ACTIVATED ;)")
         elif msg == "oclr":
-            if self.window.core.api.openai.client:
-                self.window.core.api.openai.client.close()
+            if self.window.core.api.pool.count("openai"):
+                self.window.core.api.pool.invalidate("openai")
+                self.window.core.api.openai.client = None
                 self.log("OpenAI client closed")
             else:
                 self.log("OpenAI client not initialized")
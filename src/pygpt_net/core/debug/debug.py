@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.12 20:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import gc
@@ -368,7 +368,7 @@ class Debug:
         unreachable_objects = gc.collect()
 
         num_widgets = len(QApplication.allWidgets())
-        num_threads = self.window.threadpool.activeThreadCount()
+        num_threads = self.window.core.executor.active_count()
 
         stats = []
         stats.append(f"[GC] All: {all_objects}, Unreachable: {unreachable_objects}")
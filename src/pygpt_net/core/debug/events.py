@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.14 20:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from pygpt_net.core.events import (
@@ -43,6 +43,9 @@ class EventsDebug:
         debug.add(self.id, '----', '')
         debug.add(self.id, 'Voice Cmds (all):', str(access_voice.commands))
         debug.add(self.id, 'Voice Cmds (allowed):', str(access_voice.get_commands()))
+        debug.add(self.id, '----', '')
+        for name, stats in self.window.core.dispatcher.get_stats().items():
+            debug.add(self.id, '[dispatch] ' + name, str(stats))
         debug.end(self.id)
 
     def extract_events(self, events: BaseEvent) -> dict:
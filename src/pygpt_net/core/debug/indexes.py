@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.14 20:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import datetime
@@ -64,6 +64,7 @@ class IndexesDebug:
         debug.add(self.id, 'Offline loaders [files]:', str(sorted(list(indexing.loaders["file"].keys()))))
         debug.add(self.id, 'Offline loaders [web]:', str(sorted(list(indexing.loaders["web"].keys()))))
         debug.add(self.id, 'External instructions [web]:', str(indexing.external_instructions))
+        debug.add(self.id, 'Web page cache:', str(self.window.core.web.cache.get_stats()))
 
         excluded = config.get("llama.idx.excluded.ext").replace(" ", "").split(',')
         debug.add(self.id, 'Excluded (ext):', str(excluded))
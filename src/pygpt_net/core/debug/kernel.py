@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.14 20:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 class KernelDebug:
@@ -30,4 +30,21 @@ class KernelDebug:
         debug.add(self.id, 'Status:', str(kernel_controller.status))
         debug.add(self.id, 'State:', str(kernel_controller.state))
         debug.add(self.id, 'Stack:', str(kernel_controller.last_stack))
+
+        # executor lanes
+        for name, stats in self.window.core.executor.get_stats().items():
+            debug.add(
+                self.id,
+                f'[lane] {name}:',
+                "threads: {active}/{threads}, pending: {pending}, running: {running}, "
+                "submitted: {submitted}, finished: {finished}, cancelled: {cancelled}, failed: {failed}, "
+                "wait avg/max: {wait_avg_ms:.1f}/{wait_max_ms:.1f} ms, "
+                "run avg/max: {run_avg_ms:.1f}/{run_max_ms:.1f} ms".format(
+                    wait_avg_ms=stats["wait_avg"] * 1000,
+                    wait_max_ms=stats["wait_max"] * 1000,
+                    run_avg_ms=stats["run_avg"] * 1000,
+                    run_max_ms=stats["run_max"] * 1000,
+                    **stats
+                )
+            )
         debug.end(self.id)
\ No newline at end of file
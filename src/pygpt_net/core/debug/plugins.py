@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.14 20:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 
@@ -34,6 +34,7 @@ class PluginsDebug:
                 'id': plugin.id,
                 'name': plugin.name,
                 'description': plugin.description,
+                'events': getattr(plugin, 'events', None),
                 'options': plugin.options
             }
             debug.add(self.id, str(key), str(data))
@@ -6,10 +6,11 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.30 06:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
-from typing import List, Tuple
+import time
+from typing import List, Tuple, Dict, Optional, Callable, Any
 
 from pygpt_net.core.events import (
     BaseEvent,
@@ -35,6 +36,75 @@ class Dispatcher:
         ]
         self.call_id = 0
         self._pending_tasks = []
+        self.subscriptions = {}  # plugin id -> {event name: handler}
+        self.routes = {}  # (event name, all) -> [(plugin id, handler)]
+        self.stats = {}  # event name -> [count, total time, max time, plugins]
+
+    def subscribe(self, plugin: Any):
+        """
+        Register plugin event subscriptions
+
+        :param plugin: plugin instance
+        """
+        fn = getattr(plugin, "get_subscriptions", None)
+        subscriptions = fn() if callable(fn) else None
+        if subscriptions is None:
+            self.subscriptions.pop(plugin.id, None)  # subscribed to all events
+        else:
+            self.subscriptions[plugin.id] = dict(subscriptions)
+        self.invalidate()
+
+    def unsubscribe(self, id: str):
+        """
+        Unregister plugin event subscriptions
+
+        :param id: plugin id
+        """
+        self.subscriptions.pop(id, None)
+        self.invalidate()
+
+    def invalidate(self):
+        """Invalidate dispatch map (on plugin register, enable or disable)"""
+        self.routes = {}
+
+    def is_subscribed(self, id: str, name: str) -> bool:
+        """
+        Check if plugin is subscribed to event
+
+        :param id: plugin id
+        :param name: event name
+        :return: True if subscribed
+        """
+        subscriptions = self.subscriptions.get(id)
+        return subscriptions is None or name in subscriptions
+
+    def get_routes(
+            self,
+            name: str,
+            all: bool = False
+    ) -> List[Tuple[str, Optional[Callable]]]:
+        """
+        Get plugins (and handlers) subscribed to event, built once and reused until invalidated
+
+        :param name: event name
+        :param all: include disabled plugins
+        :return: list of (plugin id, handler), handler is None if plugin is subscribed to all events
+        """
+        key = (name, all)
+        routes = self.routes.get(key)
+        if routes is None:
+            routes = []
+            is_enabled = self.window.controller.plugins.is_enabled
+            for pid in tuple(self.window.core.plugins.plugins.keys()):
+                if not all and not is_enabled(pid):
+                    continue
+                subscriptions = self.subscriptions.get(pid)
+                if subscriptions is None:
+                    routes.append((pid, None))
+                elif name in subscriptions:
+                    routes.append((pid, subscriptions[name]))
+            self.routes[key] = routes
+        return routes
 
     def dispatch(
             self,
@@ -42,7 +112,33 @@ class Dispatcher:
             all: bool = False
     ) -> Tuple[List[str], BaseEvent]:
         """
-        Dispatch an event to the appropriate handlers.
+        Dispatch an event to the appropriate handlers (and measure dispatch time).
+
+        :param event: BaseEvent: The event to dispatch.
+        :param all: bool: If True, dispatch to all plugins regardless of their state.
+        :return: Tuple[List[str], BaseEvent]: A tuple containing a list of affected plugin IDs and the event.
+        """
+        start = time.perf_counter()
+        affected, event = self.handle(event, all)
+        elapsed = time.perf_counter() - start
+        stats = self.stats.get(event.name)
+        if stats is None:
+            self.stats[event.name] = [1, elapsed, elapsed, len(affected)]
+        else:
+            stats[0] += 1
+            stats[1] += elapsed
+            if elapsed > stats[2]:
+                stats[2] = elapsed
+            stats[3] += len(affected)
+        return affected, event
+
+    def handle(
+            self,
+            event: BaseEvent,
+            all: bool = False
+    ) -> Tuple[List[str], BaseEvent]:
+        """
+        Handle event in controllers and subscribed plugins.
 
         :param event: BaseEvent: The event to dispatch.
         :param all: bool: If True, dispatch to all plugins regardless of their state.
@@ -152,21 +248,17 @@ class Dispatcher:
             controller.access.handle(event)
 
         affected = []
-        plugins_mgr = core.plugins
-        plugins_dict = plugins_mgr.plugins
-        plugin_ids = tuple(plugins_dict.keys())
-
-        # plugins
-        for pid in plugin_ids:
-            if controller.plugins.is_enabled(pid) or all:
-                if event.stop:
-                    if log_event:
-                        debug.info(f"[event] Skipping... (stopped):  {event.name}")
-                    break
-                if log_event and debug.enabled():
-                    debug.debug(f"[event] Apply [{event.name}] to plugin: {pid}")
-                self.apply(pid, event)
-                affected.append(pid)
+
+        # plugins (subscribed only)
+        for pid, handler in self.get_routes(event.name, all):
+            if event.stop:
+                if log_event:
+                    debug.info(f"[event] Skipping... (stopped):  {event.name}")
+                break
+            if log_event and debug.enabled():
+                debug.debug(f"[event] Apply [{event.name}] to plugin: {pid}")
+            self.apply(pid, event, handler)
+            affected.append(pid)
 
         if log_event:
             if debug.enabled():
@@ -179,20 +271,25 @@ class Dispatcher:
     def apply(
             self,
             id: str,
-            event: BaseEvent
+            event: BaseEvent,
+            handler: Optional[Callable] = None
     ):
         """
         Apply an event to a specific plugin by its ID.
 
         :param id: str: The ID of the plugin to which the event should be applied.
         :param event: BaseEvent: The event to apply to the plugin.
+        :param handler: Callable: subscribed handler (plugin.handle if None)
         """
         plugins = self.window.core.plugins.plugins
         plugin = plugins.get(id)
         if plugin is None:
             return
         try:
-            plugin.handle(event)
+            if handler is not None:
+                handler(event)
+            else:
+                plugin.handle(event)
         except AttributeError:
             pass
 
@@ -219,3 +316,28 @@ class Dispatcher:
         :return: bool: True if event logging is enabled, False otherwise.
         """
         return self.window.core.config.get("log.events", False)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get dispatch timing stats per event, sorted by total time
+
+        :return: dict: event name -> stats (count, total/avg/max time in ms, avg plugins called)
+        """
+        result = {}
+        for name, (count, total, max_time, plugins) in sorted(
+                self.stats.items(),
+                key=lambda item: item[1][1],
+                reverse=True,
+        ):
+            result[name] = {
+                "count": count,
+                "total_ms": round(total * 1000, 3),
+                "avg_ms": round(total * 1000 / count, 3),
+                "max_ms": round(max_time * 1000, 3),
+                "plugins": round(plugins / count, 1),
+            }
+        return result
+
+    def reset_stats(self):
+        """Reset dispatch timing stats"""
+        self.stats = {}
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.11 14:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from typing import Any
@@ -14,6 +14,7 @@ from typing import Any
 from PySide6.QtCore import Signal, Slot, QObject
 
 from pygpt_net.core.events import RenderEvent
+from pygpt_net.core.executor import LANE_MAINTENANCE
 from pygpt_net.plugin.base.signals import BaseSignals
 from pygpt_net.plugin.base.worker import BaseWorker
 from pygpt_net.utils import trans
@@ -68,6 +69,8 @@ class WorkerSignals(BaseSignals):
     build_finished = Signal()
 
 class Worker(BaseWorker):
+    lane = LANE_MAINTENANCE  # executor lane
+
     def __init__(self, *args, **kwargs):
         super(Worker, self).__init__()
         self.signals = WorkerSignals()
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 12:00:00                  #
+# ================================================== #
+
+import threading
+import time
+from typing import Dict, Optional, List
+
+from PySide6.QtCore import QRunnable, QThread, QThreadPool
+
+LANE_DEFAULT = "default"
+LANE_INTERACTIVE = "interactive"
+LANE_TOOLS = "tools"
+LANE_INDEXING = "indexing"
+LANE_MAINTENANCE = "maintenance"
+
+
+class CancelToken:
+    def __init__(self):
+        """Cancellation token of executor task"""
+        self.event = threading.Event()
+
+    def cancel(self):
+        """Cancel task (pending task is not started, running task can check is_cancelled())"""
+        self.event.set()
+
+    def is_cancelled(self) -> bool:
+        """
+        Check if task is cancelled
+
+        :return: True if cancelled
+        """
+        return self.event.is_set()
+
+
+class Lane:
+    def __init__(
+            self,
+            name: str,
+            threads: int,
+            priority: QThread.Priority,
+            pool: Optional[QThreadPool] = None
+    ):
+        """
+        Executor lane (thread pool with own concurrency limit and thread priority)
+
+        :param name: lane name
+        :param threads: max number of threads
+        :param priority: thread priority
+        :param pool: thread pool (new pool if not provided)
+        """
+        self.name = name
+        self.priority = priority
+        self.pool = pool if pool is not None else QThreadPool()
+        self.lock = threading.Lock()
+        self.tasks: Dict["Task", None] = {}  # pending and running tasks (ordered set)
+        self.submitted = 0
+        self.started = 0
+        self.finished = 0
+        self.cancelled = 0
+        self.failed = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.run_total = 0.0
+        self.run_max = 0.0
+        self.configure(threads)
+
+    def configure(self, threads: int):
+        """
+        Set concurrency limit
+
+        :param threads: max number of threads (0 = Qt default)
+        """
+        if threads > 0:
+            self.pool.setMaxThreadCount(threads)
+        self.pool.setThreadPriority(self.priority)
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Get lane metrics
+
+        :return: metrics dict
+        """
+        with self.lock:
+            pending = len([task for task in self.tasks if task.started_at is None])
+            return {
+                "threads": self.pool.maxThreadCount(),
+                "active": self.pool.activeThreadCount(),
+                "pending": pending,
+                "running": len(self.tasks) - pending,
+                "submitted": self.submitted,
+                "finished": self.finished,
+                "cancelled": self.cancelled,
+                "failed": self.failed,
+                "wait_avg": self.wait_total / self.started if self.started else 0.0,
+                "wait_max": self.wait_max,
+                "run_avg": self.run_total / self.finished if self.finished else 0.0,
+                "run_max": self.run_max,
+            }
+
+
+class Task(QRunnable):
+    def __init__(self, lane: Lane, runnable: QRunnable, token: CancelToken):
+        """
+        Executor task, wraps runnable and collects lane metrics
+
+        :param lane: lane
+        :param runnable: runnable to run
+        :param token: cancellation token
+        """
+        super().__init__()
+        self.lane = lane
+        self.runnable = runnable
+        self.token = token
+        self.submitted_at = time.perf_counter()
+        self.started_at = None
+
+    def run(self):
+        lane = self.lane
+        if self.token.is_cancelled():
+            with lane.lock:
+                lane.tasks.pop(self, None)
+                lane.cancelled += 1
+            self.runnable = None
+            return
+
+        self.started_at = time.perf_counter()
+        wait = self.started_at - self.submitted_at
+        with lane.lock:
+            lane.started += 1
+            lane.wait_total += wait
+            lane.wait_max = max(lane.wait_max, wait)
+        failed = False
+        try:
+            self.runnable.run()
+        except Exception as e:
+            failed = True
+            print("Executor: unhandled error in {} lane: {}".format(lane.name, e))
+        finally:
+            elapsed = time.perf_counter() - self.started_at
+            with lane.lock:
+                lane.tasks.pop(self, None)
+                lane.finished += 1
+                lane.run_total += elapsed
+                lane.run_max = max(lane.run_max, elapsed)
+                if failed:
+                    lane.failed += 1
+            self.runnable = None  # release worker
+
+
+class Executor:
+    # lane name: (config key, default max threads, thread priority)
+    LANES = {
+        LANE_INTERACTIVE: ("executor.threads.interactive", 8, QThread.HighPriority),
+        LANE_TOOLS: ("executor.threads.tools", 8, QThread.NormalPriority),
+        LANE_INDEXING: ("executor.threads.indexing", 2, QThread.LowPriority),
+        LANE_MAINTENANCE: ("executor.threads.maintenance", 1, QThread.LowestPriority),
+    }
+
+    def __init__(self, window=None):
+        """
+        Worker executor with named lanes
+
+        Each lane has own thread pool, concurrency limit and thread priority, so long background
+        jobs (indexing, maintenance) do not block interactive workers (chat stream, bridge calls).
+        Runnables are assigned to lane by `lane` argument or by runnable's `lane` attribute,
+        other runnables run in the default lane (Qt global thread pool).
+
+        :param window: Window instance
+        """
+        self.window = window
+        self.lanes: Dict[str, Lane] = {}
+
+    def init(self):
+        """Create lanes"""
+        if self.lanes:
+            return
+        self.lanes[LANE_DEFAULT] = Lane(LANE_DEFAULT, 0, QThread.InheritPriority, QThreadPool.globalInstance())
+        for name, (key, threads, priority) in self.LANES.items():
+            self.lanes[name] = Lane(name, self.get_threads(name), priority)
+
+    def setup(self):
+        """Apply lane limits from config"""
+        for name in self.LANES:
+            if name in self.lanes:
+                self.lanes[name].configure(self.get_threads(name))
+
+    def get_threads(self, lane: str) -> int:
+        """
+        Get max threads of lane from config
+
+        :param lane: lane name
+        :return: max number of threads
+        """
+        key, default, _ = self.LANES[lane]
+        try:
+            return max(1, int(self.window.core.config.get(key, default)))
+        except (TypeError, ValueError):
+            return default
+
+    def get_lane(self, name: Optional[str]) -> Lane:
+        """
+        Get lane by name
+
+        :param name: lane name
+        :return: lane (default lane if not found)
+        """
+        self.init()
+        return self.lanes.get(name) or self.lanes[LANE_DEFAULT]
+
+    def start(
+            self,
+            runnable: QRunnable,
+            priority: int = 0,
+            lane: Optional[str] = None,
+            token: Optional[CancelToken] = None
+    ) -> CancelToken:
+        """
+        Start runnable in lane (compatible with QThreadPool.start)
+
+        :param runnable: QRunnable instance
+        :param priority: priority in lane queue
+        :param lane: lane name (default: runnable's `lane` attribute)
+        :param token: cancellation token (created if not provided)
+        :return: cancellation token
+        """
+        if lane is None:
+            lane = getattr(runnable, "lane", None)
+        item = self.get_lane(lane)
+        if token is None:
+            token = CancelToken()
+        try:
+            runnable.cancel_token = token  # worker can check token.is_cancelled()
+        except Exception:
+            pass
+        task = Task(item, runnable, token)
+        with item.lock:
+            item.tasks[task] = None
+            item.submitted += 1
+        item.pool.start(task, priority)
+        return token
+
+    def cancel(self, lane: Optional[str] = None):
+        """
+        Cancel tasks (pending tasks are removed from queue, running tasks get cancelled token)
+
+        :param lane: lane name, or None to cancel all lanes
+        """
+        for name, item in list(self.lanes.items()):
+            if lane is not None and name != lane:
+                continue
+            with item.lock:
+                tasks = list(item.tasks)
+            for task in tasks:
+                task.token.cancel()
+                if task.started_at is None and item.pool.tryTake(task):
+                    with item.lock:
+                        item.tasks.pop(task, None)
+                        item.cancelled += 1
+
+    def active_count(self) -> int:
+        """
+        Get number of active threads in all lanes
+
+        :return: number of active threads
+        """
+        return sum(item.pool.activeThreadCount() for item in self.lanes.values())
+
+    def activeThreadCount(self) -> int:
+        """QThreadPool compatible alias of active_count()"""
+        return self.active_count()
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get metrics of all lanes
+
+        :return: lane name -> metrics
+        """
+        return {name: item.get_stats() for name, item in self.lanes.items()}
+
+    def get_names(self) -> List[str]:
+        """
+        Get lane names
+
+        :return: list of lane names
+        """
+        return [LANE_DEFAULT] + list(self.LANES.keys())
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.28 09:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import json
@@ -14,6 +14,7 @@ from typing import Dict, List, Optional
 
 from PySide6.QtCore import Slot
 
+from pygpt_net.core.experts.fanout import FanOut
 from pygpt_net.core.experts.worker import ExpertWorker
 from pygpt_net.core.types import (
     MODE_AGENT,
@@ -60,6 +61,7 @@ class Experts:
         self.last_expert_id = None  # last expert id used in call
         self.last_idx = None  # last index used in call
         self.master_ctx = None  # master meta for expert calls
+        self.fanout = None  # current (or last) concurrent expert calls
 
     def get_mode(self) -> str:
         """
@@ -81,6 +83,11 @@ class Experts:
         """
         return self.window.controller.kernel.stopped()
 
+    def stop(self):
+        """Cancel concurrent expert calls in progress"""
+        if self.fanout is not None:
+            self.fanout.cancel()
+
     def agent_enabled(self) -> bool:
         """
         Check if agent is enabled
@@ -227,12 +234,15 @@ class Experts:
                 return {}
         return calls
 
-    def extract_tool_calls(self, ctx: CtxItem):
+    def extract_tool_calls(self, ctx: CtxItem, idx: Optional[str] = None):
         """
         Extract tool calls from expert
 
         :param ctx: context item
+        :param idx: index used by expert (default: last used index)
         """
+        if idx is None:
+            idx = self.last_idx
         for call in ctx.tool_calls:
             if (call["type"] == "function"
                     and "function" in call
@@ -243,7 +253,7 @@ class Experts:
                         "cmd": TOOL_QUERY_ENGINE_NAME,
                         "params": {
                             "query": call["function"]["arguments"]["query"],
-                            "idx": self.last_idx,
+                            "idx": idx,
                         },
                     }
                 ]
@@ -341,6 +351,79 @@ class Experts:
         self.window.dispatch(event)  # dispatch busy event
         self.window.threadpool.start(self.worker)
 
+    def call_many(
+            self,
+            master_ctx: CtxItem,
+            calls: Dict[str, str]
+    ):
+        """
+        Call multiple experts concurrently and reply to master with joined results
+
+        :param master_ctx: master context
+        :param calls: expert calls {expert_id: query}
+        """
+        if self.stopped() or not calls:
+            return
+
+        self.stop()  # cancel previous calls if still in progress
+        config = self.window.core.config
+        fanout = FanOut(
+            experts=self,
+            master_ctx=master_ctx,
+            calls=calls,
+            parallel=config.get("experts.parallel", 4),
+            timeout=config.get("experts.timeout", 180),
+        )
+        self.fanout = fanout
+        self.master_ctx = master_ctx
+        names = ", ".join(call.name for call in fanout.calls)
+        event = KernelEvent(KernelEvent.STATE_BUSY, {
+            "msg": f"{trans('expert.wait.status')} ({names})",
+        })
+        self.window.dispatch(event)  # dispatch busy event
+        fanout.start()
+
+    def handle_join(self, fanout: FanOut):
+        """
+        Handle joined results of concurrent expert calls
+
+        :param fanout: FanOut instance
+        """
+        dispatch = self.window.dispatch
+        core = self.window.core
+        core.debug.info("[experts] Joined {} calls in {:.0f} ms: {}".format(
+            len(fanout.calls),
+            fanout.get_elapsed() * 1000,
+            fanout.get_timings(),
+        ))
+
+        if self.stopped():
+            dispatch(KernelEvent(KernelEvent.STATE_IDLE, {}))  # dispatch idle event
+            return
+
+        master_ctx = fanout.master_ctx
+        reply_ctx = CtxItem()
+        reply_ctx.meta = master_ctx.meta
+        reply_ctx.pid = master_ctx.pid
+        reply_ctx.input_name = ", ".join(call.name for call in fanout.calls)
+        reply_ctx.output_name = ""
+        reply_ctx.sub_call = True  # this flag is not copied in to_dict
+
+        # results in call order
+        context = BridgeContext()
+        context.ctx = reply_ctx
+        context.prompt = json.dumps(fanout.get_results(), ensure_ascii=False, indent=2)
+        reply_ctx.output = context.prompt
+        dispatch(KernelEvent(KernelEvent.INPUT_SYSTEM, {
+            'context': context,
+            'extra': {
+                "force": True,
+                "reply": True,
+                "internal": False,
+            },
+        }))  # reply to master
+        dispatch(KernelEvent(KernelEvent.STATE_IDLE, {}))  # dispatch idle event
+
     @Slot(CtxItem, str)
     def handle_output(self, ctx: CtxItem, mode: str):
         """
@@ -379,37 +462,12 @@ class Experts:
         if self.stopped():
             return
 
-        core = self.window.core
-        update_status = self.window.update_status
-
-        # extract native tool calls if provided
-        if ctx.tool_calls:
-            # if not internal commands in a text body then append tool calls as commands (prevent double commands)
-            if not core.command.has_cmds(ctx.output):
-                core.command.append_tool_calls(ctx)  # append tool calls as commands
-                if not isinstance(ctx.extra, dict):
-                    ctx.extra = {}
-                ctx.extra["tool_calls"] = ctx.tool_calls
-
-        # if 'get_context' tool is used then force call, and append idx
-        self.extract_tool_calls(ctx)  # extract tool calls from ctx
-        self.window.controller.chat.command.handle(ctx, internal=True)  # handle cmds sync
-
-        if ctx.reply:
-            update_status("")  # clear status
-            # prepare data to send as reply
-            tool_data = json.dumps(ctx.results)
-            # if "tool_output" in ctx.extra and ctx.extra["tool_output"]:
-               # tool_data = str(ctx.extra["tool_output"])
-
-            core.ctx.update_item(ctx)  # update context in db
-            update_status('...')
-            ctx.output = f"<tool>{ctx.cmds}</tool>"
-            core.ctx.update_item(ctx)  # update ctx in DB
+        tool_data = self.run_cmds(ctx)
+        if tool_data is not None:
             self.handle_finished()
             self.call(
                 master_ctx=self.master_ctx,
-                expert_id=self.last_expert_id,
+                expert_id=expert_id,
                 query=tool_data,
             )
             return
@@ -434,6 +492,44 @@ class Experts:
         # output: ... (call the master)
         self.handle_response(reply_ctx, str(expert_id))
 
+    def run_cmds(self, ctx: CtxItem, idx: Optional[str] = None) -> Optional[str]:
+        """
+        Execute commands from expert response
+
+        :param ctx: CtxItem
+        :param idx: index used by expert (default: last used index)
+        :return: tool results to send back to expert, or None if no reply is needed
+        """
+        core = self.window.core
+        update_status = self.window.update_status
+
+        # extract native tool calls if provided
+        if ctx.tool_calls:
+            # if not internal commands in a text body then append tool calls as commands (prevent double commands)
+            if not core.command.has_cmds(ctx.output):
+                core.command.append_tool_calls(ctx)  # append tool calls as commands
+                if not isinstance(ctx.extra, dict):
+                    ctx.extra = {}
+                ctx.extra["tool_calls"] = ctx.tool_calls
+
+        # if 'get_context' tool is used then force call, and append idx
+        self.extract_tool_calls(ctx, idx)  # extract tool calls from ctx
+        self.window.controller.chat.command.handle(ctx, internal=True)  # handle cmds sync
+
+        if ctx.reply:
+            update_status("")  # clear status
+            # prepare data to send as reply
+            tool_data = json.dumps(ctx.results)
+            # if "tool_output" in ctx.extra and ctx.extra["tool_output"]:
+               # tool_data = str(ctx.extra["tool_output"])
+
+            core.ctx.update_item(ctx)  # update context in db
+            update_status('...')
+            ctx.output = f"<tool>{ctx.cmds}</tool>"
+            core.ctx.update_item(ctx)  # update ctx in DB
+            return tool_data
+        return None
+
     @Slot()
     def handle_input_locked(self):
         """
@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 12:00:00                  #
+# ================================================== #
+
+import time
+from collections import deque
+from typing import Dict, List, Optional, Any
+
+from PySide6.QtCore import QObject, Slot
+
+from pygpt_net.core.experts.worker import ExpertWorker
+from pygpt_net.item.ctx import CtxItem
+
+
+class ExpertCall(QObject):
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_DONE = "done"
+    STATUS_ERROR = "error"
+    STATUS_TIMEOUT = "timeout"
+    STATUS_CANCELLED = "cancelled"
+
+    def __init__(
+            self,
+            fanout: "FanOut",
+            index: int,
+            expert_id: str,
+            query: str
+    ):
+        """
+        Single expert call in fan-out, receives signals from expert workers
+
+        :param fanout: FanOut instance
+        :param index: call index (order in master response)
+        :param expert_id: expert id (preset ID)
+        :param query: query to expert
+        """
+        super(ExpertCall, self).__init__()
+        self.fanout = fanout
+        self.experts = fanout.experts
+        self.window = fanout.window
+        self.index = index
+        self.expert_id = expert_id
+        self.query = query
+        self.name = self.experts.get_expert_name_by_id(expert_id) or expert_id
+        self.status = self.STATUS_PENDING
+        self.result: Optional[str] = None
+        self.error: Optional[str] = None
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.rounds = 0  # expert requests (first query + tool results)
+        self.runs = 0  # workers in flight
+        self.tokens = []  # executor cancel tokens
+
+    def get_job_name(self) -> str:
+        """
+        Get timeout job name
+
+        :return: scheduler job name
+        """
+        return "experts.timeout.{}.{}".format(self.index, self.expert_id)
+
+    def start(self):
+        """Start expert call"""
+        self.status = self.STATUS_RUNNING
+        self.started_at = time.perf_counter()
+        if self.fanout.timeout > 0:
+            self.window.core.scheduler.call_later(
+                self.fanout.timeout,
+                self.on_timeout,
+                name=self.get_job_name(),
+            )
+        self.run(self.query)
+
+    def run(self, query: str):
+        """
+        Run expert worker
+
+        :param query: query or tool results
+        """
+        experts = self.experts
+        worker = ExpertWorker(
+            window=self.window,
+            master_ctx=self.fanout.master_ctx,
+            expert_id=self.expert_id,
+            query=query,
+        )
+        worker.signals.response.connect(self.on_response)
+        worker.signals.finished.connect(self.on_finished)
+        worker.signals.error.connect(self.on_error)
+        worker.signals.cmd.connect(self.on_cmd)
+        worker.signals.event.connect(experts.handle_event)
+        worker.signals.output.connect(experts.handle_output)
+        worker.signals.lock_input.connect(experts.handle_input_locked)
+        self.runs += 1
+        self.rounds += 1
+        self.tokens.append(self.window.threadpool.start(worker))
+
+    def is_done(self) -> bool:
+        """
+        Check if call is finished (in any way)
+
+        :return: True if finished
+        """
+        return self.status not in (self.STATUS_PENDING, self.STATUS_RUNNING)
+
+    def get_idx(self) -> Optional[str]:
+        """
+        Get index used by expert (worker sets shared last_idx, so it is resolved per call here)
+
+        :return: index name or None
+        """
+        expert = self.experts.get_expert(self.expert_id)
+        if expert is not None and self.window.core.idx.is_valid(expert.idx):
+            return expert.idx
+        return None
+
+    @Slot(object, object, str, str, str)
+    def on_cmd(
+            self,
+            ctx: CtxItem,
+            master_ctx: CtxItem,
+            expert_id: str,
+            expert_name: str,
+            result: str
+    ):
+        """
+        Handle expert commands, re-run expert with tool results if needed
+
+        :param ctx: CtxItem
+        :param master_ctx: master context item
+        :param expert_id: expert id
+        :param expert_name: expert name
+        :param result: expert output
+        """
+        if self.is_done():
+            return
+        if self.experts.stopped():
+            self.fanout.cancel()
+            return
+        tool_data = self.experts.run_cmds(ctx, idx=self.get_idx())
+        if tool_data is not None:
+            self.run(tool_data)
+            return
+        self.finish(self.STATUS_DONE, result=result)
+
+    @Slot(object, str)
+    def on_response(self, ctx: CtxItem, expert_id: str):
+        """
+        Handle expert response
+
+        :param ctx: CtxItem
+        :param expert_id: expert id
+        """
+        if self.is_done():
+            return
+        self.finish(self.STATUS_DONE, result=str(ctx.output))
+
+    @Slot(str)
+    def on_error(self, error: str):
+        """
+        Handle expert error
+
+        :param error: error message
+        """
+        if self.is_done():
+            return
+        self.finish(self.STATUS_ERROR, error=error)
+
+    @Slot()
+    def on_finished(self):
+        """Handle worker finished, worker without response ends call"""
+        self.runs -= 1
+        if self.runs > 0 or self.is_done():
+            return
+        self.finish(self.STATUS_DONE)
+
+    def on_timeout(self):
+        """Handle call timeout"""
+        if self.is_done():
+            return
+        for token in self.tokens:
+            token.cancel()  # running worker stops before next request or result emit
+        self.finish(self.STATUS_TIMEOUT, error="Timeout after {:.0f} s".format(self.fanout.timeout))
+
+    def cancel(self):
+        """Cancel call"""
+        if self.is_done():
+            return
+        for token in self.tokens:
+            token.cancel()
+        self.window.core.scheduler.remove(self.get_job_name())
+        self.status = self.STATUS_CANCELLED
+        if self.started_at is not None:
+            self.finished_at = time.perf_counter()
+
+    def finish(
+            self,
+            status: str,
+            result: Optional[str] = None,
+            error: Optional[str] = None
+    ):
+        """
+        Finish call and notify fan-out
+
+        :param status: final status
+        :param result: expert output
+        :param error: error message
+        """
+        self.status = status
+        self.result = result
+        self.error = error
+        self.finished_at = time.perf_counter()
+        self.window.core.scheduler.remove(self.get_job_name())
+        self.fanout.on_call_done(self)
+
+    def get_elapsed(self) -> float:
+        """
+        Get call time
+
+        :return: elapsed time in seconds
+        """
+        if self.started_at is None:
+            return 0.0
+        end = self.finished_at if self.finished_at is not None else time.perf_counter()
+        return end - self.started_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get call result for master
+
+        :return: result dict
+        """
+        data = {
+            "expert_id": self.expert_id,
+        }
+        if self.status == self.STATUS_DONE and self.result:
+            data["result"] = self.result
+        elif self.error:
+            data["error"] = self.error
+        else:
+            data["error"] = "No response from expert."
+        return data
+
+
+class FanOut:
+    def __init__(
+            self,
+            experts,
+            master_ctx: CtxItem,
+            calls: Dict[str, str],
+            parallel: int = 4,
+            timeout: float = 0
+    ):
+        """
+        Concurrent expert calls with results joined into single reply to master
+
+        :param experts: Experts core instance
+        :param master_ctx: master context
+        :param calls: expert calls {expert_id: query}
+        :param parallel: max concurrent calls
+        :param timeout: timeout of single expert call in seconds (0 = no timeout)
+        """
+        self.experts = experts
+        self.window = experts.window
+        self.master_ctx = master_ctx
+        self.parallel = max(1, int(parallel or 1))
+        self.timeout = max(0.0, float(timeout or 0))
+        self.calls: List[ExpertCall] = [
+            ExpertCall(self, i, expert_id, query) for i, (expert_id, query) in enumerate(calls.items())
+        ]
+        self.queue = deque(self.calls)
+        self.running = 0
+        self.closed = False
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    def start(self):
+        """Start calls"""
+        self.started_at = time.perf_counter()
+        self.launch()
+
+    def launch(self):
+        """Start pending calls up to parallel limit"""
+        while self.queue and self.running < self.parallel and not self.closed:
+            call = self.queue.popleft()
+            self.running += 1
+            call.start()
+
+    def on_call_done(self, call: ExpertCall):
+        """
+        Handle finished call
+
+        :param call: ExpertCall
+        """
+        self.running -= 1
+        if self.closed:
+            return
+        if self.experts.stopped():
+            self.cancel()
+            return
+        self.launch()
+        if self.running <= 0 and not self.queue:
+            self.join()
+
+    def join(self):
+        """Join results and reply to master"""
+        self.closed = True
+        self.finished_at = time.perf_counter()
+        self.experts.handle_join(self)
+
+    def cancel(self):
+        """Cancel all calls"""
+        if self.closed:
+            return
+        self.closed = True
+        self.queue.clear()
+        for call in self.calls:
+            call.cancel()
+        self.finished_at = time.perf_counter()
+
+    def is_active(self) -> bool:
+        """
+        Check if fan-out is in progress
+
+        :return: True if in progress
+        """
+        return self.started_at is not None and not self.closed
+
+    def get_results(self) -> List[Dict[str, Any]]:
+        """
+        Get results in call order
+
+        :return: list of results
+        """
+        return [call.to_dict() for call in self.calls]
+
+    def get_elapsed(self) -> float:
+        """
+        Get total time
+
+        :return: elapsed time in seconds
+        """
+        if self.started_at is None:
+            return 0.0
+        end = self.finished_at if self.finished_at is not None else time.perf_counter()
+        return end - self.started_at
+
+    def get_timings(self) -> Dict[str, str]:
+        """
+        Get timing per expert (for debug)
+
+        :return: dict {expert_id: timing}
+        """
+        timings = {}
+        for call in self.calls:
+            timings[call.expert_id] = "{}, {:.0f} ms, requests: {}".format(
+                call.status,
+                call.get_elapsed() * 1000,
+                call.rounds,
+            )
+        return timings
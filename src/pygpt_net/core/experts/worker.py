@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.23 15:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from typing import List, Optional
@@ -19,6 +19,7 @@ from pygpt_net.core.types import (
     TOOL_EXPERT_CALL_NAME,
 )
 from pygpt_net.core.bridge.context import BridgeContext
+from pygpt_net.core.executor import LANE_INTERACTIVE
 from pygpt_net.core.events import Event, KernelEvent, RenderEvent
 from pygpt_net.item.ctx import CtxItem
 
@@ -36,6 +37,7 @@ class WorkerSignals(QObject):
 
 class ExpertWorker(QRunnable):
     """Worker for handling expert calls in a separate thread."""
+    lane = LANE_INTERACTIVE  # executor lane
 
     def __init__(
             self,
@@ -50,6 +52,15 @@ class ExpertWorker(QRunnable):
         self.expert_id = expert_id
         self.query = query
         self.signals = WorkerSignals()
+        self.cancel_token = None  # set by executor
+
+    def is_cancelled(self) -> bool:
+        """
+        Check if worker was cancelled (e.g. expert call timeout)
+
+        :return: True if cancelled
+        """
+        return self.cancel_token is not None and self.cancel_token.is_cancelled()
 
     @Slot()
     def run(self):
@@ -58,6 +69,9 @@ class ExpertWorker(QRunnable):
         query = self.query
 
         try:
+            if self.is_cancelled():
+                return
+
             # get or create children (slave) meta
             slave = self.window.core.ctx.get_or_create_slave_meta(master_ctx, expert_id)
             expert = self.window.core.experts.get_expert(expert_id)  # preset
@@ -185,6 +199,9 @@ class ExpertWorker(QRunnable):
                     if tool.metadata.name == TOOL_EXPERT_CALL_NAME:
                         tools.remove(tool)
 
+                if self.is_cancelled():
+                    return
+
                 result = self.call_agent(
                     context=bridge_context,
                     tools=tools,
@@ -237,6 +254,9 @@ class ExpertWorker(QRunnable):
                     request=True,  # use normal request instead of quick call
                 )
 
+                if self.is_cancelled():
+                    return
+
                 self.signals.lock_input.emit()  # emit lock input signal
                 event = KernelEvent(KernelEvent.CALL, {
                     'context': bridge_context,  # call using slave ctx history
@@ -252,6 +272,9 @@ class ExpertWorker(QRunnable):
                     self.signals.finished.emit()
                     return
 
+            if self.is_cancelled():
+                return  # timed out or cancelled during call, do not emit result
+
             # handle output
             ctx.current = False  # reset current state
             ctx.output = result  # store expert output in their context
@@ -289,6 +312,8 @@ class ExpertWorker(QRunnable):
             reply_ctx.sub_call = True  # this flag is not copied in to_dict
 
             # reply to main thread
+            if self.is_cancelled():
+                return
 
             # send to reply()
             # input: something (no tool results here)
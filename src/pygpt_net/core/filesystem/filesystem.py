@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.23 23:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import os
@@ -26,6 +26,8 @@ from .types import Types
 from .url import Url
 
 class Filesystem:
+    DB_FILES = ["db.sqlite", "db.sqlite-wal", "db.sqlite-shm"]  # database with WAL journal files
+
     def __init__(self, window=None):
         """
         Filesystem core
@@ -334,7 +336,7 @@ class Filesystem:
         :param human_readable: return human-readable format
         :return: total size of the database file
         """
-        db_files = ["db.sqlite", "db.sqlite.backup"]
+        db_files = self.DB_FILES + ["db.sqlite.backup"]
         total_size = 0
         for file in db_files:
             db_file = os.path.join(path, file)
@@ -377,10 +379,10 @@ class Filesystem:
         :param copy_datadir: copy data directory
         :return: True if working directory is copied
         """
-        excluded_files = []
+        excluded_files = ["db.sqlite-shm"]  # shared memory index is rebuilt from WAL on open
         excluded_dirs = []
         if not copy_db:
-            excluded_files.append("db.sqlite")
+            excluded_files.extend(self.DB_FILES)
             excluded_files.append("db.sqlite.backup")
         if not copy_datadir:
             excluded_dirs.append("data")
@@ -425,7 +427,7 @@ class Filesystem:
         if not remove_datadir:
             excluded_dirs.append("data")
         if not remove_db:
-            excluded_files.append("db.sqlite")
+            excluded_files.extend(self.DB_FILES)  # WAL may contain not checkpointed commits
         for item in os.listdir(path):
             item_path = os.path.join(path, item)
             if os.path.isfile(item_path):
@@ -6,11 +6,9 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
-import datetime
-import os
 from typing import List
 
 from pygpt_net.item.ctx import CtxItem
@@ -47,18 +45,17 @@ class History:
         # delete all txt history files from history dir
         self.provider.truncate()
 
+    def flush(self):
+        """Write buffered history entries to files"""
+        self.provider.flush()
+
     def remove_items(self, items: List[CtxItem]):
         """
-        Remove items from history (txt files)
+        Remove items from history (txt files), each day file is rewritten once
 
         :param items: list of ctx items to remove
         """
-        path = self.window.core.config.get_user_dir('history')
-        if not os.path.exists(path):
-            return
-        for item in items:
-            self.remove_entry(item.input, item.input_timestamp)
-            self.remove_entry(item.output, item.output_timestamp)
+        self.provider.remove(items)
 
     def remove_entry(self, text: str, ts: int):
         """
@@ -69,26 +66,7 @@ class History:
         """
         if text is None or text.strip() == "":
             return
-
-        # remove entry from txt file in history dir
-        dir = self.window.core.config.get_user_dir('history')
-        filename = datetime.datetime.fromtimestamp(ts).strftime("%Y_%m_%d") + ".txt"
-        prefix = datetime.datetime.fromtimestamp(ts).strftime("%H:%M:%S") + ": "
-        path = os.path.join(dir, filename)
-        if not os.path.exists(path):
-            return
-        try:
-            data = prefix + text
-            with open(path, "r", encoding="utf-8") as f:
-                txt = f.read()
-                content = txt.replace(data.strip() + "\n", "")
-                if content == txt:  # if nothing was removed (timestamp mismatch or missing)
-                    # try without prefix
-                    content = content.replace(text.strip() + "\n", "")
-            if content.strip() == "":
-                os.remove(path)  # remove file if empty
-            else:
-                with open(path, "w", encoding="utf-8") as f:
-                    f.write(content.strip() + "\n")
-        except Exception as e:
-            print(e)
+        item = CtxItem()
+        item.input = text
+        item.input_timestamp = ts
+        self.provider.remove([item])
@@ -6,11 +6,11 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.12.27 17:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import datetime
-from typing import Optional, Tuple, List, Dict, Any
+from typing import Optional, Tuple, List, Dict, Any, Callable
 
 from packaging.version import Version
 
@@ -27,6 +27,7 @@ from .metadata import Metadata
 from .ui import UI
 
 from .types.ctx import Ctx
+from .types.embeddings import Embeddings
 from .types.external import External
 from .types.files import Files
 
@@ -58,6 +59,7 @@ class Idx:
         self.ctx = Ctx(window, self.get_provider())
         self.external = External(window, self.get_provider())
         self.files = Files(window, self.get_provider())
+        self.embeddings = Embeddings(window, self.get_provider())
 
     def install(self):
         """Install provider data"""
@@ -147,6 +149,7 @@ class Idx:
             path: Optional[str] = None,
             replace: Optional[bool] = None,
             recursive: Optional[bool] = None,
+            callback: Optional[Callable[[int, int], None]] = None,
     ) -> Tuple[Dict, List[str]]:
         """
         Index file or directory of files
@@ -155,10 +158,11 @@ class Idx:
         :param path: path to file or directory
         :param replace: replace index
         :param recursive: recursive indexing
+        :param callback: progress callback (done, total)
         :return: dict with indexed files (path -> id), list with errors
         """
         llm, embed_model = self.llm.get_service_context(stream=False)
-        index = self.storage.get(
+        index = self.storage.get_for_update(
             id=idx,
             llm=llm,
             embed_model=embed_model,
@@ -169,6 +173,7 @@ class Idx:
             path=path,
             replace=replace,
             recursive=recursive,
+            callback=callback,
         )  # index files
         if len(files) > 0:
             self.storage.store(
@@ -195,7 +200,7 @@ class Idx:
         :return: num of indexed files, list with errors
         """
         llm, embed_model = self.llm.get_service_context(stream=False)
-        index = self.storage.get(
+        index = self.storage.get_for_update(
             id=idx,
             llm=llm,
             embed_model=embed_model,
@@ -229,7 +234,7 @@ class Idx:
         :return: num of indexed files, list with errors
         """
         llm, embed_model = self.llm.get_service_context(stream=False)
-        index = self.storage.get(
+        index = self.storage.get_for_update(
             id=idx,
             llm=llm,
             embed_model=embed_model,
@@ -266,7 +271,7 @@ class Idx:
         :return: num of indexed, list with errors
         """
         llm, embed_model = self.llm.get_service_context(stream=False)
-        index = self.storage.get(
+        index = self.storage.get_for_update(
             id=idx,
             llm=llm,
             embed_model=embed_model,
@@ -310,7 +315,7 @@ class Idx:
         self.indexing.update_loader_args(type, config)
 
         llm, embed_model = self.llm.get_service_context(stream=False)
-        index = self.storage.get(
+        index = self.storage.get_for_update(
             id=idx,
             llm=llm,
             embed_model=embed_model,
@@ -451,6 +456,7 @@ class Idx:
             doc_id = files[path]
             file_id = self.files.get_id(path)
             ts = int(datetime.datetime.now().timestamp())
+            state = self.indexing.states.pop(path, None)  # size, mtime, hash
             if file_id not in self.items[store_id][idx].items:
                 id = self.files.append(
                     store_id=store_id,
@@ -458,6 +464,7 @@ class Idx:
                     file_id=file_id,
                     path=path,
                     doc_id=doc_id,
+                    state=state,
                 )
                 if id is not None:
                     self.items[store_id][idx].items[file_id] = {
@@ -466,15 +473,20 @@ class Idx:
                         "path": path,
                         "indexed_ts": ts,
                     }
+                    if state:
+                        self.items[store_id][idx].items[file_id].update(state)
             else:
                 # update indexed timestamp only
                 self.files.update(
                     id=self.items[store_id][idx].items[file_id]["db_id"],  # DB id
                     doc_id=doc_id,
                     ts=ts,
+                    state=state,
                 )
                 self.items[store_id][idx].items[file_id]["id"] = doc_id
                 self.items[store_id][idx].items[file_id]["indexed_ts"] = ts
+                if state:
+                    self.items[store_id][idx].items[file_id].update(state)
 
     def remove_doc(
             self,
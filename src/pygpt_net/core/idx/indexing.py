@@ -6,15 +6,14 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.21 07:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import datetime
 import os
-import time
 
 from pathlib import Path
-from typing import Optional, Tuple, List, Dict, Any
+from typing import Optional, Tuple, List, Dict, Any, Callable
 
 from sqlalchemy import text
 
@@ -26,6 +25,8 @@ from pygpt_net.item.model import ModelItem
 from pygpt_net.provider.loaders.base import BaseLoader
 from pygpt_net.utils import parse_args, pack_arg
 
+from .pipeline import Pipeline
+
 
 class Indexing:
     def __init__(self, window=None):
@@ -42,7 +43,8 @@ class Indexing:
         self.data_providers = {}  # data providers (loaders)
         self.external_instructions = {}
         self.external_config = {}
-        self.last_call = None
+        self.states = {}  # path -> state (size, mtime, hash) of indexed files
+        self.pipeline = Pipeline(window, self)
 
     def register_loader(self, loader: BaseLoader):
         """
@@ -455,7 +457,8 @@ class Indexing:
             path: Optional[str] = None,
             is_tmp: bool = False,
             replace: Optional[bool] = None,
-            recursive: Optional[bool] = None
+            recursive: Optional[bool] = None,
+            callback: Optional[Callable[[int, int], None]] = None,
     ) -> Tuple[dict, list]:
         """
         Index all files in directory
@@ -466,8 +469,22 @@ class Indexing:
         :param is_tmp: True if temporary index
         :param replace: True if replace old document
         :param recursive: True if recursive indexing
+        :param callback: progress callback (done, total), pipeline mode only
         :return: dict with indexed files, errors
         """
+        if self.pipeline.is_enabled():
+            if recursive is None:
+                recursive = bool(self.window.core.config.get("llama.idx.recursive"))
+            return self.pipeline.index_files(
+                idx=idx,
+                index=index,
+                path=path,
+                is_tmp=is_tmp,
+                replace=replace,
+                recursive=recursive,
+                callback=callback,
+            )
+
         if recursive is not None:
             if recursive:
                 return self.index_files_recursive(idx, index, path, is_tmp, replace)
@@ -489,6 +506,10 @@ class Indexing:
                 if self.is_stopped():  # force stop
                     break
 
+                if self.is_unchanged(idx, file, is_tmp, replace):
+                    self.window.core.idx.log(f"Skipping unchanged file: {file}")
+                    continue
+
                 # force replace or not old document
                 if replace is not None:
                     if replace:
@@ -553,6 +574,10 @@ class Indexing:
                         if self.is_stopped():  # force stop
                             break
 
+                        if self.is_unchanged(idx, file_path, is_tmp, replace):
+                            self.window.core.idx.log(f"Skipping unchanged file: {file_path}")
+                            continue
+
                         # force replace or not old document
                         if replace is not None:
                             if replace:
@@ -586,6 +611,10 @@ class Indexing:
         # file
         elif os.path.isfile(path):
             try:
+                if self.is_unchanged(idx, path, is_tmp, replace):
+                    self.window.core.idx.log(f"Skipping unchanged file: {path}")
+                    return indexed, errors
+
                 # remove old file from index if exists
                 file_id = self.window.core.idx.files.get_id(path)
 
@@ -928,6 +957,65 @@ class Indexing:
             errors.extend(errs)
         return n, errors
 
+    def is_unchanged(
+            self,
+            idx: str,
+            path: str,
+            is_tmp: bool = False,
+            replace: Optional[bool] = None
+    ) -> bool:
+        """
+        Check if file is already indexed and not changed since last indexing
+
+        Current file state is stored in self.states to persist it with the indexed file.
+
+        :param idx: index name
+        :param path: path to file
+        :param is_tmp: True if temporary index
+        :param replace: True if force replace (file is re-indexed, only state is collected)
+        :return: True if file can be skipped
+        """
+        if is_tmp:
+            return False
+        try:
+            if replace or not self.window.core.config.get("llama.idx.skip_unchanged", True):
+                state = self.window.core.idx.files.get_state(path)
+            else:
+                file_id = self.window.core.idx.files.get_id(path)
+                data = self.window.core.idx.get_idx_data(idx).get(idx, {}).get(file_id)
+                unchanged, state = self.window.core.idx.files.compare(data, path)
+                if unchanged is True:
+                    if state["mtime"] != data.get("mtime"):
+                        self.store_state(data, state)  # touched only, keep new mtime for next check
+                    return True
+        except Exception as e:
+            self.window.core.debug.log(e)
+            return False
+        self.states[path] = state
+        return False
+
+    def store_state(
+            self,
+            data: Dict[str, Any],
+            state: Dict[str, Any]
+    ):
+        """
+        Store current state of indexed file without re-indexing it
+
+        :param data: indexed file data (from index items)
+        :param state: current file state (size, mtime, hash)
+        """
+        try:
+            self.window.core.idx.files.update(
+                id=data["db_id"],
+                doc_id=data["id"],
+                ts=data["indexed_ts"],
+                state=state,
+            )
+            data.update(state)
+        except Exception as e:
+            self.window.core.debug.log(e)
+
     def remove_old_meta_id(
             self,
             idx: str,
@@ -1040,7 +1128,7 @@ class Indexing:
         :param index: index instance
         :param doc: document
         """
-        self.apply_rate_limit()  # apply RPM limit
+        self.apply_rate_limit(doc.text)  # apply RPM/TPM limit
         """
         try:
             # display embedding model info
@@ -1172,22 +1260,30 @@ class Indexing:
         self.window.core.idx.storage.store_ctx_idx(index_path, index)
         return True
 
-    def apply_rate_limit(self):
-        """Apply API calls RPM limit"""
-        max_per_minute = 60
-        if self.window.core.config.has("llama.idx.embeddings.limit.rpm"):
-            max_per_minute = int(self.window.core.config.get("llama.idx.embeddings.limit.rpm")) # per minute
-        if max_per_minute <= 0:
-            return
-        interval = datetime.timedelta(minutes=1) / max_per_minute
-        now = datetime.datetime.now()
-        if self.last_call is not None:
-            time_since_last_call = now - self.last_call
-            if time_since_last_call < interval:
-                sleep_time = (interval - time_since_last_call).total_seconds()
-                self.window.core.idx.log(f"RPM limit: sleep for {sleep_time} seconds")
-                time.sleep(sleep_time)
-        self.last_call = now
+    def apply_rate_limit(self, text: Optional[str] = None):
+        """
+        Apply embeddings API RPM and TPM limits (shared limiter)
+
+        :param text: text to embed, used for tokens estimate
+        """
+        rpm, tpm = self.pipeline.get_rate_limits()
+        limiter = self.window.core.limiter
+        limiter.acquire(
+            self.get_limit_provider(),
+            "embeddings",
+            tokens=limiter.estimate_tokens(text),
+            rpm=rpm,
+            tpm=tpm,
+            stopped=self.is_stopped,
+        )
+
+    def get_limit_provider(self) -> str:
+        """
+        Get embeddings provider id used as rate limiter key
+
+        :return: provider id
+        """
+        return str(self.window.core.config.get("llama.idx.embeddings.provider", "openai"))
 
     def stop_enabled(self) -> bool:
         """
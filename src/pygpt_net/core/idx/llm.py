@@ -6,11 +6,15 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.07.13 01:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
+import hashlib
+import json
 import os.path
-from typing import Optional, Union, List, Dict
+import threading
+from collections import OrderedDict
+from typing import Optional, Union, List, Dict, Callable
 
 from llama_index.core.llms.llm import BaseLLM
 from llama_index.core.multi_modal_llms import MultiModalLLM
@@ -25,6 +29,8 @@ from pygpt_net.item.model import ModelItem
 
 
 class Llm:
+    MAX_EMBED_MODELS = 8  # max number of cached embedding model instances (LRU)
+
     def __init__(self, window=None):
         """
         LLM provider core
@@ -35,6 +41,8 @@ class Llm:
         self.default_model = MODEL_DEFAULT_MINI
         self.default_embed = "openai"
         self.initialized = False
+        self.embed_models: "OrderedDict[str, BaseEmbedding]" = OrderedDict()  # key -> embedding model
+        self.lock = threading.Lock()
 
     def init(self):
         """Init base ENV vars"""
@@ -121,10 +129,7 @@ class Llm:
         )
         model_name = self.extract_model_name_from_args(args)
         self.window.core.idx.log(f"Embeddings: using global provider: {provider}, model_name: {model_name}")
-        return self.window.core.llm.llms[provider].get_embeddings_model(
-            window=self.window,
-            config=args,
-        )
+        return self.get_embeddings_model(provider, args, env)
 
     def get_service_context(
             self,
@@ -194,15 +199,117 @@ class Llm:
                 break
 
         if is_custom_provider:
-            embed_model = self.window.core.llm.llms[model.provider].get_embeddings_model(
-                window=self.window,
-                config=args,
-            )
+            embed_model = self.get_embeddings_model(model.provider, args)
         if not embed_model:
             self.window.core.idx.log(f"Embeddings: not configured for {model.provider}. Fallback: using global provider.")
             embed_model = self.get_embeddings_provider()
         return embed_model
 
+    def get_embeddings_model(
+            self,
+            provider: str,
+            args: List[Dict],
+            env: Optional[List[Dict]] = None
+    ) -> Optional[BaseEmbedding]:
+        """
+        Get embedding model instance (cached per provider and args)
+
+        :param provider: embeddings provider id
+        :param args: provider args
+        :param env: provider ENV vars
+        :return: embedding model instance
+        """
+        key = self.get_embed_key(provider, args, env)
+        with self.lock:
+            embed_model = self.embed_models.get(key)
+            if embed_model is not None:
+                self.embed_models.move_to_end(key)
+                return embed_model
+
+        embed_model = self.window.core.llm.llms[provider].get_embeddings_model(
+            window=self.window,
+            config=args,
+        )
+        if embed_model is None:
+            return None
+        self.attach_query_cache(embed_model)
+        with self.lock:
+            embed_model = self.embed_models.setdefault(key, embed_model)
+            self.embed_models.move_to_end(key)
+            while len(self.embed_models) > self.MAX_EMBED_MODELS:
+                self.embed_models.popitem(last=False)
+        return embed_model
+
+    def get_embed_key(
+            self,
+            provider: str,
+            args: List[Dict],
+            env: Optional[List[Dict]] = None
+    ) -> str:
+        """
+        Get cache key of embedding model
+
+        :param provider: embeddings provider id
+        :param args: provider args
+        :param env: provider ENV vars
+        :return: key (hash of provider and args)
+        """
+        data = json.dumps([provider, args, env], sort_keys=True, default=str)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def attach_query_cache(self, embed_model: BaseEmbedding):
+        """
+        Attach LRU cache of query embeddings (query text -> vector) to embedding model instance
+
+        :param embed_model: embedding model instance
+        """
+        size = int(self.window.core.config.get("llama.idx.embeddings.query_cache", 256) or 0)
+        if size <= 0 or not isinstance(embed_model, BaseEmbedding):
+            return
+        cache: "OrderedDict[str, List[float]]" = OrderedDict()
+        lock = threading.Lock()
+
+        def lookup(query: str) -> Optional[List[float]]:
+            with lock:
+                vector = cache.get(query)
+                if vector is not None:
+                    cache.move_to_end(query)
+                    return list(vector)
+            return None
+
+        def store(query: str, vector: List[float]):
+            with lock:
+                cache[query] = list(vector)
+                while len(cache) > size:
+                    cache.popitem(last=False)
+
+        def wrap(get: Callable) -> Callable:
+            def get_query_embedding(query: str) -> List[float]:
+                vector = lookup(query)
+                if vector is None:
+                    vector = get(query)
+                    store(query, vector)
+                return vector
+            return get_query_embedding
+
+        def wrap_async(aget: Callable) -> Callable:
+            async def aget_query_embedding(query: str) -> List[float]:
+                vector = lookup(query)
+                if vector is None:
+                    vector = await aget(query)
+                    store(query, vector)
+                return vector
+            return aget_query_embedding
+
+        # instance attributes, model fields and serialization are not affected
+        object.__setattr__(embed_model, "_get_query_embedding", wrap(embed_model._get_query_embedding))
+        object.__setattr__(embed_model, "_aget_query_embedding", wrap_async(embed_model._aget_query_embedding))
+
+    def clear_embeddings_cache(self):
+        """Clear cached embedding model instances and their query embeddings"""
+        with self.lock:
+            self.embed_models.clear()
+
     def extract_model_name_from_args(self, args: List[Dict]) -> str:
         """
         Extract model name from provider args
@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 12:00:00                  #
+# ================================================== #
+
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple, List, Dict, Callable
+
+from llama_index.core.indices.base import BaseIndex
+from llama_index.core.ingestion import run_transformations
+from llama_index.core.schema import Document, BaseNode, MetadataMode
+
+
+class Pipeline:
+    def __init__(self, window=None, indexing=None):
+        """
+        Pipelined file indexing (load -> chunk -> embed in batches -> bulk insert)
+
+        :param window: Window instance
+        :param indexing: Indexing instance
+        """
+        self.window = window
+        self.indexing = indexing
+
+    def is_enabled(self) -> bool:
+        """
+        Check if pipelined indexing is enabled
+
+        :return: True if enabled
+        """
+        return bool(self.window.core.config.get("llama.idx.pipeline", False))
+
+    def get_workers(self) -> int:
+        """
+        Get number of loader threads
+
+        :return: number of threads
+        """
+        workers = int(self.window.core.config.get("llama.idx.pipeline.workers", 4) or 0)
+        if workers <= 0:
+            workers = min(8, (os.cpu_count() or 1) + 2)
+        return workers
+
+    def get_batch_limits(self) -> Tuple[int, int]:
+        """
+        Get embedding batch limits
+
+        :return: max nodes per batch, max tokens per batch (0 = no limit)
+        """
+        size = int(self.window.core.config.get("llama.idx.embeddings.batch.size", 100) or 0)
+        tokens = int(self.window.core.config.get("llama.idx.embeddings.batch.tokens", 100000) or 0)
+        return max(1, size), max(0, tokens)
+
+    def get_rate_limits(self) -> Tuple[int, int]:
+        """
+        Get embeddings API rate limits
+
+        :return: requests per minute, tokens per minute (0 = no limit)
+        """
+        rpm = int(self.window.core.config.get("llama.idx.embeddings.limit.rpm", 60) or 0)
+        tpm = int(self.window.core.config.get("llama.idx.embeddings.limit.tpm", 0) or 0)
+        return max(0, rpm), max(0, tpm)
+
+    def collect_files(
+            self,
+            path: str,
+            recursive: bool = False
+    ) -> List[str]:
+        """
+        Collect files to index
+
+        :param path: path to file or directory
+        :param recursive: True if walk subdirectories
+        :return: list of file paths
+        """
+        files = []
+        if os.path.isdir(path):
+            if recursive:
+                for root, dirs, names in os.walk(path):
+                    for name in names:
+                        files.append(os.path.join(root, name))
+            else:
+                files = [os.path.join(path, f)
+                         for f in os.listdir(path) if os.path.isfile(os.path.join(path, f))]
+        elif os.path.isfile(path):
+            files = [path]
+        return files
+
+    def index_files(
+            self,
+            idx: str,
+            index: BaseIndex,
+            path: Optional[str] = None,
+            is_tmp: bool = False,
+            replace: Optional[bool] = None,
+            recursive: bool = False,
+            callback: Optional[Callable[[int, int], None]] = None,
+    ) -> Tuple[dict, list]:
+        """
+        Index files using pipeline: files are loaded and chunked in thread pool,
+        nodes are embedded in batches and inserted into index in bulk
+
+        :param idx: index name
+        :param index: index instance
+        :param path: path to file or directory
+        :param is_tmp: True if temporary index
+        :param replace: True if replace old document
+        :param recursive: True if recursive indexing
+        :param callback: progress callback (done, total)
+        :return: dict with indexed files, errors
+        """
+        indexed = {}
+        errors = []
+        files = self.collect_files(path, recursive)
+        total = len(files)
+        if total == 0:
+            return indexed, errors
+
+        batch_size, batch_tokens = self.get_batch_limits()
+        workers = min(self.get_workers(), total)
+        self.window.core.idx.log(
+            f"Pipeline indexing: {total} files, threads: {workers}, batch: {batch_size} nodes / {batch_tokens} tokens"
+        )
+
+        batch = []  # (file, node, tokens)
+        batch_num_tokens = 0
+        remaining = {}  # file -> nodes left to insert
+        docs = {}  # file -> loaded documents
+        failed = set()  # files with failed batches
+        done = 0
+        is_break = False
+
+        def flush() -> bool:
+            """Embed and insert current batch, returns False on error"""
+            nonlocal batch, batch_num_tokens, done
+            if not batch:
+                return True
+            items = batch
+            batch = []
+            batch_num_tokens = 0
+            try:
+                self.insert_batch(index, [node for _, node, _ in items], sum(t for _, _, t in items))
+            except Exception as e:
+                for file in dict.fromkeys(f for f, _, _ in items):
+                    failed.add(file)
+                    remaining.pop(file, None)
+                    docs.pop(file, None)
+                    errors.append(str(e))
+                    print(f"Error while indexing file: {file}")
+                self.window.core.debug.log(e)
+                return False
+            for file, _, _ in items:
+                if file not in remaining:
+                    continue
+                remaining[file] -= 1
+                if remaining[file] == 0:
+                    del remaining[file]
+                    self.complete_file(index, file, docs.pop(file), indexed)
+                    done += 1
+                    if callback is not None:
+                        callback(done, total)
+            return True
+
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="idx-pipeline")
+        pending = deque()  # futures in order of submission
+        queue = iter(files)
+        try:
+            # keep a bounded number of loaded files in memory
+            for file in queue:
+                pending.append((file, executor.submit(self.load, idx, index, file, is_tmp, replace)))
+                if len(pending) >= workers * 2:
+                    break
+
+            while pending:
+                if self.indexing.is_stopped():  # force stop
+                    break
+
+                file, future = pending.popleft()
+                next_file = next(queue, None)
+                if next_file is not None:
+                    pending.append((next_file, executor.submit(self.load, idx, index, next_file, is_tmp, replace)))
+
+                try:
+                    result = future.result()
+                    if result is None:  # unchanged since last indexing
+                        self.window.core.idx.log(f"Skipping unchanged file: {file}")
+                        done += 1
+                        if callback is not None:
+                            callback(done, total)
+                        continue
+                    documents, nodes = result
+                    self.remove_old(idx, file, is_tmp, replace)
+                except Exception as e:
+                    errors.append(str(e))
+                    print(f"Error while indexing file: {file}")
+                    self.window.core.debug.log(e)
+                    if self.indexing.stop_enabled():
+                        break  # break loop if error
+                    continue
+
+                if not documents:
+                    done += 1
+                    if callback is not None:
+                        callback(done, total)
+                    continue
+
+                docs[file] = documents
+                if not nodes:
+                    self.complete_file(index, file, documents, indexed)
+                    del docs[file]
+                    done += 1
+                    if callback is not None:
+                        callback(done, total)
+                    continue
+
+                remaining[file] = len(nodes)
+                for node in nodes:
+                    tokens = self.count_tokens(node)
+                    if batch and (len(batch) >= batch_size
+                                  or (batch_tokens > 0 and batch_num_tokens + tokens > batch_tokens)):
+                        if not flush() and self.indexing.stop_enabled():
+                            is_break = True
+                            break
+                    if file in failed:
+                        break
+                    batch.append((file, node, tokens))
+                    batch_num_tokens += tokens
+                if is_break:
+                    break
+
+            if not is_break and not self.indexing.is_stopped():
+                flush()
+        finally:
+            for _, future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+        self.evict_cache()
+        return indexed, errors
+
+    def evict_cache(self):
+        """Apply size and age limits of embeddings cache after indexing"""
+        cache = self.window.core.idx.embeddings
+        if not cache.is_enabled():
+            return
+        try:
+            removed = cache.evict()
+            if removed:
+                self.window.core.idx.log(f"Embeddings cache: {removed} old vectors removed")
+        except Exception as e:
+            self.window.core.debug.log(e)
+
+    def load(
+            self,
+            idx: str,
+            index: BaseIndex,
+            file: str,
+            is_tmp: bool = False,
+            replace: Optional[bool] = None
+    ) -> Optional[Tuple[List[Document], List[BaseNode]]]:
+        """
+        Load and chunk file (executed in thread pool)
+
+        :param idx: index name
+        :param index: index instance
+        :param file: path to file
+        :param is_tmp: True if temporary index
+        :param replace: True if force replace old document (unchanged files are re-indexed too)
+        :return: documents, nodes or None if file is unchanged
+        """
+        if self.indexing.is_stopped():
+            return [], []
+        if self.indexing.is_unchanged(idx, file, is_tmp, replace):
+            return None
+        documents = self.indexing.get_documents(file)
+        for doc in documents:
+            self.indexing.prepare_document(doc)
+        return documents, self.chunk(index, documents)
+
+    def chunk(
+            self,
+            index: BaseIndex,
+            documents: List[Document]
+    ) -> List[BaseNode]:
+        """
+        Split documents into nodes using index transformations
+
+        :param index: index instance
+        :param documents: list of documents
+        :return: list of nodes
+        """
+        if not documents:
+            return []
+        transformations = getattr(index, "_transformations", None) or []
+        return run_transformations(documents, transformations, show_progress=False)
+
+    def remove_old(
+            self,
+            idx: str,
+            file: str,
+            is_tmp: bool = False,
+            replace: Optional[bool] = None
+    ):
+        """
+        Remove previous version of file from index
+
+        :param idx: index name
+        :param file: path to file
+        :param is_tmp: True if temporary index
+        :param replace: True if replace old document
+        """
+        if replace is not None:
+            if replace:
+                file_id = self.window.core.idx.files.get_id(file)
+                self.indexing.remove_old_file(idx, file_id, force=True)
+        else:
+            # if auto, only replace if not temporary
+            if not is_tmp:
+                file_id = self.window.core.idx.files.get_id(file)
+                self.indexing.remove_old_file(idx, file_id)
+
+    def count_tokens(self, node: BaseNode) -> int:
+        """
+        Estimate number of tokens of node content sent to embeddings API
+
+        :param node: node
+        :return: number of tokens
+        """
+        return self.estimate_tokens(node.get_content(metadata_mode=MetadataMode.EMBED))
+
+    def estimate_tokens(self, text: str) -> int:
+        """
+        Estimate number of tokens in text
+
+        :param text: text
+        :return: number of tokens
+        """
+        return len(text) // 3 + 1  # upper estimate, tokens are ~4 chars on average
+
+    def insert_batch(
+            self,
+            index: BaseIndex,
+            nodes: List[BaseNode],
+            tokens: int = 0
+    ):
+        """
+        Embed batch of nodes and insert them into index
+
+        :param index: index instance
+        :param nodes: list of nodes
+        :param tokens: estimated number of tokens in batch
+        """
+        embed_model = getattr(index, "_embed_model", None)
+        if embed_model is not None:
+            texts = []
+            to_embed = []
+            for node in nodes:
+                if node.embedding is None:
+                    texts.append(node.get_content(metadata_mode=MetadataMode.EMBED))
+                    to_embed.append(node)
+
+            # reuse vectors of already embedded chunks
+            cache = self.window.core.idx.embeddings
+            model = None
+            hashes = []
+            if texts and cache.is_enabled():
+                model = cache.get_model_key(embed_model)
+                hashes = [cache.hash(text) for text in texts]
+                cached = cache.get(model, hashes)
+                if cached:
+                    misses = [i for i, hash in enumerate(hashes) if hash not in cached]
+                    for i, hash in enumerate(hashes):
+                        if hash in cached:
+                            to_embed[i].embedding = cached[hash]
+                    self.window.core.idx.log(f"Embeddings cache: {len(texts) - len(misses)} hits")
+                    texts = [texts[i] for i in misses]
+                    to_embed = [to_embed[i] for i in misses]
+                    hashes = [hashes[i] for i in misses]
+                    tokens = sum(self.estimate_tokens(text) for text in texts)
+
+            if texts:
+                per_call = int(getattr(embed_model, "embed_batch_size", 0) or len(texts))
+                requests = -(-len(texts) // per_call)  # ceil
+                self.wait_for_limit(requests, tokens)
+                embeddings = embed_model.get_text_embedding_batch(texts)
+                for node, embedding in zip(to_embed, embeddings):
+                    node.embedding = embedding
+                if model is not None:
+                    cache.append(model, dict(zip(hashes, embeddings)))
+        index.insert_nodes(nodes)
+        self.window.core.idx.log(f"Inserted batch: {len(nodes)} nodes, ~{tokens} tokens")
+
+    def complete_file(
+            self,
+            index: BaseIndex,
+            file: str,
+            documents: List[Document],
+            indexed: Dict[str, str]
+    ):
+        """
+        Mark file documents as indexed
+
+        :param index: index instance
+        :param file: path to file
+        :param documents: file documents
+        :param indexed: dict with indexed files
+        """
+        for doc in documents:
+            try:
+                index.docstore.set_document_hash(doc.id_, doc.hash)
+            except Exception as e:
+                self.window.core.debug.log(e)
+            indexed[file] = doc.id_
+            self.window.core.idx.log(f"Inserted document: {doc.id_}, metadata: {doc.metadata}")
+
+    def wait_for_limit(self, requests: int, tokens: int):
+        """
+        Wait until batch fits in RPM and TPM limits (shared limiter)
+
+        :param requests: number of API requests in batch
+        :param tokens: number of tokens in batch
+        """
+        rpm, tpm = self.get_rate_limits()
+        self.window.core.limiter.acquire(
+            self.indexing.get_limit_provider(),
+            "embeddings",
+            requests=requests,
+            tokens=tokens,
+            rpm=rpm,
+            tpm=tpm,
+            stopped=self.indexing.is_stopped,
+        )
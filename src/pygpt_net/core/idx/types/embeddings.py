@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 12:00:00                  #
+# ================================================== #
+
+import hashlib
+import json
+import time
+from array import array
+from typing import Optional, Dict, List, Any
+
+
+class Embeddings:
+    # model fields which do not change vectors (credentials, transport, batching)
+    IGNORED_ARGS = ("key", "token", "secret", "password", "callback", "client", "header",
+                    "batch", "workers", "timeout", "retries", "retry")
+
+    def __init__(self, window=None, provider=None):
+        """
+        Embeddings cache core (content hash -> vector, per embedding model)
+
+        :param window: Window instance
+        :param provider: provider name
+        """
+        self.window = window
+        self.provider = provider
+
+    def is_enabled(self) -> bool:
+        """
+        Check if embeddings cache is enabled
+
+        :return: True if enabled
+        """
+        return bool(self.window.core.config.get("llama.idx.embeddings.cache", True))
+
+    def evict(self) -> int:
+        """
+        Remove vectors older than max age and oldest vectors above max items
+
+        :return: number of removed vectors
+        """
+        config = self.window.core.config
+        max_items = int(config.get("llama.idx.embeddings.cache.max_items", 200000) or 0)
+        max_age = int(config.get("llama.idx.embeddings.cache.max_age", 90) or 0)  # days
+        min_ts = int(time.time()) - max_age * 86400 if max_age > 0 else 0
+        if max_items <= 0 and min_ts <= 0:
+            return 0
+        return self.provider.evict_embeddings(max_items, min_ts)
+
+    def get_model_key(self, embed_model: Any) -> str:
+        """
+        Get cache key of embedding model
+
+        :param embed_model: embedding model instance
+        :return: model key (provider class + model name + hash of model args)
+        """
+        name = getattr(embed_model, "model_name", None) or ""
+        try:
+            cls = embed_model.class_name()
+        except Exception:
+            cls = embed_model.__class__.__name__
+        return f"{cls}:{name}:{self.get_args_hash(embed_model)}"
+
+    def get_args_hash(self, embed_model: Any) -> str:
+        """
+        Get stable hash of resolved embedding model args (e.g. dimensions)
+
+        :param embed_model: embedding model instance
+        :return: short hash
+        """
+        try:
+            fields = embed_model.model_dump()
+        except Exception:
+            fields = dict(getattr(embed_model, "__dict__", {}))
+        args = {}
+        for key, value in fields.items():
+            lower = str(key).lower()
+            if lower.startswith("_") or any(word in lower for word in self.IGNORED_ARGS):
+                continue
+            try:
+                args[key] = json.loads(json.dumps(value, sort_keys=True))  # JSON values only
+            except (TypeError, ValueError):
+                continue
+        data = json.dumps(args, sort_keys=True)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()[:16]
+
+    def hash(self, text: str) -> str:
+        """
+        Get content hash
+
+        :param text: text to embed
+        :return: sha256 hex digest
+        """
+        return hashlib.sha256(text.encode("utf-8", errors="replace")).hexdigest()
+
+    def get(
+            self,
+            model: str,
+            hashes: List[str]
+    ) -> Dict[str, List[float]]:
+        """
+        Get cached vectors
+
+        :param model: embedding model key
+        :param hashes: list of content hashes
+        :return: dict of hash -> vector
+        """
+        if not hashes:
+            return {}
+        items = {}
+        for hash, data in self.provider.get_embeddings(model, hashes).items():
+            vector = array("f")
+            vector.frombytes(data)
+            items[hash] = vector.tolist()
+        return items
+
+    def append(
+            self,
+            model: str,
+            items: Dict[str, List[float]]
+    ) -> bool:
+        """
+        Store vectors in cache
+
+        :param model: embedding model key
+        :param items: dict of hash -> vector
+        :return: True if stored
+        """
+        if not items:
+            return False
+        return self.provider.append_embeddings(
+            model,
+            {hash: array("f", vector).tobytes() for hash, vector in items.items()},
+        )
+
+    def truncate(self, model: Optional[str] = None) -> bool:
+        """
+        Truncate embeddings cache
+
+        :param model: embedding model key (all models if None)
+        :return: True if truncated
+        """
+        return self.provider.truncate_embeddings(model)
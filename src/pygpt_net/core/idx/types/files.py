@@ -6,12 +6,13 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 00:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import datetime
+import hashlib
 import os.path
-from typing import Optional
+from typing import Optional, Dict, Any, Tuple
 
 
 class Files:
@@ -31,7 +32,8 @@ class Files:
             idx: str,
             file_id: str,
             path: str,
-            doc_id: str
+            doc_id: str,
+            state: Optional[Dict[str, Any]] = None
     ) -> int:
         """
         Append file to index
@@ -41,6 +43,7 @@ class Files:
         :param file_id: file id
         :param path: file path
         :param doc_id: document id
+        :param state: file state (size, mtime, hash)
         :return: ID of appended file
         """
         data = {
@@ -49,6 +52,8 @@ class Files:
             "indexed_ts": datetime.datetime.now().timestamp(),
             "id": doc_id,
         }
+        if state:
+            data.update(state)
         return self.provider.append_file(
             store_id=store_id,
             idx=idx,
@@ -112,7 +117,8 @@ class Files:
             self,
             id: int,
             doc_id: str,
-            ts: int
+            ts: int,
+            state: Optional[Dict[str, Any]] = None
     ) -> bool:
         """
         Update timestamp of indexed file
@@ -120,14 +126,66 @@ class Files:
         :param id: database record ID
         :param doc_id: document ID
         :param ts: timestamp
+        :param state: file state (size, mtime, hash)
         :return: True if file was updated
         """
         return self.provider.update_file(
             id=id,
             doc_id=doc_id,
             ts=ts,
+            state=state,
         )
 
+    def get_state(
+            self,
+            path: str,
+            with_hash: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Get current file state
+
+        :param path: file path
+        :param with_hash: True to calculate content hash (sha256)
+        :return: file state (size, mtime, hash)
+        """
+        stat = os.stat(path)
+        state = {
+            "size": stat.st_size,
+            "mtime": stat.st_mtime_ns,
+            "hash": "",
+        }
+        if with_hash:
+            sha = hashlib.sha256()
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(1024 * 1024), b""):
+                    sha.update(block)
+            state["hash"] = sha.hexdigest()
+        return state
+
+    def compare(
+            self,
+            data: Optional[Dict[str, Any]],
+            path: str
+    ) -> Tuple[bool, Dict[str, Any]]:
+        """
+        Compare indexed file data with current file state
+
+        Content hash is calculated only if size or mtime differs from stored state.
+
+        :param data: indexed file data (from index items)
+        :param path: file path
+        :return: True if unchanged, current file state
+        """
+        if data and data.get("hash"):
+            state = self.get_state(path, with_hash=False)
+            if state["size"] == data["size"]:
+                if state["mtime"] == data.get("mtime"):
+                    state["hash"] = data["hash"]
+                    return True, state
+                state = self.get_state(path)
+                return state["hash"] == data["hash"], state
+        return False, self.get_state(path)
+
     def remove(
             self,
             store_id: str,
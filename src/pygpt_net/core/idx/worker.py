@@ -6,18 +6,23 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.12.27 19:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from PySide6.QtCore import QObject, Signal, QRunnable, Slot
 
+from pygpt_net.core.executor import LANE_INDEXING
+
 
 class IndexWorkerSignals(QObject):
     finished = Signal(str, object, object, bool)  # idx, result, errors, silent mode
     error = Signal(object)
+    progress = Signal(str, int, int)  # idx, done, total
 
 
 class IndexWorker(QRunnable):
+    lane = LANE_INDEXING  # executor lane
+
     def __init__(self, *args, **kwargs):
         super().__init__()
         self.signals = IndexWorkerSignals()
@@ -52,6 +57,7 @@ class IndexWorker(QRunnable):
                     self.content,
                     self.replace,
                     self.recursive,
+                    callback=self.on_progress,
                 )
             elif self.type == "files":
                 result = {}
@@ -62,6 +68,7 @@ class IndexWorker(QRunnable):
                         path,
                         self.replace,
                         self.recursive,
+                        callback=self.on_progress,
                     )
                     result.update(r)
                     errors.extend(e)
@@ -111,6 +118,16 @@ class IndexWorker(QRunnable):
         finally:
             self.cleanup()
 
+    def on_progress(self, done: int, total: int):
+        """
+        Emit indexing progress
+
+        :param done: number of processed files
+        :param total: number of files
+        """
+        if self.signals is not None:
+            self.signals.progress.emit(self.idx, done, total)
+
     def cleanup(self):
         """Cleanup resources after worker execution."""
         sig = self.signals
@@ -0,0 +1,454 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 12:00:00                  #
+# ================================================== #
+
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+KIND_REQUESTS = "requests"
+KIND_TOKENS = "tokens"
+
+
+class TokenBucket:
+    def __init__(self, limit: int, period: float = 60.0):
+        """
+        Token bucket, refilled continuously up to limit per period
+
+        Reservations may take the bucket below zero, the debt is the wait time
+        of the next reservation, so concurrent callers are scheduled one after another.
+
+        :param limit: max units per period (0 = no limit)
+        :param period: period in seconds
+        """
+        self.limit = limit
+        self.period = period
+        self.level = float(limit)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+    def refill(self, now: float):
+        """
+        Refill bucket
+
+        :param now: current monotonic time
+        """
+        if self.limit > 0:
+            elapsed = max(0.0, now - self.updated)
+            self.level = min(float(self.limit), self.level + elapsed * self.limit / self.period)
+        self.updated = now
+
+    def reserve(self, amount: int, now: float) -> float:
+        """
+        Reserve units
+
+        :param amount: number of units
+        :param now: current monotonic time
+        :return: delay in seconds after which reserved units are available
+        """
+        self.refill(now)
+        delay = 0.0
+        if self.limit > 0 and amount > 0:
+            self.level -= min(amount, self.limit)  # oversized request waits for full bucket only
+            if self.level < 0:
+                delay = -self.level * self.period / self.limit
+        return max(delay, self.blocked_until - now)
+
+    def set_limit(self, limit: int, now: float):
+        """
+        Change limit
+
+        :param limit: max units per period
+        :param now: current monotonic time
+        """
+        self.refill(now)
+        if self.limit <= 0:
+            self.level = float(limit)  # was unlimited, start with full bucket
+        self.limit = limit
+        self.level = min(self.level, float(limit))
+
+    def sync(self, remaining: int, now: float):
+        """
+        Sync level with remaining units reported by server
+
+        :param remaining: remaining units
+        :param now: current monotonic time
+        """
+        self.refill(now)
+        self.level = min(self.level, float(remaining))
+
+    def block(self, seconds: float, now: float):
+        """
+        Block bucket for time (e.g. Retry-After)
+
+        :param seconds: seconds
+        :param now: current monotonic time
+        """
+        self.blocked_until = max(self.blocked_until, now + seconds)
+
+
+class Limiter:
+    MAX_WAIT = 300.0  # max delay taken from response headers, in seconds
+    HEADERS = {
+        # kind: (limit headers, remaining headers, reset headers)
+        KIND_REQUESTS: (
+            ("x-ratelimit-limit-requests", "anthropic-ratelimit-requests-limit"),
+            ("x-ratelimit-remaining-requests", "anthropic-ratelimit-requests-remaining"),
+            ("x-ratelimit-reset-requests", "anthropic-ratelimit-requests-reset"),
+        ),
+        KIND_TOKENS: (
+            ("x-ratelimit-limit-tokens", "anthropic-ratelimit-tokens-limit"),
+            ("x-ratelimit-remaining-tokens", "anthropic-ratelimit-tokens-remaining"),
+            ("x-ratelimit-reset-tokens", "anthropic-ratelimit-tokens-reset"),
+        ),
+    }
+
+    def __init__(self, window=None):
+        """
+        Shared API rate limiter: RPM and TPM token buckets per provider and model
+
+        Limits are taken from config and adapted from rate-limit and Retry-After
+        response headers. Callers reserve capacity and get delay, so requests can be
+        scheduled instead of sleeping in worker threads.
+
+        :param window: Window instance
+        """
+        self.window = window
+        self.buckets: Dict[Tuple[str, str, str], TokenBucket] = {}
+        self.learned: Dict[Tuple[str, str, str], int] = {}  # limits from response headers
+        self.lock = threading.Lock()
+
+    def get_limits(self) -> Tuple[int, int]:
+        """
+        Get API rate limits from config
+
+        :return: requests per minute, tokens per minute (0 = no limit)
+        """
+        cfg = self.window.core.config
+        try:
+            rpm = int(cfg.get("max_requests_limit", 60) or 0)
+            tpm = int(cfg.get("max_tpm_limit", 0) or 0)
+        except (TypeError, ValueError):
+            rpm, tpm = 60, 0
+        return max(0, rpm), max(0, tpm)
+
+    def get_key(self, provider: Optional[str], model: Optional[str], kind: str) -> Tuple[str, str, str]:
+        """
+        Get bucket key
+
+        :param provider: provider id
+        :param model: model id
+        :param kind: requests | tokens
+        :return: bucket key
+        """
+        return str(provider or "*"), str(model or "*"), kind
+
+    def get_bucket(self, key: Tuple[str, str, str], limit: int, now: float) -> TokenBucket:
+        """
+        Get or create bucket (call with lock held)
+
+        :param key: bucket key
+        :param limit: configured limit (0 = no limit)
+        :param now: current monotonic time
+        :return: token bucket
+        """
+        learned = self.learned.get(key, 0)
+        if limit > 0 and learned > 0:
+            limit = min(limit, learned)
+        else:
+            limit = limit or learned
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(limit)
+            self.buckets[key] = bucket
+        elif bucket.limit != limit:
+            bucket.set_limit(limit, now)
+        return bucket
+
+    def reserve(
+            self,
+            provider: Optional[str],
+            model: Optional[str] = None,
+            requests: int = 1,
+            tokens: int = 0,
+            rpm: Optional[int] = None,
+            tpm: Optional[int] = None
+    ) -> float:
+        """
+        Reserve capacity for API call (non-blocking)
+
+        :param provider: provider id
+        :param model: model id
+        :param requests: number of requests
+        :param tokens: estimated number of tokens
+        :param rpm: requests per minute (default: from config)
+        :param tpm: tokens per minute (default: from config)
+        :return: delay in seconds before call can be made
+        """
+        cfg_rpm, cfg_tpm = self.get_limits()
+        rpm = cfg_rpm if rpm is None else rpm
+        tpm = cfg_tpm if tpm is None else tpm
+        now = time.monotonic()
+        with self.lock:
+            delay = self.get_bucket(
+                self.get_key(provider, model, KIND_REQUESTS), rpm, now
+            ).reserve(requests, now)
+            if tokens > 0:
+                delay = max(delay, self.get_bucket(
+                    self.get_key(provider, model, KIND_TOKENS), tpm, now
+                ).reserve(tokens, now))
+        if delay > 0:
+            self.window.core.debug.debug(
+                "Rate limit [{}/{}]: delay {:.2f} seconds".format(provider, model, delay)
+            )
+        return delay
+
+    def wait(self, delay: float, stopped: Optional[Callable[[], bool]] = None) -> bool:
+        """
+        Wait for delay (for callers that must block, e.g. sequential indexing)
+
+        :param delay: delay in seconds
+        :param stopped: callback returning True if waiting should be aborted
+        :return: False if aborted
+        """
+        end = time.monotonic() + delay
+        while True:
+            if stopped is not None and stopped():
+                return False
+            left = end - time.monotonic()
+            if left <= 0:
+                return True
+            time.sleep(min(0.5, left))
+
+    def acquire(
+            self,
+            provider: Optional[str],
+            model: Optional[str] = None,
+            requests: int = 1,
+            tokens: int = 0,
+            rpm: Optional[int] = None,
+            tpm: Optional[int] = None,
+            stopped: Optional[Callable[[], bool]] = None
+    ) -> bool:
+        """
+        Reserve capacity and wait until it is available
+
+        :param provider: provider id
+        :param model: model id
+        :param requests: number of requests
+        :param tokens: estimated number of tokens
+        :param rpm: requests per minute (default: from config)
+        :param tpm: tokens per minute (default: from config)
+        :param stopped: callback returning True if waiting should be aborted
+        :return: False if aborted
+        """
+        delay = self.reserve(provider, model, requests, tokens, rpm, tpm)
+        if delay <= 0:
+            return True
+        return self.wait(delay, stopped)
+
+    def schedule(self, delay: float, callback: Callable[[], Any]) -> Optional[threading.Timer]:
+        """
+        Run callback after delay without blocking caller
+
+        :param delay: delay in seconds
+        :param callback: callback
+        :return: timer or None if called immediately
+        """
+        if delay <= 0:
+            callback()
+            return None
+        timer = threading.Timer(delay, callback)
+        timer.daemon = True
+        timer.start()
+        return timer
+
+    def estimate_tokens(self, *texts: Optional[str]) -> int:
+        """
+        Fast token estimate (4 chars per token), used for TPM reservations
+
+        :param texts: texts
+        :return: estimated number of tokens
+        """
+        return sum(len(text) for text in texts if text) // 4
+
+    def update(
+            self,
+            provider: Optional[str],
+            model: Optional[str],
+            headers: Mapping[str, str],
+            status: Optional[int] = None
+    ):
+        """
+        Adapt limits from response headers
+
+        :param provider: provider id
+        :param model: model id
+        :param headers: response headers
+        :param status: HTTP status code
+        """
+        if not self.window.core.config.get("max_requests_headers", True):
+            return
+        rpm, tpm = self.get_limits()
+        now = time.monotonic()
+        retry = self.parse_retry_after(headers)
+        with self.lock:
+            for kind, (limit_keys, remaining_keys, reset_keys) in self.HEADERS.items():
+                key = self.get_key(provider, model, kind)
+                limit = self.parse_int(self.get_header(headers, limit_keys))
+                remaining = self.parse_int(self.get_header(headers, remaining_keys))
+                reset = self.parse_reset(self.get_header(headers, reset_keys))
+                if limit is None and remaining is None and retry is None:
+                    continue
+                if limit:
+                    self.learned[key] = limit
+                bucket = self.get_bucket(key, rpm if kind == KIND_REQUESTS else tpm, now)
+                if remaining is not None:
+                    bucket.sync(remaining, now)
+                    if remaining <= 0 and reset:
+                        bucket.block(reset, now)
+                if retry is not None and status == 429:
+                    bucket.block(retry, now)
+        if status == 429:
+            self.window.core.debug.debug(
+                "Rate limit [{}/{}]: 429 received, retry after {}".format(provider, model, retry)
+            )
+
+    def get_hook(self, provider: str) -> Callable:
+        """
+        Get HTTP client response hook which adapts limits from response headers
+
+        :param provider: provider id
+        :return: httpx response hook
+        """
+        def hook(response):
+            try:
+                self.update(provider, self.get_model(response.request), response.headers, response.status_code)
+            except Exception as e:
+                self.window.core.debug.log(e)
+        return hook
+
+    def get_model(self, request) -> Optional[str]:
+        """
+        Get model id from API request body
+
+        :param request: httpx request
+        :return: model id or None
+        """
+        try:
+            match = re.search(rb'"model"\s*:\s*"([^"]+)"', request.content[:4096])
+        except Exception:
+            return None
+        if match:
+            return match.group(1).decode("utf-8", "ignore")
+        return None
+
+    def reset(self):
+        """Reset all buckets and learned limits"""
+        with self.lock:
+            self.buckets.clear()
+            self.learned.clear()
+
+    @staticmethod
+    def get_header(headers: Mapping[str, str], names: Tuple[str, ...]) -> Optional[str]:
+        """
+        Get first present header
+
+        :param headers: headers
+        :param names: header names
+        :return: header value or None
+        """
+        for name in names:
+            value = headers.get(name)
+            if value is not None:
+                return value
+        return None
+
+    @staticmethod
+    def parse_int(value: Optional[str]) -> Optional[int]:
+        """
+        Parse integer header
+
+        :param value: header value
+        :return: int or None
+        """
+        if value is None:
+            return None
+        try:
+            return int(float(value))
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def parse_duration(value: str) -> Optional[float]:
+        """
+        Parse duration, e.g. "1s", "6m0s", "250ms", "1.5"
+
+        :param value: duration string
+        :return: seconds or None
+        """
+        value = value.strip()
+        try:
+            return float(value)
+        except ValueError:
+            pass
+        parts = re.findall(r"(\d+(?:\.\d+)?)(ms|h|m|s)", value)
+        if not parts:
+            return None
+        units = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+        return sum(float(num) * units[unit] for num, unit in parts)
+
+    def parse_reset(self, value: Optional[str]) -> Optional[float]:
+        """
+        Parse rate-limit reset header (duration or RFC 3339 date)
+
+        :param value: header value
+        :return: seconds to reset or None
+        """
+        if not value:
+            return None
+        seconds = self.parse_duration(value)
+        if seconds is None:
+            try:
+                date = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+                if date.tzinfo is None:
+                    date = date.replace(tzinfo=timezone.utc)
+                seconds = (date - datetime.now(timezone.utc)).total_seconds()
+            except ValueError:
+                return None
+        return min(max(0.0, seconds), self.MAX_WAIT)
+
+    def parse_retry_after(self, headers: Mapping[str, str]) -> Optional[float]:
+        """
+        Parse Retry-After (seconds or HTTP date) and retry-after-ms headers
+
+        :param headers: headers
+        :return: seconds or None
+        """
+        value = headers.get("retry-after-ms")
+        if value is not None:
+            try:
+                return min(max(0.0, float(value) / 1000), self.MAX_WAIT)
+            except ValueError:
+                pass
+        value = headers.get("retry-after")
+        if value is None:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                seconds = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                return None
+        return min(max(0.0, seconds), self.MAX_WAIT)
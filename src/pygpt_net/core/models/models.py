@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.12.26 20:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import copy
@@ -453,13 +453,15 @@ class Models:
     def prepare_client_args(
             self,
             mode: str = MODE_CHAT,
-            model: ModelItem = None
+            model: ModelItem = None,
+            http_client: bool = True
     ) -> Dict[str, str]:
         """
         Prepare chat client arguments
 
         :param mode: mode name
         :param model: ModelItem
+        :param http_client: create proxy HTTP client (False if client is created by pool)
         :return: client arguments dict
         """
         cfg = self.window.core.config
@@ -477,8 +479,9 @@ class Models:
             proxy = cfg.get('api_proxy')
             if proxy and cfg.get('api_proxy.enabled', False):
                 args["api_proxy"] = proxy
-                transport = SyncProxyTransport.from_url(proxy)
-                args["http_client"] = DefaultHttpxClient(transport=transport)
+                if http_client:
+                    transport = SyncProxyTransport.from_url(proxy)
+                    args["http_client"] = DefaultHttpxClient(transport=transport)
 
         if model is not None:
             if model.provider == "x_ai":
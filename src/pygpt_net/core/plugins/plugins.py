@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.15 23:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import copy
@@ -109,6 +109,8 @@ class Plugins:
         plugin.attach(self.window)
         plugin_id = plugin.id
         self.plugins[plugin_id] = plugin
+        self.window.core.dispatcher.subscribe(plugin)  # build event subscriptions table
+        self.window.core.command.invalidate()
 
         if hasattr(plugin, 'options'):
             self.plugins[plugin_id].initial_options = copy.deepcopy(plugin.options)
@@ -152,6 +154,7 @@ class Plugins:
                         del ucfg[key]
         if removed:
             self.window.core.config.save()
+        self.window.core.command.invalidate()
 
     def register_options(self, plugin_id: str, options: Dict[str, dict]):
         """
@@ -175,6 +178,8 @@ class Plugins:
         :param plugin_id: plugin id
         """
         self.plugins.pop(plugin_id, None)
+        self.window.core.dispatcher.unsubscribe(plugin_id)
+        self.window.core.command.invalidate()
 
     def enable(self, plugin_id: str):
         """
@@ -188,6 +193,8 @@ class Plugins:
             cfg = self.window.core.config
             cfg.data['plugins_enabled'][plugin_id] = True
             cfg.save()
+            self.window.core.dispatcher.invalidate()  # rebuild dispatch map
+            self.window.core.command.invalidate()  # rebuild tools schemas
 
     def disable(self, plugin_id: str):
         """
@@ -201,6 +208,8 @@ class Plugins:
             cfg = self.window.core.config
             cfg.data['plugins_enabled'][plugin_id] = False
             cfg.save()
+            self.window.core.dispatcher.invalidate()  # rebuild dispatch map
+            self.window.core.command.invalidate()  # rebuild tools schemas
 
     def destroy(self, plugin_id: str):
         """
@@ -246,6 +255,7 @@ class Plugins:
 
         if hasattr(plugin, 'initial_options'):
             plugin.options = copy.deepcopy(plugin.initial_options)
+        self.window.core.command.invalidate()
 
         if not all:
             for key in options_to_preserve:
@@ -6,18 +6,21 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.31 23:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import io
 import math
 import os
 import wave
-import audioop
 from array import array
 import struct
 from typing import Optional, Tuple, List
 
+import numpy as np
+
+from pygpt_net.core.audio.backend.shared.conversions import PCMConverter, lin_to_s16le
+
 DEFAULT_24K = 24000
 
 def coerce_to_pcm16_mono(data: bytes, fmt: Optional[str], rate_hint: Optional[int], fallback_rate: int = DEFAULT_24K) -> Tuple[int, int, bytes]:
@@ -41,11 +44,9 @@ def coerce_to_pcm16_mono(data: bytes, fmt: Optional[str], rate_hint: Optional[in
             frames = wf.readframes(wf.getnframes())
 
         if sw != 2:
-            frames = audioop.lin2lin(frames, sw, 2)
-        if ch == 2:
-            frames = audioop.tomono(frames, 2, 0.5, 0.5)
-        elif ch != 1:
-            frames = audioop.tomono(frames, 2, 1.0, 0.0)
+            frames = lin_to_s16le(frames, sw)
+        if ch != 1:
+            frames = PCMConverter(sr, ch, sr, 1).convert(frames)
 
         return sr, 1, frames
     except Exception:
@@ -119,7 +120,7 @@ def to_pcm16_mono(data: bytes, fmt: Optional[str], rate_hint: Optional[int], tar
         pcm16 = data
         if src_rate != target_rate:
             try:
-                pcm16, _ = audioop.ratecv(pcm16, 2, 1, src_rate, target_rate, None)
+                pcm16 = PCMConverter(src_rate, 1, target_rate, 1).convert(pcm16)
             except Exception:
                 return b"", target_rate
         return pcm16, target_rate
@@ -140,27 +141,12 @@ def to_pcm16_mono(data: bytes, fmt: Optional[str], rate_hint: Optional[int], tar
         if format_tag == 3 or ((format_tag == 65534) and (fmt_info or {}).get("subformat_tag") == 3):
             frames16 = float32_to_int16_bytes(frames)
         else:
-            if sw != 2:
-                frames16 = audioop.lin2lin(frames, sw, 2)
-            else:
-                frames16 = frames
+            frames16 = lin_to_s16le(frames, sw)
 
-        # mixdown to mono
-        if ch == 2:
+        # mixdown to mono and resample
+        if ch != 1 or sr != target_rate:
             try:
-                frames16 = audioop.tomono(frames16, 2, 0.5, 0.5)
-            except Exception:
-                frames16 = frames16[0::2] + b""
-        elif ch != 1:
-            try:
-                frames16 = audioop.tomono(frames16, 2, 1.0, 0.0)
-            except Exception:
-                pass
-
-        # resample
-        if sr != target_rate:
-            try:
-                frames16, _ = audioop.ratecv(frames16, 2, 1, sr, target_rate, None)
+                frames16 = PCMConverter(sr, ch, target_rate, 1).convert(frames16)
             except Exception:
                 return b"", target_rate
 
@@ -172,8 +158,7 @@ def resample_pcm16_mono(pcm: bytes, src_rate: int, dst_rate: int) -> bytes:
     if src_rate == dst_rate or not pcm:
         return pcm
     try:
-        out, _ = audioop.ratecv(pcm, 2, 1, src_rate, dst_rate, None)
-        return out
+        return PCMConverter(src_rate, 1, dst_rate, 1).convert(pcm)
     except Exception:
         return pcm
 
@@ -201,12 +186,10 @@ def pcm16_stats(pcm16_mono: bytes, sample_rate: int) -> dict:
     try:
         n_samp = len(pcm16_mono) // 2
         dur = n_samp / float(sample_rate or 1)
-        rms = audioop.rms(pcm16_mono, 2)
-        peak = audioop.max(pcm16_mono, 2) if pcm16_mono else 0
-        try:
-            avg = audioop.avg(pcm16_mono, 2)
-        except Exception:
-            avg = 0
+        samples = np.frombuffer(pcm16_mono, dtype="<i2", count=n_samp).astype(np.int64)
+        rms = int(np.sqrt(np.mean(samples * samples))) if n_samp else 0
+        peak = int(np.max(np.abs(samples))) if n_samp else 0
+        avg = int(np.mean(samples)) if n_samp else 0
         dbfs = (-999.0 if rms == 0 else 20.0 * math.log10(rms / 32768.0))
         return {"duration_s": dur, "samples": n_samp, "rms": rms, "peak": peak, "dc_offset": avg, "dbfs": dbfs}
     except Exception:
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.06 20:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import asyncio
@@ -15,6 +15,7 @@ from typing import Optional
 from PySide6.QtCore import Slot, QRunnable, QObject, Signal
 
 from pygpt_net.core.events import RealtimeEvent
+from pygpt_net.core.executor import LANE_INTERACTIVE
 from pygpt_net.item.ctx import CtxItem
 
 from .options import RealtimeOptions
@@ -33,6 +34,8 @@ class RealtimeWorker(QRunnable):
     - RT_OUTPUT_AUDIO_END is emitted when the session ends.
     - RT_OUTPUT_AUDIO_ERROR is emitted on error.
     """
+    lane = LANE_INTERACTIVE  # executor lane
+
     def __init__(
             self,
             window,
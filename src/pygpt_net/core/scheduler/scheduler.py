@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 12:00:00                  #
+# ================================================== #
+
+import heapq
+import itertools
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, Optional, List, Tuple
+
+from PySide6.QtCore import QObject, QTimer, Qt, Signal, Slot
+
+
+class Job:
+    def __init__(
+            self,
+            name: str,
+            callback: Callable,
+            interval: Optional[float] = None,
+            cron: Optional[str] = None
+    ):
+        """
+        Scheduled job
+
+        :param name: job name (unique)
+        :param callback: callable to run
+        :param interval: interval in seconds (periodic job)
+        :param cron: cron expression (cron job)
+        """
+        self.name = name
+        self.callback = callback
+        self.interval = interval
+        self.cron = cron
+        self.deadline = 0.0  # wall-clock timestamp
+        self.seq = 0  # sequence of current heap entry
+        self.runs = 0
+        self.cancelled = False
+
+    def cancel(self):
+        """Cancel job"""
+        self.cancelled = True
+
+    def is_periodic(self) -> bool:
+        """
+        Check if job is periodic
+
+        :return: True if periodic or cron job
+        """
+        return bool(self.interval) or bool(self.cron)
+
+
+class Scheduler(QObject):
+    MAX_SLEEP = 60.0  # max timer sleep (seconds), catches up wall-clock after system suspend
+
+    wake = Signal()
+
+    def __init__(self, window=None):
+        """
+        Event-driven scheduler
+
+        Jobs (one-shot, periodic and cron) are kept in a deadline heap and a single timer
+        is armed for the earliest deadline only, so there are no wakeups when nothing is due.
+        Callbacks run in the main thread, jobs can be added and removed from any thread.
+
+        :param window: Window instance
+        """
+        super(Scheduler, self).__init__()
+        self.window = window
+        self.jobs: Dict[str, Job] = {}
+        self.heap: List[Tuple[float, int, Job]] = []
+        self.lock = threading.RLock()
+        self.counter = itertools.count(1)
+        self.timer = None
+        self.wake.connect(self.arm, Qt.QueuedConnection)
+
+    def setup(self):
+        """Create timer and arm it for the earliest deadline"""
+        if self.timer is None:
+            self.timer = QTimer(self)
+            self.timer.setSingleShot(True)
+            self.timer.timeout.connect(self.run_pending)
+        self.arm()
+
+    def add(
+            self,
+            name: Optional[str],
+            callback: Callable,
+            delay: float = 0.0,
+            interval: Optional[float] = None,
+            cron: Optional[str] = None
+    ) -> Job:
+        """
+        Add job (job with the same name is replaced)
+
+        :param name: job name (auto-generated if None)
+        :param callback: callable to run
+        :param delay: delay of first run in seconds (ignored for cron jobs)
+        :param interval: interval in seconds (periodic job)
+        :param cron: cron expression (cron job)
+        :return: job
+        """
+        with self.lock:
+            if name is None:
+                name = "job.{}".format(next(self.counter))
+            job = Job(name, callback, interval, cron)
+            if cron:
+                deadline = self.next_cron(cron, time.time())
+            else:
+                deadline = time.time() + max(0.0, delay)
+            self.remove(name)
+            self.jobs[name] = job
+            self.push(job, deadline)
+        self.wake.emit()
+        return job
+
+    def call_later(
+            self,
+            delay: float,
+            callback: Callable,
+            name: Optional[str] = None
+    ) -> Job:
+        """
+        Run callback once after delay
+
+        :param delay: delay in seconds
+        :param callback: callable to run
+        :param name: job name
+        :return: job
+        """
+        return self.add(name, callback, delay=delay)
+
+    def call_every(
+            self,
+            interval: float,
+            callback: Callable,
+            name: Optional[str] = None,
+            delay: Optional[float] = None
+    ) -> Job:
+        """
+        Run callback periodically
+
+        :param interval: interval in seconds
+        :param callback: callable to run
+        :param name: job name
+        :param delay: delay of first run (default: interval)
+        :return: job
+        """
+        return self.add(name, callback, delay=interval if delay is None else delay, interval=interval)
+
+    def call_cron(
+            self,
+            expr: str,
+            callback: Callable,
+            name: Optional[str] = None
+    ) -> Job:
+        """
+        Run callback on cron schedule (next fire time is computed once per run)
+
+        :param expr: cron expression
+        :param callback: callable to run
+        :param name: job name
+        :return: job
+        """
+        return self.add(name, callback, cron=expr)
+
+    def remove(self, name: str) -> bool:
+        """
+        Remove job
+
+        :param name: job name
+        :return: True if removed
+        """
+        with self.lock:
+            job = self.jobs.pop(name, None)
+            if job is None:
+                return False
+            job.cancel()  # heap entry is dropped lazily
+            if len(self.heap) > 64 and len(self.heap) > 4 * len(self.jobs):
+                self.heap = [entry for entry in self.heap if not entry[2].cancelled and entry[1] == entry[2].seq]
+                heapq.heapify(self.heap)
+            return True
+
+    def has(self, name: str) -> bool:
+        """
+        Check if job exists
+
+        :param name: job name
+        :return: True if exists
+        """
+        return name in self.jobs
+
+    def get_names(self, prefix: str = "") -> List[str]:
+        """
+        Get job names
+
+        :param prefix: name prefix filter
+        :return: list of job names
+        """
+        with self.lock:
+            return [name for name in self.jobs if name.startswith(prefix)]
+
+    def get_next(self) -> Optional[float]:
+        """
+        Get earliest deadline
+
+        :return: wall-clock timestamp or None if no jobs
+        """
+        with self.lock:
+            self.prune()
+            if not self.heap:
+                return None
+            return self.heap[0][0]
+
+    @staticmethod
+    def next_cron(expr: str, now: float) -> float:
+        """
+        Get next fire time of cron expression
+
+        :param expr: cron expression
+        :param now: current timestamp
+        :return: next fire timestamp
+        """
+        from croniter import croniter
+        return croniter(expr, datetime.fromtimestamp(now)).get_next(datetime).timestamp()
+
+    def push(self, job: Job, deadline: float):
+        """
+        Push job into deadline heap
+
+        :param job: job
+        :param deadline: wall-clock timestamp
+        """
+        job.deadline = deadline
+        job.seq = next(self.counter)
+        heapq.heappush(self.heap, (deadline, job.seq, job))
+
+    def prune(self):
+        """Drop cancelled and rescheduled entries from heap top"""
+        while self.heap:
+            _, seq, job = self.heap[0]
+            if job.cancelled or seq != job.seq:
+                heapq.heappop(self.heap)
+            else:
+                break
+
+    @Slot()
+    def run_pending(self, now: Optional[float] = None) -> int:
+        """
+        Run due jobs and re-arm timer
+
+        :param now: current timestamp (default: time.time())
+        :return: number of executed jobs
+        """
+        if now is None:
+            now = time.time()
+        due = []
+        with self.lock:
+            while True:
+                self.prune()
+                if not self.heap or self.heap[0][0] > now:
+                    break
+                _, _, job = heapq.heappop(self.heap)
+                due.append(job)
+                if job.cron:
+                    try:
+                        self.push(job, self.next_cron(job.cron, now))
+                    except Exception as e:
+                        print("Scheduler: invalid cron expression in job {}: {}".format(job.name, e))
+                        self.jobs.pop(job.name, None)
+                elif job.interval:
+                    deadline = job.deadline + job.interval
+                    if deadline <= now:
+                        deadline = now + job.interval  # skip missed runs
+                    self.push(job, deadline)
+                else:
+                    self.jobs.pop(job.name, None)
+
+        for job in due:
+            if job.cancelled:
+                continue
+            job.runs += 1
+            try:
+                job.callback()
+            except Exception as e:
+                print("Scheduler: error in job {}: {}".format(job.name, e))
+        self.arm()
+        return len(due)
+
+    @Slot()
+    def arm(self):
+        """Arm timer for the earliest deadline (or stop it if there are no jobs)"""
+        if self.timer is None:
+            return
+        deadline = self.get_next()
+        if deadline is None:
+            self.timer.stop()
+            return
+        delay = min(max(0.0, deadline - time.time()), self.MAX_SLEEP)
+        self.timer.start(int(delay * 1000))
+
+    def stop(self):
+        """Stop timer and remove all jobs"""
+        with self.lock:
+            for job in self.jobs.values():
+                job.cancel()
+            self.jobs.clear()
+            self.heap.clear()
+        if self.timer is not None:
+            self.timer.stop()
@@ -6,16 +6,15 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.28 09:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
-from typing import Tuple, List
+from typing import Tuple, List, TYPE_CHECKING
 from functools import lru_cache
 
-import tiktoken
-
 # from langchain_core.messages import ChatMessage as ChatMessageLangchain
-from llama_index.core.base.llms.types import ChatMessage as ChatMessageLlama
+if TYPE_CHECKING:
+    from llama_index.core.base.llms.types import ChatMessage as ChatMessageLlama
 
 from pygpt_net.core.types import (
     MODE_AGENT,
@@ -60,6 +59,7 @@ class Tokens:
     @lru_cache(maxsize=128)
     def _encoding_name_for_model(model: str | None) -> str:
         if model:
+            import tiktoken  # lazy, heavy import
             try:
                 return tiktoken.encoding_for_model(model).name
             except KeyError:
@@ -71,6 +71,7 @@ class Tokens:
     @staticmethod
     @lru_cache(maxsize=64)
     def _get_encoding(encoding_name: str):
+        import tiktoken  # lazy, heavy import
         try:
             return tiktoken.get_encoding(encoding_name)
         except Exception:
@@ -193,7 +194,7 @@ class Tokens:
     @staticmethod
     def from_llama_messages(
             query: str,
-            messages: List[ChatMessageLlama],
+            messages: List["ChatMessageLlama"],
             model: str = "gpt-4"
     ) -> int:
         model, per_message, per_name = Tokens.get_config(model)
@@ -211,6 +212,31 @@ class Tokens:
             ctx: CtxItem,
             mode: str = MODE_CHAT,
             model: str = "gpt-4"
+    ) -> int:
+        if mode in CHAT_MODES:
+            mode_key = MODE_CHAT  # all chat modes are counted the same way
+        elif mode == MODE_COMPLETION:
+            mode_key = MODE_COMPLETION
+        else:
+            return 0
+        model, per_message, per_name = Tokens.get_config(model)
+        try:
+            enc_name = Tokens._encoding_name_for_model(model)
+            Tokens._get_encoding(enc_name)
+        except Exception:
+            return Tokens.count_ctx(ctx, mode, model)  # encoding not available, do not cache fallback count
+        key = "{}:{}:{}:{}".format(enc_name, mode_key, per_message, per_name)
+        num = ctx.get_cached_tokens(key)
+        if num is None:
+            num = Tokens.count_ctx(ctx, mode, model)
+            ctx.set_cached_tokens(key, num)
+        return num
+
+    @staticmethod
+    def count_ctx(
+            ctx: CtxItem,
+            mode: str = MODE_CHAT,
+            model: str = "gpt-4"
     ) -> int:
         model, per_message, per_name = Tokens.get_config(model)
         num = 0
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.12.29 21:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import copy
@@ -24,6 +24,7 @@ from PySide6.QtCore import QObject, Signal, Slot, QRunnable
 from packaging.version import parse as parse_version, Version
 
 from pygpt_net.utils import trans
+from pygpt_net.core.executor import LANE_MAINTENANCE
 
 
 class Updater(QObject):
@@ -509,6 +510,8 @@ class UpdaterSignals(QObject):
 
 
 class UpdaterWorker(QRunnable):
+    lane = LANE_MAINTENANCE  # executor lane
+
     def __init__(self, *args, **kwargs):
         super().__init__()
         self.signals = UpdaterSignals()
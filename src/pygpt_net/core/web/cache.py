@@ -0,0 +1,477 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 12:00:00                  #
+# ================================================== #
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from typing import Optional, Dict, Tuple, Any
+from urllib.error import HTTPError
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from urllib.request import Request, urlopen
+
+import requests
+
+
+class PageCache:
+    INDEX = "index.json"
+    DEFAULT_PORTS = {"http": 80, "https": 443}
+
+    def __init__(self, window=None):
+        """
+        Persistent web page cache
+
+        Stores raw response body and extracted text keyed by normalized URL, bounded by size (LRU).
+        Freshness follows Cache-Control / Expires headers, stale entries are revalidated
+        with conditional GET (ETag / Last-Modified), and served if revalidation fails.
+
+        :param window: Window instance
+        """
+        self.window = window
+        self.path = None
+        self.entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()  # LRU order, oldest first
+        self.lock = threading.RLock()
+        self.loaded = False
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "revalidated": 0,
+            "stale": 0,
+            "stored": 0,
+            "evicted": 0,
+        }
+
+    def is_enabled(self) -> bool:
+        """
+        Check if cache is enabled
+
+        :return: True if enabled
+        """
+        return bool(self.window.core.config.get("web.cache", True))
+
+    def get_max_size(self) -> int:
+        """
+        Get max cache size
+
+        :return: max size in bytes
+        """
+        try:
+            return max(1, int(self.window.core.config.get("web.cache.max_size", 100))) * 1024 * 1024
+        except (TypeError, ValueError):
+            return 100 * 1024 * 1024
+
+    def get_ttl(self) -> int:
+        """
+        Get default freshness time for responses without cache headers
+
+        :return: seconds
+        """
+        try:
+            return max(0, int(self.window.core.config.get("web.cache.ttl", 300)))
+        except (TypeError, ValueError):
+            return 300
+
+    def get_path(self) -> str:
+        """
+        Get cache directory
+
+        :return: cache directory path
+        """
+        if self.path is None:
+            path = os.path.join(self.window.core.config.get_user_dir("tmp"), "web_cache")
+            os.makedirs(path, exist_ok=True)
+            self.path = path
+        return self.path
+
+    @classmethod
+    def normalize_url(cls, url: str) -> str:
+        """
+        Normalize URL (scheme and host case, default port, fragment, query order)
+
+        :param url: URL
+        :return: normalized URL
+        """
+        parts = urlsplit(url.strip())
+        scheme = parts.scheme.lower()
+        host = (parts.hostname or "").lower()
+        if parts.port and parts.port != cls.DEFAULT_PORTS.get(scheme):
+            host += ":{}".format(parts.port)
+        if parts.username:
+            host = "{}@{}".format(parts.username, host)
+        query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+        return urlunsplit((scheme, host, parts.path or "/", query, ""))
+
+    def get_key(self, url: str) -> str:
+        """
+        Get cache key
+
+        :param url: URL
+        :return: cache key
+        """
+        return hashlib.sha1(self.normalize_url(url).encode("utf-8")).hexdigest()
+
+    def get(
+            self,
+            url: str,
+            headers: Optional[Dict[str, str]] = None,
+            timeout: Optional[float] = 10,
+            context: Any = None
+    ) -> bytes:
+        """
+        Get URL content (from cache if fresh, revalidated if stale)
+
+        :param url: URL
+        :param headers: request headers
+        :param timeout: connection timeout
+        :param context: SSL context
+        :return: response body
+        """
+        if not self.is_enabled():
+            return self.request(url, headers, timeout, context)[1]
+
+        key = self.get_key(url)
+        with self.lock:
+            self.load()
+            entry = self.entries.get(key)
+            if entry is not None:
+                entry = dict(entry)
+        if entry is not None and entry["expires"] > time.time():
+            body = self.read(key, "bin")
+            if body is not None:
+                self.touch(key)
+                self.count("hits")
+                return body
+
+        req_headers = dict(headers or {})
+        if entry is not None:
+            if entry.get("etag"):
+                req_headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                req_headers["If-Modified-Since"] = entry["last_modified"]
+        try:
+            status, body, res_headers = self.request(url, req_headers, timeout, context)
+        except Exception:
+            body = self.read(key, "bin") if entry is not None else None
+            if body is not None:
+                self.count("stale")  # serve stale content on network error
+                return body
+            raise
+
+        if status == 304 and entry is not None:
+            body = self.read(key, "bin")
+            if body is not None:
+                self.revalidate(key, res_headers)
+                self.count("revalidated")
+                return body
+            status, body, res_headers = self.request(url, headers, timeout, context)
+
+        self.count("misses")
+        try:
+            self.store(key, url, body, res_headers)
+        except Exception as e:
+            print("Web cache: error storing {}: {}".format(url, e))
+        return body
+
+    def get_page(self, url: str, timeout: Optional[float] = 10) -> bytes:
+        """
+        Get page content as plain requests.get() did (default requests User-Agent, error pages returned as content)
+
+        :param url: URL
+        :param timeout: connection timeout
+        :return: response body
+        """
+        headers = {
+            "User-Agent": requests.utils.default_user_agent(),
+        }
+        try:
+            return self.get(url, headers=headers, timeout=timeout)
+        except HTTPError as e:
+            return e.read()  # 4xx/5xx page, not cached
+
+    def request(
+            self,
+            url: str,
+            headers: Optional[Dict[str, str]] = None,
+            timeout: Optional[float] = 10,
+            context: Any = None
+    ) -> Tuple[int, bytes, Dict[str, str]]:
+        """
+        Send GET request
+
+        :param url: URL
+        :param headers: request headers
+        :param timeout: connection timeout
+        :param context: SSL context
+        :return: status code, body, response headers (lowercase names)
+        """
+        req = Request(url=url, headers=headers or {})
+        try:
+            with urlopen(req, timeout=timeout, context=context) as response:
+                return response.status, response.read(), {k.lower(): v for k, v in response.headers.items()}
+        except HTTPError as e:
+            if e.code == 304:
+                return 304, b"", {k.lower(): v for k, v in e.headers.items()}
+            raise
+
+    def get_expires(self, headers: Dict[str, str], now: float) -> Optional[float]:
+        """
+        Get expiration time from response headers
+
+        :param headers: response headers (lowercase names)
+        :param now: current time
+        :return: expiration timestamp, None if response must not be stored
+        """
+        directives = {}
+        for item in headers.get("cache-control", "").lower().split(","):
+            name, _, value = item.strip().partition("=")
+            if name:
+                directives[name] = value.strip('"')
+        if "no-store" in directives:
+            return None
+        if "no-cache" in directives:
+            return now
+        if "max-age" in directives:
+            try:
+                return now + max(0, int(directives["max-age"]))
+            except ValueError:
+                return now
+        if headers.get("expires"):
+            try:
+                return parsedate_to_datetime(headers["expires"]).timestamp()
+            except (TypeError, ValueError):
+                return now
+        return now + self.get_ttl()
+
+    def store(
+            self,
+            key: str,
+            url: str,
+            body: bytes,
+            headers: Dict[str, str]
+    ):
+        """
+        Store response in cache
+
+        :param key: cache key
+        :param url: URL
+        :param body: response body
+        :param headers: response headers (lowercase names)
+        """
+        now = time.time()
+        expires = self.get_expires(headers, now)
+        with self.lock:
+            if expires is None or len(body) > self.get_max_size():
+                self.remove(key)
+                self.save()
+                return
+            self.write(key, "bin", body)
+            self.delete(key, "txt")
+            self.entries.pop(key, None)
+            self.entries[key] = {
+                "url": url,
+                "etag": headers.get("etag"),
+                "last_modified": headers.get("last-modified"),
+                "expires": expires,
+                "size": len(body),
+                "text": False,
+                "stored": now,
+            }
+            self.stats["stored"] += 1
+            self.evict()
+            self.save()
+
+    def revalidate(self, key: str, headers: Dict[str, str]):
+        """
+        Update entry after 304 Not Modified response
+
+        :param key: cache key
+        :param headers: response headers (lowercase names)
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return
+            expires = self.get_expires(headers, time.time())
+            entry["expires"] = expires if expires is not None else 0
+            if headers.get("etag"):
+                entry["etag"] = headers["etag"]
+            if headers.get("last-modified"):
+                entry["last_modified"] = headers["last-modified"]
+            self.entries.move_to_end(key)
+            self.save()
+
+    def get_text(self, url: str) -> Optional[str]:
+        """
+        Get extracted text of cached page
+
+        :param url: URL
+        :return: text or None if not cached
+        """
+        if not self.is_enabled():
+            return None
+        key = self.get_key(url)
+        with self.lock:
+            self.load()
+            entry = self.entries.get(key)
+            if entry is None or not entry.get("text"):
+                return None
+        data = self.read(key, "txt")
+        if data is None:
+            return None
+        return data.decode("utf-8")
+
+    def set_text(self, url: str, text: str):
+        """
+        Store extracted text of cached page (dropped when page content changes)
+
+        :param url: URL
+        :param text: extracted text
+        """
+        if not self.is_enabled() or text is None:
+            return
+        key = self.get_key(url)
+        data = text.encode("utf-8")
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry.get("text"):
+                return
+            self.write(key, "txt", data)
+            entry["text"] = True
+            entry["size"] += len(data)
+            self.evict()
+            self.save()
+
+    def touch(self, key: str):
+        """
+        Mark entry as recently used
+
+        :param key: cache key
+        """
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+
+    def count(self, name: str):
+        """
+        Increment statistics counter
+
+        :param name: counter name
+        """
+        with self.lock:
+            self.stats[name] += 1
+
+    def evict(self):
+        """Remove least recently used entries above max size"""
+        max_size = self.get_max_size()
+        total = sum(entry["size"] for entry in self.entries.values())
+        while total > max_size and len(self.entries) > 1:
+            key = next(iter(self.entries))
+            total -= self.entries[key]["size"]
+            self.remove(key)
+            self.stats["evicted"] += 1
+
+    def remove(self, key: str):
+        """
+        Remove entry and its files
+
+        :param key: cache key
+        """
+        self.entries.pop(key, None)
+        self.delete(key, "bin")
+        self.delete(key, "txt")
+
+    def clear(self):
+        """Remove all entries and reset statistics"""
+        with self.lock:
+            self.load()
+            for key in list(self.entries.keys()):
+                self.remove(key)
+            for name in self.stats:
+                self.stats[name] = 0
+            self.save()
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics
+
+        :return: hits, misses, revalidated, stale, stored, evicted, entries, size
+        """
+        with self.lock:
+            self.load()
+            stats = dict(self.stats)
+            stats["entries"] = len(self.entries)
+            stats["size"] = sum(entry["size"] for entry in self.entries.values())
+            return stats
+
+    def load(self):
+        """Load cache index"""
+        if self.loaded:
+            return
+        self.loaded = True
+        try:
+            with open(os.path.join(self.get_path(), self.INDEX), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict):
+            for key, entry in data.items():
+                if isinstance(entry, dict) and "size" in entry and "expires" in entry:
+                    self.entries[key] = entry
+
+    def save(self):
+        """Save cache index"""
+        path = os.path.join(self.get_path(), self.INDEX)
+        try:
+            with open(path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(self.entries, f)
+            os.replace(path + ".tmp", path)
+        except Exception as e:
+            print("Web cache: error saving index: {}".format(e))
+
+    def read(self, key: str, ext: str) -> Optional[bytes]:
+        """
+        Read cached file
+
+        :param key: cache key
+        :param ext: file extension (bin: body, txt: text)
+        :return: file content or None
+        """
+        try:
+            with open(os.path.join(self.get_path(), "{}.{}".format(key, ext)), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def write(self, key: str, ext: str, data: bytes):
+        """
+        Write cached file
+
+        :param key: cache key
+        :param ext: file extension (bin: body, txt: text)
+        :param data: file content
+        """
+        with open(os.path.join(self.get_path(), "{}.{}".format(key, ext)), "wb") as f:
+            f.write(data)
+
+    def delete(self, key: str, ext: str):
+        """
+        Delete cached file
+
+        :param key: cache key
+        :param ext: file extension (bin: body, txt: text)
+        """
+        try:
+            os.remove(os.path.join(self.get_path(), "{}.{}".format(key, ext)))
+        except OSError:
+            pass
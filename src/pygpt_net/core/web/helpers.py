@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.06 19:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import os
@@ -131,6 +131,16 @@ class Helpers:
                 upload[k].close()  # close files if opened
             return None, f'Error: {e}'
 
+    def get_content(self, url: str, timeout: int = 10) -> bytes:
+        """
+        Get page content (using web page cache)
+
+        :param url: URL
+        :param timeout: connection timeout
+        :return: response body
+        """
+        return self.window.core.web.cache.get_page(url, timeout=timeout)
+
     def get_main_image(self, url: str) -> Optional[str]:
         """
         Get main image from URL
@@ -139,8 +149,7 @@ class Helpers:
         :return: image URL
         """
         from bs4 import BeautifulSoup
-        response = requests.get(url)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(self.get_content(url), 'html.parser')
 
         og_image = soup.find('meta', property='og:image')
         if og_image and og_image.get('content'):
@@ -189,8 +198,7 @@ class Helpers:
         :return: links list
         """
         from bs4 import BeautifulSoup
-        response = requests.get(url)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(self.get_content(url), 'html.parser')
         links = []
         urls = []
         for link in soup.find_all('a'):
@@ -221,8 +229,7 @@ class Helpers:
         :return: images list
         """
         from bs4 import BeautifulSoup
-        response = requests.get(url)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(self.get_content(url), 'html.parser')
         images = []
         for img in soup.find_all('img'):
             try:
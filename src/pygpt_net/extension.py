@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 12:00:00                  #
+# ================================================== #
+
+import copy
+import importlib
+import threading
+from typing import Any, Dict, Optional
+
+
+class LazyExtension:
+    """
+    Lightweight descriptor of extension (LLM, agent, vector store, data loader, etc.)
+
+    Registered in place of the extension instance. Attributes given as metadata (id, name, type, etc.)
+    are served without importing anything, the extension module is imported and the class
+    is instantiated on first access to any other attribute, then all access is delegated to the instance.
+
+    Example:
+    --------
+    ::
+
+        launcher.add_llm(LazyExtension(
+            "my_package.my_llm",  # module path
+            "MyLLM",  # class name
+            id="my_llm",
+            name="My LLM",
+            type=["llama_index", "embeddings"],
+        ))
+    """
+
+    def __init__(
+            self,
+            module: str,
+            cls: str,
+            id: str,
+            setters: Optional[Dict[str, str]] = None,
+            **meta
+    ):
+        """
+        Extension descriptor
+
+        :param module: module path, e.g. "pygpt_net.provider.llms.openai"
+        :param cls: class name in module
+        :param id: extension id
+        :param setters: setter methods that can be called without loading: {method name: attribute name}
+        :param meta: extension metadata (attributes served without loading)
+        """
+        meta["id"] = id
+        object.__setattr__(self, "_lazy_module", module)
+        object.__setattr__(self, "_lazy_cls", cls)
+        object.__setattr__(self, "_lazy_meta", meta)
+        object.__setattr__(self, "_lazy_setters", dict(setters or {}))
+        object.__setattr__(self, "_lazy_calls", [])  # deferred setter calls
+        object.__setattr__(self, "_lazy_base", None)
+        object.__setattr__(self, "_lazy_instance", None)
+        object.__setattr__(self, "_lazy_lock", threading.RLock())
+
+    def lazy_path(self) -> str:
+        """
+        Get extension class path
+
+        :return: module.Class
+        """
+        return f"{self._lazy_module}.{self._lazy_cls}"
+
+    def lazy_expect(self, base: type):
+        """
+        Set required base class (checked on load)
+
+        :param base: base class
+        """
+        object.__setattr__(self, "_lazy_base", base)
+
+    def lazy_loaded(self) -> bool:
+        """
+        Check if extension is already loaded
+
+        :return: True if loaded
+        """
+        return self._lazy_instance is not None
+
+    def lazy_load(self) -> Any:
+        """
+        Import module and create extension instance (once)
+
+        :return: extension instance
+        """
+        instance = self._lazy_instance
+        if instance is not None:
+            return instance
+        with self._lazy_lock:
+            if self._lazy_instance is not None:
+                return self._lazy_instance
+            module = importlib.import_module(self._lazy_module)
+            instance = getattr(module, self._lazy_cls)()
+            base = self._lazy_base
+            if base is not None and not isinstance(instance, base):
+                raise TypeError(
+                    f"Extension {self.lazy_path()} must be instance of: {base.__module__}.{base.__name__}"
+                )
+            if getattr(instance, "id", None) != self._lazy_meta["id"]:
+                raise ValueError(
+                    f"Extension {self.lazy_path()} id mismatch: "
+                    f"{getattr(instance, 'id', None)} != {self._lazy_meta['id']}"
+                )
+            for name, args, kwargs in self._lazy_calls:
+                getattr(instance, name)(*args, **kwargs)  # replay deferred setters
+            self._lazy_calls.clear()
+            object.__setattr__(self, "_lazy_instance", instance)
+            return instance
+
+    def _lazy_setter(self, name: str):
+        """
+        Get deferred setter
+
+        :param name: method name
+        :return: callable storing value and recording call
+        """
+        def setter(*args, **kwargs):
+            with self._lazy_lock:
+                if self._lazy_instance is not None:
+                    return getattr(self._lazy_instance, name)(*args, **kwargs)
+                value = args[0] if args else next(iter(kwargs.values()), None)
+                self._lazy_meta[self._lazy_setters[name]] = value
+                self._lazy_calls[:] = [c for c in self._lazy_calls if c[0] != name]  # keep last call only
+                self._lazy_calls.append((name, args, kwargs))
+        return setter
+
+    def __getattr__(self, name: str) -> Any:
+        # called only if attribute not found in descriptor itself
+        if name.startswith("_lazy_") or (name.startswith("__") and name.endswith("__")):
+            raise AttributeError(name)
+        if self._lazy_instance is None:
+            if name in self._lazy_meta:
+                return self._lazy_meta[name]
+            if name in self._lazy_setters:
+                return self._lazy_setter(name)
+        return getattr(self.lazy_load(), name)
+
+    def __setattr__(self, name: str, value: Any):
+        with self._lazy_lock:
+            if self._lazy_instance is None:
+                self._lazy_meta[name] = value
+                self._lazy_calls.append(("__setattr__", (name, value), {}))
+            else:
+                setattr(self._lazy_instance, name, value)
+
+    def __copy__(self):
+        return copy.copy(self.lazy_load())
+
+    def __deepcopy__(self, memo: dict):
+        return copy.deepcopy(self.lazy_load(), memo)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.lazy_loaded() else "lazy"
+        return f"<LazyExtension {self._lazy_meta['id']} ({self.lazy_path()}, {state})>"
@@ -6,11 +6,12 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.03 17:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import copy
 import datetime
+import hashlib
 import json
 import time
 
@@ -83,6 +84,10 @@ class CtxItem:
     sub_reply: bool = False
     sub_tool_call: bool = False
     thread: Optional[object] = None
+    tokens_cache: dict = field(default_factory=dict)
+    tokens_cache_dirty: bool = False
+    tokens_cache_hash: Optional[str] = None
+    tokens_cache_src: Optional[tuple] = None
     tool_calls: list = field(default_factory=list)
     total_tokens: int = 0
     urls: list = field(default_factory=list)
@@ -159,6 +164,10 @@ class CtxItem:
         self.sub_reply = False  # sub call reply
         self.sub_tool_call = False  # sub tool call
         self.thread = None
+        self.tokens_cache = {}  # history token counts: {key: {"hash": content hash, "tokens": count}}
+        self.tokens_cache_dirty = False  # True if tokens cache changed and is not stored yet
+        self.tokens_cache_hash = None  # content hash for tokens_cache_src
+        self.tokens_cache_src = None  # references to hashed values, to skip re-hashing unchanged content
         self.tool_calls = []  # API tool calls
         self.total_tokens = 0
         self.urls = []
@@ -279,6 +288,7 @@ class CtxItem:
         self.input = input
         self.input_name = name
         self.input_timestamp = int(time.time())
+        self.clear_tokens_cache()
 
     def set_output(self, output: Optional[str], name: Optional[str] = None):
         """
@@ -290,6 +300,7 @@ class CtxItem:
         self.output = output
         self.output_name = name
         self.output_timestamp = int(time.time())
+        self.clear_tokens_cache()
 
     def set_agent_final_response(self, output: str):
         """
@@ -310,6 +321,71 @@ class CtxItem:
         self.output_tokens = output_tokens
         self.total_tokens = input_tokens + output_tokens
 
+    def get_content_hash(self) -> str:
+        """
+        Get hash of content used in token counting (input, output, hidden parts, names)
+
+        :return: content hash
+        """
+        src = (
+            self.input,
+            self.hidden_input,
+            self.output,
+            self.hidden_output,
+            self.input_name,
+            self.output_name,
+        )
+        prev = self.tokens_cache_src
+        if prev is not None and self.tokens_cache_hash is not None and all(a is b for a, b in zip(src, prev)):
+            return self.tokens_cache_hash
+        h = hashlib.blake2b(digest_size=16)
+        for value in src:
+            if value is not None:
+                h.update(str(value).encode("utf-8", "surrogatepass"))
+            h.update(b"\x00")
+        self.tokens_cache_src = src
+        self.tokens_cache_hash = h.hexdigest()
+        return self.tokens_cache_hash
+
+    def get_cached_tokens(self, key: str) -> Optional[int]:
+        """
+        Get cached tokens count if content has not changed since it was counted
+
+        :param key: cache key (encoding, mode, etc.)
+        :return: tokens count or None if not cached
+        """
+        if not self.tokens_cache or not isinstance(self.tokens_cache, dict):
+            return None
+        entry = self.tokens_cache.get(key)
+        if not isinstance(entry, dict) or entry.get("hash") != self.get_content_hash():
+            return None
+        return entry.get("tokens")
+
+    def set_cached_tokens(self, key: str, tokens: int):
+        """
+        Store tokens count in cache, entries for outdated content are removed
+
+        :param key: cache key (encoding, mode, etc.)
+        :param tokens: tokens count
+        """
+        content_hash = self.get_content_hash()
+        cache = {}
+        if isinstance(self.tokens_cache, dict):
+            for k, v in self.tokens_cache.items():
+                if isinstance(v, dict) and v.get("hash") == content_hash:
+                    cache[k] = v
+        cache[key] = {"hash": content_hash, "tokens": tokens}
+        self.tokens_cache = cache
+        self.tokens_cache_dirty = True
+
+    def clear_tokens_cache(self):
+        """Clear tokens cache (on content edit)"""
+        if self.tokens_cache:
+            self.tokens_cache_dirty = True
+        self.tokens_cache = {}
+        self.tokens_cache_hash = None
+        self.tokens_cache_src = None
+
     def get_pid(self) -> int:
         """
         Get context item PID (process ID)
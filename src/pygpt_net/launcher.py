@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.12.31 17:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import os
@@ -14,9 +14,10 @@ import sys
 import argparse
 import signal
 from logging import ERROR, WARNING, INFO, DEBUG
+from typing import Union
 
 from PySide6 import QtCore
-from PySide6.QtCore import QCoreApplication, Qt
+from PySide6.QtCore import QCoreApplication, Qt, QTimer
 from PySide6.QtGui import QScreen
 from PySide6.QtWidgets import QApplication
 
@@ -24,6 +25,8 @@ from pygpt_net.core.events import AppEvent
 from pygpt_net.core.access.shortcuts import GlobalShortcutFilter
 from pygpt_net.core.debug import Debug
 from pygpt_net.core.platforms import Platforms
+from pygpt_net.extension import LazyExtension
+from pygpt_net import profiler
 from pygpt_net.tools import BaseTool
 from pygpt_net.ui.main import MainWindow
 from pygpt_net.plugin.base.plugin import BasePlugin
@@ -109,6 +112,12 @@ class Launcher:
                 required=False,
                 help="force set workdir",
             )
+            parser.add_argument(
+                profiler.PROFILE_ARG,
+                action="store_true",
+                required=False,
+                help="print per-module import time breakdown after startup",
+            )
             safe_argv = self._clean_multiprocessing_argv(sys.argv[1:])
             known, unknown = parser.parse_known_args(safe_argv)
             args = vars(known)
@@ -197,140 +206,165 @@ class Launcher:
                 pass
             self._preloader = None
 
-    def add_plugin(self, plugin: BasePlugin):
+    def validate(self, extension, base: type, error: str) -> str:
+        """
+        Validate extension type (lazy descriptors are validated on first use)
+
+        :param extension: extension instance or lazy descriptor
+        :param base: required base class
+        :param error: error message
+        :return: extension class info
+        """
+        if isinstance(extension, LazyExtension):
+            extension.lazy_expect(base)
+            return "lazy: " + extension.lazy_path()
+        if not isinstance(extension, base):
+            raise TypeError(error)
+        return extension.__class__.__name__
+
+    def add_plugin(self, plugin: Union[BasePlugin, LazyExtension]):
         """
         Register plugin
 
-        :param plugin: plugin instance
+        :param plugin: plugin instance or lazy descriptor
         """
-        if not isinstance(plugin, BasePlugin):
-            raise TypeError(
-                "Plugin must be instance of: "
-                "pygpt_net.plugin.base.BasePlugin"
-            )
+        info = self.validate(
+            plugin,
+            BasePlugin,
+            "Plugin must be instance of: "
+            "pygpt_net.plugin.base.BasePlugin"
+        )
         self.window.add_plugin(plugin)
         if self.debug:
-            print("Loaded plugin: {} ({})".format(plugin.id, plugin.__class__.__name__))
+            print("Loaded plugin: {} ({})".format(plugin.id, info))
 
-    def add_llm(self, llm: BaseLLM):
+    def add_llm(self, llm: Union[BaseLLM, LazyExtension]):
         """
         Register LLM provider
 
-        :param llm: LLM provider instance
+        :param llm: LLM provider instance or lazy descriptor
         """
-        if not isinstance(llm, BaseLLM):
-            raise TypeError(
-                "LLM provider must be instance of: "
-                "pygpt_net.provider.llms.base.BaseLLM"
-            )
+        info = self.validate(
+            llm,
+            BaseLLM,
+            "LLM provider must be instance of: "
+            "pygpt_net.provider.llms.base.BaseLLM"
+        )
         self.window.add_llm(llm)
         if self.debug:
-            print("Loaded LLM: {} ({})".format(llm.id, llm.__class__.__name__))
+            print("Loaded LLM: {} ({})".format(llm.id, info))
 
-    def add_vector_store(self, store: BaseStore):
+    def add_vector_store(self, store: Union[BaseStore, LazyExtension]):
         """
         Register vector store provider
 
-        :param store: Vector store provider instance
+        :param store: Vector store provider instance or lazy descriptor
         """
-        if not isinstance(store, BaseStore):
-            raise TypeError(
-                "Vector store provider must be instance of: "
-                "pygpt_net.provider.vector_stores.base.BaseStore"
-            )
+        info = self.validate(
+            store,
+            BaseStore,
+            "Vector store provider must be instance of: "
+            "pygpt_net.provider.vector_stores.base.BaseStore"
+        )
         self.window.add_vector_store(store)
         if self.debug:
-            print("Loaded vector store: {} ({})".format(store.id, store.__class__.__name__))
+            print("Loaded vector store: {} ({})".format(store.id, info))
 
-    def add_loader(self, loader: BaseLoader):
+    def add_loader(self, loader: Union[BaseLoader, LazyExtension]):
         """
         Register data loader
 
-        :param loader: Data loader instance
+        :param loader: Data loader instance or lazy descriptor
         """
-        if not isinstance(loader, BaseLoader):
-            raise TypeError(
-                "Data loader must be instance of: "
-                "pygpt_net.provider.loaders.base.BaseLoader"
-            )
+        info = self.validate(
+            loader,
+            BaseLoader,
+            "Data loader must be instance of: "
+            "pygpt_net.provider.loaders.base.BaseLoader"
+        )
         self.window.add_loader(loader)
         if self.debug:
-            print("Loaded data loader: {} ({})".format(loader.id, loader.__class__.__name__))
+            print("Loaded data loader: {} ({})".format(loader.id, info))
 
-    def add_audio_input(self, audio: BaseAudioInput):
+    def add_audio_input(self, audio: Union[BaseAudioInput, LazyExtension]):
         """
         Register audio input provider
 
-        :param audio: Audio input provider instance
+        :param audio: Audio input provider instance or lazy descriptor
         """
-        if not isinstance(audio, BaseAudioInput):
-            raise TypeError(
-                "Audio input provider must be instance of: "
-                "pygpt_net.provider.audio_input.base.BaseProvider"
-            )
+        info = self.validate(
+            audio,
+            BaseAudioInput,
+            "Audio input provider must be instance of: "
+            "pygpt_net.provider.audio_input.base.BaseProvider"
+        )
         self.window.add_audio_input(audio)
         if self.debug:
-            print("Loaded audio input: {} ({})".format(audio.id, audio.__class__.__name__))
+            print("Loaded audio input: {} ({})".format(audio.id, info))
 
-    def add_audio_output(self, audio: BaseAudioOutput):
+    def add_audio_output(self, audio: Union[BaseAudioOutput, LazyExtension]):
         """
         Register audio output provider
 
-        :param audio: Audio output provider instance
+        :param audio: Audio output provider instance or lazy descriptor
         """
-        if not isinstance(audio, BaseAudioOutput):
-            raise TypeError(
-                "Audio output provider must be instance of: "
-                "pygpt_net.provider.audio_output.base.BaseProvider"
-            )
+        info = self.validate(
+            audio,
+            BaseAudioOutput,
+            "Audio output provider must be instance of: "
+            "pygpt_net.provider.audio_output.base.BaseProvider"
+        )
         self.window.add_audio_output(audio)
         if self.debug:
-            print("Loaded audio output: {} ({})".format(audio.id, audio.__class__.__name__))
+            print("Loaded audio output: {} ({})".format(audio.id, info))
 
-    def add_web(self, provider: BaseWeb):
+    def add_web(self, provider: Union[BaseWeb, LazyExtension]):
         """
         Register web provider
 
-        :param provider: Web provider instance
+        :param provider: Web provider instance or lazy descriptor
         """
-        if not isinstance(provider, BaseWeb):
-            raise TypeError(
-                "Web provider must be instance of: "
-                "pygpt_net.provider.web.base.BaseProvider"
-            )
+        info = self.validate(
+            provider,
+            BaseWeb,
+            "Web provider must be instance of: "
+            "pygpt_net.provider.web.base.BaseProvider"
+        )
         self.window.add_web(provider)
         if self.debug:
-            print("Loaded web provider: {} ({})".format(provider.id, provider.__class__.__name__))
+            print("Loaded web provider: {} ({})".format(provider.id, info))
 
-    def add_tool(self, tool: BaseTool):
+    def add_tool(self, tool: Union[BaseTool, LazyExtension]):
         """
         Register tool
 
-        :param tool: tool instance
+        :param tool: tool instance or lazy descriptor
         """
-        if not isinstance(tool, BaseTool):
-            raise TypeError(
-                "Tool must be instance of: "
-                "pygpt_net.tools.base.BaseTool"
-            )
+        info = self.validate(
+            tool,
+            BaseTool,
+            "Tool must be instance of: "
+            "pygpt_net.tools.base.BaseTool"
+        )
         self.window.add_tool(tool)
         if self.debug:
-            print("Loaded tool: {} ({})".format(tool.id, tool.__class__.__name__))
+            print("Loaded tool: {} ({})".format(tool.id, info))
 
-    def add_agent(self, agent: BaseAgent):
+    def add_agent(self, agent: Union[BaseAgent, LazyExtension]):
         """
         Register agent (LlamaIndex agent)
 
-        :param agent: Agent instance
+        :param agent: Agent instance or lazy descriptor
         """
-        if not isinstance(agent, BaseAgent):
-            raise TypeError(
-                "Agent must be instance of: "
-                "pygpt_net.provider.agents.base.BaseAgent"
-            )
+        info = self.validate(
+            agent,
+            BaseAgent,
+            "Agent must be instance of: "
+            "pygpt_net.provider.agents.base.BaseAgent"
+        )
         self.window.add_agent(agent)
         if self.debug:
-            print("Loaded agent: {} ({})".format(agent.id, agent.__class__.__name__))
+            print("Loaded agent: {} ({})".format(agent.id, info))
 
     def run(self):
         """Run app"""
@@ -347,6 +381,8 @@ class Launcher:
         self.window.controller.after_setup()
         self.window.dispatch(AppEvent(AppEvent.APP_STARTED))  # app event
         self.window.setup_global_shortcuts()
+        profiler.mark("app started")
+        QTimer.singleShot(0, profiler.finish)  # print import times when event loop starts
         # self.window.core.debug.mem("INIT")  # debug memory usage
         signal.signal(signal.SIGTERM, self.handle_signal)
         signal.signal(signal.SIGINT, self.handle_signal)
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 12:00:00                  #
+# ================================================== #
+
+from sqlalchemy import text
+
+from .base import BaseMigration
+
+
+class Version20261018120000(BaseMigration):
+    def __init__(self, window=None):
+        super(Version20261018120000, self).__init__(window)
+        self.window = window
+
+    def up(self, conn):
+        # FTS5 may be missing in custom SQLite builds, search falls back to LIKE then
+        result = conn.execute(text("""
+        SELECT sqlite_compileoption_used('ENABLE_FTS5');
+        """)).fetchone()
+        if not result or not result[0]:
+            print("[DB] FTS5 is not available, skipping full-text index for ctx items")
+            return
+
+        # external content index (no text duplication), kept in sync by triggers
+        conn.execute(text("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS ctx_item_fts USING fts5(
+            input,
+            output,
+            content='ctx_item',
+            content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2',
+            prefix='2 3'
+        );
+        """))
+        conn.execute(text("""
+        CREATE TRIGGER IF NOT EXISTS ctx_item_fts_ai AFTER INSERT ON ctx_item BEGIN
+            INSERT INTO ctx_item_fts(rowid, input, output) VALUES (new.id, new.input, new.output);
+        END;
+        """))
+        conn.execute(text("""
+        CREATE TRIGGER IF NOT EXISTS ctx_item_fts_ad AFTER DELETE ON ctx_item BEGIN
+            INSERT INTO ctx_item_fts(ctx_item_fts, rowid, input, output) VALUES ('delete', old.id, old.input, old.output);
+        END;
+        """))
+        conn.execute(text("""
+        CREATE TRIGGER IF NOT EXISTS ctx_item_fts_au AFTER UPDATE OF input, output ON ctx_item BEGIN
+            INSERT INTO ctx_item_fts(ctx_item_fts, rowid, input, output) VALUES ('delete', old.id, old.input, old.output);
+            INSERT INTO ctx_item_fts(rowid, input, output) VALUES (new.id, new.input, new.output);
+        END;
+        """))
+
+        # index already stored items
+        conn.execute(text("""
+        INSERT INTO ctx_item_fts(ctx_item_fts) VALUES ('rebuild');
+        """))
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 13:00:00                  #
+# ================================================== #
+
+from sqlalchemy import text
+
+from .base import BaseMigration
+
+
+class Version20261018130000(BaseMigration):
+    def __init__(self, window=None):
+        super(Version20261018130000, self).__init__(window)
+        self.window = window
+
+    def up(self, conn):
+        conn.execute(text("""
+        CREATE INDEX IF NOT EXISTS idx_ctx_item_meta_id ON ctx_item (meta_id);
+        """))
+        conn.execute(text("""
+        CREATE INDEX IF NOT EXISTS idx_ctx_meta_updated_ts ON ctx_meta (updated_ts);
+        """))
+        conn.execute(text("""
+        CREATE INDEX IF NOT EXISTS idx_ctx_meta_group_id ON ctx_meta (group_id, updated_ts);
+        """))
+        conn.execute(text("""
+        CREATE INDEX IF NOT EXISTS idx_ctx_meta_is_important ON ctx_meta (is_important, updated_ts);
+        """))
+        conn.execute(text("""
+        CREATE INDEX IF NOT EXISTS idx_ctx_meta_root_id ON ctx_meta (root_id);
+        """))
+        conn.execute(text("""
+        CREATE INDEX IF NOT EXISTS idx_ctx_meta_indexed_ts ON ctx_meta (indexed_ts);
+        """))
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 15:00:00                  #
+# ================================================== #
+
+from sqlalchemy import text
+
+from .base import BaseMigration
+
+
+class Version20261018150000(BaseMigration):
+    def __init__(self, window=None):
+        super(Version20261018150000, self).__init__(window)
+        self.window = window
+
+    def up(self, conn):
+        # indexed file state (to skip unchanged files on re-index)
+        conn.execute(text("""
+        ALTER TABLE idx_file ADD COLUMN size INTEGER NOT NULL DEFAULT 0;
+        """))
+        conn.execute(text("""
+        ALTER TABLE idx_file ADD COLUMN mtime INTEGER NOT NULL DEFAULT 0;
+        """))
+        conn.execute(text("""
+        ALTER TABLE idx_file ADD COLUMN hash TEXT NOT NULL DEFAULT '';
+        """))
+
+        # content-addressed embeddings cache (chunk hash -> vector, per embedding model)
+        conn.execute(text("""
+        CREATE TABLE IF NOT EXISTS idx_embedding (
+            model TEXT NOT NULL,
+            hash TEXT NOT NULL,
+            vector BLOB NOT NULL,
+            created_ts INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (model, hash)
+        ) WITHOUT ROWID;
+        """))
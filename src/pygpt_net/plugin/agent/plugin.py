@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.15 23:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from pygpt_net.plugin.base.plugin import BasePlugin
@@ -30,6 +30,20 @@ class Plugin(BasePlugin):
             "cmd.inline",
         ]
         self.order = 9998
+        self.events = [
+            Event.CMD_EXECUTE,
+            Event.CMD_INLINE,
+            Event.CTX_AFTER,
+            Event.CTX_BEFORE,
+            Event.CTX_END,
+            Event.DISABLE,
+            Event.ENABLE,
+            Event.FORCE_STOP,
+            Event.INPUT_BEFORE,
+            Event.PLUGIN_SETTINGS_CHANGED,
+            Event.SYSTEM_PROMPT,
+            Event.USER_SEND,
+        ]
         self.use_locale = True
         self.config = Config(self)
         self.init_options()
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.31 23:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import os
@@ -49,6 +49,18 @@ class Plugin(BasePlugin):
             'Thank you for watching',
         ]  # phrases to ignore (fix for empty phrases)
         self.order = 1
+        self.events = [
+            Event.AUDIO_INPUT_RECORD_TOGGLE,
+            Event.AUDIO_INPUT_STOP,
+            Event.AUDIO_INPUT_TOGGLE,
+            Event.AUDIO_INPUT_TRANSCRIBE,
+            Event.CTX_BEGIN,
+            Event.CTX_END,
+            Event.DISABLE,
+            Event.ENABLE,
+            Event.INPUT_BEFORE,
+            Event.PLUGIN_OPTION_GET,
+        ]
         self.use_locale = True
         self.input_file = "input.wav"
         self.config = Config(self)
@@ -371,6 +383,27 @@ class Plugin(BasePlugin):
         except Exception as e:
             self.error(e)
 
+    def handle_segments(self, source):
+        """
+        Handle speech segments transcription thread (continuous mode with VAD)
+
+        :param source: segments source (next_segment() provider)
+        """
+        try:
+            worker = Worker()
+            worker.from_defaults(self)
+            worker.segments = source
+
+            # signals
+            worker.signals.finished.connect(self.handle_input)
+            worker.signals.destroyed.connect(self.handle_destroy)
+
+            worker.run_async()
+
+        except Exception as e:
+            source.segments_busy = False
+            self.error(e)
+
     def can_listen(self) -> bool:
         """
         Check if can listen
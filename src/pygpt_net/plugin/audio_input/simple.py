@@ -6,10 +6,13 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.31 23:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import os
+import threading
+from collections import deque
+from typing import Optional, Tuple
 
 from PySide6.QtCore import QTimer
 
@@ -31,6 +34,9 @@ class Simple:
         self.plugin = plugin
         self.is_recording = False
         self.timer = None
+        self.segments = deque()  # speech segments waiting for transcription (continuous mode)
+        self.segments_lock = threading.Lock()
+        self.segments_busy = False
 
     def toggle_realtime(
             self,
@@ -111,6 +117,7 @@ class Simple:
 
         # enable continuous mode if notepad tab is active
         self.plugin.window.core.audio.capture.set_repeat_callback(self.on_stop)
+        self.plugin.window.core.audio.capture.set_segment_callback(self.on_segment)
         continuous_enabled = self.plugin.window.core.config.get('audio.input.continuous', False)
         if continuous_enabled and self.plugin.window.controller.ui.tabs.get_current_type() == Tab.TAB_NOTEPAD:
             self.plugin.window.core.audio.capture.set_loop(True)  # set loop
@@ -208,3 +215,30 @@ class Simple:
         self.plugin.window.core.audio.capture.stop()
         self.plugin.window.core.audio.capture.start()
         self.plugin.handle_thread(True)
+
+    def on_segment(self, data: bytes, rate: int, channels: int):
+        """
+        Handle speech segment (continuous mode with VAD), segments are transcribed in order
+
+        :param data: PCM16 data
+        :param rate: sample rate
+        :param channels: number of channels
+        """
+        with self.segments_lock:
+            self.segments.append((data, rate, channels))
+            if self.segments_busy:
+                return  # picked up by running worker
+            self.segments_busy = True
+        self.plugin.handle_segments(self)
+
+    def next_segment(self) -> Optional[Tuple[bytes, int, int]]:
+        """
+        Get next speech segment to transcribe (called from worker)
+
+        :return: (data, rate, channels) or None if no more segments
+        """
+        with self.segments_lock:
+            if not self.segments:
+                self.segments_busy = False
+                return None
+            return self.segments.popleft()
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.11 14:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import os.path
@@ -16,6 +16,7 @@ import audioop
 
 from PySide6.QtCore import Slot, Signal
 
+from pygpt_net.core.executor import LANE_DEFAULT
 from pygpt_net.core.tabs.tab import Tab
 from pygpt_net.utils import trans
 from pygpt_net.plugin.base.worker import BaseWorker, BaseSignals
@@ -27,6 +28,8 @@ class WorkerSignals(BaseSignals):
 
 
 class Worker(BaseWorker):
+    lane = LANE_DEFAULT  # long-running listener, not limited by tools lane
+
     def __init__(self, *args, **kwargs):
         super(Worker, self).__init__()
         self.signals = WorkerSignals()
@@ -36,6 +39,7 @@ class Worker(BaseWorker):
         self.path = None
         self.advanced = False
         self.transcribe = False
+        self.segments = None  # speech segments source (continuous mode)
 
     @Slot()
     def run(self):
@@ -43,6 +47,8 @@ class Worker(BaseWorker):
         try:
             if self.transcribe:
                 self.handle_file()  # from file
+            elif self.segments is not None:
+                self.handle_segments()  # from microphone, in-memory speech segments
             else:
                 if self.advanced:
                     self.handle_advanced() # from microphone
@@ -69,6 +75,23 @@ class Worker(BaseWorker):
             self.stopped()
             self.status('Error: {}'.format(e))
 
+    def handle_segments(self):
+        """Handle speech segments (continuous mode), transcribed in order without temporary files."""
+        while True:
+            segment = self.segments.next_segment()  # drain queue, releases source when empty
+            if segment is None:
+                break
+            data, rate, channels = segment
+            try:
+                self.status(trans('audio.speak.wait'))
+                transcript = self.plugin.get_provider().transcribe_audio(data, rate, channels)
+                self.status('')
+                if transcript is not None and transcript.strip() != '':
+                    self.response(transcript)
+            except Exception as e:
+                self.error(e)
+                self.status('Error: {}'.format(e))
+
     def handle_simple(self):
         """Handle mic simple mode."""
         try:
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.27 07:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from typing import Any
@@ -34,6 +34,13 @@ class Plugin(BasePlugin):
         self.input_text = None
         self.playback = None
         self.order = 1
+        self.events = [
+            Event.AUDIO_OUTPUT_STOP,
+            Event.AUDIO_PLAYBACK,
+            Event.AUDIO_READ_TEXT,
+            Event.CTX_AFTER,
+            Event.INPUT_BEFORE,
+        ]
         self.use_locale = True
         # Temporary file management
         self._temp_audio_files = []
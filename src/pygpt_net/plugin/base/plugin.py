@@ -6,11 +6,11 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.22 19:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import copy
-from typing import Optional, Any, Dict, List
+from typing import Optional, Any, Dict, List, Callable
 
 from PySide6.QtCore import QObject, Slot
 
@@ -58,6 +58,8 @@ class BasePlugin(QObject):
         self.enabled = False
         self.use_locale = False
         self.order = 0
+        self.events = None  # subscribed event names, None = all events
+        self.cache_syntax = True  # cache commands syntax until options change
 
     def setup(self) -> Dict[str, Any]:
         """
@@ -252,6 +254,7 @@ class BasePlugin(QObject):
         elif t == "float":
             value = float(value)
         opt["value"] = value
+        self.window.core.command.invalidate()
         self.refresh_option(name)
 
     def attach(self, window):
@@ -271,6 +274,16 @@ class BasePlugin(QObject):
         if option_id in self.options:
             self.window.controller.plugins.settings.refresh_option(self.id, option_id)
 
+    def get_subscriptions(self) -> Optional[Dict[str, Callable]]:
+        """
+        Return event subscriptions (event name -> handler)
+
+        :return: subscriptions dict or None if subscribed to all events
+        """
+        if self.events is None:
+            return None
+        return {name: self.handle for name in self.events}
+
     def handle(
             self,
             event: Event,
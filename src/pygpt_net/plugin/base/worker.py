@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.11 14:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from typing import Optional, Any, Dict, List
@@ -14,11 +14,14 @@ from typing import Optional, Any, Dict, List
 from PySide6.QtCore import QRunnable
 from typing_extensions import deprecated
 
+from pygpt_net.core.executor import LANE_TOOLS
 from .plugin import BasePlugin
 from .signals import BaseSignals
 
 
 class BaseWorker(QRunnable):
+    lane = LANE_TOOLS  # executor lane
+
     def __init__(
             self,
             plugin: Optional[BasePlugin] = None,
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.20 03:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import json
@@ -31,6 +31,7 @@ class Plugin(BasePlugin):
         self.description = "Provides the ability to make external API calls"
         self.prefix = "API"
         self.order = 100
+        self.events = [Event.CMD_EXECUTE, Event.CMD_SYNTAX]
         self.use_locale = True
         self.worker = None
         self.config = Config(self)
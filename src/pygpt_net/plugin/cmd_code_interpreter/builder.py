@@ -6,12 +6,13 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.07.17 02:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from PySide6.QtCore import Slot, Signal, QObject
 
 from pygpt_net.core.events import RenderEvent
+from pygpt_net.core.executor import LANE_MAINTENANCE
 from pygpt_net.plugin.base.worker import BaseWorker, BaseSignals
 from pygpt_net.utils import trans
 
@@ -64,6 +65,8 @@ class WorkerSignals(BaseSignals):
     build_finished = Signal()
 
 class Worker(BaseWorker):
+    lane = LANE_MAINTENANCE  # executor lane
+
     def __init__(self, *args, **kwargs):
         super(Worker, self).__init__()
         self.signals = WorkerSignals()
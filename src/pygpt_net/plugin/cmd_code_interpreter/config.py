@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.07.14 18:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from pygpt_net.plugin.base.config import BaseConfig, BasePlugin
@@ -226,6 +226,64 @@ class Config(BaseConfig):
             description="Python command template to execute, use {filename} for filename placeholder",
             tab="python_legacy",
         )
+        plugin.add_option(
+            "python_pool",
+            type="bool",
+            value=False,
+            label="Warm interpreter pool",
+            description="Run Python code on host in pre-started interpreters "
+                        "(no startup and import cost on every run). Module state "
+                        "and threads started by code may be kept between runs",
+            tab="python_legacy",
+        )
+        plugin.add_option(
+            "python_pool_size",
+            type="int",
+            value=1,
+            label="Warm interpreters",
+            description="Number of pre-started interpreters",
+            min=1,
+            max=16,
+            tab="python_legacy",
+            advanced=True,
+        )
+        plugin.add_option(
+            "python_pool_preload",
+            type="text",
+            value="",
+            label="Preloaded modules",
+            description="Comma-separated modules imported when interpreter starts, e.g. numpy, pandas",
+            tab="python_legacy",
+        )
+        plugin.add_option(
+            "python_pool_max_runs",
+            type="int",
+            value=20,
+            label="Recycle after runs",
+            description="Restart interpreter after this number of runs, 0 = never",
+            min=0,
+            tab="python_legacy",
+            advanced=True,
+        )
+        plugin.add_option(
+            "python_timeout",
+            type="int",
+            value=0,
+            label="Timeout (seconds)",
+            description="Stop execution after this time, 0 = no timeout",
+            min=0,
+            tab="python_legacy",
+        )
+        plugin.add_option(
+            "python_memory_limit",
+            type="int",
+            value=0,
+            label="Memory limit (MB)",
+            description="Max memory of warm interpreter (Linux/macOS only), 0 = no limit",
+            min=0,
+            tab="python_legacy",
+            advanced=True,
+        )
         plugin.add_option(
             "dockerfile",
             type="textarea",
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.15 23:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import os
@@ -25,6 +25,7 @@ from .builder import Builder
 from .ipython import LocalKernel
 from .ipython import DockerKernel
 from .output import Output
+from .pool import ProcessPool
 from .runner import Runner
 
 from pygpt_net.utils import trans
@@ -54,9 +55,11 @@ class Plugin(BasePlugin):
             "render_html_output",
             "get_html_output",
         ]
+        self.events = [Event.CMD_EXECUTE, Event.CMD_SYNTAX, Event.TOOL_OUTPUT_RENDER, Event.ENABLE, Event.DISABLE]
         self.use_locale = True
         self.docker = Docker(self)
         self.runner = Runner(self)
+        self.pool = ProcessPool(self)
         self.ipython_docker = DockerKernel(self)
         self.ipython_local = LocalKernel(self)
         self.builder = Builder(self)
@@ -109,6 +112,18 @@ class Plugin(BasePlugin):
             if data['tool'] == self.id:
                 data['html'] = self.output.handle(ctx, data['content'])
 
+        elif name == Event.ENABLE:
+            if data.get('value') == self.id:
+                self.pool.open()  # allow reuse after previous disable
+
+        elif name == Event.DISABLE:
+            if data.get('value') == self.id:
+                self.pool.shutdown()  # stop warm interpreters
+
+    def destroy(self):
+        """Stop warm interpreters"""
+        self.pool.shutdown()
+
     def cmd_syntax(self, data: dict):
         """
         Event: CMD_SYNTAX
@@ -0,0 +1,589 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 12:00:00                  #
+# ================================================== #
+
+import codecs
+import json
+import os
+import queue
+import signal
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from typing import Callable, List, Optional, Tuple
+
+# warm worker, started with Python command template, runs files sent as JSON lines to stdin
+BOOTSTRAP = r'''
+import importlib
+import json
+import os
+import runpy
+import site
+import sys
+import sysconfig
+import traceback
+
+
+def get_library_dirs():
+    dirs = set()
+    for name in ("stdlib", "platstdlib", "purelib", "platlib"):
+        try:
+            dirs.add(sysconfig.get_path(name))
+        except Exception:
+            pass
+    try:
+        dirs.add(site.getusersitepackages())
+    except Exception:
+        pass
+    return tuple(os.path.join(os.path.normcase(os.path.realpath(d)), "") for d in dirs if d)
+
+
+def is_library(module, dirs):
+    file = getattr(module, "__file__", None)
+    if not file:
+        return False
+    return os.path.normcase(os.path.realpath(file)).startswith(dirs)
+
+
+def main():
+    config = json.loads(os.environ.pop("PYGPT_POOL_CONFIG", "{}") or "{}")
+    marker = config["marker"]
+    memory = int(config.get("memory", 0) or 0)
+    if memory > 0:
+        try:
+            import resource
+            size = memory * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (size, size))
+        except Exception:
+            pass
+    for name in config.get("preload", []):
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            sys.stderr.write("Preload error: {}: {}\n".format(name, e))
+    for stream in (sys.stdout, sys.stderr):
+        stream.write("\n{}init:0\n".format(marker))  # ready
+        stream.flush()
+
+    channel = sys.stdin
+    sys.stdin = open(os.devnull, "r")  # executed code cannot read from control channel
+    cwd = os.getcwd()
+    path = list(sys.path)
+    argv = list(sys.argv)
+    libs = get_library_dirs()
+    for line in channel:
+        try:
+            job = json.loads(line)
+        except ValueError:
+            continue
+        code = 0
+        modules = set(sys.modules)
+        environ = dict(os.environ)
+        importlib.invalidate_caches()
+        sys.argv = [job["path"]]
+        sys.path[:] = [os.path.dirname(os.path.abspath(job["path"]))] + path
+        try:
+            runpy.run_path(job["path"], run_name="__main__")
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except BaseException:
+            traceback.print_exc()
+            code = 1
+        finally:
+            for stream in (sys.stdout, sys.stderr):
+                try:
+                    stream.flush()
+                except Exception:
+                    pass
+            sys.stdout, sys.stderr = sys.__stdout__, sys.__stderr__
+            os.chdir(cwd)
+            sys.path[:] = path
+            sys.argv = argv
+            # run starts clean: drop user modules imported by run (libraries stay warm)
+            for name in list(sys.modules):
+                if name not in modules and not is_library(sys.modules.get(name), libs):
+                    sys.modules.pop(name, None)
+            if dict(os.environ) != environ:
+                os.environ.clear()
+                os.environ.update(environ)
+        for stream in (sys.stdout, sys.stderr):
+            stream.write("\n{}{}:{}\n".format(marker, job["id"], code))
+            stream.flush()
+
+
+main()
+'''
+
+
+class PythonProcess:
+    CHUNK_INTERVAL = 0.1  # seconds, output is sent in chunks, not per read
+
+    def __init__(self, cmd: str, config: dict, key: str):
+        """
+        Warm Python interpreter
+
+        :param cmd: command to start worker
+        :param config: worker config (marker, preload, memory)
+        :param key: pool config key
+        """
+        self.key = key
+        self.runs = 0
+        self.ready = False
+        self.init_output = ""  # output of startup (preload errors)
+        self.marker = config["marker"].encode("utf-8")
+        self.queue = queue.Queue()
+        env = dict(os.environ)
+        env["PYTHONUNBUFFERED"] = "1"
+        env["PYTHONIOENCODING"] = "utf-8"
+        env["PYGPT_POOL_CONFIG"] = json.dumps(config)
+        kwargs = {}
+        if sys.platform == "win32":
+            kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
+        else:
+            kwargs["start_new_session"] = True  # kill whole group (shell + interpreter)
+        self.process = subprocess.Popen(
+            cmd,
+            shell=True,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=env,
+            bufsize=0,
+            **kwargs
+        )
+        start_readers(self.process, self.queue, self.marker)
+
+    def is_alive(self) -> bool:
+        """
+        Check if process is running
+
+        :return: True if running
+        """
+        return self.process.poll() is None
+
+    def run(
+            self,
+            path: str,
+            timeout: float = 0,
+            callback: Optional[Callable[[str, str], None]] = None
+    ) -> Tuple[str, str, bool]:
+        """
+        Run Python file in warm interpreter
+
+        :param path: path to Python file
+        :param timeout: timeout in seconds (0 = no timeout)
+        :param callback: output callback (text, stdout/stderr), called as output is produced
+        :return: stdout, stderr, True if process is still usable
+        """
+        if not self.ready:
+            stdout, stderr, ready = collect(self.queue, timeout, None, self.kill)  # wait for preload
+            self.init_output = stdout + stderr
+            self.ready = True
+            if not ready:
+                return stdout, stderr, False
+        self.runs += 1
+        job = json.dumps({"id": uuid.uuid4().hex, "path": path}) + "\n"
+        self.process.stdin.write(job.encode("utf-8"))
+        self.process.stdin.flush()
+        return collect(self.queue, timeout, callback, self.kill)
+
+    def kill(self):
+        """Kill process (with process group)"""
+        kill_process(self.process)
+
+
+def start_readers(process: subprocess.Popen, output: queue.Queue, marker: bytes = b""):
+    """
+    Start stdout and stderr reader threads
+
+    :param process: process
+    :param output: output queue
+    :param marker: end-of-run marker (empty = read until EOF only)
+    """
+    for name, stream in (("stdout", process.stdout), ("stderr", process.stderr)):
+        thread = threading.Thread(target=read_stream, args=(name, stream, output, marker), daemon=True)
+        thread.start()
+
+
+def read_stream(name: str, stream, output: queue.Queue, marker: bytes = b""):
+    """
+    Read stream as data arrives and put output chunks and end-of-run markers into queue
+
+    :param name: stream name (stdout/stderr)
+    :param stream: pipe
+    :param output: queue with (stream name, text | None = end of run | False = EOF)
+    :param marker: end-of-run marker (empty = read until EOF only)
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    sep = b"\n" + marker if marker else b""
+    pending = b""
+
+    def put(data: bytes, final: bool = False):
+        text = decoder.decode(data, final=final)
+        if text:
+            output.put((name, text))
+
+    try:
+        while True:
+            data = stream.read1(65536) if hasattr(stream, "read1") else stream.read(65536)
+            if not data:
+                break
+            if not sep:
+                put(data)
+                continue
+            pending += data
+            while True:
+                pos = pending.find(sep)
+                if pos == -1:
+                    keep = partial(pending, sep)  # tail may be beginning of marker
+                    put(pending[:len(pending) - keep])
+                    pending = pending[len(pending) - keep:]
+                    break
+                end = pending.find(b"\n", pos + len(sep))
+                put(pending[:pos])
+                if end == -1:
+                    pending = pending[pos:]  # wait for full marker line
+                    break
+                output.put((name, None))  # end of run
+                pending = pending[end + 1:]
+    except Exception:
+        pass
+    put(pending, final=True)
+    output.put((name, False))  # EOF
+
+
+def partial(data: bytes, sep: bytes) -> int:
+    """
+    Get length of data tail which is beginning of separator
+
+    :param data: data
+    :param sep: separator
+    :return: length of tail
+    """
+    for size in range(min(len(sep) - 1, len(data)), 0, -1):
+        if sep.startswith(data[-size:]):
+            return size
+    return 0
+
+
+def run_command(
+        cmd: str,
+        timeout: float = 0,
+        callback: Optional[Callable[[str, str], None]] = None
+) -> Tuple[str, str]:
+    """
+    Run command in new process and stream its output
+
+    :param cmd: command
+    :param timeout: timeout in seconds (0 = no timeout)
+    :param callback: output callback (text, stdout/stderr)
+    :return: stdout, stderr
+    """
+    kwargs = {}
+    if sys.platform == "win32":
+        kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kwargs["start_new_session"] = True
+    env = dict(os.environ)
+    env["PYTHONUNBUFFERED"] = "1"
+    process = subprocess.Popen(
+        cmd,
+        shell=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=env,
+        bufsize=0,
+        **kwargs
+    )
+    output = queue.Queue()
+    start_readers(process, output)
+    stdout, stderr, _ = collect(output, timeout, callback, lambda: kill_process(process))
+    try:
+        process.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        kill_process(process)
+    return stdout, stderr
+
+
+def collect(
+        output: queue.Queue,
+        timeout: float = 0,
+        callback: Optional[Callable[[str, str], None]] = None,
+        on_timeout: Optional[Callable[[], None]] = None
+) -> Tuple[str, str, bool]:
+    """
+    Collect output of run from queue, output is passed to callback in chunks
+
+    :param output: queue with (stream name, text | None = end of run | False = EOF)
+    :param timeout: timeout in seconds (0 = no timeout)
+    :param callback: output callback (text, stdout/stderr)
+    :param on_timeout: called on timeout
+    :return: stdout, stderr, True if finished by end-of-run markers
+    """
+    result = {"stdout": [], "stderr": []}
+    chunk = []  # (name, text) not sent yet
+    done = set()
+    finished = True
+    deadline = time.monotonic() + timeout if timeout and timeout > 0 else None
+    last = time.monotonic()
+    while len(done) < 2:
+        wait = PythonProcess.CHUNK_INTERVAL
+        if deadline is not None:
+            left = deadline - time.monotonic()
+            if left <= 0:
+                if on_timeout is not None:
+                    on_timeout()
+                msg = "\nTimeout: execution stopped after {} seconds\n".format(timeout)
+                result["stderr"].append(msg)
+                chunk.append(("stderr", msg))
+                finished = False
+                break
+            wait = min(wait, left)
+        try:
+            name, text = output.get(timeout=wait)
+            if text is None or text is False:
+                done.add(name)
+                if text is False:
+                    finished = False
+            else:
+                result[name].append(text)
+                chunk.append((name, text))
+        except queue.Empty:
+            pass
+        now = time.monotonic()
+        if chunk and (now - last >= PythonProcess.CHUNK_INTERVAL or len(done) == 2):
+            send(chunk, callback)
+            chunk = []
+            last = now
+    send(chunk, callback)
+    return "".join(result["stdout"]), "".join(result["stderr"]), finished
+
+
+def send(chunk: List[Tuple[str, str]], callback: Optional[Callable[[str, str], None]]):
+    """
+    Send output chunk to callback, merged by stream
+
+    :param chunk: list of (stream name, text)
+    :param callback: output callback (text, stdout/stderr)
+    """
+    if callback is None or not chunk:
+        return
+    merged = []
+    for name, text in chunk:
+        if merged and merged[-1][0] == name:
+            merged[-1][1].append(text)
+        else:
+            merged.append((name, [text]))
+    for name, parts in merged:
+        callback("".join(parts), name)
+
+
+def kill_process(process: subprocess.Popen):
+    """
+    Kill process with its children
+
+    :param process: process
+    """
+    if process.poll() is not None:
+        return
+    try:
+        if sys.platform == "win32":
+            subprocess.run(
+                ["taskkill", "/F", "/T", "/PID", str(process.pid)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        else:
+            os.killpg(os.getpgid(process.pid), signal.SIGKILL)
+    except Exception:
+        process.kill()
+
+
+class ProcessPool:
+    def __init__(self, plugin=None):
+        """
+        Pool of warm Python interpreters for host mode code execution
+
+        Interpreters are started in advance with preloaded modules, each run executes
+        file in fresh globals and interpreter is recycled after configured number of runs.
+        Modules imported by run from outside of library paths, environment and working
+        directory are restored after each run.
+
+        :param plugin: plugin
+        """
+        self.plugin = plugin
+        self.idle: List[PythonProcess] = []
+        self.lock = threading.Lock()
+        self.marker = "\x00PYGPT:{}:".format(uuid.uuid4().hex)
+        self.bootstrap = None  # path to worker bootstrap file
+        self.closed = False  # shut down, running interpreters are not returned to pool
+
+    def is_enabled(self) -> bool:
+        """
+        Check if warm pool is enabled
+
+        :return: True if enabled
+        """
+        return bool(self.plugin.get_option_value("python_pool"))
+
+    def get_int(self, key: str, default: int = 0) -> int:
+        """
+        Get int option
+
+        :param key: option key
+        :param default: default value
+        :return: option value
+        """
+        try:
+            return max(0, int(self.plugin.get_option_value(key) or 0))
+        except (TypeError, ValueError):
+            return default
+
+    def get_timeout(self) -> int:
+        """
+        Get run timeout
+
+        :return: timeout in seconds (0 = no timeout)
+        """
+        return self.get_int("python_timeout")
+
+    def get_preload(self) -> List[str]:
+        """
+        Get modules to preload
+
+        :return: list of module names
+        """
+        value = self.plugin.get_option_value("python_pool_preload") or ""
+        return [name.strip() for name in value.replace("\n", ",").split(",") if name.strip()]
+
+    def get_bootstrap_path(self) -> str:
+        """
+        Get (and write if needed) worker bootstrap file
+
+        :return: path to bootstrap file
+        """
+        if self.bootstrap is not None and os.path.exists(self.bootstrap):
+            return self.bootstrap
+        path = os.path.join(self.plugin.window.core.config.get_user_dir("data"), "tmp", ".interpreter.pool.py")
+        self.bootstrap = path
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                if f.read() == BOOTSTRAP:
+                    return path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(BOOTSTRAP)
+        return path
+
+    def get_config(self) -> Tuple[str, dict, str]:
+        """
+        Get worker command and config
+
+        :return: command, worker config, config key
+        """
+        cmd = self.plugin.get_option_value("python_cmd_tpl").format(filename=self.get_bootstrap_path())
+        config = {
+            "marker": self.marker,
+            "preload": self.get_preload(),
+            "memory": self.get_int("python_memory_limit"),
+        }
+        key = json.dumps([cmd, config], sort_keys=True)
+        return cmd, config, key
+
+    def acquire(self) -> PythonProcess:
+        """
+        Get warm interpreter from pool or start new one
+
+        :return: interpreter
+        """
+        cmd, config, key = self.get_config()
+        stale = []
+        process = None
+        with self.lock:
+            while self.idle:
+                item = self.idle.pop(0)
+                if item.key == key and item.is_alive():
+                    process = item
+                    break
+                stale.append(item)  # config changed or process died
+        for item in stale:
+            item.kill()
+        if process is None:
+            process = PythonProcess(cmd, config, key)
+        return process
+
+    def release(self, process: PythonProcess, usable: bool = True):
+        """
+        Return interpreter to pool, recycle if needed and start replacements
+
+        :param process: interpreter
+        :param usable: False if interpreter must not be reused
+        """
+        max_runs = self.get_int("python_pool_max_runs")
+        if self.closed:
+            process.kill()
+            return
+        if not usable or not process.is_alive() or (max_runs > 0 and process.runs >= max_runs):
+            process.kill()
+        else:
+            with self.lock:
+                self.idle.append(process)
+        self.fill()
+
+    def fill(self):
+        """Start warm interpreters up to pool size"""
+        size = max(1, self.get_int("python_pool_size", 1))
+        cmd, config, key = self.get_config()
+        with self.lock:
+            missing = size - len(self.idle)
+            for _ in range(missing):
+                self.idle.append(PythonProcess(cmd, config, key))
+            extra = self.idle[size:]
+            del self.idle[size:]
+        for item in extra:
+            item.kill()
+
+    def run(
+            self,
+            path: str,
+            callback: Optional[Callable[[str, str], None]] = None
+    ) -> Tuple[str, str]:
+        """
+        Run Python file in warm interpreter
+
+        :param path: path to Python file
+        :param callback: output callback (text, stdout/stderr)
+        :return: stdout, stderr
+        """
+        process = self.acquire()
+        usable = False
+        try:
+            stdout, stderr, usable = process.run(path, self.get_timeout(), callback)
+        finally:
+            self.release(process, usable)
+        if process.init_output and process.runs == 1:
+            self.plugin.log("Interpreter startup: {}".format(process.init_output.strip()))
+        return stdout, stderr
+
+    def open(self):
+        """Allow reuse of interpreters again (after shutdown)"""
+        with self.lock:
+            self.closed = False
+
+    def shutdown(self):
+        """Kill all idle interpreters (interpreter in use is killed when run ends)"""
+        with self.lock:
+            self.closed = True
+            items = self.idle
+            self.idle = []
+        for item in items:
+            item.kill()
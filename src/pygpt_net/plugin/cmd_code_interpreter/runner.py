@@ -6,15 +6,17 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.07.17 19:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import os.path
 import re
-import subprocess
 import docker
 
+from typing import Tuple, Union
+
 from pygpt_net.item.ctx import CtxItem
+from .pool import run_command
 
 
 class Runner:
@@ -84,22 +86,30 @@ class Runner:
         if self.signals is not None:
             self.signals.html_output.emit(data)
 
-    def handle_result(self, stdout, stderr):
+    def handle_result(
+            self,
+            stdout: Union[bytes, str, None],
+            stderr: Union[bytes, str, None],
+            send: bool = True
+    ):
         """
         Handle result from subprocess
 
         :param stdout: stdout
         :param stderr: stderr
+        :param send: send output to interpreter (False if already streamed)
         :return: result
         """
         result = None
         if stdout:
-            result = stdout.decode("utf-8")
-            self.send_interpreter_output(result, "stdout")
+            result = stdout.decode("utf-8") if isinstance(stdout, bytes) else stdout
+            if send:
+                self.send_interpreter_output(result, "stdout")
             self.log("STDOUT: {}".format(result))
         if stderr:
-            result = stderr.decode("utf-8")
-            self.send_interpreter_output(result, "stderr")
+            result = stderr.decode("utf-8") if isinstance(stderr, bytes) else stderr
+            if send:
+                self.send_interpreter_output(result, "stderr")
             self.log("STDERR: {}".format(result))
         if result is None:
             result = "No result (STDOUT/STDERR empty)"
@@ -197,6 +207,21 @@ class Runner:
         return response
 
 
+    def run_host(self, path: str) -> Tuple[str, str]:
+        """
+        Run Python file on host, output is streamed to interpreter as it is produced
+
+        :param path: path to Python file
+        :return: stdout, stderr
+        """
+        pool = self.plugin.pool
+        if pool.is_enabled():
+            self.log("Running in warm interpreter: {}".format(path))
+            return pool.run(path, self.send_interpreter_output)
+        cmd = self.plugin.get_option_value('python_cmd_tpl').format(filename=path)
+        self.log("Running command: {}".format(cmd))
+        return run_command(cmd, pool.get_timeout(), self.send_interpreter_output)
+
     def code_execute_file_host(self, ctx, item: dict, request: dict) -> dict or None:
         """
         Execute code from file on host machine
@@ -226,22 +251,13 @@ class Runner:
         """
 
         # run code
-        cmd = self.plugin.get_option_value('python_cmd_tpl').format(filename=path)
-        self.log("Running command: {}".format(cmd))
+        self.send_interpreter_output_begin("stdout")
         try:
-            self.send_interpreter_output_begin("stdout")
-            process = subprocess.Popen(
-                cmd,
-                shell=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-            )
-            stdout, stderr = process.communicate()
+            stdout, stderr = self.run_host(path)
+            result = self.handle_result(stdout, stderr, send=False)  # already streamed
         except Exception as e:
             self.error(e)
-            stdout = None
-            stderr = str(e).encode("utf-8")
-        result = self.handle_result(stdout, stderr)
+            result = self.handle_result(None, str(e))
         self.send_interpreter_output_end("stdout")
         return {
             "request": request,
@@ -312,22 +328,13 @@ class Runner:
         self.send_interpreter_input(data)  # send input to interpreter
 
         # run code
-        cmd = self.plugin.get_option_value('python_cmd_tpl').format(filename=path)
-        self.log("Running command: {}".format(cmd))
+        self.send_interpreter_output_begin("stdout")
         try:
-            self.send_interpreter_output_begin("stdout")
-            process = subprocess.Popen(
-                cmd,
-                shell=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-            )
-            stdout, stderr = process.communicate()
+            stdout, stderr = self.run_host(path)
+            result = self.handle_result(stdout, stderr, send=False)  # already streamed
         except Exception as e:
             self.error(e)
-            stdout = None
-            stderr = str(e).encode("utf-8")
-        result = self.handle_result(stdout, stderr)
+            result = self.handle_result(None, str(e))
         self.send_interpreter_output_end("stdout")
         return {
             "request": request,
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.05 18:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import os
@@ -51,6 +51,13 @@ class Plugin(BasePlugin):
             "cwd",
             "file_index",
         ]
+        self.events = [
+            Event.CMD_EXECUTE,
+            Event.CMD_SYNTAX,
+            Event.MODELS_CHANGED,
+            Event.POST_PROMPT_END,
+            Event.TOOL_OUTPUT_RENDER,
+        ]
         self.use_locale = True
         self.worker = None
         self.output = Output(self)
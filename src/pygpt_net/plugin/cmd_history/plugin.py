@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.15 23:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import json
@@ -42,6 +42,16 @@ class Plugin(BasePlugin):
             "remove_day_note",
         ]
         self.order = 100
+        self.events = [
+            Event.CMD_EXECUTE,
+            Event.CMD_INLINE,
+            Event.CMD_SYNTAX,
+            Event.CMD_SYNTAX_INLINE,
+            Event.MODELS_CHANGED,
+            Event.POST_PROMPT,
+            Event.SYSTEM_PROMPT,
+            Event.USER_SEND,
+        ]
         self.use_locale = True
         self.worker = None
         self.config = Config(self)
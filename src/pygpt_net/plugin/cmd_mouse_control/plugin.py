@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.02 02:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 import time
 import os
@@ -64,6 +64,7 @@ class Plugin(BasePlugin):
             "scroll",
             "drag"
         ]
+        self.events = [Event.CMD_EXECUTE, Event.CMD_SYNTAX, Event.SYSTEM_PROMPT]
         self.use_locale = True
         self.worker = None
         self.config = Config(self)
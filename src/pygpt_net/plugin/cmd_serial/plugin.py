@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.15 23:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from pygpt_net.plugin.base.plugin import BasePlugin
@@ -29,6 +29,7 @@ class Plugin(BasePlugin):
             "serial_send_bytes",
             "serial_read",
         ]
+        self.events = [Event.CMD_EXECUTE, Event.CMD_SYNTAX]
         self.use_locale = True
         self.worker = None
         self.config = Config(self)
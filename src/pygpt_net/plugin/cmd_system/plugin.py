@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.23 07:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import platform
@@ -73,6 +73,7 @@ class Plugin(BasePlugin):
             "sys_exec",
         ] + self.winapi_cmds
 
+        self.events = [Event.CMD_EXECUTE, Event.CMD_SYNTAX, Event.TOOL_OUTPUT_RENDER]
         self.use_locale = True
         self.docker = Docker(self)
         self.runner = Runner(self)
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.22 15:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from pygpt_net.core.types import MODEL_DEFAULT_MINI
@@ -69,6 +69,41 @@ class Config(BaseConfig):
             min=1,
             max=None,
         )
+        plugin.add_option(
+            "chunk_tokens",
+            type="int",
+            value=4000,
+            label="Per-page content chunk tokens",
+            description="Max tokens per content chunk, chunks are split on sentence boundaries (0 = characters only)",
+            min=0,
+            max=None,
+        )
+        plugin.add_option(
+            "max_parallel_fetch",
+            type="int",
+            value=4,
+            label="Parallel page downloads",
+            description="Number of search result pages downloaded in parallel",
+            min=1,
+            max=None,
+        )
+        plugin.add_option(
+            "max_parallel_summary",
+            type="int",
+            value=4,
+            label="Parallel summary requests",
+            description="Number of content chunks summarized in parallel",
+            min=1,
+            max=None,
+        )
+        plugin.add_option(
+            "summary_reduce",
+            type="bool",
+            value=True,
+            label="Combine chunk summaries",
+            description="If enabled, summaries of chunks are combined into one summary by an additional request",
+            tooltip="Combine chunk summaries",
+        )
         plugin.add_option(
             "raw",
             type="bool",
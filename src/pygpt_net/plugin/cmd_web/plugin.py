@@ -6,11 +6,10 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.15 23:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import ssl
-from urllib.request import Request, urlopen
 
 from pygpt_net.plugin.base.plugin import BasePlugin
 from pygpt_net.provider.web.base import BaseProvider
@@ -42,6 +41,13 @@ class Plugin(BasePlugin):
             "web_extract_images",
         ]
         self.order = 100
+        self.events = [
+            Event.CMD_EXECUTE,
+            Event.CMD_SYNTAX,
+            Event.INPUT_BEFORE,
+            Event.MODELS_CHANGED,
+            Event.SETTINGS_CHANGED,
+        ]
         self.use_locale = True
         self.worker = None
         self.websearch = WebSearch(self)
@@ -419,26 +425,19 @@ class Plugin(BasePlugin):
         if extra_headers is not None:
             headers.update(extra_headers)
 
-        req = Request(
-            url=url,
-            headers=headers,
-        )
         data = ""
         try:
+            context = None
             if self.get_option_value('disable_ssl'):
                 context = ssl.create_default_context()
                 context.check_hostname = False
                 context.verify_mode = ssl.CERT_NONE
-                data = urlopen(
-                    req,
-                    context=context,
-                    timeout=self.get_option_value('timeout'),
-                ).read()
-            else:
-                data = urlopen(
-                    req,
-                    timeout=self.get_option_value('timeout'),
-                ).read()
+            data = self.window.core.web.cache.get(
+                url,
+                headers=headers,
+                timeout=self.get_option_value('timeout'),
+                context=context,
+            )  # cached and revalidated
         except Exception as e:
             data = str(e)
         return data
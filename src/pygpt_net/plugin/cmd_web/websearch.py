@@ -6,17 +6,23 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import re
-from typing import Optional, Tuple, Any, List
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Optional, Tuple, Any, List, Iterator
+
 
 from bs4 import BeautifulSoup
 
 from pygpt_net.core.events import KernelEvent
 from pygpt_net.core.bridge.context import BridgeContext
 
+SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+
 
 class WebSearch:
     def __init__(self, plugin=None):
@@ -79,6 +85,10 @@ class WebSearch:
         html = ''
         try:
             data = self.plugin.get_url(url)
+            cache = self.plugin.window.core.web.cache
+            cached = cache.get_text(url)  # extracted text of unchanged page
+            if cached:
+                return cached
             try:
                 html = data.decode("utf-8")  # try to decode
             except Exception as e:
@@ -90,6 +100,7 @@ class WebSearch:
                     text += element.text
                 text = text.replace("\n", " ").replace("\t", " ")
                 text = re.sub(r'\s+', ' ', text)
+                cache.set_text(url, text)
                 self.debug(
                     "Plugin: cmd_web:query_url: received text: {}".format(text)
                 )
@@ -101,6 +112,37 @@ class WebSearch:
             )
             self.log("Error in query_web: " + str(e))
 
+    def fetch(self, urls: List[str]) -> Iterator[Tuple[str, Optional[str]]]:
+        """
+        Download pages in parallel and yield their content in order of URLs
+
+        At most `max_parallel_fetch` downloads are in flight, next URL is queued when
+        result of the previous one is consumed, so stopping iteration cancels the rest.
+
+        :param urls: list of URLs
+        :return: iterator of (URL, text content)
+        """
+        num = max(1, int(self.plugin.get_option_value("max_parallel_fetch") or 1))
+        if num == 1 or len(urls) < 2:
+            for url in urls:
+                yield url, self.query_url(url)
+            return
+
+        executor = ThreadPoolExecutor(max_workers=min(num, len(urls)))
+        pending = iter(urls)
+        futures = deque()
+        try:
+            for url in islice(pending, num):
+                futures.append((url, executor.submit(self.query_url, url)))
+            while futures:
+                url, future = futures.popleft()
+                next_url = next(pending, None)
+                if next_url is not None:
+                    futures.append((next_url, executor.submit(self.query_url, next_url)))
+                yield url, future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def to_chunks(
             self,
             text: str,
@@ -117,6 +159,150 @@ class WebSearch:
             return []
         return [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
 
+    def count_tokens(self, text: str, model: str = "gpt-4") -> int:
+        """
+        Count tokens in text
+
+        :param text: text
+        :param model: model name
+        :return: number of tokens
+        """
+        try:
+            return int(self.plugin.window.core.tokens.from_str(text, model))
+        except Exception:
+            return len(text) // 4 + 1
+
+    def to_token_chunks(
+            self,
+            text: str,
+            max_tokens: int,
+            max_chars: int = 0,
+            model: str = "gpt-4"
+    ) -> List[str]:
+        """
+        Split text into chunks on sentence boundaries, limited by tokens and characters
+
+        :param text: text to split
+        :param max_tokens: max tokens per chunk (0 = characters only)
+        :param max_chars: max characters per chunk (0 = unlimited)
+        :param model: model name (for tokenizer)
+        :return: list of chunks
+        """
+        if text is None or text == "":
+            return []
+        if max_tokens <= 0:
+            if max_chars > 0:
+                return self.to_chunks(text, max_chars)
+            return [text]
+
+        # split too long sentences into words, and too long words into slices
+        units = []
+        for sentence in SENTENCE_END.split(text):
+            if not sentence:
+                continue
+            tokens = self.count_tokens(sentence, model)
+            if tokens <= max_tokens and not 0 < max_chars < len(sentence):
+                units.append((sentence, tokens))
+                continue
+            for word in sentence.split(" "):
+                if not word:
+                    continue
+                tokens = self.count_tokens(word, model)
+                if tokens <= max_tokens and not 0 < max_chars < len(word):
+                    units.append((word, tokens))
+                    continue
+                size = min(max_tokens, max_chars) if max_chars > 0 else max_tokens
+                for part in self.to_chunks(word, size):
+                    units.append((part, self.count_tokens(part, model)))
+
+        chunks = []
+        current = []
+        current_tokens = 0
+        current_chars = 0
+        for unit, tokens in units:
+            if current and (current_tokens + tokens > max_tokens
+                            or 0 < max_chars < current_chars + len(unit) + 1):
+                chunks.append(" ".join(current))
+                current = []
+                current_tokens = 0
+                current_chars = 0
+            if current:
+                current_chars += 1
+            current.append(unit)
+            current_tokens += tokens
+            current_chars += len(unit)
+        if current:
+            chunks.append(" ".join(current))
+        return chunks
+
+    def get_chunks(self, content: str) -> List[str]:
+        """
+        Split page content into chunks for summarization
+
+        :param content: page content
+        :return: list of chunks
+        """
+        return self.to_token_chunks(
+            content,
+            int(self.plugin.get_option_value("chunk_tokens") or 0),
+            int(self.plugin.get_option_value("chunk_size") or 0),
+            self.get_model().id,
+        )
+
+    def get_model(self):
+        """
+        Get model used for summarization
+
+        :return: model item
+        """
+        model = self.plugin.window.core.models.from_defaults()
+        tmp_model = self.plugin.get_option_value("summary_model")
+        if self.plugin.window.core.models.has(tmp_model):
+            model = self.plugin.window.core.models.get(tmp_model)
+        return model
+
+    def summarize(
+            self,
+            text: str,
+            sys_prompt: str,
+            model,
+            max_tokens: int
+    ) -> str:
+        """
+        Summarize text in one model call
+
+        :param text: text to summarize
+        :param sys_prompt: system prompt
+        :param model: model item
+        :param max_tokens: max output tokens
+        :return: summary (empty string on error)
+        """
+        self.debug(
+            "Plugin: cmd_web:get_summary (chunk, max_tokens): {}, {}".format(text, max_tokens)
+        )
+        try:
+            bridge_context = BridgeContext(
+                prompt=text,
+                system_prompt=sys_prompt,
+                model=model,
+                max_tokens=max_tokens,
+                temperature=0.0,
+            )
+            event = KernelEvent(KernelEvent.CALL, {
+                'context': bridge_context,
+                'extra': {},
+            })
+            self.plugin.window.dispatch(event)
+            response = event.data.get('response')
+            if response is not None and response != "":
+                return response
+        except Exception as e:
+            self.error(e)
+            self.debug(
+                "Plugin: cmd_web:get_summary: error: {}".format(e)
+            )
+        return ""
+
     def get_summary(
             self,
             chunks: list,
@@ -131,7 +317,6 @@ class WebSearch:
         :param summarize_prompt: custom summarize prompt
         :return: summarized text
         """
-        summary = ""
         sys_prompt = "Summarize text in English in a maximum of 3 paragraphs, trying to find the most important " \
                      "content that can help answer the following question: {query}".format(query=query)
 
@@ -156,40 +341,27 @@ class WebSearch:
                     'prompt_summarize_url'
                 ).format(query=query))
 
-        # get model
-        model = self.plugin.window.core.models.from_defaults()
-        tmp_model = self.plugin.get_option_value("summary_model")
-        if self.plugin.window.core.models.has(tmp_model):
-            model = self.plugin.window.core.models.get(tmp_model)
+        model = self.get_model()
 
-        # summarize per chunk
-        for chunk in chunks:
-            # print("Chunk: " + chunk)
-            self.debug(
-                "Plugin: cmd_web:get_summary (chunk, max_tokens): {}, {}".format(chunk, max_tokens)
-            )
-            try:
-                bridge_context = BridgeContext(
-                    prompt=chunk,
-                    system_prompt=sys_prompt,
-                    model=model,
-                    max_tokens=max_tokens,
-                    temperature=0.0,
-                )
-                event = KernelEvent(KernelEvent.CALL, {
-                    'context': bridge_context,
-                    'extra': {},
-                })
-                self.plugin.window.dispatch(event)
-                response = event.data.get('response')
-                if response is not None and response != "":
-                    summary += response
-            except Exception as e:
-                self.error(e)
-                self.debug(
-                    "Plugin: cmd_web:get_summary: error: {}".format(e)
-                )
-        return summary
+        # map: summarize chunks in parallel, keep order of chunks
+        num = min(len(chunks), max(1, int(self.plugin.get_option_value("max_parallel_summary") or 1)))
+        if num > 1:
+            with ThreadPoolExecutor(max_workers=num) as executor:
+                summaries = list(executor.map(
+                    lambda chunk: self.summarize(chunk, sys_prompt, model, max_tokens),
+                    chunks,
+                ))
+        else:
+            summaries = [self.summarize(chunk, sys_prompt, model, max_tokens) for chunk in chunks]
+        summaries = [summary for summary in summaries if summary]
+
+        # reduce: combine chunk summaries into one
+        if len(summaries) > 1 and self.plugin.get_option_value("summary_reduce"):
+            self.log("Combining {} summaries. Please wait...".format(len(summaries)))
+            summary = self.summarize("\n\n".join(summaries), sys_prompt, model, max_tokens)
+            if summary:
+                return summary
+        return "".join(summaries)
 
     def make_query(
             self,
@@ -213,60 +385,60 @@ class WebSearch:
         if self.plugin.get_option_value("raw"):
             is_summary = False
         max_per_page = int(self.plugin.get_option_value("max_page_content_length"))
-        chunk_size = int(self.plugin.get_option_value("chunk_size"))
         max_result_size = int(self.plugin.get_option_value("max_result_length"))
 
         total_found = len(urls)
         result = ""
-        i = 1
-        current = 1
         url = ""
         img = None
-        for url in urls:
-            if url is None or url == "":
-                continue
-
-            # check if requested page number
-            if current != page_no:
-                current += 1
-                continue
-
-            self.log("Web attempt: " + str(i) + " of " + str(len(urls)))
-            self.log("URL: " + url)
-            content = self.query_url(url)
-            if content is None or content == "":
-                i += 1
-                continue
 
-            self.log("Content found (chars: {}). Please wait...".format(len(content)))
-            if 0 < max_per_page < len(content):
-                content = content[:max_per_page]
+        # start from requested page number, next URLs are fallbacks
+        urls = [url for url in urls if url is not None and url != ""]
+        if 1 <= page_no <= len(urls):
+            current = page_no
+            urls = urls[page_no - 1:]
+        else:
+            current = len(urls) + 1
+            urls = []
 
-            # get summary
-            if is_summary:
-                chunks = self.to_chunks(content, chunk_size)  # it returns list of chunks
-                self.debug(
-                    "Plugin: cmd_web: URL: {}".format(url)
-                )
-                result = self.get_summary(
-                    chunks,
-                    str(query),
-                    summarize_prompt,
-                )
-            else:
-                # no summary
-                result = str(content)
-
-            # if result then stop
-            if result is not None and result != "":
-                # get thumbnail image
-                if self.plugin.get_option_value("img_thumbnail"):
-                    img = self.plugin.window.core.web.helpers.get_main_image(url)
-                self.log("Summary generated (chars: {})".format(len(result)))
-                # index webpage if auto-index is enabled
-                self.index_url(url)
-                break
-            i += 1
+        fetched = self.fetch(urls)
+        try:
+            for i, (url, content) in enumerate(fetched, start=1):
+                self.log("Web attempt: " + str(i) + " of " + str(total_found))
+                self.log("URL: " + url)
+                if content is None or content == "":
+                    continue
+
+                self.log("Content found (chars: {}). Please wait...".format(len(content)))
+                if 0 < max_per_page < len(content):
+                    content = content[:max_per_page]
+
+                # get summary
+                if is_summary:
+                    chunks = self.get_chunks(content)  # it returns list of chunks
+                    self.debug(
+                        "Plugin: cmd_web: URL: {}".format(url)
+                    )
+                    result = self.get_summary(
+                        chunks,
+                        str(query),
+                        summarize_prompt,
+                    )
+                else:
+                    # no summary
+                    result = str(content)
+
+                # if result then stop
+                if result is not None and result != "":
+                    # get thumbnail image
+                    if self.plugin.get_option_value("img_thumbnail"):
+                        img = self.plugin.window.core.web.helpers.get_main_image(url)
+                    self.log("Summary generated (chars: {})".format(len(result)))
+                    # index webpage if auto-index is enabled
+                    self.index_url(url)
+                    break
+        finally:
+            fetched.close()  # cancel pending downloads
 
         self.debug(
             "Plugin: cmd_web: summary: {}".format(result)
@@ -308,7 +480,6 @@ class WebSearch:
         if self.plugin.get_option_value("raw"):
             is_summary = False
         max_per_page = int(self.plugin.get_option_value("max_page_content_length"))
-        chunk_size = int(self.plugin.get_option_value("chunk_size"))
         max_result_size = int(self.plugin.get_option_value("max_result_length"))
 
         img = None
@@ -331,10 +502,7 @@ class WebSearch:
 
         # get summary
         if is_summary:
-            chunks = self.to_chunks(
-                content,
-                chunk_size,
-            )  # it returns list of chunks
+            chunks = self.get_chunks(content)  # it returns list of chunks
             result = self.get_summary(chunks, "", summarize_prompt)
         else:
             # no summary
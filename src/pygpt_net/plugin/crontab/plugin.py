@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.20 21:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from pygpt_net.core.bridge.context import BridgeContext
@@ -14,7 +14,6 @@ from pygpt_net.plugin.base.plugin import BasePlugin
 from pygpt_net.core.events import Event, KernelEvent
 
 from datetime import datetime
-from croniter import croniter
 
 from pygpt_net.utils import trans
 
@@ -33,6 +32,7 @@ class Plugin(BasePlugin):
                            "you can schedule prompts to be sent at any time using cron-based syntax for task setup."
         self.prefix = "Cron"
         self.order = 100
+        self.events = [Event.ENABLE, Event.DISABLE, Event.PLUGIN_OPTION_GET, Event.PLUGIN_SETTINGS_CHANGED]
         self.use_locale = True
         self.timers = []
         self.config = Config(self)
@@ -42,15 +42,6 @@ class Plugin(BasePlugin):
         """Initialize options"""
         self.config.from_defaults(self)
 
-    def on_update(self):
-        pass
-
-    def on_post_update(self):
-        """
-        On post update hook
-        """
-        self.schedule_tasks()
-
     def count_active(self) -> int:
         """
         Count active tasks
@@ -78,6 +69,16 @@ class Plugin(BasePlugin):
             self.window.ui.tray.update_schedule_tasks(
                 self.count_active()
             )
+            if self.window.controller.plugins.is_enabled(self.id):
+                self.schedule_tasks()
+
+        elif name == Event.ENABLE:
+            if data.get("value") == self.id:
+                self.schedule_tasks()
+
+        elif name == Event.DISABLE:
+            if data.get("value") == self.id:
+                self.unschedule_tasks()
 
         elif name == Event.PLUGIN_OPTION_GET:
             if "name" in data and data["name"] == "scheduled_tasks_count":
@@ -130,58 +131,38 @@ class Plugin(BasePlugin):
         self.window.dispatch(event)
 
     def schedule_tasks(self):
-        """Schedule tasks based on crontab"""
-        crontab = self.get_option_value("crontab")
-        # remove unused or inactive items
-        for timer in self.timers:
-            if not timer["item"]["enabled"] or timer["item"] not in crontab:
-                self.timers.remove(timer)
-
-        for item in crontab:
+        """Register enabled tasks in app scheduler (next run time is computed once per run)"""
+        self.unschedule_tasks()
+        scheduler = self.window.core.scheduler
+        for i, item in enumerate(self.get_option_value("crontab")):
+            if not item["enabled"]:
+                continue
             try:
-                if not item["enabled"]:
-                    continue
-                cron = item["crontab"]
-                base_time = datetime.now()
-                iter = croniter(cron, base_time)
-                is_timer = False
-                timer = None
-                for timer in self.timers:
-                    if item == timer["item"]:
-                        is_timer = True
-                        break
-
-                # add to timers if not exists
-                if not is_timer:
-                    timer = {
-                        "item": item,
-                        "next_time": None,
-                    }
-                    self.timers.append(timer)
-
-                next_time = timer["next_time"]
-
-                # if first run
-                if next_time is None:
-                    next_time = iter.get_next(datetime)
-                    timer["next_time"] = next_time
-                    continue
-
-                if datetime.now() >= next_time:
-                    next_time = iter.get_next(datetime)
-                    timer["next_time"] = next_time
-                    self.job(item)
-
-                timer["next_time"] = iter.get_next(datetime)
+                scheduler.call_cron(
+                    item["crontab"],
+                    lambda item=item: self.job(item),
+                    name="crontab.{}".format(i),
+                )
+                self.timers.append(item)
             except Exception as e:
                 self.log("Error: {}".format(e))
+        self.update_addon()
+
+    def unschedule_tasks(self):
+        """Remove tasks from app scheduler"""
+        scheduler = self.window.core.scheduler
+        for name in scheduler.get_names("crontab."):
+            scheduler.remove(name)
+        self.timers = []
+        self.update_addon()
 
-        # show number of scheduled jobs
+    def update_addon(self):
+        """Show number of scheduled jobs"""
         num_jobs = len(self.timers)
         if num_jobs > 0:
             self.window.ui.plugin_addon['schedule'].setVisible(True)
             self.window.ui.plugin_addon['schedule'].setText(
-                "+ Cron: {} job(s)".format(len(self.timers)),
+                "+ Cron: {} job(s)".format(num_jobs),
             )
         else:
             self.window.ui.plugin_addon['schedule'].setVisible(False)
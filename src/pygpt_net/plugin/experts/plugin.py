@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.15 23:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from pygpt_net.core.types import (
@@ -32,6 +32,7 @@ class Plugin(BasePlugin):
             "expert_call",
         ]
         self.order = 9998
+        self.events = [Event.SYSTEM_PROMPT]
         self.use_locale = True
         self.disallowed_modes = (MODE_AGENT, MODE_EXPERT)
         self.config = Config(self)
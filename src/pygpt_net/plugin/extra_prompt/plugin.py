@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.20 03:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from pygpt_net.plugin.base.plugin import BasePlugin
@@ -25,6 +25,7 @@ class Plugin(BasePlugin):
         self.iteration = 0
         self.prev_output = None
         self.order = 9998
+        self.events = [Event.SYSTEM_PROMPT]
         self.use_locale = True
         self.stop = False
         self.config = Config(self)
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.15 23:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from pygpt_net.plugin.base.plugin import BasePlugin
@@ -36,6 +36,7 @@ class Plugin(BasePlugin):
             "fb_page_post_delete",
             "fb_page_photo_upload"
         ]
+        self.events = [Event.CMD_EXECUTE, Event.CMD_SYNTAX]
         self.use_locale = False
         self.worker = None
         self.config = Config(self)
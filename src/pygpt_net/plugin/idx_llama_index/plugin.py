@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.20 09:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import json
@@ -39,6 +39,18 @@ class Plugin(BasePlugin):
             "cmd.inline",
         ]
         self.order = 100
+        self.events = [
+            Event.CMD_EXECUTE,
+            Event.CMD_INLINE,
+            Event.CMD_SYNTAX,
+            Event.CMD_SYNTAX_INLINE,
+            Event.INPUT_BEFORE,
+            Event.MODELS_CHANGED,
+            Event.POST_PROMPT_END,
+            Event.SETTINGS_CHANGED,
+            Event.SYSTEM_PROMPT,
+        ]
+        self.cache_syntax = False  # depends on current mode
         self.use_locale = True
         self.worker = None
         self.mode = None  # current mode
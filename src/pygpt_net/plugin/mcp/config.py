@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.16 22:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from pygpt_net.plugin.base.config import BaseConfig, BasePlugin
@@ -100,4 +100,15 @@ class Config(BaseConfig):
             label="Cache TTL (seconds)",
             description="Time-to-live for tools cache per server.",
             tooltip="Set to 0 to disable TTL (not recommended).",
-        )
\ No newline at end of file
+        )
+        plugin.add_option(
+            "session_idle_timeout",
+            type="int",
+            value=300,
+            label="Keep sessions alive (seconds)",
+            min=0,
+            max=None,
+            description="Keep MCP sessions (stdio server processes, HTTP/SSE connections) open between tool calls "
+                        "and close them after this idle time.",
+            tooltip="Set to 0 to close sessions after each call.",
+        )
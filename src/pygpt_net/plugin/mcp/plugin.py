@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.16 22:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import asyncio
@@ -22,6 +22,7 @@ from pygpt_net.core.events import Event
 from pygpt_net.item.ctx import CtxItem
 
 from .config import Config
+from .pool import SessionPool
 
 
 class Plugin(BasePlugin):
@@ -32,6 +33,8 @@ class Plugin(BasePlugin):
         self.description = "Use remote tools via MCP"
         self.prefix = "RemoteTool"
         self.order = 100
+        self.events = [Event.CMD_EXECUTE, Event.CMD_SYNTAX, Event.DISABLE]
+        self.cache_syntax = False  # tools discovered from servers
         self.use_locale = True
         self.worker = None
         self.config = Config(self)
@@ -44,6 +47,9 @@ class Plugin(BasePlugin):
         self._tools_cache: Dict[str, Dict[str, Any]] = {}
         self._last_config_signature: Optional[str] = None
 
+        # Warm sessions (background event loop)
+        self.pool = SessionPool(self)
+
     def init_options(self):
         """Initialize options"""
         self.config.from_defaults(self)
@@ -69,6 +75,10 @@ class Plugin(BasePlugin):
                 data['commands'],
             )
 
+        elif name == Event.DISABLE:
+            if data.get('value') == self.id:
+                self.pool.close()  # stop servers
+
     def cmd_syntax(self, data: dict):
         """
         Event: CMD_SYNTAX
@@ -81,6 +91,12 @@ class Plugin(BasePlugin):
         active_servers = [(i, s) for i, s in enumerate(servers) if s.get("active", False)]
         self.tools_index.clear()
 
+        # Close sessions of inactive servers
+        active_keys = {self._server_key(server) for _, server in active_servers}
+        stale_keys = [key for key in self.pool.sessions if key not in active_keys]
+        if stale_keys:
+            self.pool.close(stale_keys)
+
         if len(active_servers) == 0:
             return
 
@@ -187,8 +203,8 @@ class Plugin(BasePlugin):
     # ---------------------------
 
     def _discover_tools_sync(self, active_servers: List[Tuple[int, dict]]) -> List[Tuple[int, str, str, Any, dict]]:
-        """Run async discovery in a dedicated loop and return collected tools."""
-        return asyncio.run(self._discover_tools_async(active_servers))
+        """Run async discovery in the session pool loop and return collected tools."""
+        return self.pool.run(self._discover_tools_async(active_servers))
 
     async def _discover_tools_async(
         self,
@@ -196,22 +212,16 @@ class Plugin(BasePlugin):
         per_server_timeout: float = 8.0
     ) -> List[Tuple[int, str, str, Any, dict]]:
         """
-        Discover tools for each active server (with cache).
+        Discover tools for each active server (with cache), servers are queried concurrently.
         Returns tuples: (server_idx, server_tag, transport, tool, server_cfg)
         """
-        results: List[Tuple[int, str, str, Any, dict]] = []
-
         # Lazy import
         try:
             from mcp import ClientSession  # type: ignore
-            from mcp.client.stdio import stdio_client  # type: ignore
-            from mcp.client.streamable_http import streamablehttp_client  # type: ignore
-            from mcp.client.sse import sse_client  # type: ignore
-            from mcp import StdioServerParameters  # type: ignore
         except Exception as e:
             self.error('MCP SDK not installed. Install with: pip install "mcp[cli]"')
             self.log(f"MCP import error: {e}")
-            return results
+            return []
 
         cache_enabled = bool(self.get_option_value("tools_cache_enabled"))
         try:
@@ -219,86 +229,84 @@ class Plugin(BasePlugin):
         except Exception:
             ttl = 300
 
-        for server_idx, server in active_servers:
-            address = (server.get("server_address") or "").strip()
-            if not address:
-                continue
+        results = await asyncio.gather(*[
+            self._discover_server_tools(server_idx, server, cache_enabled, ttl, per_server_timeout)
+            for server_idx, server in active_servers
+        ])
+        return [item for items in results for item in items]
 
-            transport = self._detect_transport(address)
-            server_tag = self._make_server_tag(server, server_idx)
-            server_key = self._server_key(server)
-            headers = self._build_headers(server)
+    async def _discover_server_tools(
+        self,
+        server_idx: int,
+        server: dict,
+        cache_enabled: bool,
+        ttl: int,
+        per_server_timeout: float
+    ) -> List[Tuple[int, str, str, Any, dict]]:
+        """
+        Discover tools of a single server using pooled session.
+        """
+        results: List[Tuple[int, str, str, Any, dict]] = []
+        address = (server.get("server_address") or "").strip()
+        if not address:
+            return results
 
-            allowed = self._parse_csv(server.get("allowed_commands"))
-            disabled = self._parse_csv(server.get("disabled_commands"))
+        transport = self._detect_transport(address)
+        server_tag = self._make_server_tag(server, server_idx)
+        server_key = self._server_key(server)
+        headers = self._build_headers(server)
 
-            # Cache
-            cached_tools = None
-            if cache_enabled:
-                cached = self._tools_cache.get(server_key)
-                if cached and cached.get("transport") == transport:
-                    if (time.time() - float(cached.get("ts", 0))) <= ttl:
-                        cached_tools = cached.get("tools", None)
+        allowed = self._parse_csv(server.get("allowed_commands"))
+        disabled = self._parse_csv(server.get("disabled_commands"))
 
-            async def list_tools_for_session(session: ClientSession) -> List[Any]:
-                tools_resp = await session.list_tools()
-                return list(tools_resp.tools)
+        # Cache
+        cached_tools = None
+        if cache_enabled:
+            cached = self._tools_cache.get(server_key)
+            if cached and cached.get("transport") == transport:
+                if (time.time() - float(cached.get("ts", 0))) <= ttl:
+                    cached_tools = cached.get("tools", None)
 
-            try:
-                if cached_tools is None:
-                    async def _run_discovery():
-                        if transport == "stdio":
-                            cmd, args = self._parse_stdio_command(address)
-                            params = StdioServerParameters(command=cmd, args=args)
-                            async with stdio_client(params) as (read, write):
-                                async with ClientSession(read, write) as session:
-                                    await session.initialize()
-                                    return await list_tools_for_session(session)
-
-                        elif transport == "http":
-                            # Streamable HTTP – pass Authorization if set
-                            async with streamablehttp_client(address, headers=headers or None) as (read, write, _):
-                                async with ClientSession(read, write) as session:
-                                    await session.initialize()
-                                    return await list_tools_for_session(session)
-
-                        elif transport == "sse":
-                            # SSE – pass Authorization if set
-                            async with sse_client(address, headers=headers or None) as (read, write):
-                                async with ClientSession(read, write) as session:
-                                    await session.initialize()
-                                    return await list_tools_for_session(session)
-
-                        else:
-                            raise RuntimeError(f"Unsupported MCP transport for server '{server_tag}': {transport}")
-
-                    tools = await asyncio.wait_for(_run_discovery(), timeout=per_server_timeout)
-
-                    if cache_enabled:
-                        self._tools_cache[server_key] = {
-                            "ts": time.time(),
-                            "transport": transport,
-                            "tools": tools,
-                        }
-                else:
-                    tools = cached_tools
-
-                for tool in tools:
-                    tname = getattr(tool, "name", None) or tool.get("name")
-                    if disabled and tname in disabled:
-                        continue
-                    if allowed and tname not in allowed:
-                        continue
-                    results.append((server_idx, server_tag, transport, tool, server))
-
-            except asyncio.TimeoutError:
-                self.error(f"MCP: timeout during discovery on server '{server_tag}'")
-            except Exception as e:
-                self.log(f"MCP discovery error on '{server_tag}': {e}")
-                self.error(f"MCP: discovery error on '{server_tag}': {e}")
+        try:
+            if cached_tools is None:
+                if transport not in ("stdio", "http", "sse"):
+                    raise RuntimeError(f"Unsupported MCP transport for server '{server_tag}': {transport}")
+
+                tools_resp = await asyncio.wait_for(
+                    self.pool.call(server_key, address, transport, headers, lambda session: session.list_tools()),
+                    timeout=per_server_timeout,
+                )
+                tools = list(tools_resp.tools)
+
+                if cache_enabled:
+                    self._tools_cache[server_key] = {
+                        "ts": time.time(),
+                        "transport": transport,
+                        "tools": tools,
+                    }
+            else:
+                tools = cached_tools
+
+            for tool in tools:
+                tname = getattr(tool, "name", None) or tool.get("name")
+                if disabled and tname in disabled:
+                    continue
+                if allowed and tname not in allowed:
+                    continue
+                results.append((server_idx, server_tag, transport, tool, server))
+
+        except asyncio.TimeoutError:
+            self.error(f"MCP: timeout during discovery on server '{server_tag}'")
+        except Exception as e:
+            self.log(f"MCP discovery error on '{server_tag}': {e}")
+            self.error(f"MCP: discovery error on '{server_tag}': {e}")
 
         return results
 
+    def destroy(self):
+        """Close pooled sessions"""
+        self.pool.shutdown()
+
     # --------------
     # Schema helpers
     # --------------
@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 12:00:00                  #
+# ================================================== #
+
+import asyncio
+import shlex
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+class PooledSession:
+    def __init__(self, key: str):
+        """
+        Pooled MCP session (owned by a holder task running in the pool loop)
+
+        :param key: server key
+        """
+        self.key = key
+        self.params = None  # (address, transport, headers)
+        self.session = None
+        self.task = None
+        self.error = None
+        self.ready = None
+        self.closing = None
+        self.lock = asyncio.Lock()
+        self.users = 0  # calls in progress
+        self.broken = False  # connection lost
+        self.last_used = time.monotonic()
+
+    def is_alive(self) -> bool:
+        """
+        Check if session is connected
+
+        :return: True if connected
+        """
+        return (self.session is not None
+                and not self.broken
+                and self.task is not None
+                and not self.task.done())
+
+
+class SessionPool:
+    CONNECT_TIMEOUT = 30.0  # seconds
+    PING_TIMEOUT = 5.0  # seconds
+    CHECK_INTERVAL = 30.0  # health check sessions idle longer than this (seconds)
+    REAP_INTERVAL = 5.0  # seconds
+
+    def __init__(self, plugin=None):
+        """
+        Long-lived MCP client sessions, kept warm in a background event loop
+
+        :param plugin: plugin instance
+        """
+        self.plugin = plugin
+        self.loop = None
+        self.thread = None
+        self.sessions: Dict[str, PooledSession] = {}
+        self.reaper = None
+        self.mutex = threading.Lock()
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        """
+        Start background event loop (if not running)
+
+        :return: event loop
+        """
+        with self.mutex:
+            if self.loop is None or self.loop.is_closed():
+                self.loop = asyncio.new_event_loop()
+                self.thread = threading.Thread(
+                    target=self.loop.run_forever,
+                    name="mcp-session-pool",
+                    daemon=True,
+                )
+                self.thread.start()
+            return self.loop
+
+    def run(self, coro, timeout: Optional[float] = None) -> Any:
+        """
+        Run coroutine in pool loop and wait for result (blocking)
+
+        :param coro: coroutine
+        :param timeout: timeout in seconds
+        :return: coroutine result
+        """
+        if self.thread is not None and threading.current_thread() is self.thread:
+            coro.close()
+            raise RuntimeError("SessionPool.run() called from the pool loop")
+        loop = self.start()
+        return asyncio.run_coroutine_threadsafe(coro, loop).result(timeout)
+
+    def get_idle_timeout(self) -> float:
+        """
+        Get idle timeout of pooled sessions
+
+        :return: idle timeout in seconds, 0 = close sessions after use
+        """
+        try:
+            return max(0.0, float(self.plugin.get_option_value("session_idle_timeout") or 0))
+        except Exception:
+            return 300.0
+
+    @asynccontextmanager
+    async def session(
+            self,
+            key: str,
+            address: str,
+            transport: str,
+            headers: Optional[dict] = None
+    ):
+        """
+        Get pooled session for server (connects or reconnects if needed)
+
+        :param key: server key
+        :param address: server address
+        :param transport: transport (stdio, http, sse)
+        :param headers: HTTP headers
+        """
+        entry = await self.acquire(key, address, transport, headers)
+        entry.users += 1
+        try:
+            yield entry.session
+        except Exception as e:
+            if self.is_closed_error(e):
+                entry.broken = True
+            raise
+        finally:
+            entry.users -= 1
+            entry.last_used = time.monotonic()
+            if entry.users == 0 and (entry.broken or self.get_idle_timeout() <= 0):
+                await self.disconnect(entry)  # reconnect on next use
+
+    async def call(
+            self,
+            key: str,
+            address: str,
+            transport: str,
+            headers: Optional[dict],
+            fn: Callable[[Any], Awaitable[Any]]
+    ) -> Any:
+        """
+        Call request on pooled session, reconnect and retry once if connection was closed before request was sent
+
+        :param key: server key
+        :param address: server address
+        :param transport: transport (stdio, http, sse)
+        :param headers: HTTP headers
+        :param fn: async callback receiving ClientSession
+        :return: callback result
+        """
+        try:
+            async with self.session(key, address, transport, headers) as session:
+                return await fn(session)
+        except Exception as e:
+            if not self.is_sent_error(e):
+                raise
+        async with self.session(key, address, transport, headers) as session:
+            return await fn(session)
+
+    def is_closed_error(self, e: Exception) -> bool:
+        """
+        Check if exception means that connection to server is lost
+
+        :param e: exception
+        :return: True if connection lost
+        """
+        if self.is_sent_error(e):
+            return True
+        error = getattr(e, "error", None)
+        return getattr(error, "code", None) == -32000  # mcp.types.CONNECTION_CLOSED
+
+    def is_sent_error(self, e: Exception) -> bool:
+        """
+        Check if exception was raised while sending request over closed connection (request not delivered)
+
+        :param e: exception
+        :return: True if request was not sent
+        """
+        try:
+            import anyio
+        except ImportError:
+            return False
+        return isinstance(e, (anyio.ClosedResourceError, anyio.BrokenResourceError))
+
+    async def acquire(
+            self,
+            key: str,
+            address: str,
+            transport: str,
+            headers: Optional[dict] = None
+    ) -> PooledSession:
+        """
+        Get connected session entry, health check sessions idle for a while
+
+        :param key: server key
+        :param address: server address
+        :param transport: transport (stdio, http, sse)
+        :param headers: HTTP headers
+        :return: pooled session
+        """
+        entry = self.sessions.get(key)
+        if entry is None:
+            entry = PooledSession(key)
+            self.sessions[key] = entry
+        params = (address, transport, tuple(sorted((headers or {}).items())))
+        async with entry.lock:
+            if entry.is_alive() and entry.params != params:
+                await self.disconnect(entry)  # server config changed
+            if entry.is_alive() and time.monotonic() - entry.last_used > self.CHECK_INTERVAL:
+                try:
+                    await asyncio.wait_for(entry.session.send_ping(), timeout=self.PING_TIMEOUT)
+                except Exception:
+                    await self.disconnect(entry)  # stale session
+            if not entry.is_alive():
+                await self.disconnect(entry)  # close previous holder, if any
+                entry.params = params
+                await self.connect(entry, address, transport, headers)
+            entry.last_used = time.monotonic()
+        if self.reaper is None or self.reaper.done():
+            self.reaper = asyncio.create_task(self.reap())
+        return entry
+
+    async def connect(
+            self,
+            entry: PooledSession,
+            address: str,
+            transport: str,
+            headers: Optional[dict] = None
+    ):
+        """
+        Open session in holder task and wait until initialized
+
+        :param entry: pooled session
+        :param address: server address
+        :param transport: transport (stdio, http, sse)
+        :param headers: HTTP headers
+        """
+        entry.ready = asyncio.Event()
+        entry.closing = asyncio.Event()
+        entry.error = None
+        entry.session = None
+        entry.broken = False
+        entry.task = asyncio.create_task(self.hold(entry, address, transport, headers))
+        try:
+            await asyncio.wait_for(entry.ready.wait(), timeout=self.CONNECT_TIMEOUT)
+        except asyncio.TimeoutError:
+            entry.task.cancel()
+            raise TimeoutError(f"MCP: timeout while connecting to {address}")
+        if entry.session is None:
+            raise entry.error or RuntimeError(f"MCP: cannot connect to {address}")
+
+    async def hold(
+            self,
+            entry: PooledSession,
+            address: str,
+            transport: str,
+            headers: Optional[dict] = None
+    ):
+        """
+        Keep session open until closing is requested (transports must be entered and exited in the same task)
+
+        :param entry: pooled session
+        :param address: server address
+        :param transport: transport (stdio, http, sse)
+        :param headers: HTTP headers
+        """
+        try:
+            async with self.open_session(address, transport, headers=headers) as session:
+                entry.session = session
+                entry.ready.set()
+                await entry.closing.wait()
+        except Exception as e:
+            entry.error = e
+        finally:
+            entry.session = None
+            entry.ready.set()
+
+    async def disconnect(self, entry: PooledSession):
+        """
+        Close session
+
+        :param entry: pooled session
+        """
+        task = entry.task
+        entry.session = None
+        entry.task = None
+        if task is None or task.done():
+            return
+        entry.closing.set()
+        try:
+            await asyncio.wait_for(task, timeout=self.PING_TIMEOUT)
+        except BaseException:
+            task.cancel()
+
+    async def reap(self):
+        """Close sessions idle longer than idle timeout"""
+        while self.sessions:
+            await asyncio.sleep(self.REAP_INTERVAL)
+            timeout = self.get_idle_timeout()
+            now = time.monotonic()
+            for key, entry in list(self.sessions.items()):
+                if entry.users > 0 or entry.lock.locked():
+                    continue
+                if not entry.is_alive() or now - entry.last_used > timeout:
+                    await self.disconnect(entry)
+                    self.sessions.pop(key, None)
+
+    async def close_all(self, keys: Optional[List[str]] = None):
+        """
+        Close sessions
+
+        :param keys: server keys, None = all
+        """
+        for key in list(self.sessions.keys()):
+            if keys is None or key in keys:
+                entry = self.sessions.pop(key)
+                await self.disconnect(entry)
+        if keys is None and self.reaper is not None and not self.reaper.done():
+            self.reaper.cancel()
+            try:
+                await self.reaper
+            except BaseException:
+                pass
+            self.reaper = None
+
+    def close(self, keys: Optional[List[str]] = None):
+        """
+        Close sessions (from any thread)
+
+        :param keys: server keys, None = all
+        """
+        if self.loop is None or self.loop.is_closed() or not self.sessions:
+            return
+        try:
+            self.run(self.close_all(keys), timeout=self.CONNECT_TIMEOUT)
+        except Exception as e:
+            if self.plugin is not None:
+                self.plugin.log(f"MCP: error while closing sessions: {e}")
+
+    def shutdown(self):
+        """Close all sessions and stop event loop"""
+        self.close()
+        with self.mutex:
+            loop = self.loop
+            self.loop = None
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(loop.stop)
+            if self.thread is not None:
+                self.thread.join(timeout=self.PING_TIMEOUT)
+            if not loop.is_running():
+                loop.close()
+        self.thread = None
+        self.sessions = {}
+        self.reaper = None
+
+    @asynccontextmanager
+    async def open_session(
+            self,
+            address: str,
+            transport: str,
+            headers: Optional[dict] = None
+    ):
+        """
+        Open and initialize MCP session for given server address and transport.
+        Yields a ready-to-use ClientSession.
+
+        :param address: server address
+        :param transport: transport (stdio, http, sse)
+        :param headers: HTTP headers
+        """
+        from mcp import ClientSession  # type: ignore
+
+        if transport == "stdio":
+            from mcp.client.stdio import stdio_client  # type: ignore
+            from mcp import StdioServerParameters  # type: ignore
+            cmd, args = self.parse_stdio_command(address)
+            params = StdioServerParameters(command=cmd, args=args)
+            async with stdio_client(params) as (read, write):
+                async with ClientSession(read, write) as session:
+                    await session.initialize()
+                    yield session
+
+        elif transport == "http":
+            from mcp.client.streamable_http import streamablehttp_client  # type: ignore
+            async with streamablehttp_client(address, headers=headers or None) as (read, write, _):
+                async with ClientSession(read, write) as session:
+                    await session.initialize()
+                    yield session
+
+        elif transport == "sse":
+            from mcp.client.sse import sse_client  # type: ignore
+            async with sse_client(address, headers=headers or None) as (read, write):
+                async with ClientSession(read, write) as session:
+                    await session.initialize()
+                    yield session
+
+        else:
+            raise RuntimeError(f"Unsupported transport: {transport}")
+
+    def parse_stdio_command(self, address: str) -> Tuple[str, List[str]]:
+        """
+        Parse 'stdio: <command line>' into (command, args).
+
+        :param address: server address
+        :return: command, args
+        """
+        cmdline = address[len("stdio:"):].strip()
+        tokens = shlex.split(cmdline)
+        if not tokens:
+            raise ValueError("Invalid stdio address: empty command")
+        return tokens[0], tokens[1:]
@@ -6,14 +6,12 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.16 22:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import asyncio
 import json
-import shlex
-from contextlib import asynccontextmanager
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, List, Optional
 from urllib.parse import urlparse
 
 from PySide6.QtCore import Slot
@@ -40,10 +38,10 @@ class Worker(BaseWorker):
     def run(self):
         """
         Worker entry point executed in a background thread.
-        Starts an asyncio loop to talk to MCP servers.
+        Runs tool calls in the plugin's session pool loop (sessions are kept warm between calls).
         """
         try:
-            responses = asyncio.run(self._run_async())
+            responses = self.plugin.pool.run(self._run_async())
             if responses:
                 self.reply_more(responses)
         except Exception as e:
@@ -53,22 +51,14 @@ class Worker(BaseWorker):
 
     async def _run_async(self) -> List[dict]:
         """
-        Group commands per server, open a session per server, then call tools.
+        Group commands per server, then call tools on all servers concurrently (pooled sessions).
         """
-        responses: List[dict] = []
-
         try:
             from mcp import ClientSession, types  # type: ignore
-            from mcp.client.stdio import stdio_client  # type: ignore
-            from mcp.client.streamable_http import streamablehttp_client  # type: ignore
-            from mcp.client.sse import sse_client  # type: ignore
-            from mcp import StdioServerParameters  # type: ignore
         except Exception as e:
             self.status('MCP SDK not installed. Install with: pip install "mcp[cli]"')
             self.log(f"MCP import error in worker: {e}")
-            for item in (self.cmds or []):
-                responses.append(self.make_response(item, f"MCP SDK not installed: {e}"))
-            return responses
+            return [self.make_response(item, f"MCP SDK not installed: {e}") for item in (self.cmds or [])]
 
         # Group by server
         grouped: Dict[str, List[dict]] = {}
@@ -79,92 +69,61 @@ class Worker(BaseWorker):
             server_key = self._server_key(meta["server"])
             grouped.setdefault(server_key, []).append(item)
 
-        # Execute per server
-        for server_key, items in grouped.items():
-            meta0 = self.tools_index.get(items[0]["cmd"])
-            if not meta0:
-                continue
-            server_cfg = meta0["server"]
-            address = (server_cfg.get("server_address") or "").strip()
-            transport = meta0["transport"]
-            headers = self._build_headers(server_cfg)
-
-            try:
-                async with self._open_session(address, transport, headers=headers) as session:
-                    for item in items:
-                        if self.is_stopped():
-                            break
-
-                        meta = self.tools_index.get(item["cmd"])
-                        if not meta:
-                            continue
+        # Execute per server, servers in parallel
+        results = await asyncio.gather(
+            *[self._run_server(server_key, items) for server_key, items in grouped.items()]
+        )
+        return [response for responses in results for response in responses]
 
-                        tool_name = meta["tool_name"]
-                        schema = meta.get("schema")
-                        arguments = self._coerce_arguments(item.get("params", {}), schema)
-
-                        try:
-                            result = await session.call_tool(tool_name, arguments=arguments)
-                            text = self._extract_text_result(result)
-                            responses.append(self.make_response(item, text))
-                        except Exception as e:
-                            responses.append(self.make_response(item, self.throw_error(e)))
-
-            except Exception as e:
-                msg = f"MCP server error ({address}): {e}"
-                self.log(msg)
-                self.status(msg)
-                for item in items:
-                    responses.append(self.make_response(item, self.throw_error(e)))
-
-        return responses
-
-    # ---------------------------
-    # Session / transport helpers
-    # ---------------------------
-
-    @asynccontextmanager
-    async def _open_session(self, address: str, transport: str, headers: Optional[dict] = None):
+    async def _run_server(self, server_key: str, items: List[dict]) -> List[dict]:
         """
-        Open and initialize MCP session for given server address and transport.
-        Yields a ready-to-use ClientSession.
+        Call tools on a single server, one after another.
         """
-        from mcp import ClientSession  # type: ignore
-
-        if transport == "stdio":
-            from mcp.client.stdio import stdio_client  # type: ignore
-            from mcp import StdioServerParameters  # type: ignore
-            cmd, args = self._parse_stdio_command(address)
-            params = StdioServerParameters(command=cmd, args=args)
-            async with stdio_client(params) as (read, write):
-                async with ClientSession(read, write) as session:
-                    await session.initialize()
-                    yield session
-
-        elif transport == "http":
-            from mcp.client.streamable_http import streamablehttp_client  # type: ignore
-            async with streamablehttp_client(address, headers=headers or None) as (read, write, _):
-                async with ClientSession(read, write) as session:
-                    await session.initialize()
-                    yield session
+        responses: List[dict] = []
+        meta0 = self.tools_index.get(items[0]["cmd"])
+        if not meta0:
+            return responses
+        server_cfg = meta0["server"]
+        address = (server_cfg.get("server_address") or "").strip()
+        transport = meta0["transport"]
+        headers = self._build_headers(server_cfg)
 
-        elif transport == "sse":
-            from mcp.client.sse import sse_client  # type: ignore
-            async with sse_client(address, headers=headers or None) as (read, write):
-                async with ClientSession(read, write) as session:
-                    await session.initialize()
-                    yield session
+        pool = self.plugin.pool
+        try:
+            async with pool.session(server_key, address, transport, headers=headers):
+                for item in items:
+                    if self.is_stopped():
+                        break
+
+                    meta = self.tools_index.get(item["cmd"])
+                    if not meta:
+                        continue
+
+                    tool_name = meta["tool_name"]
+                    schema = meta.get("schema")
+                    arguments = self._coerce_arguments(item.get("params", {}), schema)
+
+                    try:
+                        result = await pool.call(
+                            server_key,
+                            address,
+                            transport,
+                            headers,
+                            lambda session: session.call_tool(tool_name, arguments=arguments),
+                        )
+                        text = self._extract_text_result(result)
+                        responses.append(self.make_response(item, text))
+                    except Exception as e:
+                        responses.append(self.make_response(item, self.throw_error(e)))
 
-        else:
-            raise RuntimeError(f"Unsupported transport: {transport}")
+        except Exception as e:
+            msg = f"MCP server error ({address}): {e}"
+            self.log(msg)
+            self.status(msg)
+            for item in items:
+                responses.append(self.make_response(item, self.throw_error(e)))
 
-    def _parse_stdio_command(self, address: str) -> Tuple[str, List[str]]:
-        """Parse 'stdio: <command line>' into (command, args)."""
-        cmdline = address[len("stdio:"):].strip()
-        tokens = shlex.split(cmdline)
-        if not tokens:
-            raise ValueError("Invalid stdio address: empty command")
-        return tokens[0], tokens[1:]
+        return responses
 
     # ---------------------------
     # Result & argument handling
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.28 09:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from pygpt_net.core.types import (
@@ -54,6 +54,15 @@ class Plugin(BasePlugin):
             "image",
         ]
         self.order = 100
+        self.events = [
+            Event.CMD_EXECUTE,
+            Event.CMD_INLINE,
+            Event.CMD_SYNTAX,
+            Event.CMD_SYNTAX_INLINE,
+            Event.MODELS_CHANGED,
+            Event.SYSTEM_PROMPT,
+        ]
+        self.cache_syntax = False  # depends on native tools config
         self.use_locale = True
         self.config = Config(self)
         self.init_options()
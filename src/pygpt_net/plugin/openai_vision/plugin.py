@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.28 09:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from pygpt_net.core.types import (
@@ -38,6 +38,25 @@ class Plugin(BasePlugin):
         self.description = "Integrates GPT-4 Vision abilities with any chat mode"
         self.prefix = "Vision"
         self.order = 100
+        self.events = [
+            Event.AGENT_PROMPT,
+            Event.CMD_EXECUTE,
+            Event.CMD_INLINE,
+            Event.CMD_SYNTAX,
+            Event.CMD_SYNTAX_INLINE,
+            Event.CTX_SELECT,
+            Event.INPUT_BEFORE,
+            Event.MODELS_CHANGED,
+            Event.MODEL_BEFORE,
+            Event.MODEL_SELECT,
+            Event.MODE_BEFORE,
+            Event.MODE_SELECT,
+            Event.PRE_PROMPT,
+            Event.SYSTEM_PROMPT,
+            Event.UI_ATTACHMENTS,
+            Event.UI_VISION,
+        ]
+        self.cache_syntax = False  # depends on model and attachments
         self.use_locale = True
         self.prompt = ""
         self.allowed_urls_ext = [
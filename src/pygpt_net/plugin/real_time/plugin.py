@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.15 23:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from datetime import datetime
@@ -30,6 +30,12 @@ class Plugin(BasePlugin):
             "get_time",
         ]
         self.order = 2
+        self.events = [
+            Event.AGENT_PROMPT,
+            Event.CMD_EXECUTE,
+            Event.CMD_SYNTAX,
+            Event.POST_PROMPT_END,
+        ]
         self.use_locale = True
         self.config = Config(self)
         self.init_options()
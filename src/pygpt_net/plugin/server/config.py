@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.22 10:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from pygpt_net.plugin.base.config import BaseConfig, BasePlugin
@@ -58,6 +58,25 @@ class Config(BaseConfig):
             description="Network operations timeout.",
         )
 
+        # Connection pool
+        plugin.add_option(
+            "pool_idle_timeout",
+            type="int",
+            value=300,
+            label="Connection pool: idle timeout (s)",
+            description="Keep SSH/SFTP/FTP connections open for reuse for this many seconds after last use, 0 = disable pooling.",
+            min=0,
+        )
+        plugin.add_option(
+            "pool_max_per_host",
+            type="int",
+            value=4,
+            label="Connection pool: max connections per host",
+            description="Max concurrent connections to a single host (also number of parallel transfers in batch commands).",
+            min=1,
+            max=32,
+        )
+
         # SSH / SFTP (system/native and Paramiko)
         plugin.add_option(
             "prefer_system_ssh",
@@ -94,6 +113,14 @@ class Config(BaseConfig):
             label="Extra ssh options",
             description="Extra options appended to ssh/scp (e.g. -o StrictHostKeyChecking=no).",
         )
+        plugin.add_option(
+            "ssh_keepalive",
+            type="int",
+            value=30,
+            label="Paramiko: keepalive interval (s)",
+            description="Send keepalive packets on pooled SSH connections every N seconds, 0 = disabled.",
+            min=0,
+        )
         plugin.add_option(
             "ssh_auto_add_hostkey",
             type="bool",
@@ -232,6 +259,39 @@ class Config(BaseConfig):
             tab="server",
         )
 
+        # Batch download
+        plugin.add_cmd(
+            "srv_get_batch",
+            instruction="Download multiple remote files to local data dir in parallel (prefer over many srv_get calls).",
+            params=[
+                {"name": "server", "type": "str", "required": True, "description": "Server name/host"},
+                {"name": "port", "type": "int", "required": True, "description": "Service port"},
+                {"name": "files", "type": "list", "required": True,
+                 "description": "List of remote paths or dicts {remote_path, local_path}"},
+                {"name": "overwrite", "type": "bool", "required": False,
+                 "description": "Overwrite if exists (default True)"},
+            ],
+            enabled=True,
+            description="Server: download files (batch)",
+            tab="server",
+        )
+
+        # Batch upload
+        plugin.add_cmd(
+            "srv_put_batch",
+            instruction="Upload multiple local files to remote in parallel (prefer over many srv_put calls).",
+            params=[
+                {"name": "server", "type": "str", "required": True, "description": "Server name/host"},
+                {"name": "port", "type": "int", "required": True, "description": "Service port"},
+                {"name": "files", "type": "list", "required": True,
+                 "description": "List of local paths (relative=./data) or dicts {local_path, remote_path}"},
+                {"name": "make_dirs", "type": "bool", "required": False, "description": "Create dirs (SFTP)"},
+            ],
+            enabled=True,
+            description="Server: upload files (batch)",
+            tab="server",
+        )
+
         # Remove
         plugin.add_cmd(
             "srv_rm",
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.22 10:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from pygpt_net.plugin.base.plugin import BasePlugin
@@ -14,6 +14,7 @@ from pygpt_net.core.events import Event
 from pygpt_net.item.ctx import CtxItem
 
 from .config import Config
+from .pool import ConnectionPool
 
 
 class Plugin(BasePlugin):
@@ -29,13 +30,17 @@ class Plugin(BasePlugin):
             "srv_ls",
             "srv_get",
             "srv_put",
+            "srv_get_batch",
+            "srv_put_batch",
             "srv_rm",
             "srv_mkdir",
             "srv_stat",
             "smtp_send"
         ]
+        self.events = [Event.CMD_EXECUTE, Event.CMD_SYNTAX, Event.DISABLE]
         self.use_locale = False
         self.worker = None
+        self.pool = ConnectionPool(self)  # shared by workers
         self.config = Config(self)
         self.init_options()
 
@@ -64,6 +69,10 @@ class Plugin(BasePlugin):
                 data['commands'],
             )
 
+        elif name == Event.DISABLE:
+            if data.get('value') == self.id:
+                self.pool.close()  # close idle connections
+
     def cmd_syntax(self, data: dict):
         """
         Event: CMD_SYNTAX
@@ -109,3 +118,7 @@ class Plugin(BasePlugin):
 
         except Exception as e:
             self.error(e)
+
+    def destroy(self):
+        """Close pooled connections"""
+        self.pool.shutdown()
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 12:00:00                  #
+# ================================================== #
+
+import ftplib
+import hashlib
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+Key = Tuple[str, str, int, str, str]  # (transport, host, port, user, credentials hash)
+
+
+class PooledConnection:
+    def __init__(self, key: Key, client: Any):
+        """
+        Pooled connection (paramiko SSHClient or ftplib.FTP)
+
+        :param key: pool key
+        :param client: connected client
+        """
+        self.key = key
+        self.client = client
+        self.sftp = None  # SFTP channel opened on SSH connection, reused
+        self.last_used = time.monotonic()
+
+    @property
+    def transport(self) -> str:
+        return self.key[0]
+
+    def get_sftp(self):
+        """
+        Get SFTP client opened on this SSH connection
+
+        :return: paramiko SFTPClient
+        """
+        if self.sftp is None:
+            self.sftp = self.client.open_sftp()
+        return self.sftp
+
+    def is_alive(self) -> bool:
+        """
+        Check if connection is still usable
+
+        :return: True if alive
+        """
+        try:
+            if self.transport == "ssh":
+                transport = self.client.get_transport()
+                return transport is not None and transport.is_active()
+            return getattr(self.client, "sock", None) is not None
+        except Exception:
+            return False
+
+    def ping(self) -> bool:
+        """
+        Health check connection on the wire (FTP NOOP, SSH transport state)
+
+        :return: True if alive
+        """
+        if not self.is_alive():
+            return False
+        if self.transport == "ssh":
+            return True
+        try:
+            self.client.voidcmd("NOOP")
+            return True
+        except Exception:
+            return False
+
+    def close(self):
+        """Close connection"""
+        if self.sftp is not None:
+            try:
+                self.sftp.close()
+            except Exception:
+                pass
+            self.sftp = None
+        try:
+            if self.transport == "ssh":
+                self.client.close()
+            else:
+                try:
+                    self.client.quit()
+                except Exception:
+                    self.client.close()
+        except Exception:
+            pass
+
+
+class ConnectionPool:
+    CHECK_INTERVAL = 30.0  # health check connections idle longer than this (seconds)
+    REAP_INTERVAL = 5.0  # seconds
+
+    def __init__(self, plugin=None):
+        """
+        Keyed pool of SSH/SFTP and FTP connections, shared by all plugin workers
+
+        :param plugin: plugin instance
+        """
+        self.plugin = plugin
+        self.idle: Dict[Key, List[PooledConnection]] = {}
+        self.limits: Dict[Tuple[str, int], threading.BoundedSemaphore] = {}
+        self.mutex = threading.Lock()
+        self.reaper = None
+        self.stopped = threading.Event()
+
+    def get_option(self, key: str, default: int) -> int:
+        """
+        Get int plugin option
+
+        :param key: option key
+        :param default: default value
+        :return: option value
+        """
+        try:
+            value = self.plugin.get_option_value(key)
+            return default if value is None else int(value)
+        except Exception:
+            return default
+
+    def get_idle_timeout(self) -> float:
+        """
+        Get idle timeout of pooled connections
+
+        :return: idle timeout in seconds, 0 = close connections after use
+        """
+        return float(max(0, self.get_option("pool_idle_timeout", 300)))
+
+    def get_max_per_host(self) -> int:
+        """
+        Get max concurrent connections per host
+
+        :return: connections limit
+        """
+        return max(1, self.get_option("pool_max_per_host", 4))
+
+    def get_limit(self, host: str, port: int) -> threading.BoundedSemaphore:
+        """
+        Get per-host concurrency limit
+
+        :param host: host
+        :param port: port
+        :return: semaphore
+        """
+        with self.mutex:
+            limit = self.limits.get((host, port))
+            if limit is None:
+                limit = threading.BoundedSemaphore(self.get_max_per_host())
+                self.limits[(host, port)] = limit
+            return limit
+
+    @contextmanager
+    def connection(
+            self,
+            transport: str,
+            host: str,
+            port: int,
+            user: str,
+            opener: Callable[[], Any],
+            timeout: Optional[float] = None,
+            secret: Optional[str] = None
+    ):
+        """
+        Borrow connection from pool (opens new one if no idle connection available)
+
+        :param transport: transport (ssh, ftp, ftps)
+        :param host: host
+        :param port: port
+        :param user: login
+        :param opener: callback returning connected client
+        :param timeout: max time to wait for free slot (seconds)
+        :param secret: password used by opener, connections opened with other credentials are not reused
+        """
+        key = (transport, host, int(port), user, self.hash_secret(secret))
+        limit = self.get_limit(host, int(port))
+        if not limit.acquire(timeout=timeout or None):
+            raise TimeoutError(f"Connection pool: no free connection to {host}:{port}")
+        conn = None
+        try:
+            conn = self.acquire(key, opener)
+            yield conn
+        except Exception as e:
+            if conn is not None and (self.is_connection_error(e) or not conn.is_alive()):
+                conn.close()  # do not reuse connection in unknown state
+                conn = None
+            raise
+        finally:
+            if conn is not None:
+                self.release(conn)
+            limit.release()
+
+    def hash_secret(self, secret: Optional[str]) -> str:
+        """
+        Hash credentials for pool key (plain password is not kept in pool)
+
+        :param secret: password
+        :return: hash
+        """
+        if not secret:
+            return ""
+        return hashlib.sha256(str(secret).encode("utf-8")).hexdigest()
+
+    def is_connection_error(self, e: Exception) -> bool:
+        """
+        Check if exception leaves connection in unknown state (network error, protocol desync)
+
+        :param e: exception
+        :return: True if connection should be discarded
+        """
+        if isinstance(e, (EOFError, ConnectionError, TimeoutError, ftplib.error_reply, ftplib.error_proto)):
+            return True
+        try:
+            import paramiko
+        except ImportError:
+            return False
+        return isinstance(e, paramiko.SSHException)
+
+    def acquire(self, key: Key, opener: Callable[[], Any]) -> PooledConnection:
+        """
+        Get idle connection for key or open new one
+
+        :param key: pool key
+        :param opener: callback returning connected client
+        :return: pooled connection
+        """
+        while True:
+            with self.mutex:
+                conns = self.idle.get(key)
+                conn = conns.pop() if conns else None
+            if conn is None:
+                break
+            if time.monotonic() - conn.last_used > self.CHECK_INTERVAL:
+                alive = conn.ping()
+            else:
+                alive = conn.is_alive()
+            if alive:
+                return conn
+            conn.close()  # stale, try next
+        return PooledConnection(key, opener())
+
+    def release(self, conn: PooledConnection):
+        """
+        Return connection to pool
+
+        :param conn: pooled connection
+        """
+        conn.last_used = time.monotonic()
+        if self.get_idle_timeout() <= 0 or self.stopped.is_set() or not conn.is_alive():
+            conn.close()
+            return
+        with self.mutex:
+            self.idle.setdefault(conn.key, []).append(conn)
+            if self.reaper is None or not self.reaper.is_alive():
+                self.reaper = threading.Thread(
+                    target=self.reap,
+                    name="server-connection-pool",
+                    daemon=True,
+                )
+                self.reaper.start()
+
+    def reap(self):
+        """Close connections idle longer than idle timeout"""
+        while not self.stopped.wait(self.REAP_INTERVAL):
+            self.evict()
+            with self.mutex:
+                if not self.idle:
+                    self.reaper = None
+                    return
+
+    def evict(self, max_idle: Optional[float] = None) -> int:
+        """
+        Close idle connections
+
+        :param max_idle: max idle time (seconds), None = idle timeout option
+        :return: number of closed connections
+        """
+        if max_idle is None:
+            max_idle = self.get_idle_timeout()
+        now = time.monotonic()
+        expired = []
+        with self.mutex:
+            for key in list(self.idle.keys()):
+                keep = []
+                for conn in self.idle[key]:
+                    if now - conn.last_used >= max_idle:
+                        expired.append(conn)
+                    else:
+                        keep.append(conn)
+                if keep:
+                    self.idle[key] = keep
+                else:
+                    del self.idle[key]
+        for conn in expired:
+            conn.close()
+        return len(expired)
+
+    def count(self) -> int:
+        """
+        Count idle connections
+
+        :return: idle connections
+        """
+        with self.mutex:
+            return sum(len(conns) for conns in self.idle.values())
+
+    def close(self):
+        """Close all idle connections"""
+        with self.mutex:
+            conns = [conn for items in self.idle.values() for conn in items]
+            self.idle = {}
+            self.limits = {}  # apply changed limits on next use
+        for conn in conns:
+            conn.close()
+
+    def shutdown(self):
+        """Close all connections and stop reaper"""
+        self.stopped.set()
+        self.close()
+        reaper = self.reaper
+        if reaper is not None and reaper is not threading.current_thread():
+            reaper.join(timeout=self.REAP_INTERVAL)
+        self.reaper = None
+        self.stopped.clear()
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.22 10:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from __future__ import annotations
@@ -19,6 +19,7 @@ import smtplib
 import time
 import stat as pystat
 
+from concurrent.futures import ThreadPoolExecutor
 from email.message import EmailMessage
 from PySide6.QtCore import Slot
 
@@ -33,6 +34,7 @@ class Worker(BaseWorker):
     """
     Server plugin worker: SSH, SFTP, FTP, Telnet, SMTP.
     Credentials are fetched via self.get_server_config(server, port).
+    Paramiko and FTP connections are borrowed from the plugin connection pool.
     When prefer_system_ssh is enabled, uses system ssh/scp/sftp and system keys.
     """
 
@@ -79,6 +81,10 @@ class Worker(BaseWorker):
                             response = self.cmd_srv_get(item)
                         elif item["cmd"] == "srv_put":
                             response = self.cmd_srv_put(item)
+                        elif item["cmd"] == "srv_get_batch":
+                            response = self.cmd_srv_get_batch(item)
+                        elif item["cmd"] == "srv_put_batch":
+                            response = self.cmd_srv_put_batch(item)
                         elif item["cmd"] == "srv_rm":
                             response = self.cmd_srv_rm(item)
                         elif item["cmd"] == "srv_mkdir":
@@ -304,36 +310,7 @@ class Worker(BaseWorker):
 
     # ---------------------- SSH / SFTP (paramiko) ----------------------
 
-    def _ssh_exec_paramiko(self, host: str, port: int, user: str, password: str | None, command: str, cwd: str | None,
-                           env: dict | None) -> dict:
-        self._ensure_paramiko()
-        import paramiko
-        client = paramiko.SSHClient()
-        if self._ssh_auto_add_hostkey():
-            client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        try:
-            client.connect(
-                host,
-                port=port,
-                username=user,
-                password=password or None,
-                timeout=self._timeout(),
-                allow_agent=True,
-                look_for_keys=True,
-            )
-            rcmd = self._build_remote_cmd(command, cwd=cwd, env=env)
-            stdin, stdout, stderr = client.exec_command(rcmd, timeout=self._timeout())
-            out = stdout.read().decode("utf-8", errors="replace")
-            err = stderr.read().decode("utf-8", errors="replace")
-            rc = stdout.channel.recv_exit_status()
-            return {"rc": rc, "stdout": out, "stderr": err}
-        finally:
-            try:
-                client.close()
-            except Exception:
-                pass
-
-    def _sftp_opener(self, host: str, port: int, user: str, password: str | None):
+    def _ssh_connect(self, host: str, port: int, user: str, password: str | None):
         self._ensure_paramiko()
         import paramiko
         client = paramiko.SSHClient()
@@ -348,12 +325,48 @@ class Worker(BaseWorker):
             allow_agent=True,
             look_for_keys=True,
         )
-        sftp = client.open_sftp()
-        return client, sftp
+        keepalive = self._ssh_keepalive()
+        if keepalive > 0:
+            transport = client.get_transport()
+            if transport is not None:
+                transport.set_keepalive(keepalive)  # keep pooled connection open through NAT/firewalls
+        return client
+
+    def _ssh_connection(self, host: str, port: int, user: str, password: str | None):
+        """
+        Borrow pooled SSH connection (shared by exec and SFTP)
+
+        :param host: host
+        :param port: port
+        :param user: login
+        :param password: password
+        :return: context manager yielding PooledConnection
+        """
+        return self.plugin.pool.connection(
+            "ssh", host, port, user,
+            lambda: self._ssh_connect(host, port, user, password),
+            secret=password,
+        )
 
-    def _sftp_ls(self, host: str, port: int, user: str, password: str | None, path: str | None) -> dict:
-        client, sftp = self._sftp_opener(host, port, user, password)
+    def _ssh_keepalive(self) -> int:
         try:
+            return int(self.plugin.get_option_value("ssh_keepalive") or 0)
+        except Exception:
+            return 0
+
+    def _ssh_exec_paramiko(self, host: str, port: int, user: str, password: str | None, command: str, cwd: str | None,
+                           env: dict | None) -> dict:
+        with self._ssh_connection(host, port, user, password) as conn:
+            rcmd = self._build_remote_cmd(command, cwd=cwd, env=env)
+            stdin, stdout, stderr = conn.client.exec_command(rcmd, timeout=self._timeout())
+            out = stdout.read().decode("utf-8", errors="replace")
+            err = stderr.read().decode("utf-8", errors="replace")
+            rc = stdout.channel.recv_exit_status()
+            return {"rc": rc, "stdout": out, "stderr": err}
+
+    def _sftp_ls(self, host: str, port: int, user: str, password: str | None, path: str | None) -> dict:
+        with self._ssh_connection(host, port, user, password) as conn:
+            sftp = conn.get_sftp()
             p = path or "."
             attrs = sftp.listdir_attr(p)
             out = []
@@ -373,40 +386,21 @@ class Worker(BaseWorker):
                     "mode": mode,
                 })
             return {"entries": out}
-        finally:
-            try:
-                sftp.close()
-            except Exception:
-                pass
-            try:
-                client.close()
-            except Exception:
-                pass
 
     def _sftp_get(self, host: str, port: int, user: str, password: str | None, remote_path: str,
                   local_path: str) -> dict:
-        client, sftp = self._sftp_opener(host, port, user, password)
-        try:
+        with self._ssh_connection(host, port, user, password) as conn:
             os.makedirs(os.path.dirname(local_path) or ".", exist_ok=True)
-            sftp.get(remote_path, local_path)
+            conn.get_sftp().get(remote_path, local_path)
             size = os.path.getsize(local_path)
             return {"saved_path": local_path, "size": size}
-        finally:
-            try:
-                sftp.close()
-            except Exception:
-                pass
-            try:
-                client.close()
-            except Exception:
-                pass
 
     def _sftp_put(self, host: str, port: int, user: str, password: str | None, local_path: str, remote_path: str,
                   make_dirs: bool) -> dict:
         if not os.path.exists(local_path):
             raise RuntimeError(f"Local path not found: {local_path}")
-        client, sftp = self._sftp_opener(host, port, user, password)
-        try:
+        with self._ssh_connection(host, port, user, password) as conn:
+            sftp = conn.get_sftp()
             if make_dirs:
                 # naive mkdir -p
                 dir_part = os.path.dirname(remote_path)
@@ -414,15 +408,6 @@ class Worker(BaseWorker):
                     self._sftp_mkdirs(sftp, dir_part)
             sftp.put(local_path, remote_path)
             return {"uploaded": True, "source": local_path, "dest": remote_path}
-        finally:
-            try:
-                sftp.close()
-            except Exception:
-                pass
-            try:
-                client.close()
-            except Exception:
-                pass
 
     def _sftp_mkdirs(self, sftp, remote_dir: str):
         parts = []
@@ -454,8 +439,8 @@ class Worker(BaseWorker):
                     pass
 
     def _sftp_rm(self, host: str, port: int, user: str, password: str | None, remote_path: str) -> dict:
-        client, sftp = self._sftp_opener(host, port, user, password)
-        try:
+        with self._ssh_connection(host, port, user, password) as conn:
+            sftp = conn.get_sftp()
             st = sftp.stat(remote_path)
             if pystat.S_ISDIR(st.st_mode):
                 # Non-recursive rmdir
@@ -464,39 +449,21 @@ class Worker(BaseWorker):
             else:
                 sftp.remove(remote_path)
                 return {"removed": True, "path": remote_path, "type": "file"}
-        finally:
-            try:
-                sftp.close()
-            except Exception:
-                pass
-            try:
-                client.close()
-            except Exception:
-                pass
 
     def _sftp_mkdir(self, host: str, port: int, user: str, password: str | None, remote_path: str,
                     exist_ok: bool) -> dict:
-        client, sftp = self._sftp_opener(host, port, user, password)
-        try:
+        with self._ssh_connection(host, port, user, password) as conn:
+            sftp = conn.get_sftp()
             try:
                 sftp.mkdir(remote_path)
             except IOError:
                 if not exist_ok:
                     raise
             return {"mkdir": True, "path": remote_path}
-        finally:
-            try:
-                sftp.close()
-            except Exception:
-                pass
-            try:
-                client.close()
-            except Exception:
-                pass
 
     def _sftp_stat(self, host: str, port: int, user: str, password: str | None, remote_path: str) -> dict:
-        client, sftp = self._sftp_opener(host, port, user, password)
-        try:
+        with self._ssh_connection(host, port, user, password) as conn:
+            sftp = conn.get_sftp()
             st = sftp.stat(remote_path)
             mode = st.st_mode
             ftype = "file"
@@ -511,15 +478,6 @@ class Worker(BaseWorker):
                 "mtime": getattr(st, "st_mtime", None),
                 "mode": mode,
             }
-        finally:
-            try:
-                sftp.close()
-            except Exception:
-                pass
-            try:
-                client.close()
-            except Exception:
-                pass
 
     # ---------------------- FTP / FTPS (stdlib) ----------------------
 
@@ -538,11 +496,27 @@ class Worker(BaseWorker):
         ftp.set_pasv(passive)
         return ftp
 
-    def _ftp_ls(self, host: str, port: int, user: str, password: str | None, path: str | None) -> dict:
+    def _ftp_connection(self, host: str, port: int, user: str, password: str | None):
+        """
+        Borrow pooled FTP/FTPS connection
+
+        :param host: host
+        :param port: port
+        :param user: login
+        :param password: password
+        :return: context manager yielding PooledConnection
+        """
         use_tls = self._ftp_use_tls_default() or (int(port) in [990])
         passive = self._ftp_passive_default()
-        ftp = self._ftp_connect(host, port, user, password, use_tls, passive)
-        try:
+        return self.plugin.pool.connection(
+            "ftps" if use_tls else "ftp", host, port, user,
+            lambda: self._ftp_connect(host, port, user, password, use_tls, passive),
+            secret=password,
+        )
+
+    def _ftp_ls(self, host: str, port: int, user: str, password: str | None, path: str | None) -> dict:
+        with self._ftp_connection(host, port, user, password) as conn:
+            ftp = conn.client
             p = path or "."
             entries = []
             # Prefer MLSD if supported
@@ -577,51 +551,30 @@ class Worker(BaseWorker):
                     base = os.path.basename(name)
                     entries.append({"name": base, "type": "unknown"})
             return {"entries": entries}
-        finally:
-            try:
-                ftp.quit()
-            except Exception:
-                pass
 
     def _ftp_get(self, host: str, port: int, user: str, password: str | None, remote_path: str,
                  local_path: str) -> dict:
-        use_tls = self._ftp_use_tls_default() or (int(port) in [990])
-        passive = self._ftp_passive_default()
-        ftp = self._ftp_connect(host, port, user, password, use_tls, passive)
-        try:
+        with self._ftp_connection(host, port, user, password) as conn:
+            ftp = conn.client
             os.makedirs(os.path.dirname(local_path) or ".", exist_ok=True)
             with open(local_path, "wb") as fh:
                 ftp.retrbinary(f"RETR {remote_path}", fh.write)
             size = os.path.getsize(local_path)
             return {"saved_path": local_path, "size": size}
-        finally:
-            try:
-                ftp.quit()
-            except Exception:
-                pass
 
     def _ftp_put(self, host: str, port: int, user: str, password: str | None, local_path: str,
                  remote_path: str) -> dict:
         if not os.path.exists(local_path):
             raise RuntimeError(f"Local path not found: {local_path}")
-        use_tls = self._ftp_use_tls_default() or (int(port) in [990])
-        passive = self._ftp_passive_default()
-        ftp = self._ftp_connect(host, port, user, password, use_tls, passive)
-        try:
+        with self._ftp_connection(host, port, user, password) as conn:
+            ftp = conn.client
             with open(local_path, "rb") as fh:
                 ftp.storbinary(f"STOR {remote_path}", fh)
             return {"uploaded": True, "source": local_path, "dest": remote_path}
-        finally:
-            try:
-                ftp.quit()
-            except Exception:
-                pass
 
     def _ftp_rm(self, host: str, port: int, user: str, password: str | None, remote_path: str) -> dict:
-        use_tls = self._ftp_use_tls_default() or (int(port) in [990])
-        passive = self._ftp_passive_default()
-        ftp = self._ftp_connect(host, port, user, password, use_tls, passive)
-        try:
+        with self._ftp_connection(host, port, user, password) as conn:
+            ftp = conn.client
             try:
                 ftp.delete(remote_path)
                 return {"removed": True, "path": remote_path, "type": "file"}
@@ -629,35 +582,21 @@ class Worker(BaseWorker):
                 # maybe it's a dir (non-recursive)
                 ftp.rmd(remote_path)
                 return {"removed": True, "path": remote_path, "type": "dir"}
-        finally:
-            try:
-                ftp.quit()
-            except Exception:
-                pass
 
     def _ftp_mkdir(self, host: str, port: int, user: str, password: str | None, remote_path: str,
                    exist_ok: bool) -> dict:
-        use_tls = self._ftp_use_tls_default() or (int(port) in [990])
-        passive = self._ftp_passive_default()
-        ftp = self._ftp_connect(host, port, user, password, use_tls, passive)
-        try:
+        with self._ftp_connection(host, port, user, password) as conn:
+            ftp = conn.client
             try:
                 ftp.mkd(remote_path)
             except ftplib.error_perm:
                 if not exist_ok:
                     raise
             return {"mkdir": True, "path": remote_path}
-        finally:
-            try:
-                ftp.quit()
-            except Exception:
-                pass
 
     def _ftp_stat(self, host: str, port: int, user: str, password: str | None, remote_path: str) -> dict:
-        use_tls = self._ftp_use_tls_default() or (int(port) in [990])
-        passive = self._ftp_passive_default()
-        ftp = self._ftp_connect(host, port, user, password, use_tls, passive)
-        try:
+        with self._ftp_connection(host, port, user, password) as conn:
+            ftp = conn.client
             # Try MLST single path
             try:
                 resp = []
@@ -702,11 +641,6 @@ class Worker(BaseWorker):
                 pass
             # Unknown
             return {"path": remote_path, "type": "unknown"}
-        finally:
-            try:
-                ftp.quit()
-            except Exception:
-                pass
 
     # ---------------------- Telnet (stdlib, best-effort) ----------------------
 
@@ -798,6 +732,61 @@ class Worker(BaseWorker):
             except Exception:
                 pass
 
+    # ---------------------- Transfers ----------------------
+
+    def _is_transfer_supported(self, port: int) -> bool:
+        svc = self._service_from_port(port)
+        return svc in ["ssh", "sftp", "ftp", "unknown"] or int(port) in [21, 22, 990]
+
+    def _get_file(self, cfg: dict, port: int, remote_path: str, local_path: str) -> dict:
+        host = cfg.get("server")
+        user = cfg.get("login")
+        password = cfg.get("password")
+        svc = self._service_from_port(port)
+        if svc in ["ssh", "sftp", "unknown"] or int(port) == 22:
+            if self._prefer_system_ssh():
+                return self._scp_get_system(host, port, user, remote_path, local_path)
+            return self._sftp_get(host, port, user, password, remote_path, local_path)
+        return self._ftp_get(host, port, user, password, remote_path, local_path)
+
+    def _put_file(self, cfg: dict, port: int, local_path: str, remote_path: str, make_dirs: bool) -> dict:
+        host = cfg.get("server")
+        user = cfg.get("login")
+        password = cfg.get("password")
+        svc = self._service_from_port(port)
+        if svc in ["ssh", "sftp", "unknown"] or int(port) == 22:
+            if self._prefer_system_ssh():
+                # System scp cannot create remote dirs automatically; rely on user setting up path
+                return self._scp_put_system(host, port, user, local_path, remote_path)
+            return self._sftp_put(host, port, user, password, local_path, remote_path, make_dirs=make_dirs)
+        return self._ftp_put(host, port, user, password, local_path, remote_path)
+
+    def _run_batch(self, files: list, fn) -> dict:
+        """
+        Run transfers concurrently, each worker thread borrows its own pooled connection
+        (up to per-host limit), so next transfer starts on a warm connection
+
+        :param files: list of file entries
+        :param fn: transfer callback (entry) -> result dict
+        :return: results dict
+        """
+        def run(entry):
+            if self.is_stopped():
+                return {"error": "Stopped."}
+            try:
+                return fn(entry)
+            except Exception as e:
+                return {"error": str(e)}
+
+        workers = min(len(files), self.plugin.pool.get_max_per_host())
+        if workers <= 1:
+            results = [run(entry) for entry in files]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="srv-transfer") as executor:
+                results = list(executor.map(run, files))
+        failed = len([r for r in results if "error" in r])
+        return {"results": results, "ok": len(results) - failed, "failed": failed}
+
     # ---------------------- Commands ----------------------
 
     def cmd_srv_exec(self, item: dict) -> dict:
@@ -874,22 +863,10 @@ class Worker(BaseWorker):
             return self.make_response(item, f"Local path exists and overwrite=False: {local_path}")
 
         cfg = self._server_config(server, port)
-        host = cfg.get("server")
-        user = cfg.get("login")
-        password = cfg.get("password")
-        svc = self._service_from_port(port)
-        if svc in ["ssh", "sftp", "unknown"] or int(port) == 22:
-            if self._prefer_system_ssh():
-                res = self._scp_get_system(host, port, user, remote_path, local_path)
-                return self.make_response(item, res)
-            else:
-                res = self._sftp_get(host, port, user, password, remote_path, local_path)
-                return self.make_response(item, res)
-        elif svc == "ftp" or int(port) in [21, 990]:
-            res = self._ftp_get(host, port, user, password, remote_path, local_path)
-            return self.make_response(item, res)
-        else:
-            return self.make_response(item, f"srv_get not supported for port {port} ({svc}).")
+        if not self._is_transfer_supported(port):
+            return self.make_response(item, f"srv_get not supported for port {port} ({self._service_from_port(port)}).")
+        res = self._get_file(cfg, port, remote_path, local_path)
+        return self.make_response(item, res)
 
     def cmd_srv_put(self, item: dict) -> dict:
         p = item.get("params", {}) or {}
@@ -907,23 +884,60 @@ class Worker(BaseWorker):
             remote_path = os.path.basename(lp)
 
         cfg = self._server_config(server, port)
-        host = cfg.get("server")
-        user = cfg.get("login")
-        password = cfg.get("password")
-        svc = self._service_from_port(port)
-        if svc in ["ssh", "sftp", "unknown"] or int(port) == 22:
-            if self._prefer_system_ssh():
-                # System scp cannot create remote dirs automatically; rely on user setting up path
-                res = self._scp_put_system(host, port, user, lp, remote_path)
-                return self.make_response(item, res)
-            else:
-                res = self._sftp_put(host, port, user, password, lp, remote_path, make_dirs=make_dirs)
-                return self.make_response(item, res)
-        elif svc == "ftp" or int(port) in [21, 990]:
-            res = self._ftp_put(host, port, user, password, lp, remote_path)
-            return self.make_response(item, res)
-        else:
-            return self.make_response(item, f"srv_put not supported for port {port} ({svc}).")
+        if not self._is_transfer_supported(port):
+            return self.make_response(item, f"srv_put not supported for port {port} ({self._service_from_port(port)}).")
+        res = self._put_file(cfg, port, lp, remote_path, make_dirs)
+        return self.make_response(item, res)
+
+    def cmd_srv_get_batch(self, item: dict) -> dict:
+        p = item.get("params", {}) or {}
+        server = p.get("server")
+        port = int(p.get("port") or 0)
+        files = p.get("files") or []
+        overwrite = bool(p.get("overwrite", True))
+        if not (server and port and files):
+            return self.make_response(item, "Params 'server', 'port' and 'files' required.")
+        cfg = self._server_config(server, port)
+        if not self._is_transfer_supported(port):
+            return self.make_response(item, f"srv_get_batch not supported for port {port} ({self._service_from_port(port)}).")
+
+        def get(entry):
+            if isinstance(entry, str):
+                entry = {"remote_path": entry}
+            remote_path = entry.get("remote_path")
+            if not remote_path:
+                raise RuntimeError("Param 'remote_path' required.")
+            local_path = self.prepare_path(entry.get("local_path") or os.path.basename(remote_path))
+            if os.path.exists(local_path) and not overwrite:
+                raise RuntimeError(f"Local path exists and overwrite=False: {local_path}")
+            return self._get_file(cfg, port, remote_path, local_path)
+
+        return self.make_response(item, self._run_batch(files, get))
+
+    def cmd_srv_put_batch(self, item: dict) -> dict:
+        p = item.get("params", {}) or {}
+        server = p.get("server")
+        port = int(p.get("port") or 0)
+        files = p.get("files") or []
+        make_dirs = bool(p.get("make_dirs", True))
+        if not (server and port and files):
+            return self.make_response(item, "Params 'server', 'port' and 'files' required.")
+        cfg = self._server_config(server, port)
+        if not self._is_transfer_supported(port):
+            return self.make_response(item, f"srv_put_batch not supported for port {port} ({self._service_from_port(port)}).")
+
+        def put(entry):
+            if isinstance(entry, str):
+                entry = {"local_path": entry}
+            local_path = entry.get("local_path")
+            if not local_path:
+                raise RuntimeError("Param 'local_path' required.")
+            lp = self.prepare_path(local_path)
+            if not os.path.exists(lp):
+                raise RuntimeError(f"Local path not found: {lp}")
+            return self._put_file(cfg, port, lp, entry.get("remote_path") or os.path.basename(lp), make_dirs)
+
+        return self.make_response(item, self._run_batch(files, put))
 
     def cmd_srv_rm(self, item: dict) -> dict:
         p = item.get("params", {}) or {}
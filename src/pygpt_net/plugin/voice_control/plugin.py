@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.20 03:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from pygpt_net.plugin.base.plugin import BasePlugin
@@ -32,6 +32,14 @@ class Plugin(BasePlugin):
             "voice_cmd",
         ]
         self.order = 100
+        self.events = [
+            Event.CMD_EXECUTE,
+            Event.CMD_INLINE,
+            Event.CMD_SYNTAX,
+            Event.CMD_SYNTAX_INLINE,
+            Event.DISABLE,
+            Event.ENABLE,
+        ]
         self.use_locale = True
         self.config = Config(self)
         self.init_options()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 12:00:00                  #
+# ================================================== #
+
+import sys
+import time
+from importlib.abc import MetaPathFinder
+from typing import Dict, List, Optional, Tuple
+
+PROFILE_ARG = "--profile-startup"
+
+
+class _TimedLoader:
+    def __init__(self, loader, name: str, profiler: "ImportProfiler"):
+        """
+        Loader wrapper measuring module execution time
+
+        :param loader: original loader
+        :param name: module name
+        :param profiler: profiler instance
+        """
+        self._loader = loader
+        self._name = name
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        if hasattr(self._loader, "create_module"):
+            return self._loader.create_module(spec)
+        return None
+
+    def exec_module(self, module):
+        self._profiler.enter(self._name)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler.exit(self._name)
+
+    def __getattr__(self, name: str):
+        return getattr(self._loader, name)
+
+
+class ImportProfiler(MetaPathFinder):
+    def __init__(self):
+        """Startup profiler, measures import time of each module (like python -X importtime)"""
+        self.started = time.perf_counter()
+        self.stack: List[Tuple[str, float, float]] = []  # name, start, children time
+        self.times: Dict[str, Tuple[float, float]] = {}  # name -> (self, cumulative)
+        self.marks: List[Tuple[str, float]] = []
+        self.active = False
+
+    def install(self):
+        """Install import hook"""
+        if not self.active:
+            sys.meta_path.insert(0, self)
+            self.active = True
+
+    def uninstall(self):
+        """Remove import hook"""
+        if self.active:
+            try:
+                sys.meta_path.remove(self)
+            except ValueError:
+                pass
+            self.active = False
+
+    def find_spec(self, fullname: str, path=None, target=None):
+        """
+        Find spec with remaining finders and wrap its loader
+
+        :param fullname: module name
+        :param path: package path
+        :param target: target module
+        :return: module spec or None
+        """
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, fullname, self)
+                return spec
+        return None
+
+    def enter(self, name: str):
+        self.stack.append((name, time.perf_counter(), 0.0))
+
+    def exit(self, name: str):
+        name, start, children = self.stack.pop()
+        cumulative = time.perf_counter() - start
+        self.times[name] = (cumulative - children, cumulative)
+        if self.stack:
+            parent, parent_start, parent_children = self.stack[-1]
+            self.stack[-1] = (parent, parent_start, parent_children + cumulative)
+
+    def mark(self, label: str):
+        """
+        Mark startup phase
+
+        :param label: phase label
+        """
+        self.marks.append((label, time.perf_counter() - self.started))
+
+    def report(self, limit: int = 40) -> str:
+        """
+        Build import time report
+
+        :param limit: max number of modules in each section
+        :return: report text
+        """
+        total = time.perf_counter() - self.started
+        imports = sum(t[0] for t in self.times.values())
+        packages: Dict[str, float] = {}
+        for name, (self_time, _) in self.times.items():
+            top = name.split(".")[0]
+            if top == "pygpt_net" and name.count(".") >= 1:
+                top = ".".join(name.split(".")[:2])
+            packages[top] = packages.get(top, 0.0) + self_time
+
+        lines = [
+            "=" * 72,
+            "Startup profile: {:.3f}s total, {:.3f}s in imports ({} modules)".format(
+                total, imports, len(self.times)),
+            "-" * 72,
+        ]
+        for label, elapsed in self.marks:
+            lines.append("  {:>9.3f}s  {}".format(elapsed, label))
+        lines.append("-" * 72)
+        lines.append("  Top packages (self time):")
+        for name, t in sorted(packages.items(), key=lambda x: x[1], reverse=True)[:limit]:
+            lines.append("  {:>9.1f}ms  {}".format(t * 1000, name))
+        lines.append("-" * 72)
+        lines.append("  Top modules:  self | cumulative")
+        items = sorted(self.times.items(), key=lambda x: x[1][1], reverse=True)[:limit]
+        for name, (self_time, cumulative) in items:
+            lines.append("  {:>9.1f}ms | {:>9.1f}ms  {}".format(self_time * 1000, cumulative * 1000, name))
+        lines.append("=" * 72)
+        return "\n".join(lines)
+
+
+_profiler: Optional[ImportProfiler] = None
+
+
+def start(argv: Optional[List[str]] = None) -> Optional[ImportProfiler]:
+    """
+    Start startup profiler if --profile-startup is passed in command line
+
+    :param argv: command line arguments
+    :return: profiler instance or None
+    """
+    global _profiler
+    argv = sys.argv[1:] if argv is None else argv
+    if _profiler is None and PROFILE_ARG in argv:
+        _profiler = ImportProfiler()
+        _profiler.install()
+    return _profiler
+
+
+def get() -> Optional[ImportProfiler]:
+    """
+    Get active profiler
+
+    :return: profiler instance or None
+    """
+    return _profiler
+
+
+def mark(label: str):
+    """
+    Mark startup phase (no-op if profiler not started)
+
+    :param label: phase label
+    """
+    if _profiler is not None:
+        _profiler.mark(label)
+
+
+def finish(limit: int = 40):
+    """
+    Print report and remove import hook (no-op if profiler not started)
+
+    :param limit: max number of modules in each section
+    """
+    global _profiler
+    if _profiler is None:
+        return
+    _profiler.uninstall()
+    print(_profiler.report(limit))
+    _profiler = None
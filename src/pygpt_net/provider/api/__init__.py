@@ -6,13 +6,14 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.21 13:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from .anthropic import ApiAnthropic
 from .google import ApiGoogle
 from .openai import ApiOpenAI
 from .x_ai import ApiXAI
+from .pool import ClientPool
 
 class Api:
 
@@ -23,6 +24,7 @@ class Api:
         :param window: Window instance
         """
         self.window = window
+        self.pool = ClientPool(window)
         self.anthropic = ApiAnthropic(window)
         self.google = ApiGoogle(window)
         self.openai = ApiOpenAI(window)
@@ -40,4 +42,5 @@ class Api:
         self.anthropic.safe_close()
         self.google.safe_close()
         self.openai.safe_close()
-        self.xai.safe_close()
\ No newline at end of file
+        self.xai.safe_close()
+        self.pool.close()
\ No newline at end of file
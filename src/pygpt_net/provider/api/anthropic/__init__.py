@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.21 13:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from typing import Optional, Dict, Any
@@ -60,14 +60,14 @@ class ApiAnthropic:
             model: ModelItem = None,
     ) -> anthropic.Anthropic:
         """
-        Get or create Anthropic client
+        Get or create Anthropic client (pooled, reused for the same client args)
 
         :param mode: Mode (chat, completion, image, etc.)
         :param model: ModelItem
         :return: anthropic.Anthropic instance
         """
         # Build minimal args from app config
-        args = self.window.core.models.prepare_client_args(mode, model)
+        args = self.window.core.models.prepare_client_args(mode, model, http_client=False)
         filtered = {}
         if args.get("api_key"):
             filtered["api_key"] = args["api_key"]
@@ -79,8 +79,23 @@ class ApiAnthropic:
         # if base_url:
             # filtered["base_url"] = base_url
 
-        # Keep a fresh client per call; Anthropic client is lightweight
-        return anthropic.Anthropic(**filtered)
+        self.last_client_args = filtered
+        self.client = self.window.core.api.pool.get("anthropic", filtered, self.create_client)
+        return self.client
+
+    def create_client(self, args: Dict[str, Any]) -> anthropic.Anthropic:
+        """
+        Create Anthropic client
+
+        :param args: client args
+        :return: anthropic.Anthropic instance
+        """
+        args = dict(args)
+        proxy = args.pop("api_proxy", None)
+        args["http_client"] = self.window.core.api.pool.create_http_client(
+            proxy, anthropic.DefaultHttpxClient, "anthropic"
+        )
+        return anthropic.Anthropic(**args)
 
     def call(
             self,
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.21 13:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import os
@@ -69,7 +69,7 @@ class ApiGoogle:
             model: ModelItem = None
     ) -> genai.Client:
         """
-        Get or create Google GenAI client
+        Get or create Google GenAI client (pooled, reused for the same client args)
 
         :param mode: Mode (chat, completion, image, etc.)
         :param model: ModelItem
@@ -78,16 +78,12 @@ class ApiGoogle:
         if not model:
             model = ModelItem()
             model.provider = "google"
-        args = self.window.core.models.prepare_client_args(mode, model)
+        args = self.window.core.models.prepare_client_args(mode, model, http_client=False)
         filtered = {}
         if args.get("api_key"):
             filtered["api_key"] = args["api_key"]
         if args.get("api_proxy"):
-            http_options = gtypes.HttpOptions(
-                client_args={"proxy": args["api_proxy"]},
-                async_client_args={"proxy": args["api_proxy"]},
-            )
-            filtered["http_options"] = http_options
+            filtered["api_proxy"] = args["api_proxy"]
 
         # setup VertexAI if enabled
         use_vertex = self.setup_env()
@@ -97,15 +93,26 @@ class ApiGoogle:
             filtered["location"] = os.environ.get("GOOGLE_CLOUD_LOCATION", "us-central1")
             # filtered["http_options"] = gtypes.HttpOptions(api_version="v1")
 
-        # use previous client if args are the same
-        if self.client and self.last_client_args == filtered:
-            return self.client
-
         self.last_client_args = filtered
-        self.client = genai.Client(**filtered)
-
+        self.client = self.window.core.api.pool.get("google", filtered, self.create_client)
         return self.client
 
+    def create_client(self, args: Dict[str, Any]) -> genai.Client:
+        """
+        Create Google GenAI client
+
+        :param args: client args
+        :return: genai.Client instance
+        """
+        args = dict(args)
+        proxy = args.pop("api_proxy", None)
+        if proxy:
+            args["http_options"] = gtypes.HttpOptions(
+                client_args={"proxy": proxy},
+                async_client_args={"proxy": proxy},
+            )
+        return genai.Client(**args)
+
     def call(
             self,
             context: BridgeContext,
@@ -338,13 +345,7 @@ class ApiGoogle:
                 print("Error closing Google client:", e)
 
     def safe_close(self):
-        """Close client"""
+        """Close client (pooled client is closed by pool)"""
         if self.locked:
             return
-        if self.client is not None:
-            try:
-                self.client.close()
-                self.client = None
-            except Exception as e:
-                self.window.core.debug.log(e)
-                print("Error closing client:", e)
\ No newline at end of file
+        self.client = None
\ No newline at end of file
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.07 23:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import asyncio
@@ -23,7 +23,7 @@ from pygpt_net.core.text.utils import has_unclosed_code_tag
 
 # shared
 from pygpt_net.core.realtime.shared.loop import BackgroundLoop
-from pygpt_net.core.realtime.shared.audio import to_pcm16_mono
+from pygpt_net.core.realtime.shared.audio import to_pcm16_mono, PCMConverter
 from pygpt_net.core.realtime.shared.tools import build_function_responses_payload
 from pygpt_net.core.realtime.shared.text import coalesce_text
 from pygpt_net.core.realtime.shared.turn import TurnMode, apply_turn_mode_google
@@ -86,6 +86,7 @@ class GoogleLiveClient:
         # Audio I/O (rates)
         self._IN_RATE = 16000     # input (LINEAR16 mono)
         self._OUT_RATE = 24000    # output (model audio PCM16@24kHz)
+        self._in_converter: Optional[PCMConverter] = None  # live input stream converter
 
         # Output audio jitter buffer
         self._audio_buf = bytearray()
@@ -401,6 +402,7 @@ class GoogleLiveClient:
         self._turn_text_parts = []
         self._last_out_tr = ""
         self._audio_buf.clear()
+        self._in_converter = None
         self._saw_data_stream = False
         self._rt_state = None
         self._last_tool_calls = []
@@ -698,9 +700,18 @@ class GoogleLiveClient:
         is_final = bool(payload.get("final", False))
 
         # Normalize to LINEAR16 mono @16kHz (Live API input native rate)
-        fmt_hint = "pcm16" if mime.startswith("audio/pcm") else None
         try:
-            pcm, norm_rate = to_pcm16_mono(data, fmt_hint, rate, target_rate=self._IN_RATE)
+            if mime.startswith("audio/pcm"):
+                # stream: keep resampler state between chunks
+                conv = self._in_converter
+                if conv is None or not conv.matches(rate, channels, self._IN_RATE, 1):
+                    conv = PCMConverter(rate, channels, self._IN_RATE, 1)
+                    self._in_converter = conv
+                pcm, norm_rate = conv.convert(data), self._IN_RATE
+                if is_final:
+                    self._in_converter = None
+            else:
+                pcm, norm_rate = to_pcm16_mono(data, None, rate, target_rate=self._IN_RATE)
         except Exception:
             return
 
@@ -715,12 +726,13 @@ class GoogleLiveClient:
             self._send_lock = asyncio.Lock()
 
         async with self._send_lock:
-            try:
-                await self._session.send_realtime_input(
-                    audio=gtypes.Blob(data=pcm, mime_type=f"audio/pcm;rate={int(norm_rate)}")
-                )
-            except Exception:
-                return
+            if pcm:  # chunk may be shorter than one output frame
+                try:
+                    await self._session.send_realtime_input(
+                        audio=gtypes.Blob(data=pcm, mime_type=f"audio/pcm;rate={int(norm_rate)}")
+                    )
+                except Exception:
+                    return
 
             # If stream end is flagged, flush server-side VAD buffer
             if is_final:
@@ -6,10 +6,10 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.21 13:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
-from openai import OpenAI
+from openai import OpenAI, DefaultHttpxClient
 
 from pygpt_net.core.types import (
     MODE_ASSISTANT,
@@ -76,18 +76,38 @@ class ApiOpenAI:
             model: ModelItem = None
     ) -> OpenAI:
         """
-        Return OpenAI client
+        Return OpenAI client (pooled, reused for the same client args)
 
         :param mode: Mode
         :param model: Model
         :return: OpenAI client
         """
         # prepare client args by mode and model provider
-        args = self.window.core.models.prepare_client_args(mode, model)
-        self.client = OpenAI(**args)
+        args = self.window.core.models.prepare_client_args(mode, model, http_client=False)
+        provider = model.provider if model is not None and model.provider else "openai"
+        self.client = self.window.core.api.pool.get(
+            "openai",
+            args,
+            lambda client_args: self.create_client(client_args, provider),
+        )
         self.last_client_args = args  # store last args for debug
         return self.client
 
+    def create_client(self, args: dict, provider: str = "openai") -> OpenAI:
+        """
+        Create OpenAI client
+
+        :param args: client args
+        :param provider: model provider id (rate limiter key)
+        :return: OpenAI client
+        """
+        args = dict(args)
+        proxy = args.pop("api_proxy", None)
+        args["http_client"] = self.window.core.api.pool.create_http_client(
+            proxy, DefaultHttpxClient, provider
+        )
+        return OpenAI(**args)
+
     def call(
             self,
             context: BridgeContext,
@@ -371,13 +391,7 @@ class ApiOpenAI:
                 print("Error closing GPT client:", e)
 
     def safe_close(self):
-        """Close client"""
+        """Close client (pooled client is closed by pool)"""
         if self.locked:
             return
-        if self.client is not None:
-            try:
-                self.client.close()
-                self.client = None
-            except Exception as e:
-                self.window.core.debug.log(e)
-                print("Error closing client:", e)
\ No newline at end of file
+        self.client = None
\ No newline at end of file
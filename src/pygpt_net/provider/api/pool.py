@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 12:00:00                  #
+# ================================================== #
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import httpx
+from httpx_socks import SyncProxyTransport
+
+
+class ClientPool:
+    MAX_CLIENTS = 16  # max number of pooled clients (LRU)
+    SECRET_ARGS = ("api_key", "management_api_key")  # hashed in signature
+    SKIP_ARGS = ("http_client",)  # created by pool
+
+    def __init__(self, window=None):
+        """
+        Pool of reusable API clients, keyed by provider and resolved client args
+
+        Clients (and their HTTP connection pools) are shared between all API calls
+        (chat, responses, image, audio, store, etc.) using the same configuration.
+
+        :param window: Window instance
+        """
+        self.window = window
+        self.clients: "OrderedDict[Tuple, Any]" = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get_limits(self) -> Tuple[int, int, float]:
+        """
+        Get connection limits from config
+
+        :return: (max connections, max keep-alive connections, keep-alive expiry)
+        """
+        cfg = self.window.core.config
+        return (
+            int(cfg.get("api_pool.max_connections", 20) or 20),
+            int(cfg.get("api_pool.max_keepalive", 10) or 0),
+            float(cfg.get("api_pool.keepalive_expiry", 30) or 0),
+        )
+
+    def signature(self, provider: str, args: Dict[str, Any]) -> Tuple:
+        """
+        Build pool key from client args
+
+        :param provider: provider id
+        :param args: resolved client args
+        :return: hashable signature
+        """
+        items = []
+        for key in sorted(args):
+            if key in self.SKIP_ARGS:
+                continue
+            value = args[key]
+            if key in self.SECRET_ARGS and value:
+                value = hashlib.sha256(str(value).encode("utf-8")).hexdigest()
+            elif not isinstance(value, (str, int, float, bool, type(None))):
+                value = json.dumps(value, sort_keys=True, default=repr)
+            items.append((key, value))
+        return (provider, tuple(items), self.get_limits())
+
+    def get(
+            self,
+            provider: str,
+            args: Dict[str, Any],
+            factory: Callable[[Dict[str, Any]], Any]
+    ) -> Any:
+        """
+        Get pooled client or create new one
+
+        :param provider: provider id
+        :param args: resolved client args
+        :param factory: client factory, called with args if client is not pooled yet
+        :return: client instance
+        """
+        key = self.signature(provider, args)
+        with self.lock:
+            client = self.clients.get(key)
+            if client is not None:
+                self.clients.move_to_end(key)
+                return client
+
+        client = factory(args)  # outside lock, client init may be slow
+        evicted = []
+        with self.lock:
+            existing = self.clients.get(key)
+            if existing is not None:
+                evicted.append(client)  # created concurrently, keep first one
+                client = existing
+                self.clients.move_to_end(key)
+            else:
+                self.clients[key] = client
+                while len(self.clients) > self.MAX_CLIENTS:
+                    evicted.append(self.clients.popitem(last=False)[1])
+        for item in evicted:
+            self.close_client(item)
+        return client
+
+    def create_http_client(
+            self,
+            proxy: Optional[str] = None,
+            client_cls: Optional[type] = None,
+            provider: Optional[str] = None
+    ) -> httpx.Client:
+        """
+        Create HTTP client with configured connection limits
+
+        :param proxy: proxy address (optional)
+        :param client_cls: httpx.Client subclass, e.g. SDK's DefaultHttpxClient
+        :param provider: provider id, rate limiter is adapted from its response headers (optional)
+        :return: HTTP client
+        """
+        max_connections, max_keepalive, expiry = self.get_limits()
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=expiry,
+        )
+        kwargs = {"limits": limits}
+        if proxy:
+            kwargs = {"transport": SyncProxyTransport.from_url(proxy, limits=limits)}
+        if provider:
+            kwargs["event_hooks"] = {"response": [self.window.core.limiter.get_hook(provider)]}
+        if client_cls is None:
+            client_cls = httpx.Client
+        return client_cls(**kwargs)
+
+    def invalidate(self, provider: Optional[str] = None):
+        """
+        Close and remove pooled clients (e.g. on credentials change)
+
+        :param provider: provider id, or None to invalidate all
+        """
+        with self.lock:
+            keys = [k for k in self.clients if provider is None or k[0] == provider]
+            clients = [self.clients.pop(k) for k in keys]
+        for client in clients:
+            self.close_client(client)
+
+    def close_client(self, client: Any):
+        """
+        Close client
+
+        :param client: client instance
+        """
+        close = getattr(client, "close", None)
+        if not callable(close):
+            return
+        try:
+            close()
+        except Exception as e:
+            self.window.core.debug.log(e)
+
+    def close(self):
+        """Close all pooled clients"""
+        self.invalidate()
+
+    def count(self, provider: Optional[str] = None) -> int:
+        """
+        Count pooled clients
+
+        :param provider: provider id, or None to count all
+        :return: number of clients
+        """
+        with self.lock:
+            return len([k for k in self.clients if provider is None or k[0] == provider])
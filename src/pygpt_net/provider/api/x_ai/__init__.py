@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.21 13:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from typing import Optional, Dict, Any
@@ -70,7 +70,7 @@ class ApiXAI:
         Get or create xAI client.
 
         - Reads api_key from config or XAI_API_KEY env.
-        - Caches the client instance.
+        - Reuses pooled client instance for the same client args.
 
         :param mode: One of MODE_*
         :param model: ModelItem (optional, not used currently)
@@ -96,11 +96,8 @@ class ApiXAI:
         if management_api_key:
             kwargs["management_api_key"] = management_api_key
 
-        if self.client is not None and self.last_client_args == kwargs:
-            return self.client
-
         self.last_client_args = kwargs
-        self.client = xai_sdk.Client(**kwargs)
+        self.client = self.window.core.api.pool.get("x_ai", kwargs, lambda args: xai_sdk.Client(**args))
         return self.client
 
     def call(
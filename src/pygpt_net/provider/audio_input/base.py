@@ -6,9 +6,12 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.18 21:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
+import os
+import tempfile
+
 from pygpt_net.plugin.base.plugin import BasePlugin
 
 
@@ -53,6 +56,30 @@ class BaseProvider:
         """
         pass
 
+    def transcribe_audio(self, data: bytes, rate: int, channels: int = 1) -> str:
+        """
+        Audio to text transcription of in-memory PCM16 data (e.g. speech segment)
+
+        Providers that accept in-memory audio override this, default implementation
+        writes temporary WAV file and calls transcribe().
+
+        :param data: PCM16 little-endian data
+        :param rate: sample rate
+        :param channels: number of channels
+        :return: transcribed text
+        """
+        from pygpt_net.core.audio.backend.shared import s16le_to_wav
+        fd, path = tempfile.mkstemp(suffix=".wav")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(s16le_to_wav(data, rate, channels))
+            return self.transcribe(path)
+        finally:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
     def is_configured(self) -> bool:
         """
         Check if provider is configured
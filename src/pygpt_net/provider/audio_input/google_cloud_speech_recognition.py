@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.06 01:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from .base import BaseProvider
@@ -61,15 +61,39 @@ class GoogleCloudSpeechRecognition(BaseProvider):
         :return: transcribed text
         """
         import speech_recognition as sr
-        args = {}
-        additional_args = parse_args(self.plugin.get_option_value('google_cloud_args'))
-        if additional_args:
-            args.update(additional_args)
-
         r = sr.Recognizer()
         file = sr.AudioFile(path)
         with file as source:
             audio = r.record(source)
+        return self.recognize(r, audio)
+
+    def transcribe_audio(self, data: bytes, rate: int, channels: int = 1) -> str:
+        """
+        Audio to text transcription of in-memory PCM16 data
+
+        :param data: PCM16 little-endian data
+        :param rate: sample rate
+        :param channels: number of channels
+        :return: transcribed text
+        """
+        import speech_recognition as sr
+        from pygpt_net.core.audio.backend.shared import PCMConverter
+        if channels > 1:
+            data = PCMConverter(rate, channels, rate, 1).convert(data)  # mono
+        return self.recognize(sr.Recognizer(), sr.AudioData(data, rate, 2))
+
+    def recognize(self, r, audio) -> str:
+        """
+        Recognize audio data
+
+        :param r: recognizer instance
+        :param audio: audio data
+        :return: transcribed text
+        """
+        args = {}
+        additional_args = parse_args(self.plugin.get_option_value('google_cloud_args'))
+        if additional_args:
+            args.update(additional_args)
         return r.recognize_google_cloud(audio, **args)
 
     def is_configured(self) -> bool:
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.02.27 04:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from .base import BaseProvider
@@ -51,6 +51,23 @@ class OpenAIWhisper(BaseProvider):
                 response_format="text",
             )
 
+    def transcribe_audio(self, data: bytes, rate: int, channels: int = 1) -> str:
+        """
+        Audio to text transcription of in-memory PCM16 data
+
+        :param data: PCM16 little-endian data
+        :param rate: sample rate
+        :param channels: number of channels
+        :return: transcribed text
+        """
+        from pygpt_net.core.audio.backend.shared import s16le_to_wav
+        client = self.plugin.window.core.api.openai.get_client()
+        return client.audio.transcriptions.create(
+            model=self.plugin.get_option_value('whisper_model'),
+            file=("audio.wav", s16le_to_wav(data, rate, channels), "audio/wav"),
+            response_format="text",
+        )
+
     def is_configured(self) -> bool:
         """
         Check if provider is configured
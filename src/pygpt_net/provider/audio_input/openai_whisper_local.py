@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.01 03:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from typing import cast
@@ -64,6 +64,33 @@ class OpenAIWhisperLocal(BaseProvider):
         result = model.transcribe(path)
         return str(result["text"])
 
+    def transcribe_audio(self, data: bytes, rate: int, channels: int = 1) -> str:
+        """
+        Audio to text transcription of in-memory PCM16 data
+
+        :param data: PCM16 little-endian data
+        :param rate: sample rate
+        :param channels: number of channels
+        :return: transcribed text
+        """
+        is_compiled = self.plugin.window.core.config.is_compiled() or self.plugin.window.core.platforms.is_snap()
+        if is_compiled:
+            raise ValueError("Local models are not available in compiled version.")
+
+        if not self.is_configured():
+            raise ImportError(self.get_config_message())
+
+        import numpy as np
+        import whisper
+        from pygpt_net.core.audio.backend.shared import PCMConverter
+
+        # whisper expects float32 mono at 16 kHz
+        pcm = PCMConverter(rate, channels, whisper.audio.SAMPLE_RATE, 1).convert(data)
+        samples = np.frombuffer(pcm, dtype="<i2").astype(np.float32) / 32768.0
+        model = whisper.load_model(self.plugin.get_option_value('whisper_local_model'))
+        result = model.transcribe(samples)
+        return str(result["text"])
+
     def is_configured(self) -> bool:
         """
         Check if provider is configured
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.06 20:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import asyncio
@@ -335,7 +335,7 @@ class XAIGrokVoiceAudioInput(BaseProvider):
         Returns (bytes, duration_seconds).
         """
         import wave
-        import audioop
+        from pygpt_net.core.audio.backend.shared.conversions import PCMConverter, lin_to_s16le
 
         with wave.open(path, "rb") as wf:
             n_channels = wf.getnchannels()
@@ -344,18 +344,13 @@ class XAIGrokVoiceAudioInput(BaseProvider):
             n_frames = wf.getnframes()
             raw = wf.readframes(n_frames)
 
-        # Convert to mono if needed
-        if n_channels > 1:
-            raw = audioop.tomono(raw, sampwidth, 1, 1)
-
         # Convert sample width to 16-bit
         if sampwidth != 2:
-            raw = audioop.lin2lin(raw, sampwidth, 2)
+            raw = lin_to_s16le(raw, sampwidth)
 
-        # Resample if needed
-        if framerate != target_rate:
-            raw, _ = audioop.ratecv(raw, 2, 1, framerate, target_rate, None)
-            framerate = target_rate
+        # Convert to mono and resample if needed
+        if n_channels > 1 or framerate != target_rate:
+            raw = PCMConverter(framerate, n_channels, target_rate, 1).convert(raw)
 
         duration_s = len(raw) / float(target_rate * 2)  # mono, 16-bit
         return raw, duration_s
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from typing import List, Dict, Optional
@@ -37,6 +37,9 @@ class BaseProvider:
     def update_item(self, item: CtxItem) -> bool:
         pass
 
+    def update_items_tokens_cache(self, items: List[CtxItem]) -> bool:
+        pass
+
     def create(self, meta: CtxMeta) -> int:
         pass
 
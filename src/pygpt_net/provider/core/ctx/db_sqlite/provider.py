@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import time
@@ -221,6 +221,15 @@ class DbSqliteProvider(BaseProvider):
         self.storage.update_meta_ts(item.meta_id)
         return self.storage.update_item(item) is not None
 
+    def update_items_tokens_cache(self, items: List[CtxItem]) -> bool:
+        """
+        Store cached token counts of items
+
+        :param items: ctx items (CtxItem)
+        :return: True if updated
+        """
+        return self.storage.update_items_tokens_cache(items)
+
     def save(self, id: int, meta: CtxMeta, items: List[CtxItem]) -> bool:
         """
         Save ctx
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.15 22:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from datetime import datetime
@@ -20,6 +20,7 @@ from pygpt_net.utils import get_tz_offset
 from pygpt_net.item.ctx import CtxMeta, CtxItem, CtxGroup
 from .utils import \
     search_by_date_string, \
+    build_fts_query, \
     pack_item_value, \
     unpack_meta, \
     unpack_item, \
@@ -36,6 +37,8 @@ class Storage:
         :param window: Window instance
         """
         self.window = window
+        self.fts_engine = None  # engine for which FTS availability was checked
+        self.fts_available = False
 
     def attach(self, window):
         """
@@ -45,13 +48,33 @@ class Storage:
         """
         self.window = window
 
+    def has_fts(self) -> bool:
+        """
+        Check if full-text index for ctx items is available (checked once per DB engine)
+
+        :return: True if ctx_item_fts table exists
+        """
+        db = self.window.core.db.get_db()
+        if self.fts_engine is not db:
+            self.fts_available = False
+            try:
+                with db.connect() as conn:
+                    row = conn.execute(text("""
+                        SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'ctx_item_fts'
+                    """)).fetchone()
+                    self.fts_available = bool(row)
+            except Exception as e:
+                print("[DB] Error checking FTS index: {}".format(e))
+            self.fts_engine = db
+        return self.fts_available
+
     def prepare_query(
             self,
             search_string: Optional[str] = None,
             filters: Optional[dict] = None,
             search_content: bool = False,
             append_date_ranges: bool = True,
-    ) -> Tuple[str, str, dict]:
+    ) -> Tuple[str, str, dict, bool]:
         """
         Prepare query for search_string and filters
 
@@ -59,11 +82,12 @@ class Storage:
         :param filters: dict of filters
         :param search_content: search in content (input, output)
         :param append_date_ranges: append date ranges
-        :return: where_statement, join_statement, bind_params
+        :return: where_statement, join_statement, bind_params, group_items (join duplicates meta rows)
         """
         where_clauses = []
         join_clauses = []
         bind_params = {}
+        group_items = False
 
         # only base by default
         where_clauses.append("(m.root_id IS NULL OR m.root_id = 0)")
@@ -80,11 +104,29 @@ class Storage:
                 search_string.strip(),
             )
             if search_string:
-                if search_content:
+                fts_query = build_fts_query(search_string) if search_content else ""
+                if fts_query and self.has_fts():
+                    # best (lowest) bm25 score of matched items per ctx, used for ranking
+                    where_clauses.append("(m.name LIKE :search_string OR f.meta_id IS NOT NULL)")
+                    join_clauses.append("""
+                        LEFT JOIN (
+                            SELECT i.meta_id AS meta_id, MIN(s.fts_rank) AS fts_rank
+                            FROM (
+                                SELECT rowid AS item_id, rank AS fts_rank
+                                FROM ctx_item_fts
+                                WHERE ctx_item_fts MATCH :fts_query
+                            ) s
+                            JOIN ctx_item i ON i.id = s.item_id
+                            GROUP BY i.meta_id
+                        ) f ON f.meta_id = m.id
+                    """)
+                    bind_params['fts_query'] = fts_query
+                elif search_content:
                     where_clauses.append(
                         "(m.name LIKE :search_string OR i.input LIKE :search_string OR i.output LIKE :search_string)"
                     )
                     join_clauses.append("LEFT JOIN ctx_item i ON m.id = i.meta_id")
+                    group_items = True
                 else:
                     where_clauses.append("m.name LIKE :search_string")
                 bind_params['search_string'] = f"%{search_string}%"
@@ -115,6 +157,15 @@ class Storage:
                     where_clauses.append("(m.group_id IS NULL OR m.group_id = 0)")
                     continue
 
+                # handle keyset paging: rows below given (updated_ts, id) in date order
+                if key == 'updated_ts' and str(mode).upper() == 'BEFORE':
+                    where_clauses.append(
+                        "(m.updated_ts < :before_ts OR (m.updated_ts = :before_ts AND m.id < :before_id))"
+                    )
+                    bind_params['before_ts'] = int(value[0])
+                    bind_params['before_id'] = int(value[1])
+                    continue
+
                 key_name = 'm.' + key
                 if isinstance(value, int):
                     where_clauses.append(f"{key_name} {mode} :{key}")
@@ -129,7 +180,7 @@ class Storage:
         where_statement = " AND ".join(where_clauses) if where_clauses else "1"
         join_statement = " ".join(join_clauses) if join_clauses else ""
 
-        return where_statement, join_statement, bind_params
+        return where_statement, join_statement, bind_params, group_items
 
     def get_meta(
             self,
@@ -145,7 +196,7 @@ class Storage:
         Return dict with CtxMeta objects, indexed by ID
 
         :param search_string: search string
-        :param order_by: order by
+        :param order_by: order by ('rank' = full-text relevance first, if available)
         :param order_direction: order direction (asc, desc)
         :param limit: result limit
         :param offset: result offset
@@ -154,13 +205,28 @@ class Storage:
         :return: dict of CtxMeta
         """
         limit_suffix = ""
-        where_statement, join_statement, bind_params = self.prepare_query(
+        where_statement, join_statement, bind_params, group_items = self.prepare_query(
             search_string=search_string,
             filters=filters,
             search_content=search_content,
             append_date_ranges=True,
         )
 
+        # items join (LIKE search) duplicates meta rows, grouping is needed only then,
+        # otherwise it would prevent using the updated_ts indexes for ORDER BY + LIMIT
+        group_statement = ""
+        if group_items:
+            group_statement = "GROUP BY m.id"
+
+        order_statement = "m.updated_ts DESC, m.id DESC"  # id as tiebreaker, stable keyset paging
+        if order_by == 'rank' and 'fts_query' in bind_params:
+            # title matches first, then best content matches
+            order_statement = """
+                CASE WHEN m.name LIKE :search_string THEN 0 ELSE 1 END,
+                f.fts_rank ASC,
+                m.updated_ts DESC
+            """
+
         # Build LIMIT/OFFSET only when limit > 0; LIMIT 0 would mean "no rows"
         if limit is not None and int(limit) > 0:
             limit_suffix = " LIMIT :limit"
@@ -180,10 +246,9 @@ class Storage:
                 {join_statement} 
             WHERE 
                 {where_statement}
-            GROUP BY 
-                m.id
+            {group_statement}
             ORDER BY 
-                m.updated_ts DESC {limit_suffix}
+                {order_statement} {limit_suffix}
         """
         stmt = text(stmt_text).bindparams(**bind_params)
 
@@ -807,7 +872,8 @@ class Storage:
                 is_internal,
                 docs_json,
                 audio_id,
-                audio_expires_ts
+                audio_expires_ts,
+                tokens_cache_json
             )
             VALUES 
             (
@@ -840,7 +906,8 @@ class Storage:
                 :is_internal,
                 :docs_json,
                 :audio_id,
-                :audio_expires_ts
+                :audio_expires_ts,
+                :tokens_cache_json
             )
         """).bindparams(
             meta_id=int(meta.id),
@@ -872,11 +939,13 @@ class Storage:
             is_internal=int(item.internal),
             docs_json=pack_item_value(item.doc_ids),
             audio_id=item.audio_id,
-            audio_expires_ts=int(item.audio_expires_ts or 0)
+            audio_expires_ts=int(item.audio_expires_ts or 0),
+            tokens_cache_json=pack_item_value(item.tokens_cache or {}),
         )
         with db.begin() as conn:
             result = conn.execute(stmt)
             item.id = result.lastrowid
+        item.tokens_cache_dirty = False
 
         return item.id
 
@@ -917,7 +986,8 @@ class Storage:
                 is_internal = :is_internal,
                 docs_json = :docs_json,
                 audio_id = :audio_id,
-                audio_expires_ts = :audio_expires_ts
+                audio_expires_ts = :audio_expires_ts,
+                tokens_cache_json = :tokens_cache_json
             WHERE id = :id
         """).bindparams(
             id=item.id,
@@ -948,10 +1018,37 @@ class Storage:
             is_internal=int(item.internal or 0),
             docs_json=pack_item_value(item.doc_ids),
             audio_id=item.audio_id,
-            audio_expires_ts=int(item.audio_expires_ts or 0)
+            audio_expires_ts=int(item.audio_expires_ts or 0),
+            tokens_cache_json=pack_item_value(item.tokens_cache or {}),
         )
         with db.begin() as conn:
             conn.execute(stmt)
+        item.tokens_cache_dirty = False
+        return True
+
+    def update_items_tokens_cache(self, items: List[CtxItem]) -> bool:
+        """
+        Update tokens cache of ctx items (in one transaction)
+
+        :param items: Context items (CtxItem)
+        :return: True if updated
+        """
+        params = [
+            {
+                "id": item.id,
+                "tokens_cache_json": pack_item_value(item.tokens_cache or {}),
+            } for item in items if item.id is not None
+        ]
+        if not params:
+            return False
+        db = self.window.core.db.get_db()
+        stmt = text("""
+            UPDATE ctx_item SET tokens_cache_json = :tokens_cache_json WHERE id = :id
+        """)
+        with db.begin() as conn:
+            conn.execute(stmt, params)
+        for item in items:
+            item.tokens_cache_dirty = False
         return True
 
     def get_ctx_count_by_day(
@@ -975,7 +1072,7 @@ class Storage:
         :return: dict with day as key and count as value
         """
         # prepare query with search filters
-        where_statement, join_statement, bind_params = self.prepare_query(
+        where_statement, join_statement, bind_params, _ = self.prepare_query(
             search_string=search_string,
             filters=filters,
             search_content=search_content,
@@ -1071,7 +1168,7 @@ class Storage:
         :return: dict with day as key and count as value
         """
         # prepare query with search filters
-        where_statement, join_statement, bind_params = self.prepare_query(
+        where_statement, join_statement, bind_params, _ = self.prepare_query(
             search_string=search_string,
             filters=filters,
             search_content=search_content,
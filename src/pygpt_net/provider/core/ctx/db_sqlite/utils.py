@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.23 15:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import json
@@ -66,6 +66,21 @@ def search_by_date_string(search_string: str) -> List[Tuple[Any, Any]]:
     return date_ranges
 
 
+def build_fts_query(search_string: str) -> str:
+    """
+    Build FTS5 MATCH query from search string (all terms required, prefix match on each term)
+
+    :param search_string: search string
+    :return: FTS5 query or empty string if no searchable terms
+    """
+    terms = []
+    for term in search_string.split():
+        if not re.search(r'\w', term):
+            continue  # punctuation only, nothing to match in the index
+        terms.append('"{}"*'.format(term.replace('"', '""')))
+    return " ".join(terms)
+
+
 def get_month_start_end_timestamps(year: int, month: int) -> Tuple[int, int]:
     """
     Get start and end timestamps for given month
@@ -165,6 +180,7 @@ def unpack_item(
     item.thread = row['thread_id']
     item.total_tokens = unpack_var(row['total_tokens'], 'int')
     item.urls = unpack_item_value(row['urls_json'])
+    item.tokens_cache = unpack_item_value(row.get('tokens_cache_json'))
 
     # set defaults
     if item.cmds is None:
@@ -173,6 +189,8 @@ def unpack_item(
         item.results = []
     if item.urls is None:
         item.urls = []
+    if not isinstance(item.tokens_cache, dict):
+        item.tokens_cache = {}
     if item.images is None:
         item.images = []
     if item.files is None:
@@ -6,9 +6,11 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2023.12.31 04:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
+from typing import List
+
 from pygpt_net.item.ctx import CtxItem
 
 
@@ -27,5 +29,11 @@ class BaseProvider:
     def append(self, ctx: CtxItem, mode: str):
         pass
 
+    def flush(self):
+        pass
+
+    def remove(self, items: List[CtxItem]):
+        pass
+
     def truncate(self):
         pass
@@ -6,11 +6,14 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.01.19 05:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import datetime
+import json
 import os
+import threading
+from typing import Dict, List, Optional, Tuple
 
 from pygpt_net.item.ctx import CtxItem
 from pygpt_net.provider.core.history.base import BaseProvider
@@ -18,12 +21,20 @@ from .patch import Patch
 
 
 class TxtFileProvider(BaseProvider):
+    FLUSH_INTERVAL = 2.0  # seconds
+    FLUSH_LINES = 50  # flush immediately if more lines buffered
+    INDEX_EXT = ".idx"  # sidecar index: {"<ctx id>:<mode>": [offset, length]}
+
     def __init__(self, window=None):
         super(TxtFileProvider, self).__init__(window)
         self.window = window
         self.patcher = Patch(window)
         self.id = "txt_file"
         self.type = "history"
+        self.buffer: Dict[str, List[Tuple[CtxItem, str, str]]] = {}  # filename -> [(ctx, mode, line)]
+        self.buffered = 0
+        self.timer = None
+        self.lock = threading.RLock()
 
     def install(self):
         """
@@ -35,7 +46,7 @@ class TxtFileProvider(BaseProvider):
 
     def append(self, ctx: CtxItem, mode: str):
         """
-        Append text to file
+        Append text to file (buffered, written on flush)
 
         :param ctx: CtxItem instance
         :param mode: mode (input | output)
@@ -56,32 +67,199 @@ class TxtFileProvider(BaseProvider):
         if ts is None:
             ts = datetime.datetime.now().timestamp()
 
-        path = self.window.core.config.get_user_dir('history')
-        name = datetime.datetime.fromtimestamp(ts).strftime("%Y_%m_%d") + ".txt"
+        name = self.get_filename(ts)
+        prefix = ""
+        if self.window.core.config.get('store_history_time'):
+            prefix = self.get_prefix(ts)
+
+        with self.lock:
+            # ctx id is resolved on flush, input is stored before ctx item is saved in db
+            self.buffer.setdefault(name, []).append((ctx, mode, prefix + text + "\n"))
+            self.buffered += 1
+            if self.buffered >= self.FLUSH_LINES:
+                self.flush()
+            elif self.timer is None:
+                self.timer = threading.Timer(self.FLUSH_INTERVAL, self.flush)
+                self.timer.daemon = True
+                self.timer.start()
+
+    def flush(self):
+        """Write buffered entries to files (one write per file)"""
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            buffer = self.buffer
+            self.buffer = {}
+            self.buffered = 0
+            if not buffer:
+                return
 
-        # check directory
+            path = self.window.core.config.get_user_dir('history')
+
+            # check directory
+            if not os.path.exists(path):
+                try:
+                    os.makedirs(path)
+                except Exception as e:
+                    self.window.core.debug.log(e)
+                    print("Error creating history directory: " + str(e))
+
+            if not os.path.exists(path):
+                return
+
+            use_index = self.is_index()
+            for name, entries in buffer.items():
+                f = os.path.join(path, name)
+                index = {}
+                try:
+                    with open(f, 'ab') as file:
+                        offset = file.tell()
+                        data = bytearray()
+                        for ctx, mode, line in entries:
+                            encoded = line.encode("utf-8")
+                            key = self.get_key(ctx, mode)
+                            if key is not None:
+                                index[key] = [offset + len(data), len(encoded)]
+                            data += encoded
+                        file.write(data)
+                except Exception as e:
+                    self.window.core.debug.log(e)
+                    print("Error appending to history: " + str(e))
+                    continue
+                if use_index and index:
+                    stored = self.load_index(f)
+                    stored.update(index)
+                    self.save_index(f, stored)
+
+    def remove(self, items: List[CtxItem]):
+        """
+        Remove ctx items from history (each day file is rewritten once)
+
+        :param items: list of ctx items to remove
+        """
+        self.flush()
+        path = self.window.core.config.get_user_dir('history')
         if not os.path.exists(path):
-            try:
-                os.makedirs(path)
-            except Exception as e:
-                self.window.core.debug.log(e)
-                print("Error creating history directory: " + str(e))
-
-        # append to file
-        if os.path.exists(path):
-            f = os.path.join(path, name)
-            try:
-                with open(f, 'a', encoding="utf-8") as file:
-                    prefix = ""
-                    if self.window.core.config.get('store_history_time'):
-                        prefix = datetime.datetime.fromtimestamp(ts).strftime("%H:%M:%S") + ": "
-                    file.write(prefix + text + "\n")
-            except Exception as e:
-                self.window.core.debug.log(e)
-                print("Error appending to history: " + str(e))
+            return
+
+        # group entries by day file
+        files: Dict[str, List[Tuple[Optional[str], str, str]]] = {}
+        for item in items:
+            for mode, text, ts in (
+                    ("input", item.input, item.input_timestamp),
+                    ("output", item.output, item.output_timestamp),
+            ):
+                if text is None or text.strip() == "" or ts is None:
+                    continue
+                files.setdefault(self.get_filename(ts), []).append(
+                    (self.get_key(item, mode), text, self.get_prefix(ts))
+                )
+
+        with self.lock:
+            for name, entries in files.items():
+                f = os.path.join(path, name)
+                if not os.path.exists(f):
+                    continue
+                try:
+                    self.remove_from_file(f, entries)
+                except Exception as e:
+                    self.window.core.debug.log(e)
+                    print("Error removing from history: " + str(e))
+
+    def remove_from_file(self, path: str, entries: List[Tuple[Optional[str], str, str]]):
+        """
+        Remove entries from day file
+
+        :param path: day file path
+        :param entries: list of (index key, text, time prefix)
+        """
+        with open(path, 'rb') as file:
+            data = file.read()
+        index = self.load_index(path)
+        ranges = []
+
+        for key, text, prefix in entries:
+            # 1) indexed: remove by offset if entry is still there
+            pos = index.pop(key, None) if key is not None else None
+            if pos is not None:
+                start, length = pos
+                chunk = data[start:start + length]
+                if chunk.endswith((text + "\n").encode("utf-8")) and (start == 0 or data[start - 1:start] == b"\n"):
+                    ranges.append((start, start + length))
+                    continue
+
+            # 2) not indexed (or file modified): find entry in file
+            for needle in ((prefix + text).strip() + "\n", text.strip() + "\n"):
+                found = self.find_all(data, needle.encode("utf-8"), ranges)
+                if found:
+                    ranges.extend(found)
+                    break
+
+        if not ranges:
+            return
+
+        ranges.sort()
+        parts = []
+        last = 0
+        for start, end in ranges:
+            if start >= last:
+                parts.append(data[last:start])
+                last = end
+        parts.append(data[last:])
+        content = b"".join(parts)
+
+        if content.strip() == b"":
+            os.remove(path)  # remove file if empty
+            self.remove_index(path)
+            return
+
+        with open(path, 'wb') as file:
+            file.write(content)
+
+        # shift offsets of remaining entries
+        if index:
+            shifted = {}
+            for key, (start, length) in index.items():
+                removed = 0
+                for r_start, r_end in ranges:
+                    if r_end <= start:
+                        removed += r_end - r_start
+                    elif r_start < start + length:
+                        removed = None  # overlaps removed entry
+                        break
+                if removed is not None:
+                    shifted[key] = [start - removed, length]
+            index = shifted
+        self.save_index(path, index)
+
+    def find_all(self, data: bytes, needle: bytes, ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """
+        Find all whole-line occurrences of entry in file data
+
+        :param data: file data
+        :param needle: entry line
+        :param ranges: already removed ranges
+        :return: list of (start, end) ranges
+        """
+        found = []
+        start = data.find(needle)
+        while start != -1:
+            end = start + len(needle)
+            if start == 0 or data[start - 1:start] == b"\n":
+                if not any(r_start < end and start < r_end for r_start, r_end in ranges):
+                    found.append((start, end))
+            start = data.find(needle, start + 1)
+        return found
 
     def truncate(self):
         """Delete all"""
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            self.buffer = {}
+            self.buffered = 0
         path = self.window.core.config.get_user_dir('history')
         try:
             if not os.path.exists(path):
@@ -90,3 +268,93 @@ class TxtFileProvider(BaseProvider):
                 os.remove(os.path.join(path, f))
         except Exception as e:
             self.window.core.debug.log(e)
+
+    def is_index(self) -> bool:
+        """
+        Check if sidecar offset index is enabled
+
+        :return: True if enabled
+        """
+        return bool(self.window.core.config.get('store_history_index', True))
+
+    def get_key(self, ctx: CtxItem, mode: str) -> Optional[str]:
+        """
+        Get index key of ctx item entry
+
+        :param ctx: CtxItem instance
+        :param mode: mode (input | output)
+        :return: index key or None if ctx item is not saved yet
+        """
+        if ctx.id is None:
+            return None
+        return f"{ctx.id}:{mode}"
+
+    def get_filename(self, ts: float) -> str:
+        """
+        Get day file name
+
+        :param ts: timestamp
+        :return: file name
+        """
+        return datetime.datetime.fromtimestamp(ts).strftime("%Y_%m_%d") + ".txt"
+
+    def get_prefix(self, ts: float) -> str:
+        """
+        Get entry time prefix
+
+        :param ts: timestamp
+        :return: time prefix
+        """
+        return datetime.datetime.fromtimestamp(ts).strftime("%H:%M:%S") + ": "
+
+    def get_index_path(self, path: str) -> str:
+        """
+        Get sidecar index path
+
+        :param path: day file path
+        :return: index file path
+        """
+        return os.path.splitext(path)[0] + self.INDEX_EXT
+
+    def load_index(self, path: str) -> Dict[str, List[int]]:
+        """
+        Load sidecar index of day file
+
+        :param path: day file path
+        :return: index dict
+        """
+        index_path = self.get_index_path(path)
+        if not os.path.exists(index_path):
+            return {}
+        try:
+            with open(index_path, 'r', encoding="utf-8") as file:
+                data = json.load(file)
+            return data if isinstance(data, dict) else {}
+        except Exception:
+            return {}  # broken index, entries will be found by text
+
+    def save_index(self, path: str, index: Dict[str, List[int]]):
+        """
+        Save sidecar index of day file
+
+        :param path: day file path
+        :param index: index dict
+        """
+        if not index:
+            self.remove_index(path)
+            return
+        try:
+            with open(self.get_index_path(path), 'w', encoding="utf-8") as file:
+                json.dump(index, file)
+        except Exception as e:
+            self.window.core.debug.log(e)
+
+    def remove_index(self, path: str):
+        """
+        Remove sidecar index of day file
+
+        :param path: day file path
+        """
+        index_path = self.get_index_path(path)
+        if os.path.exists(index_path):
+            os.remove(index_path)
@@ -6,10 +6,10 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 
 from packaging.version import Version
 
@@ -66,7 +66,8 @@ class BaseProvider:
             self,
             id: int,
             doc_id: str,
-            ts: int
+            ts: int,
+            state: Optional[Dict[str, Any]] = None
     ) -> bool:
         pass
 
@@ -206,3 +207,30 @@ class BaseProvider:
 
     def get_version(self) -> str:
         pass
+
+    def get_embeddings(
+            self,
+            model: str,
+            hashes: List[str]
+    ) -> Dict[str, bytes]:
+        pass
+
+    def append_embeddings(
+            self,
+            model: str,
+            items: Dict[str, bytes]
+    ) -> bool:
+        pass
+
+    def truncate_embeddings(
+            self,
+            model: Optional[str] = None
+    ) -> bool:
+        pass
+
+    def evict_embeddings(
+            self,
+            max_items: int = 0,
+            min_ts: int = 0
+    ) -> int:
+        pass
@@ -6,10 +6,10 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 
 from packaging.version import Version
 
@@ -211,7 +211,8 @@ class DbSqliteProvider(BaseProvider):
             self,
             id: int,
             doc_id: str,
-            ts: int
+            ts: int,
+            state: Optional[Dict[str, Any]] = None
     ) -> bool:
         """
         Update indexed timestamp of indexed file
@@ -219,8 +220,9 @@ class DbSqliteProvider(BaseProvider):
         :param: id: db record ID
         :param: doc_id: document ID
         :param: ts: timestamp
+        :param: state: file state (size, mtime, hash)
         """
-        return self.storage.update_file(id, doc_id, ts)
+        return self.storage.update_file(id, doc_id, ts, state)
 
     def update_ctx_meta(
             self,
@@ -378,3 +380,57 @@ class DbSqliteProvider(BaseProvider):
         :return: dict of counters
         """
         return self.storage.get_counters(type)
+
+    def get_embeddings(
+            self,
+            model: str,
+            hashes: List[str]
+    ) -> Dict[str, bytes]:
+        """
+        Get cached embeddings
+
+        :param model: embedding model key
+        :param hashes: list of content hashes
+        :return: dict of hash -> packed vector
+        """
+        return self.storage.get_embeddings(model, hashes)
+
+    def append_embeddings(
+            self,
+            model: str,
+            items: Dict[str, bytes]
+    ) -> bool:
+        """
+        Append embeddings to cache
+
+        :param model: embedding model key
+        :param items: dict of hash -> packed vector
+        :return: True if appended
+        """
+        return self.storage.insert_embeddings(model, items)
+
+    def truncate_embeddings(
+            self,
+            model: Optional[str] = None
+    ) -> bool:
+        """
+        Truncate embeddings cache
+
+        :param model: embedding model key (all models if None)
+        :return: True if truncated
+        """
+        return self.storage.truncate_embeddings(model)
+
+    def evict_embeddings(
+            self,
+            max_items: int = 0,
+            min_ts: int = 0
+    ) -> int:
+        """
+        Remove oldest embeddings from cache
+
+        :param max_items: max number of cached vectors (0 = no limit)
+        :param min_ts: remove vectors created before this timestamp (0 = no limit)
+        :return: number of removed vectors
+        """
+        return self.storage.evict_embeddings(max_items, min_ts)
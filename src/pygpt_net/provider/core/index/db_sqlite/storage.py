@@ -6,12 +6,12 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import uuid
 import time
-from typing import Dict, Optional
+from typing import Dict, Optional, List
 
 from sqlalchemy import text
 from traitlets import Any
@@ -95,7 +95,10 @@ class Storage:
                 name,
                 path,
                 store,
-                idx
+                idx,
+                size,
+                mtime,
+                hash
             )
             VALUES 
             (
@@ -106,7 +109,10 @@ class Storage:
                 :name,
                 :path,
                 :store,
-                :idx
+                :idx,
+                :size,
+                :mtime,
+                :hash
             )
         """).bindparams(
             uuid=str(uuid.uuid4()),
@@ -117,6 +123,9 @@ class Storage:
             path=data['path'],
             store=store_id,
             idx=idx,
+            size=int(data.get("size", 0)),
+            mtime=int(data.get("mtime", 0)),
+            hash=data.get("hash", ""),
         )
         with db.begin() as conn:
             result = conn.execute(stmt)
@@ -436,7 +445,8 @@ class Storage:
             self,
             id: int,
             doc_id: str,
-            ts: int
+            ts: int,
+            state: Optional[Dict[str, Any]] = None
     ) -> bool:
         """
         Update timestamp of file in index
@@ -444,19 +454,39 @@ class Storage:
         :param id: db record ID
         :param doc_id: document ID
         :param ts: timestamp
+        :param state: file state (size, mtime, hash)
         """
         db = self.window.core.db.get_db()
-        stmt = text("""
-            UPDATE idx_file
-            SET 
-            updated_ts = :updated_ts,
-            doc_id = :doc_id
-            WHERE id = :id
-        """).bindparams(
-            id=id,
-            doc_id=doc_id,
-            updated_ts=ts,
-        )
+        if state:
+            stmt = text("""
+                UPDATE idx_file
+                SET 
+                updated_ts = :updated_ts,
+                doc_id = :doc_id,
+                size = :size,
+                mtime = :mtime,
+                hash = :hash
+                WHERE id = :id
+            """).bindparams(
+                id=id,
+                doc_id=doc_id,
+                updated_ts=ts,
+                size=int(state.get("size", 0)),
+                mtime=int(state.get("mtime", 0)),
+                hash=state.get("hash", ""),
+            )
+        else:
+            stmt = text("""
+                UPDATE idx_file
+                SET 
+                updated_ts = :updated_ts,
+                doc_id = :doc_id
+                WHERE id = :id
+            """).bindparams(
+                id=id,
+                doc_id=doc_id,
+                updated_ts=ts,
+            )
         with db.begin() as conn:
             conn.execute(stmt)
         return True
@@ -678,6 +708,111 @@ class Storage:
                 text(query).bindparams(**params))
         return True
 
+    def get_embeddings(
+            self,
+            model: str,
+            hashes: List[str]
+    ) -> Dict[str, bytes]:
+        """
+        Get cached embeddings by content hashes
+
+        :param model: embedding model key
+        :param hashes: list of content hashes
+        :return: dict of hash -> packed vector
+        """
+        db = self.window.core.db.get_db()
+        items = {}
+        unique = list(dict.fromkeys(hashes))
+        chunk = 500  # SQLite variables limit
+        with db.connect() as conn:
+            for i in range(0, len(unique), chunk):
+                part = unique[i:i + chunk]
+                params = {"model": model}
+                keys = []
+                for j, hash in enumerate(part):
+                    params["h" + str(j)] = hash
+                    keys.append(":h" + str(j))
+                stmt = text(
+                    "SELECT hash, vector FROM idx_embedding WHERE model = :model AND hash IN (" + ", ".join(keys) + ")"
+                ).bindparams(**params)
+                for row in conn.execute(stmt):
+                    items[row.hash] = row.vector
+        return items
+
+    def insert_embeddings(
+            self,
+            model: str,
+            items: Dict[str, bytes]
+    ) -> bool:
+        """
+        Insert embeddings to cache
+
+        :param model: embedding model key
+        :param items: dict of hash -> packed vector
+        :return: True if inserted
+        """
+        if not items:
+            return False
+        db = self.window.core.db.get_db()
+        ts = int(time.time())
+        stmt = text("""
+            INSERT OR REPLACE INTO idx_embedding (model, hash, vector, created_ts)
+            VALUES (:model, :hash, :vector, :created_ts)
+        """)
+        with db.begin() as conn:
+            conn.execute(stmt, [
+                {"model": model, "hash": hash, "vector": vector, "created_ts": ts}
+                for hash, vector in items.items()
+            ])
+        return True
+
+    def truncate_embeddings(self, model: Optional[str] = None) -> bool:
+        """
+        Truncate embeddings cache
+
+        :param model: embedding model key (all models if None)
+        :return: True if truncated
+        """
+        db = self.window.core.db.get_db()
+        with db.begin() as conn:
+            if model:
+                conn.execute(text("DELETE FROM idx_embedding WHERE model = :model").bindparams(model=model))
+            else:
+                conn.execute(text("DELETE FROM idx_embedding"))
+        return True
+
+    def evict_embeddings(
+            self,
+            max_items: int = 0,
+            min_ts: int = 0
+    ) -> int:
+        """
+        Remove expired and oldest embeddings above limit
+
+        :param max_items: max number of cached vectors (0 = no limit)
+        :param min_ts: remove vectors created before this timestamp (0 = no limit)
+        :return: number of removed vectors
+        """
+        db = self.window.core.db.get_db()
+        removed = 0
+        with db.begin() as conn:
+            if min_ts > 0:
+                stmt = text("DELETE FROM idx_embedding WHERE created_ts < :ts").bindparams(ts=min_ts)
+                removed += conn.execute(stmt).rowcount
+            if max_items > 0:
+                count = conn.execute(text("SELECT COUNT(*) FROM idx_embedding")).scalar()
+                if count > max_items:
+                    stmt = text("""
+                        DELETE FROM idx_embedding
+                        WHERE (model, hash) IN (
+                            SELECT model, hash FROM idx_embedding
+                            ORDER BY created_ts ASC
+                            LIMIT :limit
+                        )
+                    """).bindparams(limit=count - max_items)
+                    removed += conn.execute(stmt).rowcount
+        return removed
+
     def get_counters(
             self,
             type: str
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from typing import Tuple, Dict, Any
@@ -28,4 +28,7 @@ def unpack_file_item(row: Dict[str, Any]) -> Tuple[str, dict]:
     data["name"] = row['name']
     data["path"] = row['path']
     data["indexed_ts"] = unpack_var(row['updated_ts'], 'int')
+    data["size"] = unpack_var(row.get('size', 0), 'int')
+    data["mtime"] = unpack_var(row.get('mtime', 0), 'int')
+    data["hash"] = row.get('hash') or ""
     return idx, data
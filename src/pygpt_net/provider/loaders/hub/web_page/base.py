@@ -1,7 +1,8 @@
 """Read Webpages"""
 
-
+import uuid
 from typing import List
+from urllib.parse import urlparse
 
 from llama_index.core.readers.base import BaseReader
 from llama_index.core.schema import Document
@@ -10,6 +11,12 @@ from llama_index.core.schema import Document
 class WebPage(BaseReader):
     """Webpage base reader."""
 
+    def __init__(self, cache=None):
+        """
+        :param cache: web page cache (optional)
+        """
+        self.cache = cache
+
     def load_data(self, **kwargs) -> List[Document]:
         """
         Read URL and return documents.
@@ -20,4 +27,32 @@ class WebPage(BaseReader):
         from llama_index.readers.web import BeautifulSoupWebReader
 
         url = kwargs.get("url")
-        return BeautifulSoupWebReader().load_data([url])
+        reader = BeautifulSoupWebReader()
+        if self.cache is None:
+            return reader.load_data([url])
+        return [self.load_cached(reader, url)]
+
+    def load_cached(self, reader, url: str) -> Document:
+        """
+        Read URL using web page cache
+
+        :param reader: BeautifulSoupWebReader instance (for site extractors)
+        :param url: URL
+        :return: document
+        """
+        from bs4 import BeautifulSoup
+
+        try:
+            content = self.cache.get_page(url)
+        except Exception:
+            raise ValueError(f"One of the inputs is not a valid url: {url}")
+        soup = BeautifulSoup(content, "html.parser")
+        hostname = urlparse(url).hostname or ""
+        extra_info = {"URL": url}
+        extractor = getattr(reader, "_website_extractor", {}).get(hostname)
+        if extractor is not None:
+            data, metadata = extractor(soup=soup, url=url, include_url_in_text=True)
+            extra_info.update(metadata)
+        else:
+            data = soup.getText()
+        return Document(text=data, id_=str(uuid.uuid4()), extra_info=extra_info)
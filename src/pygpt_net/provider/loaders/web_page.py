@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.06 01:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from llama_index.core.readers.base import BaseReader
@@ -42,7 +42,10 @@ class Loader(BaseLoader):
         :return: Data reader instance
         """
         from .hub.web_page.base import WebPage
-        return WebPage()
+        cache = None
+        if self.window is not None:
+            cache = self.window.core.web.cache  # shared web page cache
+        return WebPage(cache=cache)
 
     def prepare_args(self, **kwargs) -> dict:
         """
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.01.16 01:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import hashlib
@@ -129,6 +129,29 @@ class Storage:
             embed_model=embed_model,
         )
 
+    def get_for_update(
+            self,
+            id: str,
+            llm: Optional = None,
+            embed_model: Optional = None,
+    ) -> BaseIndex:
+        """
+        Get index instance to modify (not shared with readers until stored)
+
+        :param id: index name
+        :param llm: LLM instance
+        :param embed_model: Embedding model instance
+        :return: index instance
+        """
+        storage = self.get_storage()
+        if storage is None:
+            raise Exception('Storage engine not found!')
+        return storage.get_for_update(
+            id=id,
+            llm=llm,
+            embed_model=embed_model,
+        )
+
     def store(
             self,
             id: str,
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.01.16 01:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import os
@@ -126,6 +126,26 @@ class BaseStore:
         """
         pass
 
+    def get_for_update(
+            self,
+            id: str,
+            llm: Optional = None,
+            embed_model: Optional = None,
+    ) -> BaseIndex:
+        """
+        Get index instance to modify (indexing, removing documents)
+
+        :param id: index name
+        :param llm: LLM instance
+        :param embed_model: Embedding model instance
+        :return: index instance
+        """
+        return self.get(
+            id=id,
+            llm=llm,
+            embed_model=embed_model,
+        )
+
     def store(
             self,
             id: str,
@@ -180,7 +200,7 @@ class BaseStore:
         :param doc_id: document ID
         :return: True if success
         """
-        index = self.get(id)
+        index = self.get_for_update(id)
         index.delete_ref_doc(doc_id)
         self.store(
             id=id,
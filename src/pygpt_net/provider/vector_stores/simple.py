@@ -6,17 +6,30 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.01.16 01:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
+import glob
+import json
 import os.path
-from typing import Optional
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import numpy as np
 
 from llama_index.core import StorageContext, load_index_from_storage
 from llama_index.core.indices.base import BaseIndex
+from llama_index.core.graph_stores.types import DEFAULT_PERSIST_FNAME as GRAPH_STORE_FNAME
+from llama_index.core.storage.docstore.types import DEFAULT_PERSIST_FNAME as DOCSTORE_FNAME
+from llama_index.core.storage.index_store.types import DEFAULT_PERSIST_FNAME as INDEX_STORE_FNAME
+from llama_index.core.vector_stores.simple import SimpleVectorStore, SimpleVectorStoreData
 
 from .base import BaseStore
 
+VECTOR_STORE_JSON = "__vector_store.json"
+VECTOR_STORE_NPZ = "__vector_store.npz"
+
 
 class SimpleProvider(BaseStore):
     def __init__(self, *args, **kwargs):
@@ -30,7 +43,9 @@ class SimpleProvider(BaseStore):
         self.window = kwargs.get('window', None)
         self.id = "SimpleVectorStore"
         self.prefix = ""  # prefix for index directory
-        self.indexes = {}
+        self.indexes = OrderedDict()  # loaded indexes, LRU order
+        self.signatures = {}  # index id -> (embed model key, files signature)
+        self.lock = threading.RLock()  # guards loaded indexes cache
 
     def create(
             self,
@@ -57,7 +72,7 @@ class SimpleProvider(BaseStore):
             embed_model: Optional = None,
     ) -> BaseIndex:
         """
-        Get index
+        Get index for reading (from memory if not modified on disk since last load/store)
 
         :param id: index name
         :param llm: LLM instance
@@ -67,15 +82,62 @@ class SimpleProvider(BaseStore):
         if not self.exists(id):
             self.create(id, embed_model)
         path = self.get_path(id)
-        storage_context = StorageContext.from_defaults(
-            persist_dir=path,
-        )
-        self.indexes[id] = load_index_from_storage(
-            storage_context,
+        signature = self.get_signature(path)
+        embed_key = self.get_embed_key(embed_model)
+
+        # use cached index if files not changed and embedding model is the same
+        with self.lock:
+            index = self.indexes.get(id)
+            if index is not None and id in self.signatures:
+                cached_key, cached_signature = self.signatures[id]
+                if cached_signature == signature and (embed_model is None or cached_key == embed_key):
+                    self.indexes.move_to_end(id)
+                    return index
+
+        index = self.load(path, llm, embed_model)
+        self.cache(id, index, embed_key, signature)
+        return index
+
+    def get_for_update(
+            self,
+            id: str,
+            llm: Optional = None,
+            embed_model: Optional = None,
+    ) -> BaseIndex:
+        """
+        Get index to modify, loaded from disk and not shared with readers
+
+        Modified index is cached only after store(), so unsaved or failed
+        changes are never returned by get().
+
+        :param id: index name
+        :param llm: LLM instance
+        :param embed_model: Embedding model instance
+        :return: index instance
+        """
+        if not self.exists(id):
+            self.create(id, embed_model)
+        return self.load(self.get_path(id), llm, embed_model)
+
+    def load(
+            self,
+            path: str,
+            llm: Optional = None,
+            embed_model: Optional = None,
+    ) -> BaseIndex:
+        """
+        Load index from disk
+
+        :param path: index directory
+        :param llm: LLM instance
+        :param embed_model: Embedding model instance
+        :return: index instance
+        """
+        return load_index_from_storage(
+            self.get_storage_context(path),
             llm=llm,
             embed_model=embed_model,
         )
-        return self.indexes[id]
 
     def store(
             self,
@@ -89,9 +151,191 @@ class SimpleProvider(BaseStore):
         :param index: index instance
         """
         if index is None:
-            index = self.indexes[id]
+            with self.lock:
+                index = self.indexes[id]
         path = self.get_path(id)
-        index.storage_context.persist(
+        if self.is_binary():
+            self.persist(index.storage_context, path)
+        else:
+            index.storage_context.persist(
+                persist_dir=path,
+            )
+            for file in glob.glob(os.path.join(path, "*" + VECTOR_STORE_NPZ)):
+                os.remove(file)  # remove outdated binary vectors
+        self.cache(id, index, self.get_embed_key(getattr(index, "_embed_model", None)), self.get_signature(path))
+
+    def remove(
+            self,
+            id: str
+    ) -> bool:
+        """
+        Clear index
+
+        :param id: index name
+        :return: True if success
+        """
+        with self.lock:
+            self.indexes.pop(id, None)
+            self.signatures.pop(id, None)
+        return super(SimpleProvider, self).remove(id)
+
+    def cache(
+            self,
+            id: str,
+            index: BaseIndex,
+            embed_key: str,
+            signature: Tuple[int, int]
+    ):
+        """
+        Keep index in memory, evict least recently used indexes
+
+        :param id: index name
+        :param index: index instance
+        :param embed_key: embedding model key
+        :param signature: files signature
+        """
+        limit = int(self.window.core.config.get("llama.idx.storage.cache", 3) or 0)
+        with self.lock:
+            self.indexes[id] = index
+            self.indexes.move_to_end(id)
+            self.signatures[id] = (embed_key, signature)
+            while len(self.indexes) > max(1, limit):
+                evicted, _ = self.indexes.popitem(last=False)
+                self.signatures.pop(evicted, None)
+            if limit <= 0:
+                self.signatures.pop(id, None)  # cache disabled, always reload on next get
+
+    def is_binary(self) -> bool:
+        """
+        Check if vectors should be persisted in binary (NumPy) format
+
+        :return: True if binary format enabled
+        """
+        return self.window.core.config.get("llama.idx.storage.simple.format", "numpy") == "numpy"
+
+    def get_embed_key(self, embed_model: Optional = None) -> str:
+        """
+        Get embedding model key
+
+        :param embed_model: Embedding model instance
+        :return: key (class name + model name)
+        """
+        if embed_model is None:
+            return ""
+        return embed_model.__class__.__name__ + ":" + str(getattr(embed_model, "model_name", ""))
+
+    def get_signature(self, path: str) -> Tuple[int, int]:
+        """
+        Get signature of index files on disk
+
+        :param path: index directory
+        :return: latest mtime (ns), total size
+        """
+        mtime = 0
+        size = 0
+        if os.path.isdir(path):
+            for entry in os.scandir(path):
+                if entry.is_file():
+                    stat = entry.stat()
+                    mtime = max(mtime, stat.st_mtime_ns)
+                    size += stat.st_size
+        return mtime, size
+
+    def get_storage_context(self, path: str) -> StorageContext:
+        """
+        Get storage context from persist directory (binary vectors are used if exist)
+
+        :param path: index directory
+        :return: storage context
+        """
+        vector_stores = {}
+        for file in glob.glob(os.path.join(path, "*" + VECTOR_STORE_NPZ)):
+            namespace = os.path.basename(file)[:-len(VECTOR_STORE_NPZ)]
+            vector_stores[namespace] = self.load_vectors(file)
+        if vector_stores:
+            # namespaces stored as JSON (e.g. mixed dimensions) are loaded together with binary ones
+            for file in glob.glob(os.path.join(path, "*" + VECTOR_STORE_JSON)):
+                namespace = os.path.basename(file)[:-len(VECTOR_STORE_JSON)]
+                if namespace not in vector_stores:
+                    vector_stores[namespace] = SimpleVectorStore.from_persist_path(file)
+            return StorageContext.from_defaults(
+                persist_dir=path,
+                vector_stores=vector_stores,
+            )
+        return StorageContext.from_defaults(
             persist_dir=path,
         )
-        self.indexes[id] = index
+
+    def persist(
+            self,
+            storage_context: StorageContext,
+            path: str
+    ):
+        """
+        Persist storage context, with vectors stored as NumPy arrays
+
+        :param storage_context: storage context
+        :param path: index directory
+        """
+        os.makedirs(path, exist_ok=True)
+        storage_context.docstore.persist(persist_path=os.path.join(path, DOCSTORE_FNAME))
+        storage_context.index_store.persist(persist_path=os.path.join(path, INDEX_STORE_FNAME))
+        storage_context.graph_store.persist(persist_path=os.path.join(path, GRAPH_STORE_FNAME))
+        for namespace, vector_store in storage_context.vector_stores.items():
+            json_path = os.path.join(path, namespace + VECTOR_STORE_JSON)
+            if isinstance(vector_store, SimpleVectorStore) and self.save_vectors(
+                    vector_store.data,
+                    os.path.join(path, namespace + VECTOR_STORE_NPZ),
+            ):
+                if os.path.exists(json_path):
+                    os.remove(json_path)  # replaced by binary file
+            else:
+                vector_store.persist(persist_path=json_path)
+
+    def save_vectors(
+            self,
+            data: SimpleVectorStoreData,
+            path: str
+    ) -> bool:
+        """
+        Save vectors to .npz file (float32 matrix + ids + metadata)
+
+        :param data: vector store data
+        :param path: path to .npz file
+        :return: True if saved, False if vectors cannot be stored as matrix
+        """
+        ids = list(data.embedding_dict.keys())
+        if ids:
+            dims = {len(data.embedding_dict[i]) for i in ids}
+            if len(dims) != 1:
+                return False  # mixed dimensions, use JSON
+            vectors = np.asarray([data.embedding_dict[i] for i in ids], dtype=np.float32)
+        else:
+            vectors = np.zeros((0, 0), dtype=np.float32)
+        meta = json.dumps({
+            "text_id_to_ref_doc_id": data.text_id_to_ref_doc_id,
+            "metadata_dict": data.metadata_dict,
+        })
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, ids=np.asarray(ids, dtype=str), vectors=vectors, meta=np.asarray(meta))
+        os.replace(tmp_path, path)
+        return True
+
+    def load_vectors(self, path: str) -> SimpleVectorStore:
+        """
+        Load vector store from .npz file
+
+        :param path: path to .npz file
+        :return: vector store instance
+        """
+        with np.load(path, allow_pickle=False) as f:
+            ids = f["ids"].tolist()
+            vectors = f["vectors"].tolist()
+            meta = json.loads(str(f["meta"]))
+        data = SimpleVectorStoreData(
+            embedding_dict=dict(zip(ids, vectors)),
+            text_id_to_ref_doc_id=meta.get("text_id_to_ref_doc_id", {}),
+            metadata_dict=meta.get("metadata_dict", {}),
+        )
+        return SimpleVectorStore(data=data)
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.07.17 01:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from typing import Dict, Optional
@@ -68,6 +68,20 @@ class Tools:
         """Post-setup, after plugins are loaded"""
         for id in self.tools:
             self.tools[id].post_setup()
+        self.setup_schedule()
+
+    def setup_schedule(self):
+        """Register periodic update hooks only if any tool implements them"""
+        scheduler = self.window.core.scheduler
+        for name, hook, interval, fn in (
+                ("tools.update", "on_update", 0.03, self.on_update),
+                ("tools.post_update", "on_post_update", 1.0, self.on_post_update),
+        ):
+            base = getattr(BaseTool, hook)
+            if any(getattr(type(tool), hook, base) is not base for tool in self.tools.values()):
+                scheduler.call_every(interval, fn, name=name)
+            else:
+                scheduler.remove(name)
 
     def on_update(self):
         """On app main loop update"""
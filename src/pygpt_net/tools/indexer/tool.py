@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.16 01:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import datetime
@@ -353,6 +353,27 @@ class IndexerTool(BaseTool):
         """Truncate index"""
         self.window.controller.idx.indexer.clear(self.current_idx)
 
+    def clear_embeddings(self, force: bool = False):
+        """
+        Clear embeddings cache (vectors of indexed chunks stored in database)
+
+        :param force: force clear
+        """
+        if not force:
+            self.window.ui.dialogs.confirm(
+                type="idx.embeddings.clear",
+                id=0,
+                msg=trans("tool.indexer.confirm.embeddings.clear"),
+            )
+            return
+        try:
+            self.window.core.idx.embeddings.truncate()
+            self.log(trans("tool.indexer.status.embeddings.clear"))
+            self.window.update_status(trans("tool.indexer.status.embeddings.clear"))
+        except Exception as e:
+            self.window.core.debug.log(e)
+            self.window.update_status(e)
+
     def delete_db_idx(self, id: int, force: bool = False):
         """
         Delete index from database
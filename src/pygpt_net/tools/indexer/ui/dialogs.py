@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.22 17:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from PySide6.QtCore import Qt
@@ -63,6 +63,14 @@ class DialogBuilder:
             lambda: self.window.tools.get("indexer").truncate_idx()
         )
 
+        self.actions["file.clear_embeddings"] = QAction(
+            QIcon(":/icons/delete.svg"),
+            trans("tool.indexer.menu.file.clear_embeddings"),
+        )
+        self.actions["file.clear_embeddings"].triggered.connect(
+            lambda: self.window.tools.get("indexer").clear_embeddings()
+        )
+
         self.actions["config.settings"] = QAction(QIcon(":/icons/settings.svg"), trans("tool.indexer.menu.config.settings"))
         self.actions["config.settings"].triggered.connect(
             lambda: self.window.tools.get("indexer").open_settings()
@@ -71,6 +79,7 @@ class DialogBuilder:
         # add actions
         self.menu["file"].addAction(self.actions["file.clear_log"])
         self.menu["file"].addAction(self.actions["file.truncate_idx"])
+        self.menu["file"].addAction(self.actions["file.clear_embeddings"])
         self.menu["config"].addAction(self.actions["config.settings"])
         return self.menu_bar
 
@@ -6,11 +6,13 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.03 17:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
+import functools
+
 from PySide6 import QtCore
-from PySide6.QtGui import QStandardItemModel, QIcon
+from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QVBoxLayout, QWidget
 from datetime import datetime, timedelta
 
@@ -18,7 +20,7 @@ from pygpt_net.item.ctx import CtxMeta
 from pygpt_net.ui.layout.ctx.search_input import SearchInput
 from pygpt_net.ui.widget.element.button import NewCtxButton
 from pygpt_net.ui.widget.element.labels import TitleLabel
-from pygpt_net.ui.widget.lists.context import ContextList, Item, GroupItem, SectionItem
+from pygpt_net.ui.widget.lists.context import ContextList, CtxListModel, Item, GroupItem, SectionItem
 from pygpt_net.utils import trans
 
 
@@ -97,18 +99,18 @@ class CtxList:
 
         return widget
 
-    def create_model(self, parent) -> QStandardItemModel:
+    def create_model(self, parent) -> CtxListModel:
         """
         Create model
 
         :param parent: parent widget
-        :return: QStandardItemModel
+        :return: CtxListModel
         """
-        return QStandardItemModel(0, 1, parent)
+        return CtxListModel(self.window, parent)
 
     def update(self, id, data, expand: bool = True):
         """
-        Update ctx list
+        Update ctx list (applies changes to existing rows, does not rebuild the model)
 
         :param id: ID of the list
         :param data: Data to update
@@ -122,17 +124,15 @@ class CtxList:
 
         model = self.window.ui.models.get(id)
         if model is not None:
+            if self.window.core.config.get("ctx.records.folders.top"):
+                rows = self.get_rows_pinned(data) + self.get_rows_groups(data) + self.get_rows_items(data)
+            else:
+                rows = self.get_rows_pinned(data) + self.get_rows_items(data) + self.get_rows_groups(data)
+
             node.setUpdatesEnabled(False)
             try:
-                model.clear()
-                if self.window.core.config.get("ctx.records.folders.top"):
-                    self.update_items_pinned(id, data)
-                    self.update_groups(id, data, expand=expand)
-                    self.update_items(id, data)
-                else:
-                    self.update_items_pinned(id, data)
-                    self.update_items(id, data)
-                    self.update_groups(id, data, expand=expand)
+                model.sync(rows)
+                self.update_groups_state(id)
 
                 # APPLY PENDING SCROLL BEFORE RE-ENABLING UPDATES (prevents top flicker)
                 try:
@@ -143,125 +143,56 @@ class CtxList:
             finally:
                 node.setUpdatesEnabled(True)
 
-    def _find_first_group_row(self, model) -> int:
-        """Find the row index of the first GroupItem; return -1 if none."""
-        for r in range(model.rowCount()):
-            it = model.item(r)
-            if isinstance(it, GroupItem):
-                return r
-        return -1
-
-    def append_unpaginated(self, id: str, data: dict, add_ids: list[int]):
+    def get_rows_items(self, data: dict) -> list:
         """
-        Append more ungrouped and not pinned items without rebuilding the model.
-        Keeps scroll position perfectly stable.
-        """
-        if not add_ids:
-            return
-        node = self.window.ui.nodes[id]
-        model = self.window.ui.models[id]
+        Get rows of ungrouped items
 
-        folders_top = bool(self.window.core.config.get("ctx.records.folders.top"))
-        # decide insertion point: at the end, or just before the first group row
-        insert_pos = model.rowCount()
-        if not folders_top:
-            grp_idx = self._find_first_group_row(model)
-            insert_pos = grp_idx if grp_idx >= 0 else model.rowCount()
-
-        # find last dt of existing ungrouped area before insertion point (for date sections)
-        last_dt_str = None
-        for r in range(insert_pos - 1, -1, -1):
-            it = model.item(r)
-            if isinstance(it, Item):
-                data_role = it.data(QtCore.Qt.ItemDataRole.UserRole) or {}
-                if not data_role.get("in_group", False) and not data_role.get("is_important", False):
-                    last_dt_str = getattr(it, "dt", None)
-                    break
-            elif isinstance(it, GroupItem):
-                break  # hit groups boundary going upwards
-            else:
-                # SectionItem or others – skip
-                continue
-
-        node.setUpdatesEnabled(False)
-        try:
-            # append strictly in the order provided by add_ids (older first)
-            for mid in add_ids:
-                meta = data.get(mid)
-                if meta is None:
-                    continue
-                item = self.build_item(mid, meta, is_group=False)
-
-                # Optional date sections (same logic as in update_items)
-                if self._group_separators and (not item.isPinned or self._pinned_separators):
-                    if last_dt_str is None or last_dt_str != item.dt:
-                        section = self.build_date_section(item.dt, group=False)
-                        if section:
-                            model.insertRow(insert_pos, section)
-                            insert_pos += 1
-                        last_dt_str = item.dt
-
-                model.insertRow(insert_pos, item)
-                insert_pos += 1
-        finally:
-            node.setUpdatesEnabled(True)
-
-    def update_items(self, id, data):
-        """
-        Update items
-
-        :param id: ID of the list
         :param data: Data to update
+        :return: list of row specs
         """
-        i = 0
+        rows = []
+        sections = {}
         last_dt_str = None
-        model = self.window.ui.models[id]
         for meta_id, meta in data.items():
             gid = meta.group_id
             if (gid is None or gid == 0) and not meta.important:
-                item = self.build_item(meta_id, meta, is_group=False)
-                if self._group_separators and (not item.isPinned or self._pinned_separators):
-                    if i == 0 or last_dt_str != item.dt:
-                        section = self.build_date_section(item.dt, group=False)
-                        if section:
-                            model.appendRow(section)
-                    last_dt_str = item.dt
-                model.appendRow(item)
-                i += 1
-
-    def update_items_pinned(self, id, data):
+                fields = self.get_item_fields(meta_id, meta, is_group=False)
+                if self._group_separators and (not fields["pinned"] or self._pinned_separators):
+                    if not rows or last_dt_str != fields["dt"]:
+                        rows.append(self.get_section_row("items", fields["dt"], sections, group=False))
+                    last_dt_str = fields["dt"]
+                rows.append(self.get_item_row(fields))
+        return rows
+
+    def get_rows_pinned(self, data: dict) -> list:
         """
-        Update items pinned
+        Get rows of pinned items
 
-        :param id: ID of the list
         :param data: Data to update
+        :return: list of row specs
         """
-        i = 0
+        rows = []
+        sections = {}
         last_dt_str = None
-        model = self.window.ui.models[id]
-
         for meta_id, meta in data.items():
             gid = meta.group_id
             if (gid is None or gid == 0) and meta.important:
-                item = self.build_item(meta_id, meta, is_group=False)
+                fields = self.get_item_fields(meta_id, meta, is_group=False)
                 if self._group_separators and self._pinned_separators:
-                    if i == 0 or last_dt_str != item.dt:
-                        section = self.build_date_section(item.dt, group=False)
-                        if section:
-                            model.appendRow(section)
-                    last_dt_str = item.dt
-                model.appendRow(item)
-                i += 1
+                    if not rows or last_dt_str != fields["dt"]:
+                        rows.append(self.get_section_row("pinned", fields["dt"], sections, group=False))
+                    last_dt_str = fields["dt"]
+                rows.append(self.get_item_row(fields))
+        return rows
 
-    def update_groups(self, id, data, expand: bool = True):
+    def get_rows_groups(self, data: dict) -> list:
         """
-        Update groups
+        Get rows of groups (with items in groups as children)
 
-        :param id: ID of the list
         :param data: Data to update
-        :param expand: Whether to expand groups
+        :return: list of row specs
         """
-        model = self.window.ui.models[id]
+        rows = []
         groups = self.window.core.ctx.get_groups()
         search_string = self.window.core.ctx.get_search_string()
         grouped = {}
@@ -276,10 +207,9 @@ class CtxList:
         if getattr(self, "_folder_open_icon", None) is None:
             self._folder_open_icon = QIcon(":/icons/folder_open.svg")
 
-        node = self.window.ui.nodes[id]
-
         for group_id in groups:
             last_dt_str = None
+            sections = {}
             group = groups[group_id]
             items_in_group = grouped.get(group.id, [])
             c = len(items_in_group)
@@ -288,9 +218,13 @@ class CtxList:
 
             # Display only the group name; the counter is drawn by delegate on the right
             is_attachment = group.has_additional_ctx()
-            group_name = group.name
-            group_item = GroupItem(self._folder_icon, group_name, group.id)
-            group_item.hasAttachments = is_attachment
+            tooltip_str = None
+            if is_attachment:
+                files = group.get_attachment_names()
+                files_str = ", ".join(files)
+                if len(files_str) > 40:
+                    files_str = files_str[:40] + '...'
+                tooltip_str = f"{trans('attachments.ctx.tooltip.list').format(num=len(files))}: {files_str}"
 
             # Provide all metadata required by the delegate
             custom_data = {
@@ -299,32 +233,79 @@ class CtxList:
                 "count": c,
             }
 
-            if is_attachment:
-                files = group.get_attachment_names()
-                files_str = ", ".join(files)
-                if len(files_str) > 40:
-                    files_str = files_str[:40] + '...'
-                tooltip_str = f"{trans('attachments.ctx.tooltip.list').format(num=len(files))}: {files_str}"
-                group_item.setToolTip(tooltip_str)
+            children = []
+            for meta_id, meta in items_in_group:
+                fields = self.get_item_fields(meta_id, meta, is_group=True)
+                if self._group_separators and (not fields["pinned"] or self._pinned_separators):
+                    if not children or last_dt_str != fields["dt"]:
+                        children.append(self.get_section_row(group.id, fields["dt"], sections, group=True))
+                    last_dt_str = fields["dt"]
+                children.append(self.get_item_row(fields))
+
+            sig = (group.name, tooltip_str, custom_data)
+            rows.append((
+                ("group", group.id),
+                sig,
+                functools.partial(self.build_group, group.id, group.name, tooltip_str, custom_data),
+                children,
+            ))
+        return rows
+
+    def get_item_row(self, fields: dict) -> tuple:
+        """
+        Get row spec of item
 
-            group_item.setData(custom_data, QtCore.Qt.ItemDataRole.UserRole)
+        :param fields: item fields
+        :return: row spec: (key, signature, builder, children)
+        """
+        sig = tuple(fields.values())
+        return ("item", fields["id"]), sig, functools.partial(self.create_item, fields), None
 
-            i = 0
-            for meta_id, meta in items_in_group:
-                item = self.build_item(meta_id, meta, is_group=True)
-                if self._group_separators and (not item.isPinned or self._pinned_separators):
-                    if i == 0 or last_dt_str != item.dt:
-                        section = self.build_date_section(item.dt, group=True)
-                        if section:
-                            group_item.appendRow(section)
-                    last_dt_str = item.dt
-                group_item.appendRow(item)
-                i += 1
-
-            model.appendRow(group_item)
+    def get_section_row(self, zone, dt: str, sections: dict, group: bool = False) -> tuple:
+        """
+        Get row spec of date section
+
+        :param zone: list zone (pinned, items or group id)
+        :param dt: date section string
+        :param sections: sections already added in zone: {dt: count}
+        :param group: is group
+        :return: row spec: (key, signature, builder, children)
+        """
+        n = sections.get(dt, 0)  # the same date may repeat in zone
+        sections[dt] = n + 1
+        return ("section", zone, dt, n), (dt, group), functools.partial(self.build_date_section, dt, group), None
+
+    def build_group(self, id: int, name: str, tooltip: str, custom_data: dict) -> GroupItem:
+        """
+        Build group item for list
 
+        :param id: group id
+        :param name: group name
+        :param tooltip: tooltip text
+        :param custom_data: data for delegate
+        :return: GroupItem
+        """
+        group_item = GroupItem(self._folder_icon, name, id)
+        group_item.hasAttachments = custom_data["is_attachment"]
+        if tooltip:
+            group_item.setToolTip(tooltip)
+        group_item.setData(custom_data, QtCore.Qt.ItemDataRole.UserRole)
+        return group_item
+
+    def update_groups_state(self, id: str):
+        """
+        Restore groups expanded state and folder icons
+
+        :param id: ID of the list
+        """
+        model = self.window.ui.models[id]
+        node = self.window.ui.nodes[id]
+        for r in range(model.rowCount()):
+            group_item = model.item(r)
+            if not isinstance(group_item, GroupItem):
+                continue
             # Always reflect persisted expansion state so groups stay open after actions
-            desired = group.id in node.expanded_items
+            desired = group_item.id in node.expanded_items
             idx = group_item.index()
             if node.isExpanded(idx) != desired:
                 node.setExpanded(idx, desired)
@@ -353,6 +334,17 @@ class CtxList:
         :param is_group: is group
         :return: Item
         """
+        return self.create_item(self.get_item_fields(id, data, is_group))
+
+    def get_item_fields(self, id: int, data: CtxMeta, is_group: bool = False) -> dict:
+        """
+        Get displayed fields of item (used to detect changed rows)
+
+        :param id: context meta id
+        :param data: context meta item
+        :param is_group: is group
+        :return: dict with item fields
+        """
         append_dt = True
         label = data.label
         is_important = data.important
@@ -378,20 +370,35 @@ class CtxList:
                 files_str = files_str[:40] + '...'
             tooltip_text += f"\n{trans('attachments.ctx.tooltip.list').format(num=len(files))}: {files_str}"
 
-        item = Item(name, id)
-        item.id = id
-        item.dt = dt
-        item.isPinned = data.important
-        item.setData(tooltip_text, QtCore.Qt.ToolTipRole)
-
-        custom_data = {
-            "label": label,
-            "is_important": is_important,
-            "is_attachment": is_attachment,
-            "in_group": in_group,
+        return {
+            "id": id,
+            "name": name,
+            "dt": dt,
+            "pinned": data.important,
+            "tooltip": tooltip_text,
+            "custom_data": {
+                "label": label,
+                "is_important": is_important,
+                "is_attachment": is_attachment,
+                "in_group": in_group,
+            },
         }
-        item.setData(custom_data, QtCore.Qt.ItemDataRole.UserRole)
-        item.setData(name)
+
+    def create_item(self, fields: dict) -> Item:
+        """
+        Create item for list from fields
+
+        :param fields: item fields
+        :return: Item
+        """
+        id = fields["id"]
+        item = Item(fields["name"], id)
+        item.id = id
+        item.dt = fields["dt"]
+        item.isPinned = fields["pinned"]
+        item.setData(fields["tooltip"], QtCore.Qt.ToolTipRole)
+        item.setData(fields["custom_data"], QtCore.Qt.ItemDataRole.UserRole)
+        item.setData(fields["name"])
         return item
 
     def build_date_section(self, dt: str, group: bool = False) -> SectionItem:
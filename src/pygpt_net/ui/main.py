@@ -6,12 +6,12 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.20 20:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import os
 
-from PySide6.QtCore import QTimer, Signal, Slot, QThreadPool, QEvent, Qt, QLoggingCategory, QEventLoop
+from PySide6.QtCore import QTimer, Signal, Slot, QEvent, Qt, QLoggingCategory, QEventLoop
 from PySide6.QtGui import QShortcut, QKeySequence, QKeyEvent
 from PySide6.QtWidgets import QMainWindow, QApplication
 from qt_material import QtStyleTools
@@ -50,17 +50,11 @@ class MainWindow(QMainWindow, QtStyleTools):
         self.setWindowFlags(self.windowFlags() | Qt.WindowMinMaxButtonsHint | Qt.WindowMaximizeButtonHint)
         self.app = app
         self.args = args
-        self.timer = None
-        self.post_timer = None
-        self.update_timer = None
         self.threadpool = None
         self.is_closing = False
-        self.timer_interval = 30
-        self.post_timer_interval = 1000
         self.update_timer_interval = 300000  # check every 5 minutes
         self.state = self.STATE_IDLE
         self.prevState = None
-        self.is_post_update = False
 
         # app ready emission control
         self._app_ready_emitted = False  # ensures single-shot emission
@@ -77,8 +71,9 @@ class MainWindow(QMainWindow, QtStyleTools):
         # before render, handle engine args
         self.handle_engine_args()
 
-        # setup thread pool
-        self.threadpool = QThreadPool.globalInstance()
+        # setup thread pool (lane-aware executor, QThreadPool.start() compatible)
+        self.core.executor.init()
+        self.threadpool = self.core.executor
 
         # setup controller
         self.controller = Controller(self)
@@ -216,21 +211,15 @@ class MainWindow(QMainWindow, QtStyleTools):
     def post_setup(self):
         """Called after setup"""
         self.controller.layout.post_setup()
-        self.timer = QTimer(self)
-        self.timer.setTimerType(Qt.PreciseTimer)
-        self.timer.timeout.connect(self.update)
-        self.timer.start(self.timer_interval)
-        self.post_timer = QTimer(self)
-        self.post_timer.setTimerType(Qt.VeryCoarseTimer)
-        self.post_timer.timeout.connect(self.post_update)
-        self.post_timer.start(self.post_timer_interval)
-        self.update_timer = QTimer(self)
-        self.update_timer.setTimerType(Qt.VeryCoarseTimer)
-        self.update_timer.timeout.connect(self.core.updater.run_check)
-        self.update_timer.start(self.update_timer_interval)
+        self.core.scheduler.call_every(
+            self.update_timer_interval / 1000,
+            self.core.updater.run_check,
+            name="updater.check",
+        )
         self.logger_message.connect(self.controller.debug.handle_log)
         self.ui.post_setup()
         self.tools.post_setup()
+        self.core.scheduler.setup()  # plugins and tools register deadlines, no polling loop
 
     def showEvent(self, e):
         super().showEvent(e)
@@ -248,24 +237,6 @@ class MainWindow(QMainWindow, QtStyleTools):
             # set focus to main window after shown
             QTimer.singleShot(0, self.activateWindow)
 
-    def update(self):
-        """Called on every update (real-time)"""
-        # self.controller.on_update()
-        self.controller.plugins.on_update()
-        self.tools.on_update()
-
-    def post_update(self):
-        """Called on post-update (lazy)"""
-        if self.is_post_update:
-            return
-        self.is_post_update = True
-        try:
-            self.controller.debug.on_post_update()
-            self.controller.plugins.on_post_update()
-            self.tools.on_post_update()
-        finally:
-            self.is_post_update = False
-
     @Slot(str)
     def update_status(self, message: str = ""):
         """
@@ -339,8 +310,12 @@ class MainWindow(QMainWindow, QtStyleTools):
         print("Closing...")
         print("Sending terminate signal to all...")
         self.controller.kernel.terminate()
+        print("Cancelling pending workers...")
+        self.core.executor.cancel()
         print("Saving ctx groups...")
         self.controller.ctx.save_all()
+        print("Saving history...")
+        self.core.history.flush()
         print("Saving tabs...")
         self.core.tabs.save()
         print("Saving notepad...")
@@ -358,18 +333,7 @@ class MainWindow(QMainWindow, QtStyleTools):
         print("Saving layout state...")
         self.controller.layout.save()
         print("Stopping timers...")
-        if self.timer is not None:
-            self.timer.stop()
-            self.timer.deleteLater()
-            self.timer = None
-        if self.post_timer is not None:
-            self.post_timer.stop()
-            self.post_timer.deleteLater()
-            self.post_timer = None
-        if self.update_timer is not None:
-            self.update_timer.stop()
-            self.update_timer.deleteLater()
-            self.update_timer = None
+        self.core.scheduler.stop()
         print("Saving config...")
         self.core.config.save()
         print("Saving presets...")
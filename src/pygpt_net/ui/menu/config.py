@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.24 23:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import os
@@ -45,6 +45,7 @@ class Config:
         icon_add = QIcon(":/icons/add.svg")
         icon_folder = QIcon(":/icons/folder_filled.svg")
         icon_save = QIcon(":/icons/save.svg")
+        icon_delete = QIcon(":/icons/delete.svg")
 
         m['config.settings'] = QAction(icon_settings, tr("menu.config.settings"), w)
         m['config.settings'].setMenuRole(QAction.MenuRole.NoRole)
@@ -129,6 +130,7 @@ class Config:
         m['config.open_dir'] = QAction(icon_folder, tr("menu.config.open_dir"), w)
         m['config.change_dir'] = QAction(icon_settings, tr("menu.config.change_dir"), w)
         m['config.save'] = QAction(icon_save, tr("menu.config.save"), w)
+        m['config.web.cache.clear'] = QAction(icon_delete, tr("menu.config.web.cache.clear"), w)
 
         m['config.settings'].triggered.connect(
             lambda: w.controller.settings.toggle_editor('settings')
@@ -145,6 +147,9 @@ class Config:
         m['config.save'].triggered.connect(
             lambda: w.controller.settings.save_all()
         )
+        m['config.web.cache.clear'].triggered.connect(
+            lambda: w.controller.settings.clear_web_cache()
+        )
 
         self.lang.setup()
         self.theme.setup()
@@ -161,4 +166,5 @@ class Config:
         menu.addMenu(m['config.profile'])
         menu.addAction(m['config.open_dir'])
         menu.addAction(m['config.change_dir'])
-        menu.addAction(m['config.save'])
\ No newline at end of file
+        menu.addAction(m['config.save'])
+        menu.addAction(m['config.web.cache.clear'])
\ No newline at end of file
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.06 02:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from PySide6.QtCore import Qt
@@ -53,3 +53,4 @@ class DatabaseDialog(BaseDialog):
         """
         self.window.controller.dialogs.debug.active[self.id] = False
         self.window.controller.debug.update_menu()
+        self.window.controller.debug.update_schedule()
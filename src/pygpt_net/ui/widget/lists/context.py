@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.03 17:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import datetime
@@ -15,7 +15,7 @@ from typing import Union
 
 from PySide6 import QtWidgets, QtCore, QtGui
 from PySide6.QtCore import Qt, QPoint, QItemSelectionModel, QPersistentModelIndex
-from PySide6.QtGui import QIcon, QColor, QPixmap, QStandardItem, QDrag
+from PySide6.QtGui import QIcon, QColor, QPixmap, QStandardItem, QStandardItemModel, QDrag
 from PySide6.QtWidgets import QMenu, QAbstractItemView, QFrame
 
 from .base import BaseList
@@ -85,12 +85,6 @@ class ContextList(BaseList):
         # Persist expanded state also when user uses the disclosure arrow or programmatic expand/collapse
         self._connect_expand_collapse_signals()
 
-        self._loading_more = False  # guard to avoid multiple triggers while updating
-        try:
-            self.verticalScrollBar().valueChanged.connect(self._on_vertical_scroll)
-        except Exception:
-            pass  # safe no-op if view doesn't expose verticalScrollBar
-
         # Keep selection homogeneous using selectionChanged pruning as a safety net
         try:
             self.selectionModel().selectionChanged.connect(self._on_selection_changed)
@@ -176,24 +170,6 @@ class ContextList(BaseList):
         except Exception:
             pass
 
-    def _on_vertical_scroll(self, value: int):
-        """
-        Trigger infinite scroll: when scrollbar reaches bottom, request the next page.
-        """
-        try:
-            sb = self.verticalScrollBar()
-        except Exception:
-            return
-        if sb.maximum() <= 0:
-            return  # nothing to scroll
-        # Close-to-bottom detection; keep a tiny threshold for stability
-        if not self._loading_more and value >= sb.maximum():
-            self._loading_more = True
-            # Ask controller to increase the total limit and refresh the list
-            self.window.controller.ctx.load_more()
-            # Release the guard shortly after model updates
-            QtCore.QTimer.singleShot(250, lambda: setattr(self, "_loading_more", False))
-
     def _connect_model_signals_safely(self):
         """
         Connect model change signals once and keep track of the connected instance.
@@ -348,6 +324,8 @@ class ContextList(BaseList):
         Rows are going to be removed; capture current scroll to preserve viewport.
         Prefer context menu anchor value if present.
         """
+        if getattr(self.model(), "syncing", False) and not self._deletion_initiated:
+            return  # list update, scroll is kept by pending scroll
         anchor_val = self._context_menu_anchor_scroll_value
         self._activate_scroll_guard("rowsAboutToBeRemoved", anchor_val)
 
@@ -1174,25 +1152,6 @@ class ContextList(BaseList):
         self.restore_after_ctx_menu = True
         self.restore_scroll_position()
 
-    def get_visible_unpaged_ids(self) -> set:
-        """
-        Return a set of IDs for currently visible, ungrouped and not pinned items (top-level only).
-        """
-        ids = set()
-        model = self._model
-        for r in range(model.rowCount()):
-            it = model.item(r)
-            # skip groups and date sections
-            if isinstance(it, GroupItem) or isinstance(it, SectionItem):
-                continue
-            if isinstance(it, Item):
-                data = it.data(QtCore.Qt.ItemDataRole.UserRole) or {}
-                in_group = bool(data.get("in_group", False))
-                is_important = bool(data.get("is_important", False))
-                if not in_group and not is_important and hasattr(it, "id"):
-                    ids.add(int(it.id))
-        return ids
-
     def action_open(self, id, idx: Union[int, list] = None):
         """
         Open context action handler.
@@ -1930,4 +1889,108 @@ class SectionItem(QStandardItem):
         self.setTextAlignment(QtCore.Qt.AlignRight)
         font = self.font()
         font.setBold(True)
-        self.setFont(font)
\ No newline at end of file
+        self.setFont(font)
+
+
+class CtxListModel(QStandardItemModel):
+    # roles copied to existing row when its content changes
+    SYNC_ROLES = (
+        Qt.DisplayRole,
+        Qt.ToolTipRole,
+        Qt.UserRole,
+        Qt.UserRole + 1,
+    )
+
+    def __init__(self, window=None, parent=None):
+        """
+        Context list model, updated with keyed diffs instead of full rebuilds
+
+        :param window: main window
+        :param parent: parent object
+        """
+        super(CtxListModel, self).__init__(0, 1, parent)
+        self.window = window
+        self.syncing = False
+
+    def canFetchMore(self, parent=QtCore.QModelIndex()) -> bool:
+        """
+        Check if next page of ctx list can be fetched (called by view on scroll to bottom)
+
+        :param parent: parent index
+        :return: True if more items available
+        """
+        if parent.isValid() or self.window is None or self.syncing:
+            return False
+        return self.window.controller.ctx.can_load_more()
+
+    def fetchMore(self, parent=QtCore.QModelIndex()):
+        """
+        Fetch next page of ctx list
+
+        :param parent: parent index
+        """
+        if parent.isValid() or self.window is None or self.syncing:
+            return
+        self.window.controller.ctx.load_more()
+
+    def sync(self, rows: list, parent: QStandardItem = None):
+        """
+        Apply rows to model: remove missing, move, insert new and update changed rows (matched by key)
+
+        :param rows: row specs: [(key, signature, builder, children)], children = row specs or None
+        :param parent: parent item, None = root
+        """
+        if parent is None:
+            self.syncing = True
+            try:
+                self.sync(rows, self.invisibleRootItem())
+            finally:
+                self.syncing = False
+            return
+
+        # remove rows not present anymore (bottom-up, ranges at once)
+        keys = {row[0] for row in rows}
+        r = parent.rowCount() - 1
+        while r >= 0:
+            end = r
+            while r >= 0 and getattr(parent.child(r), "key", None) not in keys:
+                r -= 1
+            if r < end:
+                parent.removeRows(r + 1, end - r)
+            r -= 1
+
+        current = {}
+        for r in range(parent.rowCount()):
+            child = parent.child(r)
+            current[child.key] = child
+
+        for pos, (key, sig, build, children) in enumerate(rows):
+            item = parent.child(pos)
+            if item is None or item.key != key:
+                item = current.get(key)
+                if item is not None:
+                    parent.insertRow(pos, parent.takeRow(item.row()))  # moved
+                else:
+                    item = build()
+                    item.key = key
+                    item.sig = sig
+                    parent.insertRow(pos, [item])  # list overload transfers ownership
+            if item.sig != sig:
+                self.apply(item, build())
+                item.sig = sig
+            if children is not None:
+                self.sync(children, item)
+
+    def apply(self, item: QStandardItem, fresh: QStandardItem):
+        """
+        Update existing row with content of freshly built one
+
+        :param item: existing item
+        :param fresh: new item
+        """
+        for role in self.SYNC_ROLES:
+            value = fresh.data(role)
+            if item.data(role) != value:
+                item.setData(value, role)
+        for name, value in vars(fresh).items():
+            setattr(item, name, value)
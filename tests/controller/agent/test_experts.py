@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.03 14:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import pytest
@@ -15,6 +15,7 @@ from unittest.mock import MagicMock
 from pygpt_net.core.types import MODE_AGENT, MODE_EXPERT
 from pygpt_net.core.events import KernelEvent, RenderEvent
 from pygpt_net.item.ctx import CtxItem
+from pygpt_net.core.ctx.reply import ReplyContext
 from pygpt_net.controller.agent.experts import Experts
 
 # Fixture that creates a dummy window with needed sub-objects
@@ -184,6 +185,20 @@ def test_handle_calls_with_mentions(experts, dummy_window):
     assert ctx.sub_calls == 1
     assert result == 1
 
+def test_handle_calls_fan_out(experts, dummy_window):
+    ctx = DummyCtx()
+    mentions = {"exp1": "input1", "exp2": "input2"}
+    dummy_window.core.experts.extract_calls.return_value = mentions
+    result = experts.handle(ctx)
+    # Multiple experts are sent to kernel as single concurrent call
+    dispatch_calls = dummy_window.dispatch.call_args_list
+    assert len(dispatch_calls) == 2
+    reply = dispatch_calls[1][0][0].data["context"].reply_context
+    assert reply.type == ReplyContext.EXPERT_CALLS
+    assert reply.calls == mentions
+    assert ctx.sub_calls == 2
+    assert result == 2
+
 def test_handle_no_mentions(experts, dummy_window):
     ctx = DummyCtx()
     ctx.sub_reply = False
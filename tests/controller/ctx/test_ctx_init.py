@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.15 22:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from unittest.mock import MagicMock
@@ -179,6 +179,42 @@ def test_update_list(mock_window):
     mock_window.ui.contexts.ctx_list.update.assert_called_once()
 
 
+def test_load_more(mock_window):
+    """Test load next package of records"""
+    ctx = Ctx(mock_window)
+    ctx.update_list = MagicMock()
+    config = {'ctx.records.limit': 50, 'ctx.records.limit.total': 50}
+    mock_window.core.config.get = MagicMock(side_effect=lambda key, *args: config.get(key))
+    mock_window.core.config.set = MagicMock(side_effect=lambda key, value: config.update({key: value}))
+    mock_window.core.ctx.has_more_meta = MagicMock(return_value=True)
+    mock_window.core.ctx.fetch_more_meta = MagicMock(return_value=50)
+
+    assert ctx.can_load_more() is True
+    ctx.load_more()
+    mock_window.core.ctx.fetch_more_meta.assert_called_once_with(50)
+    ctx.update_list.assert_called_once_with()  # loaded records are not reloaded
+    assert config['ctx.records.limit.total'] == 100
+
+    # no rows added, loaded total is not changed
+    mock_window.core.config.save.reset_mock()
+    mock_window.core.ctx.fetch_more_meta = MagicMock(return_value=0)
+    ctx.load_more()
+    assert config['ctx.records.limit.total'] == 100
+    mock_window.core.config.save.assert_not_called()
+    ctx.update_list.assert_called_once_with()
+
+    # all loaded
+    mock_window.core.ctx.has_more_meta = MagicMock(return_value=False)
+    assert ctx.can_load_more() is False
+    ctx.load_more()
+    assert mock_window.core.ctx.fetch_more_meta.call_count == 1  # not called again
+
+    # unlimited
+    config['ctx.records.limit'] = 0
+    mock_window.core.ctx.has_more_meta = MagicMock(return_value=True)
+    assert ctx.can_load_more() is False
+
+
 def test_refresh(mock_window):
     """Test refresh ctx"""
     ctx = Ctx(mock_window)
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.16 21:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import os
@@ -113,6 +113,20 @@ def test_open_config_dir(mock_window):
     mock_window.controller.files.open_dir.assert_called_once_with('test')
 
 
+def test_clear_web_cache(mock_window):
+    """Test clear web page cache"""
+    settings = Settings(mock_window)
+    mock_window.core.web.cache.get_stats = MagicMock(return_value={"entries": 2, "size": 2048})
+    mock_window.ui.dialogs.confirm = MagicMock()
+    settings.clear_web_cache()
+    mock_window.ui.dialogs.confirm.assert_called_once()
+    assert mock_window.ui.dialogs.confirm.call_args.kwargs["type"] == 'web.cache.clear'
+    mock_window.core.web.cache.clear.assert_not_called()
+
+    settings.clear_web_cache(True)
+    mock_window.core.web.cache.clear.assert_called_once_with()
+
+
 def test_welcome_settings(mock_window):
     """Test welcome settings"""
     settings = Settings(mock_window)
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.05 18:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import os
@@ -135,6 +135,79 @@ def test_summary_context(mock_window):
     assert mock_window.dispatch.called_once()
 
 
+def test_summary_context_cached(mock_window):
+    """Test summary is reused for the same content, query and model"""
+    ctx = CtxItem()
+    ctx.input = "question"
+    ctx.meta = CtxMeta()
+    context = Context(mock_window)
+    context.get_selected_model = MagicMock(return_value=("model_summary", ModelItem()))
+    context.get_token_budget = MagicMock(return_value=None)
+    context.get_context_text = MagicMock(return_value="content")
+    context.prepare_context_history = MagicMock(return_value=[])
+
+    def dispatch(event):
+        event.data["response"] = "summary"
+
+    mock_window.dispatch = MagicMock(side_effect=dispatch)
+    assert context.summary_context(ctx, []) == "summary"
+    assert context.summary_context(ctx, []) == "summary"
+    assert mock_window.dispatch.call_count == 1
+
+    context.get_context_text.return_value = "changed content"
+    context.summary_context(ctx, [])
+    assert mock_window.dispatch.call_count == 2
+
+
+def test_read_text_cached(mock_window):
+    """Test attachment text is read once per file version"""
+    mock_window.core.tokens.from_str = MagicMock(return_value=3)
+    stat = MagicMock(st_mtime_ns=1, st_size=9)
+    context = Context(mock_window)
+    with patch("os.path.exists", return_value=True), \
+            patch("os.stat", return_value=stat), \
+            patch("builtins.open", mock_open(read_data="test_text")) as mock_file:
+        assert context.read_text("uuid", "path") == ("test_text", 3)
+        assert context.read_text("uuid", "path") == ("test_text", 3)
+        assert mock_file.call_count == 1
+        stat.st_mtime_ns = 2
+        context.read_text("uuid", "path")
+        assert mock_file.call_count == 2
+    with patch("os.path.exists", return_value=False):
+        assert context.read_text("uuid", "path") == (None, 0)
+    assert "uuid" not in context.text_cache
+
+
+def test_fit_budget(mock_window):
+    """Test budget split and trimming"""
+    context = Context(mock_window)
+    assert context.fit_budget([10, 100, 50], 200) == [10, 100, 50]
+    assert context.fit_budget([10, 100, 50], 90) == [10, 40, 40]
+    assert context.fit_budget([10, 100], 0) == [0, 0]
+    assert context.trim_text("a" * 100, 10, 20) == "a" * 100
+    assert context.trim_text("a" * 100, 10, 5) == "a" * 50 + context.TRIM_MARKER
+
+
+def test_get_token_budget(mock_window):
+    """Test budget left after prompt, reserved response and history"""
+    values = {"max_total_tokens": 0, "context_threshold": 100, "use_context": True}
+    mock_window.core.config.get = MagicMock(side_effect=lambda key, default=None: values.get(key, default))
+    mock_window.core.models.get_num_ctx = MagicMock(return_value=1000)
+    mock_window.core.tokens.from_str = MagicMock(return_value=50)
+    mock_window.core.ctx.count_history = MagicMock(return_value=(2, 300))
+    context = Context(mock_window)
+    model = ModelItem()
+    model.id = "gpt-4"
+    history = [CtxItem(), CtxItem()]
+    assert context.get_token_budget(model, "system", "input") == 800
+    assert context.get_token_budget(model, "system", "input", history=history) == 500
+    mock_window.core.ctx.count_history.assert_called_once_with(history, "gpt-4", "chat", 200, 1000)
+
+    values["use_context"] = False
+    assert context.get_token_budget(model, "system", "input", history=history) == 800
+    assert context.get_token_budget(None, "input") is None
+
+
 def test_prepare_context_history(mock_window):
     """Test prepare_context_history"""
     item1 = CtxItem()
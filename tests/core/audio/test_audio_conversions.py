@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 12:00:00                  #
+# ================================================== #
+
+import numpy as np
+
+from pygpt_net.core.audio.backend.shared.conversions import (
+    PCMConverter,
+    convert_s16_pcm,
+    lin_to_s16le,
+)
+
+
+def make_signal(rate: int, seconds: float = 0.5) -> bytes:
+    t = np.arange(int(rate * seconds)) / rate
+    return (np.sin(2 * np.pi * 440 * t) * 10000).astype("<i2").tobytes()
+
+
+def test_chunked_equals_whole():
+    """Test stream converted in chunks is identical to whole buffer conversion"""
+    data = make_signal(24000)
+    for in_rate, out_rate in ((24000, 48000), (44100, 16000), (16000, 44100)):
+        whole = convert_s16_pcm(data, in_rate, 1, out_rate, 2)
+        converter = PCMConverter(in_rate, 1, out_rate, 2)
+        parts = b"".join(converter.convert(data[i:i + 777]) for i in range(0, len(data), 777))
+        assert parts == whole
+        frames = len(data) // 2
+        assert abs(len(whole) // 4 - frames * out_rate / in_rate) <= 1
+
+
+def test_channels_and_formats():
+    """Test channel mixing and output formats"""
+    stereo = np.array([100, 300, -200, -400], dtype="<i2").tobytes()
+    assert np.frombuffer(convert_s16_pcm(stereo, 8000, 2, 8000, 1), "<i2").tolist() == [200, -300]
+
+    mono = np.array([-32768, 0, 16384], dtype="<i2").tobytes()
+    assert np.frombuffer(convert_s16_pcm(mono, 8000, 1, 8000, 2), "<i2").tolist() == [-32768, -32768, 0, 0,
+                                                                                       16384, 16384]
+    assert convert_s16_pcm(mono, 8000, 1, 8000, 1, 1, "u8") == bytes([0, 128, 192])
+    f32 = np.frombuffer(convert_s16_pcm(mono, 8000, 1, 8000, 1, 4, "f32"), "<f4").tolist()
+    assert f32 == [-1.0, 0.0, 0.5]
+
+    converter = PCMConverter(8000, 1, 8000, 1, in_format="f32")
+    assert np.frombuffer(converter.convert(np.array([0.5, -2.0], "<f4").tobytes()), "<i2").tolist() == [16383, -32767]
+
+
+def test_partial_frames():
+    """Test incomplete frames are kept for the next chunk"""
+    converter = PCMConverter(8000, 2, 8000, 2)
+    data = np.array([1, 2, 3, 4], dtype="<i2").tobytes()
+    assert converter.convert(data[:3]) == b""
+    assert converter.convert(data[3:]) == data
+    assert converter.matches(8000, 2, 8000, 2)
+    assert not converter.matches(8000, 1, 8000, 2)
+
+
+def test_lin_to_s16le():
+    """Test sample width conversion"""
+    assert lin_to_s16le(b"\x80\x7f", 1) == np.array([-32768, 32512], "<i2").tobytes()
+    assert lin_to_s16le(b"\x00\x34\x12", 3) == b"\x34\x12"
+    assert lin_to_s16le(np.array([0x12340000], "<i4").tobytes(), 4) == b"\x34\x12"
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 12:00:00                  #
+# ================================================== #
+
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from pygpt_net.core.audio.backend.shared.segmenter import FrameBuffer, VadSegmenter, get_buffer_size
+
+RATE = 16000
+
+
+def silence(seconds: float) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return rng.normal(0, 50, int(RATE * seconds)).astype("<i2")
+
+
+def speech(seconds: float) -> np.ndarray:
+    t = np.arange(int(RATE * seconds)) / RATE
+    return (np.sin(2 * np.pi * 300 * t) * 8000).astype("<i2")
+
+
+def duration(segment: bytes, channels: int = 1) -> float:
+    return round(len(segment) / 2 / channels / RATE, 2)
+
+
+def test_segments():
+    """Test utterances are emitted on pause with prefix, silence and short bursts are skipped"""
+    data = np.concatenate([
+        silence(1), speech(1), silence(1.5), speech(0.1), silence(1), speech(2), silence(0.3)
+    ]).tobytes()
+    segmenter = VadSegmenter(RATE, silence_ms=800, prefix_ms=200)
+    segments = []
+    for i in range(0, len(data), 1234):  # odd chunk size
+        segments += segmenter.feed(data[i:i + 1234])
+    assert [duration(s) for s in segments] == [1.4]  # 0.2 prefix + 1.0 speech + 0.2 tail
+    assert segmenter.is_speaking()
+    assert duration(segmenter.flush()) == 2.5
+    assert segmenter.flush() is None
+
+
+def test_max_segment_and_channels():
+    """Test long utterance is split and stereo data is segmented by frames"""
+    segmenter = VadSegmenter(RATE, max_segment_s=0.5)
+    segments = segmenter.feed(speech(1.2).tobytes())
+    assert [duration(s) for s in segments] == [0.5, 0.5]
+    assert duration(segmenter.flush()) == 0.2
+
+    stereo = np.repeat(np.concatenate([silence(0.5), speech(0.5), silence(1)]), 2).tobytes()
+    segments = VadSegmenter(RATE, channels=2).feed(stereo)
+    assert [duration(s, 2) for s in segments] == [1.1]
+
+
+def test_frame_buffer():
+    """Test oldest chunks are dropped above max size"""
+    buffer = FrameBuffer(10)
+    for i in range(5):
+        buffer.append(bytes([i]) * 4)
+    assert len(buffer) == 2
+    assert buffer.get_bytes() == b"\x03" * 4 + b"\x04" * 4
+    assert (buffer.size, buffer.dropped) == (8, 12)
+    assert buffer[-1] == b"\x04" * 4
+    buffer.clear()
+    assert not buffer
+
+
+def test_get_buffer_size():
+    """Test buffer is limited only in loop recording"""
+    window = MagicMock()
+    window.core.config.get.return_value = 600
+    assert get_buffer_size(window, 32000) == 0  # normal recording is never truncated
+    assert get_buffer_size(window, 32000, loop=True) == 600 * 32000
+    window.core.config.get.return_value = 0
+    assert get_buffer_size(window, 32000, loop=True) == 0
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.04 00:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import importlib
@@ -14,6 +14,8 @@ from types import SimpleNamespace
 from unittest.mock import Mock
 import pytest
 
+from pygpt_net.core.limiter import Limiter
+
 mod = importlib.import_module("pygpt_net.core.bridge")
 
 Bridge = mod.Bridge
@@ -34,6 +36,8 @@ class DummyContext:
         self.stream = True
         self.force = False
         self.parent_mode = None
+        self.system_prompt = ""
+        self.history = []
     def to_dict(self):
         return {"prompt": self.prompt}
 
@@ -77,6 +81,7 @@ def make_window():
     window.core.api = SimpleNamespace()
     window.core.api.openai = SimpleNamespace()
     window.core.api.openai.quick_call = Mock(return_value="quick_result")
+    window.core.limiter = Limiter(window)
     return window
 
 def test_request_returns_false_when_kernel_stopped():
@@ -94,7 +99,7 @@ def test_request_runs_worker_sync_when_mode_in_sync_modes(monkeypatch):
     worker = SimpleNamespace()
     worker.run = Mock()
     monkeypatch.setattr(mod.Bridge, "get_worker", lambda self: worker)
-    monkeypatch.setattr(mod.Bridge, "apply_rate_limit", lambda self: None)
+    monkeypatch.setattr(mod.Bridge, "apply_rate_limit", lambda self, context: 0)
     res = b.request(ctx, extra={"a": 1})
     assert res is True
     worker.run.assert_called_once()
@@ -107,7 +112,7 @@ def test_request_starts_worker_async_when_mode_not_in_sync_modes(monkeypatch):
     worker = SimpleNamespace()
     worker.run = Mock()
     monkeypatch.setattr(mod.Bridge, "get_worker", lambda self: worker)
-    monkeypatch.setattr(mod.Bridge, "apply_rate_limit", lambda self: None)
+    monkeypatch.setattr(mod.Bridge, "apply_rate_limit", lambda self, context: 0)
     res = b.request(ctx, extra=None)
     assert res is True
     window.threadpool.start.assert_called_once_with(worker)
@@ -120,7 +125,7 @@ def test_request_agent_mode_uses_sub_mode_and_idx(monkeypatch):
     ctx = DummyContext(mode=mod.MODE_AGENT)
     worker = SimpleNamespace()
     monkeypatch.setattr(mod.Bridge, "get_worker", lambda self: worker)
-    monkeypatch.setattr(mod.Bridge, "apply_rate_limit", lambda self: None)
+    monkeypatch.setattr(mod.Bridge, "apply_rate_limit", lambda self, context: 0)
     res = b.request(ctx)
     assert res is True
     assert ctx.parent_mode == mod.MODE_AGENT
@@ -138,7 +143,7 @@ def test_request_switches_model_when_not_supported(monkeypatch):
     b = Bridge(window)
     ctx = DummyContext(mode=mod.MODE_CHAT, model=fm)
     monkeypatch.setattr(mod.Bridge, "get_worker", lambda self: SimpleNamespace(run=Mock()))
-    monkeypatch.setattr(mod.Bridge, "apply_rate_limit", lambda self: None)
+    monkeypatch.setattr(mod.Bridge, "apply_rate_limit", lambda self, context: 0)
     res = b.request(ctx)
     assert res is True
     assert ctx.idx is None
@@ -227,31 +232,37 @@ def test_get_worker_connects_signals(monkeypatch):
     w = b.get_worker()
     assert w.window is window
 
-def test_apply_rate_limit_no_limit(monkeypatch):
+def test_apply_rate_limit_no_limit():
     window = make_window()
-    window.core.config.has = Mock(return_value=False)
+    window.core.config.get = Mock(return_value=0)
     b = Bridge(window)
-    b.last_call = None
-    called = []
-    monkeypatch.setattr(mod.time, "sleep", Mock(side_effect=lambda s: called.append(s)))
-    b.apply_rate_limit()
-    assert called == []
-    assert b.last_call is not None
+    model = SimpleNamespace(provider="openai", id="gpt-4o")
+    for _ in range(5):
+        assert b.apply_rate_limit(DummyContext(mode=mod.MODE_CHAT, model=model)) == 0
 
-def test_apply_rate_limit_with_sleep(monkeypatch):
+def test_apply_rate_limit_with_delay():
     window = make_window()
-    window.core.config.has = Mock(return_value=True)
-    window.core.config.get = Mock(return_value="30")
+    window.core.config.get = Mock(side_effect=lambda key, default=None: 30 if key == "max_requests_limit" else default)
     b = Bridge(window)
-    now = mod.datetime.now()
-    interval = mod.timedelta(minutes=1) / 30
-    extra = mod.timedelta(seconds=0.5)
-    b.last_call = now - interval + extra
-    sleep_mock = Mock()
-    monkeypatch.setattr(mod.time, "sleep", sleep_mock)
-    window.core.debug.debug = Mock()
-    b.apply_rate_limit()
-    assert sleep_mock.call_count == 1
-    sleep_arg = sleep_mock.call_args[0][0]
-    assert sleep_arg == pytest.approx(extra.total_seconds(), rel=1e-3)
-    window.core.debug.debug.assert_called()
\ No newline at end of file
+    model = SimpleNamespace(provider="openai", id="gpt-4o")
+    for _ in range(30):
+        assert b.apply_rate_limit(DummyContext(mode=mod.MODE_CHAT, model=model)) == 0
+    delay = b.apply_rate_limit(DummyContext(mode=mod.MODE_CHAT, model=model))
+    assert delay == pytest.approx(2.0, rel=1e-2)
+    # other provider has own bucket
+    other = SimpleNamespace(provider="anthropic", id="claude")
+    assert b.apply_rate_limit(DummyContext(mode=mod.MODE_CHAT, model=other)) == 0
+
+def test_request_schedules_worker_when_limited(monkeypatch):
+    window = make_window()
+    b = Bridge(window)
+    worker = SimpleNamespace()
+    monkeypatch.setattr(mod.Bridge, "get_worker", lambda self: worker)
+    monkeypatch.setattr(mod.Bridge, "apply_rate_limit", lambda self, context: 1.5)
+    window.core.limiter.schedule = Mock()
+    assert b.request(DummyContext(mode=mod.MODE_CHAT), extra=None) is True
+    window.threadpool.start.assert_not_called()
+    delay, callback = window.core.limiter.schedule.call_args[0]
+    assert delay == 1.5
+    callback()
+    window.threadpool.start.assert_called_once_with(worker)
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.10 00:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import pytest
@@ -34,6 +34,7 @@ class ContextObj:
     def __init__(self):
         self.mode = None
         self.ctx = CtxObj()
+        self.model = None
         self.system_prompt = ""
         self.prompt = ""
         self.history = []
@@ -47,12 +48,20 @@ class AttachmentStub:
         self.MODE_QUERY_CONTEXT = "query"
     def has_context(self, meta):
         return self._has
-    def get_context(self, ctx, history):
+    def get_context(self, ctx, history, budget=None):
         return self._context
     def get_mode(self):
         return self._mode
 
 
+def make_window(attachment):
+    context = SimpleNamespace(get_token_budget=Mock(return_value=None))
+    return SimpleNamespace(
+        controller=SimpleNamespace(chat=SimpleNamespace(attachment=attachment)),
+        core=SimpleNamespace(attachments=SimpleNamespace(context=context)),
+    )
+
+
 def test_init_defaults():
     w = BridgeWorker(1, 2, key="v")
     assert w.args == (1, 2)
@@ -100,7 +109,7 @@ def test_handle_additional_context_no_ctx():
 def test_handle_additional_context_meta_none():
     worker = BridgeWorker()
     attachment = AttachmentStub(has_context=True, context_value="CTX", mode_value="query")
-    worker.window = SimpleNamespace(controller=SimpleNamespace(chat=SimpleNamespace(attachment=attachment)))
+    worker.window = make_window(attachment)
     ctx = ContextObj()
     ctx.ctx.meta = None
     ctx.prompt = "p"
@@ -113,7 +122,7 @@ def test_handle_additional_context_meta_none():
 def test_handle_additional_context_has_no_context():
     worker = BridgeWorker()
     attachment = AttachmentStub(has_context=False)
-    worker.window = SimpleNamespace(controller=SimpleNamespace(chat=SimpleNamespace(attachment=attachment)))
+    worker.window = make_window(attachment)
     ctx = ContextObj()
     ctx.ctx.meta = "m"
     ctx.prompt = "p"
@@ -126,7 +135,7 @@ def test_handle_additional_context_has_no_context():
 def test_handle_additional_context_empty_ad_context():
     worker = BridgeWorker()
     attachment = AttachmentStub(has_context=True, context_value="", mode_value="query")
-    worker.window = SimpleNamespace(controller=SimpleNamespace(chat=SimpleNamespace(attachment=attachment)))
+    worker.window = make_window(attachment)
     ctx = ContextObj()
     ctx.ctx.meta = "m"
     ctx.prompt = "p"
@@ -139,7 +148,7 @@ def test_handle_additional_context_empty_ad_context():
 def test_handle_additional_context_query_mode_sets_hidden_input():
     worker = BridgeWorker()
     attachment = AttachmentStub(has_context=True, context_value="ADCTX", mode_value="query")
-    worker.window = SimpleNamespace(controller=SimpleNamespace(chat=SimpleNamespace(attachment=attachment)))
+    worker.window = make_window(attachment)
     ctx = ContextObj()
     ctx.ctx.meta = "m"
     ctx.prompt = "p"
@@ -152,7 +161,7 @@ def test_handle_additional_context_query_mode_sets_hidden_input():
 def test_handle_additional_context_agent_mode_sets_hidden_input():
     worker = BridgeWorker()
     attachment = AttachmentStub(has_context=True, context_value="ADCTX", mode_value="full")
-    worker.window = SimpleNamespace(controller=SimpleNamespace(chat=SimpleNamespace(attachment=attachment)))
+    worker.window = make_window(attachment)
     ctx = ContextObj()
     ctx.ctx.meta = "m"
     ctx.prompt = "p"
@@ -166,15 +175,20 @@ def test_handle_additional_context_agent_mode_sets_hidden_input():
 def test_handle_additional_context_full_mode_no_hidden_input():
     worker = BridgeWorker()
     attachment = AttachmentStub(has_context=True, context_value="ADCTX", mode_value="full")
-    worker.window = SimpleNamespace(controller=SimpleNamespace(chat=SimpleNamespace(attachment=attachment)))
+    worker.window = make_window(attachment)
     ctx = ContextObj()
     ctx.ctx.meta = "m"
     ctx.prompt = "p"
+    previous = CtxObj()
+    ctx.history = [previous, ctx.ctx]
     worker.context = ctx
-    worker.mode = None
+    worker.mode = "chat"
     worker.handle_additional_context()
     assert worker.context.prompt.endswith("\n\nADCTX")
     assert ctx.ctx.hidden_input is None
+    worker.window.core.attachments.context.get_token_budget.assert_called_once_with(
+        None, "", "p", history=[previous], mode="chat"
+    )  # history without current item
 
 
 def test_cleanup_disconnect_and_reset():
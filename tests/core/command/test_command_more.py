@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.15 23:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import json
@@ -16,6 +16,7 @@ import pytest
 from unittest.mock import Mock
 
 from pygpt_net.core.command import Command
+from pygpt_net.core.dispatcher import Dispatcher
 from pygpt_net.core.events import Event
 from pygpt_net.core.types import MODE_ASSISTANT, MODE_COMPLETION
 
@@ -52,6 +53,18 @@ def make_window():
     return window
 
 
+def add_plugins(window, handlers, cache_syntax=True):
+    plugins = {}
+    window.core.dispatcher = Dispatcher(window)
+    window.core.plugins = SimpleNamespace(plugins=plugins)
+    window.controller.plugins.is_enabled = lambda pid: True
+    for pid, handle in handlers.items():
+        plugin = SimpleNamespace(id=pid, handle=Mock(side_effect=handle), cache_syntax=cache_syntax)
+        plugins[pid] = plugin
+        window.core.dispatcher.subscribe(plugin)
+    return plugins
+
+
 def test_extract_syntax_transforms_params_and_sets_ctx():
     window = make_window()
     command = Command(window)
@@ -316,17 +329,51 @@ def test_is_cmd_and_is_enabled_with_dispatch_behavior():
     window.core.config['cmd'] = False
     window.controller.plugins = SimpleNamespace(is_type_enabled=lambda t: True)
     assert command.is_cmd(inline=True) is True
-    def dispatch(event):
+    def handle(event):
         if event.name == Event.CMD_SYNTAX:
             event.data["cmd"] = [{"cmd": "allowed"}]
         if event.name == Event.CMD_SYNTAX_INLINE:
             event.data["cmd"] = [{"cmd": "inline_allowed"}]
-    window.dispatch = dispatch
+    add_plugins(window, {"plugin": handle})
     assert command.is_enabled("allowed") is True
     assert command.is_enabled("inline_allowed") is True
     assert command.is_enabled("not_present") is False
 
 
+def test_as_native_functions_schema_cache():
+    window = make_window()
+    window.core.config['cmd'] = True
+    command = Command(window)
+    def handle(event):
+        event.data["cmd"].append({"cmd": "cached_cmd", "instruction": "c", "params": []})
+    plugins = add_plugins(window, {"plugin": handle})
+    out = command.as_native_functions()
+    assert [f["name"] for f in out] == ["cached_cmd"]
+    out[0]["name"] = "changed"  # returned functions are copies
+    assert command.as_native_functions()[0]["name"] == "cached_cmd"
+    assert command.is_enabled("cached_cmd") is True
+    assert command.is_enabled("other") is False
+    assert plugins["plugin"].handle.call_count == 3  # syntax, syntax (forced), syntax inline (forced)
+
+    command.invalidate()
+    command.as_native_functions()
+    assert plugins["plugin"].handle.call_count == 4
+
+
+def test_as_native_functions_not_cacheable_plugin():
+    window = make_window()
+    window.core.config['cmd'] = True
+    command = Command(window)
+    def handle(event):
+        event.data["cmd"].append({"cmd": "dynamic_cmd", "instruction": "d"})
+    plugins = add_plugins(window, {"plugin": handle}, cache_syntax=False)
+    command.as_native_functions()
+    command.as_native_functions()
+    assert command.is_enabled("dynamic_cmd") is True
+    assert command.names is None
+    assert plugins["plugin"].handle.call_count == 4
+
+
 def test_is_model_supports_tools_always_true():
     window = make_window()
     command = Command(window)
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.05 18:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from unittest.mock import MagicMock, patch
@@ -957,6 +957,81 @@ def test_load_meta(mock_window_conf):
     assert ctx.meta == metas
 
 
+def test_fetch_more_meta(mock_window_conf):
+    """
+    Test fetch_more_meta
+    """
+    ctx = Ctx(mock_window_conf)
+    ctx.window = MagicMock()
+    ctx.window.core.config.has.return_value = True
+    ctx.window.core.config.get.return_value = 2
+    ctx.provider = MagicMock()
+
+    def create(id, updated):
+        meta = CtxMeta(id)
+        meta.updated = updated
+        return meta
+
+    def get_meta(**kwargs):
+        filters = kwargs["filters"]
+        if filters.get("is_important", {}).get("value") == 1 or filters["group_id"]["mode"] == ">":
+            return {}  # no pinned and grouped
+        return {1: create(1, 100), 2: create(2, 90)}
+
+    ctx.provider.get_meta.side_effect = get_meta
+    ctx.load_meta()
+    assert list(ctx.meta.keys()) == [1, 2]
+    assert ctx.has_more_meta() is True
+
+    # next page starts below last loaded row, loaded pages are not fetched again
+    ctx.meta[7] = create(7, 50)  # injected current meta, not a part of fetched pages
+    ctx.provider.get_meta.side_effect = None
+    ctx.provider.get_meta.return_value = {3: create(3, 80), 4: create(4, 70)}
+    assert ctx.fetch_more_meta(2) == 2
+    filters = ctx.provider.get_meta.call_args.kwargs["filters"]
+    assert filters["updated_ts"] == {"mode": "BEFORE", "value": (90, 2)}
+    assert ctx.provider.get_meta.call_args.kwargs["limit"] == 2
+    assert list(ctx.meta.keys()) == [1, 2, 7, 3, 4]
+    assert ctx.has_more_meta() is True
+
+    # page of already loaded rows only, next one is fetched in the same call
+    ctx.provider.get_meta.side_effect = [
+        {7: create(7, 50), 4: create(4, 50)},
+        {5: create(5, 40)},
+    ]
+    assert ctx.fetch_more_meta(2) == 1
+    assert ctx.provider.get_meta.call_args.kwargs["filters"]["updated_ts"]["value"] == (50, 4)
+    assert ctx.has_more_meta() is False
+
+    # nothing more to fetch
+    ctx.provider.get_meta.reset_mock()
+    assert ctx.fetch_more_meta(2) == 0
+    ctx.provider.get_meta.assert_not_called()
+
+
+def test_fetch_more_meta_ranked(mock_window_conf):
+    """
+    Test fetch_more_meta when searching in content (paged by rank)
+    """
+    ctx = Ctx(mock_window_conf)
+    ctx.window = MagicMock()
+    ctx.window.core.config.has.return_value = True
+    ctx.window.core.config.get.return_value = 2
+    ctx.provider = MagicMock()
+    ctx.search_string = "abc"
+    ctx.is_search_content = MagicMock(return_value=True)
+    ctx.meta = {1: CtxMeta(1), 2: CtxMeta(2), 9: CtxMeta(9)}
+    ctx.meta_more = True
+    ctx.meta_offset = 2  # rows fetched from DB, without injected ones
+
+    ctx.provider.get_meta.return_value = {3: CtxMeta(3)}
+    assert ctx.fetch_more_meta(2) == 1
+    assert ctx.provider.get_meta.call_args.kwargs["offset"] == 2
+    assert "updated_ts" not in ctx.provider.get_meta.call_args.kwargs["filters"]
+    assert ctx.meta_offset == 3
+    assert ctx.has_more_meta() is False
+
+
 def test_load(mock_window_conf):
     """
     Test load
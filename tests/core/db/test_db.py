@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.01.03 19:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import os
@@ -33,6 +33,32 @@ def test_prepare(mock_window):
     assert db.engine is not None
 
 
+def test_get_profile(mock_window):
+    """Test get connection profile"""
+    db = Database(mock_window)
+    mock_window.core.config.data['db.synchronous'] = 'full'
+    mock_window.core.config.data['db.journal_mode'] = 'invalid; DROP TABLE ctx_meta'
+    mock_window.core.config.data['db.mmap_size'] = 0
+    mock_window.core.config.data['db.cache_size'] = 'abc'
+    profile = db.get_profile()
+    assert profile['synchronous'] == 'FULL'
+    assert profile['journal_mode'] == 'WAL'
+    assert profile['mmap_size'] == 0
+    assert profile['cache_size'] == -20000
+
+
+def test_on_connect(mock_window):
+    """Test apply connection profile"""
+    db = Database(mock_window)
+    db.get_profile = MagicMock(return_value={'journal_mode': 'WAL', 'synchronous': 'NORMAL'})
+    dbapi_conn = MagicMock()
+    cursor = dbapi_conn.cursor.return_value
+    db.on_connect(dbapi_conn, None)
+    cursor.execute.assert_any_call("PRAGMA journal_mode = WAL")
+    cursor.execute.assert_any_call("PRAGMA synchronous = NORMAL")
+    cursor.close.assert_called_once()
+
+
 def test_install(mock_window):
     """Test install"""
     db = Database(mock_window)
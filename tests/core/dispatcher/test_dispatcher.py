@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.20 03:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import json
@@ -38,6 +38,41 @@ def test_apply(mock_window):
     dispatcher.apply('test1', event)
     mock_window.core.plugins.plugins['test1'].handle.assert_called_once_with(event)
 
+
+def test_dispatch_subscriptions(mock_window):
+    """Test dispatch to subscribed plugins only"""
+    dispatcher = Dispatcher(mock_window)
+    plugins = {}
+    for pid, events in (('test1', ['test']), ('test2', ['other']), ('test3', None)):
+        plugin = MagicMock()
+        plugin.id = pid
+        plugin.get_subscriptions = MagicMock(
+            return_value=None if events is None else {name: plugin.handle for name in events}
+        )
+        plugins[pid] = plugin
+        dispatcher.subscribe(plugin)
+    mock_window.core.plugins.plugins = plugins
+    mock_window.controller.plugins.is_enabled = MagicMock(side_effect=lambda pid: pid != 'test2')
+
+    affected, event = dispatcher.dispatch(Event('test'))
+    assert affected == ['test1', 'test3']
+    plugins['test1'].handle.assert_called_once_with(event)
+    plugins['test2'].handle.assert_not_called()
+
+    # dispatch map is reused until invalidated
+    dispatcher.dispatch(Event('test'))
+    assert mock_window.controller.plugins.is_enabled.call_count == 3
+    assert dispatcher.dispatch(Event('other'), all=True)[0] == ['test2', 'test3']
+
+    mock_window.controller.plugins.is_enabled = MagicMock(return_value=True)
+    dispatcher.invalidate()
+    assert dispatcher.dispatch(Event('other'))[0] == ['test2', 'test3']
+
+    stats = dispatcher.get_stats()
+    assert stats['test']['count'] == 2
+    assert stats['test']['plugins'] == 2
+    assert stats['other']['count'] == 2
+
 '''
 
 def test_reply(mock_window):
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 12:00:00                  #
+# ================================================== #
+
+from unittest.mock import MagicMock
+
+from PySide6.QtCore import QRunnable
+
+from pygpt_net.core.executor import (
+    Executor,
+    CancelToken,
+    LANE_DEFAULT,
+    LANE_INDEXING,
+    LANE_TOOLS,
+)
+
+
+class Job(QRunnable):
+    def __init__(self, lane=None, error=False):
+        super().__init__()
+        if lane is not None:
+            self.lane = lane
+        self.error = error
+        self.done = False
+        self.cancel_token = None
+
+    def run(self):
+        if self.error:
+            raise ValueError("error")
+        self.done = True
+
+
+def make_executor():
+    window = MagicMock()
+    window.core.config.get.side_effect = lambda key, default=None: default
+    executor = Executor(window)
+    executor.init()
+    return executor
+
+
+def wait(executor):
+    for lane in executor.lanes.values():
+        lane.pool.waitForDone(5000)
+
+
+def test_lane_routing():
+    """Test runnables are routed by lane attribute and lane argument"""
+    executor = make_executor()
+    a = Job(lane=LANE_INDEXING)
+    b = Job()
+    c = Job(lane=LANE_INDEXING)
+    token = executor.start(a)
+    executor.start(b)
+    executor.start(c, lane=LANE_TOOLS)
+    wait(executor)
+    assert a.done and b.done and c.done
+    assert a.cancel_token is token
+    stats = executor.get_stats()
+    assert stats[LANE_INDEXING]["submitted"] == 1
+    assert stats[LANE_INDEXING]["threads"] == 2
+    assert stats[LANE_TOOLS]["finished"] == 1
+    assert stats[LANE_DEFAULT]["finished"] >= 1
+
+
+def test_cancelled_task_is_skipped():
+    """Test cancelled task is not run"""
+    executor = make_executor()
+    job = Job(lane=LANE_TOOLS)
+    token = CancelToken()
+    token.cancel()
+    executor.start(job, token=token)
+    wait(executor)
+    assert not job.done
+    assert executor.get_stats()[LANE_TOOLS]["cancelled"] == 1
+
+
+def test_failed_task_is_counted():
+    """Test unhandled error is counted as failed"""
+    executor = make_executor()
+    executor.start(Job(lane=LANE_TOOLS, error=True))
+    wait(executor)
+    stats = executor.get_stats()[LANE_TOOLS]
+    assert stats["failed"] == 1
+    assert stats["running"] == 0
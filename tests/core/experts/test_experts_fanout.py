@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 12:00:00                  #
+# ================================================== #
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from pygpt_net.core.events import KernelEvent
+from pygpt_net.core.experts import Experts
+from pygpt_net.core.experts.fanout import ExpertCall, FanOut
+from pygpt_net.core.experts.worker import ExpertWorker
+from pygpt_net.item.ctx import CtxItem
+from pygpt_net.item.model import ModelItem
+
+
+@pytest.fixture
+def fake_window(monkeypatch):
+    monkeypatch.setattr("pygpt_net.core.experts.experts.trans", lambda key: key)
+    win = MagicMock()
+    config_values = {
+        "experts.parallel": 2,
+        "experts.timeout": 60,
+    }
+    win.core.config.get.side_effect = lambda key, default=None: config_values.get(key, default)
+    win.core.presets.get_by_mode = MagicMock(return_value={})
+    win.controller.kernel.stopped = MagicMock(return_value=False)
+    win.controller.agent.legacy.enabled = MagicMock(return_value=False)
+    win.dispatch = MagicMock()
+    return win
+
+
+def get_replies(win) -> list:
+    return [
+        c[0][0] for c in win.dispatch.call_args_list
+        if isinstance(c[0][0], KernelEvent) and c[0][0].name == KernelEvent.INPUT_SYSTEM
+    ]
+
+
+def response(output: str) -> CtxItem:
+    ctx = CtxItem()
+    ctx.output = output
+    return ctx
+
+
+def test_call_many_bounded_and_joined(fake_window):
+    """Test calls run up to parallel limit and results are joined in call order"""
+    experts = Experts(window=fake_window)
+    master_ctx = CtxItem()
+    experts.call_many(master_ctx, {"a": "qa", "b": "qb", "c": "qc"})
+    fanout = experts.fanout
+    a, b, c = fanout.calls
+    assert fake_window.threadpool.start.call_count == 2
+    assert (a.status, b.status, c.status) == ("running", "running", "pending")
+
+    b.on_response(response("result b"), "b")
+    assert fake_window.threadpool.start.call_count == 3  # slot freed for next call
+    assert c.status == "running"
+    c.on_error("failed")
+    assert not get_replies(fake_window)
+
+    a.on_response(response("result a"), "a")
+    for call in (a, b, c):
+        call.on_finished()  # late worker signals are ignored
+    replies = get_replies(fake_window)
+    assert len(replies) == 1
+    context = replies[0].data["context"]
+    assert json.loads(context.prompt) == [
+        {"expert_id": "a", "result": "result a"},
+        {"expert_id": "b", "result": "result b"},
+        {"expert_id": "c", "error": "failed"},
+    ]
+    assert context.ctx.sub_call is True
+    assert not fanout.is_active()
+    assert set(fanout.get_timings()) == {"a", "b", "c"}
+
+
+def test_tool_call_and_timeout(fake_window):
+    """Test expert is re-run with tool results and timed out expert is reported"""
+    experts = Experts(window=fake_window)
+    fanout = FanOut(experts, CtxItem(), {"a": "qa", "b": "qb"}, parallel=2, timeout=30)
+    fanout.start()
+    a, b = fanout.calls
+    fake_window.core.scheduler.call_later.assert_any_call(30.0, a.on_timeout, name=a.get_job_name())
+
+    experts.run_cmds = MagicMock(side_effect=['{"tool": "data"}', None])
+    a.on_cmd(CtxItem(), fanout.master_ctx, "a", "A", "<tool>call</tool>")
+    a.on_finished()  # first worker ends, second is still running
+    assert a.status == "running" and a.rounds == 2
+    a.on_cmd(CtxItem(), fanout.master_ctx, "a", "A", "final a")
+    assert a.status == "done"
+
+    b.on_timeout()
+    assert b.status == "timeout"
+    assert json.loads(get_replies(fake_window)[0].data["context"].prompt)[1] == {
+        "expert_id": "b",
+        "error": "Timeout after 30 s",
+    }
+
+
+def test_cancel_on_stop(fake_window):
+    """Test kernel stop cancels pending and running calls without reply"""
+    experts = Experts(window=fake_window)
+    experts.call_many(CtxItem(), {"a": "qa", "b": "qb", "c": "qc"})
+    fanout = experts.fanout
+    a, b, c = fanout.calls
+    experts.stop()
+    assert [call.status for call in fanout.calls] == ["cancelled"] * 3
+    for call in (a, b):
+        for token in call.tokens:
+            token.cancel.assert_called()
+    a.on_response(response("late"), "a")
+    assert fake_window.threadpool.start.call_count == 2
+    assert not get_replies(fake_window)
+
+
+def test_no_response(fake_window):
+    """Test worker finished without response ends call"""
+    experts = Experts(window=fake_window)
+    fanout = FanOut(experts, CtxItem(), {"a": "qa"})
+    fanout.start()
+    call: ExpertCall = fanout.calls[0]
+    call.on_finished()
+    assert call.to_dict() == {"expert_id": "a", "error": "No response from expert."}
+    assert len(get_replies(fake_window)) == 1
+
+
+def test_worker_cancelled(fake_window):
+    """Test cancelled worker does not call bridge or emit result"""
+    fake_window.core.config.get.side_effect = lambda key, default=None: default
+    fake_window.core.idx.is_valid.return_value = False
+    fake_window.core.models.get.return_value = ModelItem()
+    token = MagicMock()
+    token.is_cancelled.return_value = False
+
+    def call(event):
+        token.is_cancelled.return_value = True  # timeout during bridge call
+        event.data["response"] = "late"
+
+    fake_window.dispatch.side_effect = call
+    worker = ExpertWorker(fake_window, CtxItem(), "a", "qa")
+    worker.cancel_token = token
+    signals = worker.signals
+    on_cmd, on_finished = MagicMock(), MagicMock()
+    signals.cmd.connect(on_cmd)
+    signals.finished.connect(on_finished)
+    worker.run()
+    fake_window.dispatch.assert_called_once()
+    on_cmd.assert_not_called()
+    on_finished.assert_called_once()
+
+    # cancelled before start
+    worker = ExpertWorker(fake_window, CtxItem(), "a", "qa")
+    worker.cancel_token = token
+    worker.run()
+    fake_window.dispatch.assert_called_once()
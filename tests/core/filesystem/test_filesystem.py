@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.01.03 19:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import os
@@ -155,3 +155,14 @@ def test_is_schema(mock_window):
     assert result is False
 
 
+
+
+def test_clear_workdir_keep_db(mock_window):
+    """Test clear workdir keeps database with WAL files"""
+    filesystem = Filesystem(mock_window)
+    files = ["db.sqlite", "db.sqlite-wal", "db.sqlite-shm", "config.json"]
+    with patch("os.listdir", return_value=files), \
+            patch("os.path.isfile", return_value=True), \
+            patch("os.remove") as remove:
+        filesystem.clear_workdir("dir", remove_db=False)
+    assert [c[0][0] for c in remove.call_args_list] == [os.path.join("dir", "config.json")]
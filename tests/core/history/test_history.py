@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.01.03 19:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import os
@@ -35,3 +35,12 @@ def test_append(mock_window):
     mode = 'chat'
     history.append(ctx, mode)
     history.provider.append.assert_called_once()
+
+
+def test_remove_items(mock_window):
+    """Test remove items"""
+    history = History(mock_window)
+    history.provider = MagicMock()
+    items = [CtxItem(), CtxItem()]
+    history.remove_items(items)
+    history.provider.remove.assert_called_once_with(items)
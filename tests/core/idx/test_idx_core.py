@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.01.16 01:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import os
@@ -61,7 +61,7 @@ def test_index_files(mock_window):
     mock_window.core.config.set("llama.idx.storage", "test_store")
     idx.llm.get_service_context = MagicMock(return_value=(MagicMock(), MagicMock()))
     index = MagicMock()
-    idx.storage.get = MagicMock(return_value=index)
+    idx.storage.get_for_update = MagicMock(return_value=index)
     idx.storage.store = MagicMock()
     files = {
         "file.txt": {
@@ -86,7 +86,7 @@ def test_index_db_by_meta_id(mock_window):
     mock_window.core.config.set("llama.idx.storage", "test_store")
     idx.llm.get_service_context = MagicMock(return_value=(MagicMock(), MagicMock()))
     index = MagicMock()
-    idx.storage.get = MagicMock(return_value=index)
+    idx.storage.get_for_update = MagicMock(return_value=index)
     idx.storage.store = MagicMock()
     num = 1
     errors = []
@@ -105,7 +105,7 @@ def test_index_db_from_updated_ts(mock_window):
     mock_window.core.config.set("llama.idx.storage", "test_store")
     idx.llm.get_service_context = MagicMock(return_value=(MagicMock(), MagicMock()))
     index = MagicMock()
-    idx.storage.get = MagicMock(return_value=index)
+    idx.storage.get_for_update = MagicMock(return_value=index)
     idx.storage.store = MagicMock()
     num = 1
     errors = []
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.10 00:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import importlib
@@ -15,6 +15,7 @@ from unittest.mock import Mock, MagicMock
 import datetime
 import os
 from types import SimpleNamespace
+from pygpt_net.core.limiter import Limiter
 
 module = importlib.import_module("pygpt_net.core.idx.indexing")
 Indexing = module.Indexing
@@ -36,8 +37,8 @@ def make_window(store=None):
     class ConfigFake:
         def __init__(self, s):
             self.s = s
-        def get(self, key):
-            return self.s.get(key)
+        def get(self, key, default=None):
+            return self.s.get(key, default)
         def has(self, key):
             return key in self.s
         def get_user_dir(self, key):
@@ -95,6 +96,7 @@ def make_window(store=None):
     window.core = SimpleNamespace(config=config, idx=idx, debug=debug, platforms=platforms, filesystem=filesystem, db=db, models=models)
     window.controller = controller
     window.core.ctx = core_ctx
+    window.core.limiter = Limiter(window)
     return window
 
 @pytest.fixture
@@ -417,20 +419,17 @@ def test_get_webtype_and_remove_attachment(indexing, window):
     res = indexing.remove_attachment('ip', 'docid')
     assert res is True
 
-def test_apply_rate_limit_sleep_and_no_sleep(monkeypatch, indexing, window):
-    window.core.config.s = {}
-    indexing.last_call = None
-    indexing.window.core.config.s['llama.idx.embeddings.limit.rpm'] = '0'
-    indexing.apply_rate_limit()
-    indexing.window.core.config.s['llama.idx.embeddings.limit.rpm'] = '2'
-    now = datetime.datetime.now()
-    indexing.last_call = now - datetime.timedelta(seconds=5)
-    slept = {}
-    def fake_sleep(sec):
-        slept['val'] = sec
-    monkeypatch.setattr(module.time, 'sleep', fake_sleep)
-    indexing.apply_rate_limit()
-    assert 'val' in slept
+def test_apply_rate_limit_uses_limiter(indexing, window):
+    window.core.config.s = {
+        'llama.idx.embeddings.provider': 'openai',
+        'llama.idx.embeddings.limit.rpm': '2',
+        'llama.idx.embeddings.limit.tpm': 0,
+    }
+    window.core.limiter = SimpleNamespace(acquire=Mock(return_value=True), estimate_tokens=Mock(return_value=10))
+    indexing.apply_rate_limit('text')
+    window.core.limiter.acquire.assert_called_once_with(
+        'openai', 'embeddings', tokens=10, rpm=2, tpm=0, stopped=indexing.is_stopped
+    )
 
 def test_stop_enabled_and_is_stopped(indexing, window):
     window.core.config.s = {'llama.idx.stop.error': True}
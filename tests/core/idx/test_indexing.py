@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.23 19:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import os
@@ -16,6 +16,7 @@ from llama_index.core import Document
 
 from tests.mocks import mock_window
 from pygpt_net.core.idx import Indexing
+from pygpt_net.core.idx.types.files import Files
 
 
 def test_get_online_loader(mock_window):
@@ -188,3 +189,47 @@ def test_index_db_from_updated_ts(mock_window):
     indexed, errors = idx.index_db_from_updated_ts("base", index, 123)
     assert indexed == 1
     assert errors == []
+
+
+def test_is_unchanged(mock_window):
+    """Test skip of unchanged files"""
+    idx = Indexing(mock_window)
+    files = Files(mock_window)
+    mock_window.core.idx.files = files
+    files.get_id = MagicMock(return_value="file_id")
+    items = {}
+    mock_window.core.idx.get_idx_data = MagicMock(return_value={"base": items})
+
+    # not indexed yet
+    assert idx.is_unchanged("base", __file__) is False
+    state = idx.states[__file__]
+    assert state["size"] == os.stat(__file__).st_size
+    assert len(state["hash"]) == 64
+
+    # indexed, same state
+    items["file_id"] = dict(state)
+    del idx.states[__file__]
+    assert idx.is_unchanged("base", __file__) is True
+    assert __file__ not in idx.states
+
+    # touched, same content: new mtime is stored
+    items["file_id"].update({"mtime": 0, "db_id": 1, "id": "doc_id", "indexed_ts": 123})
+    files.update = MagicMock()
+    assert idx.is_unchanged("base", __file__) is True
+    files.update.assert_called_once_with(id=1, doc_id="doc_id", ts=123, state=state)
+    assert items["file_id"]["mtime"] == state["mtime"]
+    assert idx.is_unchanged("base", __file__) is True
+    files.update.assert_called_once()
+
+    # changed content
+    items["file_id"].update({"mtime": 0, "hash": "old"})
+    assert idx.is_unchanged("base", __file__) is False
+
+    # force replace, state is collected
+    del idx.states[__file__]
+    items["file_id"]["hash"] = state["hash"]
+    assert idx.is_unchanged("base", __file__, replace=True) is False
+    assert idx.states[__file__] == state
+
+    # tmp index
+    assert idx.is_unchanged("base", __file__, is_tmp=True) is False
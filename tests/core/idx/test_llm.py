@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.05 18:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import os
@@ -304,4 +304,45 @@ def test_get_custom_embed_provider_fallbacks_to_global_when_not_configured_or_no
 
     mock_window.core.idx.log.assert_any_call(
         f"Embeddings: not configured for {model.provider}. Fallback: using global provider."
-    )
\ No newline at end of file
+    )
+
+def test_get_embeddings_model_caches_instance_and_query_embeddings(mock_window):
+    from llama_index.core.embeddings import MockEmbedding
+
+    calls = []
+
+    class CountedEmbedding(MockEmbedding):
+        def _get_query_embedding(self, query):
+            calls.append(query)
+            return super()._get_query_embedding(query)
+
+    mock_window.core.config.set("llama.idx.embeddings.query_cache", 2)
+    emb_provider = MagicMock()
+    emb_provider.get_embeddings_model = MagicMock(side_effect=lambda **kwargs: CountedEmbedding(embed_dim=3))
+    mock_window.core.llm.llms = {"prov": emb_provider}
+    args = [{"name": "model_name", "type": "str", "value": "m1"}]
+
+    llm = Llm(mock_window)
+    embed_model = llm.get_embeddings_model("prov", args)
+    assert llm.get_embeddings_model("prov", list(args)) is embed_model
+    assert emb_provider.get_embeddings_model.call_count == 1
+
+    other = llm.get_embeddings_model("prov", [{"name": "model_name", "type": "str", "value": "m2"}])
+    assert other is not embed_model
+    assert emb_provider.get_embeddings_model.call_count == 2
+
+    # query embeddings are memoized (LRU)
+    assert embed_model.get_query_embedding("q1") == [0.5, 0.5, 0.5]
+    embed_model.get_query_embedding("q1")
+    embed_model.get_agg_embedding_from_queries(["q1"])
+    assert calls == ["q1"]
+    embed_model.get_query_embedding("q2")
+    embed_model.get_query_embedding("q3")  # evicts q1
+    embed_model.get_query_embedding("q1")
+    assert calls == ["q1", "q2", "q3", "q1"]
+    assert other.get_query_embedding("q1") == [0.5, 0.5, 0.5]  # separate cache per model
+    assert calls[-1] == "q1" and len(calls) == 5
+
+    llm.clear_embeddings_cache()
+    assert llm.get_embeddings_model("prov", args) is not embed_model
+    assert emb_provider.get_embeddings_model.call_count == 3
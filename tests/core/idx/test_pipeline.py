@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 12:00:00                  #
+# ================================================== #
+
+from unittest.mock import MagicMock, patch
+
+from llama_index.core import Document, VectorStoreIndex
+from llama_index.core.embeddings import MockEmbedding
+from llama_index.core.node_parser import SentenceSplitter
+
+from tests.mocks import mock_window
+from pygpt_net.core.idx import Indexing
+from pygpt_net.core.idx.types.embeddings import Embeddings
+from pygpt_net.core.limiter import Limiter
+
+
+def make_indexing(mock_window, files):
+    mock_window.controller.idx.is_stopped = MagicMock(return_value=False)
+    mock_window.core.config.set("llama.idx.pipeline", True)
+    mock_window.core.config.set("llama.idx.embeddings.limit.rpm", 0)
+    indexing = Indexing(mock_window)
+    indexing.remove_old_file = MagicMock()
+    indexing.pipeline.collect_files = MagicMock(return_value=files)
+
+    def get_documents(path, *args, **kwargs):
+        if path.endswith("bad.txt"):
+            raise ValueError("broken file")
+        return [Document(text=f"content of {path}", metadata={"path": path})]
+
+    indexing.get_documents = MagicMock(side_effect=get_documents)
+    return indexing
+
+
+def make_index() -> VectorStoreIndex:
+    splitter = SentenceSplitter(chunk_size=256, chunk_overlap=0, tokenizer=str.split)
+    return VectorStoreIndex([], embed_model=MockEmbedding(embed_dim=8), transformations=[splitter])
+
+
+def test_index_files_pipeline(mock_window):
+    """Test pipelined indexing inserts nodes in batches"""
+    files = [f"/data/file{i}.txt" for i in range(5)] + ["/data/sub/nested.txt"]
+    mock_window.core.config.set("llama.idx.embeddings.batch.size", 2)
+    indexing = make_indexing(mock_window, files)
+    index = make_index()
+    progress = []
+
+    with patch.object(
+            MockEmbedding,
+            "get_text_embedding_batch",
+            autospec=True,
+            side_effect=lambda self, texts, **kwargs: [[0.1] * 8 for _ in texts],
+    ) as embed_batch:
+        indexed, errors = indexing.index_files(
+            "base", index, "/data", recursive=True, callback=lambda d, t: progress.append((d, t))
+        )
+    indexing.pipeline.collect_files.assert_called_once_with("/data", True)
+    assert errors == []
+    assert list(indexed.keys()) == files
+    assert len(index.ref_doc_info) == 6
+    batches = [c.args[1] for c in embed_batch.call_args_list if c.args[1]]
+    assert [len(texts) for texts in batches] == [2, 2, 2]  # 6 nodes in batches of 2
+    assert progress[-1] == (6, 6)
+    assert indexing.remove_old_file.call_count == 6
+
+
+def test_index_files_pipeline_error(mock_window):
+    """Test pipelined indexing continues on loader error"""
+    indexing = make_indexing(mock_window, ["/data/bad.txt", "/data/good.txt"])
+    index = make_index()
+
+    mock_window.core.config.set("llama.idx.stop.error", False)
+    indexed, errors = indexing.index_files("base", index, "/data", recursive=False)
+    assert errors == ["broken file"]
+    assert list(indexed.keys()) == ["/data/good.txt"]
+
+
+def test_wait_for_limit(mock_window):
+    """Test RPM/TPM limits of embedding batches"""
+    mock_window.core.limiter = Limiter(mock_window)
+    pipeline = make_indexing(mock_window, []).pipeline
+    mock_window.core.config.set("llama.idx.embeddings.provider", "openai")
+    mock_window.core.config.set("llama.idx.embeddings.limit.rpm", 10)
+    mock_window.core.config.set("llama.idx.embeddings.limit.tpm", 1000)
+    with patch("pygpt_net.core.limiter.limiter.time.sleep") as sleep:
+        pipeline.wait_for_limit(5, 500)
+        pipeline.wait_for_limit(5, 500)
+        sleep.assert_not_called()
+        bucket = mock_window.core.limiter.buckets[("openai", "embeddings", "tokens")]
+        assert bucket.limit == 1000
+
+        # limit exceeded, stop requested while waiting
+        mock_window.controller.idx.is_stopped = MagicMock(return_value=True)
+        pipeline.wait_for_limit(1, 1)
+        sleep.assert_not_called()
+
+
+def test_insert_batch_embeddings_cache(mock_window):
+    """Test cached embeddings are reused for identical chunks"""
+    stored = {}
+    provider = MagicMock()
+    provider.get_embeddings = MagicMock(side_effect=lambda model, hashes: {
+        h: stored[(model, h)] for h in hashes if (model, h) in stored
+    })
+    provider.append_embeddings = MagicMock(side_effect=lambda model, items: stored.update(
+        {(model, h): v for h, v in items.items()}
+    ))
+    mock_window.core.idx.embeddings = Embeddings(mock_window, provider)
+    pipeline = make_indexing(mock_window, []).pipeline
+
+    with patch.object(
+            MockEmbedding,
+            "get_text_embedding_batch",
+            autospec=True,
+            side_effect=lambda self, texts, **kwargs: [[0.5] * 8 for _ in texts],
+    ) as embed_batch:
+        index = make_index()
+        pipeline.insert_batch(index, pipeline.chunk(index, [Document(text="same text")]))
+        pipeline.insert_batch(index, pipeline.chunk(index, [Document(text="same text"), Document(text="other")]))
+
+    batches = [c.args[1] for c in embed_batch.call_args_list if c.args[1]]
+    assert batches == [["same text"], ["other"]]
+    assert len(stored) == 2
+    assert len(index.index_struct.nodes_dict) == 3
+
+
+def test_index_files_replace(mock_window):
+    """Test unchanged check is skipped when replace is forced"""
+    indexing = make_indexing(mock_window, ["/data/file.txt"])
+    indexing.is_unchanged = MagicMock(side_effect=lambda idx, path, is_tmp=False, replace=None: not replace)
+
+    indexed, errors = indexing.index_files("base", make_index(), "/data", recursive=False)
+    assert indexed == {}
+    indexed, errors = indexing.index_files("base", make_index(), "/data", recursive=False, replace=True)
+    assert list(indexed.keys()) == ["/data/file.txt"]
+    indexing.is_unchanged.assert_called_with("base", "/data/file.txt", False, True)
+
+
+def test_embeddings_model_key(mock_window):
+    """Test embeddings cache key depends on resolved model args"""
+    embeddings = Embeddings(mock_window, MagicMock())
+    key = embeddings.get_model_key(MockEmbedding(embed_dim=8))
+    assert key == embeddings.get_model_key(MockEmbedding(embed_dim=8))
+    assert key != embeddings.get_model_key(MockEmbedding(embed_dim=16))
+
+
+def test_embeddings_evict(mock_window):
+    """Test embeddings cache limits are passed to provider"""
+    provider = MagicMock()
+    provider.evict_embeddings = MagicMock(return_value=3)
+    embeddings = Embeddings(mock_window, provider)
+    mock_window.core.config.set("llama.idx.embeddings.cache.max_items", 10)
+    mock_window.core.config.set("llama.idx.embeddings.cache.max_age", 1)
+    with patch("pygpt_net.core.idx.types.embeddings.time.time", return_value=100000):
+        assert embeddings.evict() == 3
+    provider.evict_embeddings.assert_called_once_with(10, 100000 - 86400)
+
+    mock_window.core.config.set("llama.idx.embeddings.cache.max_items", 0)
+    mock_window.core.config.set("llama.idx.embeddings.cache.max_age", 0)
+    assert embeddings.evict() == 0
+    provider.evict_embeddings.assert_called_once()
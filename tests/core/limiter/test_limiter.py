@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 12:00:00                  #
+# ================================================== #
+
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from pygpt_net.core.limiter import Limiter, TokenBucket
+
+
+def make_limiter(config=None):
+    config = config or {}
+    window = MagicMock()
+    window.core.config.get.side_effect = lambda key, default=None: config.get(key, default)
+    return Limiter(window)
+
+
+def test_bucket_reserve():
+    """Test token bucket schedules reservations after capacity is used"""
+    bucket = TokenBucket(60)
+    assert bucket.reserve(60, 0.0) == 0
+    assert bucket.reserve(1, 0.0) == pytest.approx(1.0)
+    assert bucket.reserve(1, 0.0) == pytest.approx(2.0)
+    assert bucket.reserve(1, 10.0) == 0  # refilled
+    assert TokenBucket(0).reserve(1000, 0.0) == 0  # no limit
+
+
+def test_reserve_rpm_and_tpm():
+    """Test RPM and TPM limits per provider and model"""
+    limiter = make_limiter({"max_requests_limit": 2, "max_tpm_limit": 100})
+    assert limiter.reserve("openai", "gpt-4o", tokens=50) == 0
+    assert limiter.reserve("openai", "gpt-4o", tokens=100) == pytest.approx(30.0, rel=1e-2)  # TPM
+    assert limiter.reserve("openai", "gpt-4o") == pytest.approx(30.0, rel=1e-2)  # RPM
+    assert limiter.reserve("openai", "gpt-4o-mini") == 0
+    assert limiter.reserve("anthropic", "gpt-4o") == 0
+
+
+def test_update_from_headers():
+    """Test limits are adapted from rate-limit and Retry-After headers"""
+    limiter = make_limiter({"max_requests_limit": 0})
+    limiter.update("openai", "gpt-4o", {
+        "x-ratelimit-limit-requests": "10",
+        "x-ratelimit-remaining-requests": "0",
+        "x-ratelimit-reset-requests": "6s",
+        "x-ratelimit-limit-tokens": "1000",
+        "x-ratelimit-remaining-tokens": "900",
+    })
+    assert limiter.buckets[("openai", "gpt-4o", "requests")].limit == 10
+    assert limiter.buckets[("openai", "gpt-4o", "tokens")].limit == 1000
+    assert limiter.reserve("openai", "gpt-4o") == pytest.approx(6.0, rel=1e-2)
+
+    limiter.update("anthropic", "claude", {"retry-after": "20"}, 429)
+    assert limiter.reserve("anthropic", "claude") == pytest.approx(20.0, rel=1e-2)
+
+    limiter.window.core.config.get.side_effect = lambda key, default=None: False
+    limiter.reset()
+    limiter.update("openai", "gpt-4o", {"retry-after": "20"}, 429)  # disabled
+    assert limiter.buckets == {}
+
+
+def test_parse_reset():
+    """Test reset header formats"""
+    limiter = make_limiter()
+    assert limiter.parse_reset("2m0s") == 120
+    assert limiter.parse_reset("1h") == limiter.MAX_WAIT
+    assert limiter.parse_reset("250ms") == pytest.approx(0.25)
+    assert limiter.parse_reset("1.5") == 1.5
+    assert limiter.parse_reset("2000-01-01T00:00:00Z") == 0
+    assert limiter.parse_reset("invalid") is None
+
+
+def test_hook():
+    """Test HTTP response hook updates limits of model from request"""
+    limiter = make_limiter({"max_requests_limit": 0})
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(429, headers={"retry-after-ms": "5000"})
+    )
+    client = httpx.Client(transport=transport, event_hooks={"response": [limiter.get_hook("openai")]})
+    client.post("https://api.test/v1/chat/completions", json={"model": "gpt-4o", "messages": []})
+    client.close()
+    assert limiter.reserve("openai", "gpt-4o") == pytest.approx(5.0, rel=1e-2)
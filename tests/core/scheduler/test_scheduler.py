@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 12:00:00                  #
+# ================================================== #
+
+import time
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from pygpt_net.core.scheduler import Scheduler
+
+
+def test_one_shot_and_periodic():
+    """Test one-shot job runs once and periodic job is rescheduled"""
+    scheduler = Scheduler()
+    once = MagicMock()
+    every = MagicMock()
+    scheduler.call_later(5, once, name="once")
+    scheduler.call_every(10, every, name="every")
+    now = time.time()
+
+    assert scheduler.run_pending(now) == 0
+    assert scheduler.run_pending(now + 6) == 1
+    once.assert_called_once()
+    assert not scheduler.has("once")
+
+    assert scheduler.run_pending(now + 11) == 1
+    assert scheduler.run_pending(now + 12) == 0
+    assert scheduler.run_pending(now + 21) == 1
+    assert every.call_count == 2
+
+    # missed runs are skipped, not replayed
+    assert scheduler.run_pending(now + 100) == 1
+    assert every.call_count == 3
+    assert scheduler.get_next() > now + 100
+
+
+def test_remove_and_replace():
+    """Test removed and replaced jobs are not executed"""
+    scheduler = Scheduler()
+    first = MagicMock()
+    second = MagicMock()
+    scheduler.call_later(0, first, name="job")
+    scheduler.call_later(0, second, name="job")  # replaces first
+    scheduler.call_later(0, first, name="other")
+    scheduler.remove("other")
+    scheduler.run_pending(time.time() + 1)
+    first.assert_not_called()
+    second.assert_called_once()
+    assert scheduler.get_next() is None
+
+
+def test_cron():
+    """Test cron job fire time is computed once per run"""
+    scheduler = Scheduler()
+    callback = MagicMock()
+    job = scheduler.call_cron("0 * * * *", callback, name="hourly")
+    fire = datetime.fromtimestamp(job.deadline)
+    assert (fire.minute, fire.second) == (0, 0)
+    assert job.deadline - time.time() <= 3600
+
+    scheduler.run_pending(job.deadline)
+    callback.assert_called_once()
+    assert job.deadline == Scheduler.next_cron("0 * * * *", fire.timestamp())
+
+
+def test_error_in_job():
+    """Test failing job does not stop other jobs"""
+    scheduler = Scheduler()
+    ok = MagicMock()
+    scheduler.call_later(0, MagicMock(side_effect=ValueError("error")), name="a")
+    scheduler.call_later(0, ok, name="b")
+    assert scheduler.run_pending(time.time() + 1) == 2
+    ok.assert_called_once()
+
+
+def test_arm():
+    """Test timer is armed for earliest deadline and stopped when idle"""
+    scheduler = Scheduler()
+    scheduler.timer = MagicMock()
+    scheduler.call_later(2, MagicMock(), name="a")
+    scheduler.call_later(100, MagicMock(), name="b")
+    scheduler.arm()
+    ms = scheduler.timer.start.call_args[0][0]
+    assert 1000 < ms <= 2000
+
+    scheduler.remove("a")
+    scheduler.arm()
+    assert scheduler.timer.start.call_args[0][0] == Scheduler.MAX_SLEEP * 1000
+
+    scheduler.stop()
+    scheduler.arm()
+    scheduler.timer.stop.assert_called()
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.15 23:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from unittest.mock import MagicMock, patch
@@ -88,6 +88,28 @@ def test_from_ctx():
         assert Tokens.from_ctx(item, 'chat', model) == 40
 
 
+def test_from_ctx_cached():
+    """Test from_ctx with cached tokens"""
+    item = CtxItem()
+    item.input = "This is a test"
+    item.output = "This is a second test"
+    model = "gpt-4-0613"
+    with patch('pygpt_net.core.tokens.tokens.Tokens._encoding_name_for_model', return_value='cl100k_base'), \
+            patch('pygpt_net.core.tokens.tokens.Tokens._get_encoding'), \
+            patch('pygpt_net.core.tokens.tokens.Tokens._const_tokens', return_value=1), \
+            patch('pygpt_net.core.tokens.tokens.Tokens.from_str', return_value=8) as from_str:
+        assert Tokens.from_ctx(item, 'chat', model) == 42
+        calls = from_str.call_count
+        assert Tokens.from_ctx(item, 'chat', model) == 42
+        assert from_str.call_count == calls  # cached
+        assert item.tokens_cache_dirty is True
+
+        item.output = "Edited"
+        assert Tokens.from_ctx(item, 'chat', model) == 42
+        assert from_str.call_count > calls  # recounted after edit
+        assert len(item.tokens_cache) == 1
+
+
 def test_get_config():
     """Test get_config"""
     model = "gpt-4-0613"
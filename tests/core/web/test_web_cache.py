@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 12:00:00                  #
+# ================================================== #
+
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import MagicMock
+
+import pytest
+
+from pygpt_net.core.web.cache import PageCache
+
+
+class Handler(BaseHTTPRequestHandler):
+    requests = []
+    agents = []
+    cache_control = "max-age=60"
+
+    def do_GET(self):
+        Handler.requests.append(self.headers.get("If-None-Match"))
+        Handler.agents.append(self.headers.get("User-Agent"))
+        if self.path == "/missing":
+            body = b"<html>not found</html>"
+            self.send_response(404)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.send_header("Cache-Control", Handler.cache_control)
+            self.end_headers()
+            return
+        body = b"<html>page</html>"
+        self.send_response(200)
+        self.send_header("ETag", '"v1"')
+        self.send_header("Cache-Control", Handler.cache_control)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    Handler.requests = []
+    Handler.agents = []
+    yield "http://127.0.0.1:{}".format(httpd.server_address[1])
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def make_cache(config: dict = None) -> PageCache:
+    window = MagicMock()
+    values = config or {}
+    window.core.config.get.side_effect = lambda key, default=None: values.get(key, default)
+    cache = PageCache(window)
+    cache.path = tempfile.gettempdir()
+    cache.INDEX = "pygpt_test_web_cache.json"
+    cache.clear()
+    return cache
+
+
+def test_normalize_url():
+    """Test URL normalization"""
+    assert PageCache.normalize_url("HTTPS://Example.com:443/a?b=2&a=1#top") == "https://example.com/a?a=1&b=2"
+    assert PageCache.normalize_url("http://example.com:8080") == "http://example.com:8080/"
+
+
+def test_get_expires():
+    """Test freshness from cache headers"""
+    cache = make_cache({"web.cache.ttl": 10})
+    assert cache.get_expires({"cache-control": "max-age=60"}, 100) == 160
+    assert cache.get_expires({"cache-control": "no-cache"}, 100) == 100
+    assert cache.get_expires({"cache-control": "private, no-store"}, 100) is None
+    assert cache.get_expires({}, 100) == 110
+
+
+def test_get_hit_and_revalidate(server):
+    """Test fresh hit, conditional revalidation and extracted text cache"""
+    Handler.cache_control = "max-age=60"
+    cache = make_cache()
+    url = server + "/page?b=1&a=2"
+    assert cache.get(url) == b"<html>page</html>"
+    assert cache.get(server + "/page?a=2&b=1#x") == b"<html>page</html>"
+    assert Handler.requests == [None]
+
+    cache.set_text(url, "page")
+    assert cache.get_text(url) == "page"
+
+    key = cache.get_key(url)
+    cache.entries[key]["expires"] = time.time() - 1  # stale
+    assert cache.get(url) == b"<html>page</html>"
+    assert Handler.requests == [None, '"v1"']
+    assert cache.get_text(url) == "page"
+
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["revalidated"]) == (1, 1, 1)
+    assert stats["entries"] == 1
+    cache.clear()
+
+
+def test_get_no_store(server):
+    """Test no-store responses are not cached"""
+    Handler.cache_control = "no-store"
+    cache = make_cache()
+    cache.get(server + "/a")
+    cache.get(server + "/a")
+    assert Handler.requests == [None, None]
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_get_page(server):
+    """Test page is requested with requests User-Agent and error page is returned as content"""
+    Handler.cache_control = "max-age=60"
+    cache = make_cache()
+    assert cache.get_page(server + "/page") == b"<html>page</html>"
+    assert Handler.agents[0].startswith("python-requests/")
+    assert cache.get_page(server + "/missing") == b"<html>not found</html>"
+    assert cache.get_stats()["entries"] == 1
+    cache.clear()
+
+
+def test_evict():
+    """Test LRU eviction above max size"""
+    cache = make_cache({"web.cache.max_size": 1})
+    big = b"x" * (600 * 1024)
+    cache.store("a", "http://a", big, {})
+    cache.store("b", "http://b", big, {})
+    assert list(cache.entries) == ["b"]
+    assert cache.get_stats()["evicted"] == 1
+    cache.clear()
+
+
+def test_get_stats_loads_index():
+    """Test statistics include entries stored by previous session"""
+    cache = make_cache()
+    cache.store("a", "http://a", b"page", {})
+    cache.save()
+    other = PageCache(cache.window)
+    other.path = cache.path
+    other.INDEX = cache.INDEX
+    stats = other.get_stats()
+    assert (stats["entries"], stats["size"]) == (1, 4)
+    other.clear()
+    assert make_cache().get_stats()["entries"] == 0
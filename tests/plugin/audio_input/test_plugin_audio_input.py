@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.20 03:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 import os
@@ -16,6 +16,7 @@ from pygpt_net.core.events import Event
 from pygpt_net.item.ctx import CtxItem
 from tests.mocks import mock_window
 from pygpt_net.plugin.audio_input import Plugin
+from pygpt_net.plugin.audio_input.worker import Worker
 
 
 def test_options(mock_window):
@@ -187,3 +188,31 @@ def test_handle_audio_stop(mock_window):
     event.ctx = ctx
     plugin.handle(event)
     plugin.on_stop.assert_called_once()
+
+
+def test_handle_segments(mock_window):
+    """Test speech segments are queued and transcribed in order by single worker"""
+    plugin = Plugin(window=mock_window)
+    plugin.init_options()
+    plugin.handle_segments = MagicMock()
+    plugin.handler_simple.on_segment(b"one", 16000, 1)
+    plugin.handler_simple.on_segment(b"two", 16000, 2)
+    plugin.handle_segments.assert_called_once_with(plugin.handler_simple)
+
+    provider = MagicMock()
+    provider.transcribe_audio.side_effect = lambda data, rate, channels: "{} {}".format(data.decode(), channels)
+    plugin.get_provider = MagicMock(return_value=provider)
+    worker = Worker()
+    worker.plugin = plugin
+    worker.segments = plugin.handler_simple
+    worker.status = MagicMock()
+    worker.response = MagicMock()
+    worker.error = MagicMock()
+    with patch("pygpt_net.plugin.audio_input.worker.trans", return_value=""):
+        worker.handle_segments()
+    worker.error.assert_not_called()
+    assert [c.args[0] for c in worker.response.call_args_list] == ["one 1", "two 2"]
+    assert plugin.handler_simple.segments_busy is False
+
+    plugin.handler_simple.on_segment(b"three", 16000, 1)
+    assert plugin.handle_segments.call_count == 2
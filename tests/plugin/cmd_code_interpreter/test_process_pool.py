@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 12:00:00                  #
+# ================================================== #
+
+import glob
+import io
+import os
+import queue
+import sys
+import tempfile
+import uuid
+from unittest.mock import MagicMock
+
+import pytest
+
+from pygpt_net.plugin.cmd_code_interpreter.pool import BOOTSTRAP, ProcessPool, read_stream, collect
+
+
+created = []  # files written by tests
+remove = os.remove  # other tests may leave os functions mocked
+
+
+@pytest.fixture(autouse=True)
+def cleanup():
+    yield
+    while created:
+        path = created.pop()
+        name = os.path.splitext(os.path.basename(path))[0]
+        cached = glob.glob(os.path.join(os.path.dirname(path), "__pycache__", name + ".*.pyc"))
+        for file in [path] + cached:
+            try:
+                remove(file)
+            except OSError:
+                pass
+
+
+def write_tmp(content: str, name: str = None) -> str:
+    if name is None:
+        name = "pygpt_test_{}".format(uuid.uuid4().hex)
+    path = os.path.join(tempfile.gettempdir(), name + ".py")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    created.append(path)
+    return path
+
+
+def make_pool(**options):
+    values = {
+        "python_cmd_tpl": '"' + sys.executable + '" {filename}',
+        "python_pool": True,
+        "python_pool_size": 1,
+        "python_pool_preload": "json",
+        "python_pool_max_runs": 2,
+        "python_timeout": 10,
+        "python_memory_limit": 0,
+    }
+    values.update(options)
+    plugin = MagicMock()
+    plugin.get_option_value.side_effect = lambda key: values[key]
+    pool = ProcessPool(plugin)
+    bootstrap = write_tmp(BOOTSTRAP)
+    pool.get_bootstrap_path = lambda: bootstrap
+    return pool
+
+
+def test_read_stream_markers():
+    """Test output is split by end-of-run markers, also across reads"""
+    output = queue.Queue()
+    stream = io.BytesIO("zażółć\n\x00M:1:0\nnext".encode("utf-8"))
+    read_stream("stdout", stream, output, b"\x00M:")
+    items = []
+    while not output.empty():
+        items.append(output.get())
+    assert items == [("stdout", "zażółć"), ("stdout", None), ("stdout", "next"), ("stdout", False)]
+
+
+def test_collect_chunks():
+    """Test output is collected until both streams end and passed to callback"""
+    output = queue.Queue()
+    for item in [("stdout", "a"), ("stderr", "b"), ("stdout", "c"), ("stdout", None), ("stderr", None)]:
+        output.put(item)
+    chunks = []
+    stdout, stderr, finished = collect(output, callback=lambda text, name: chunks.append((name, text)))
+    assert (stdout, stderr, finished) == ("ac", "b", True)
+    assert "".join(text for name, text in chunks if name == "stdout") == "ac"
+
+
+def test_pool_run():
+    """Test warm interpreter runs files, streams output, times out and is recycled"""
+    pool = make_pool(python_timeout=1)
+    try:
+        path = write_tmp("import sys\nprint('hello')\nprint('err', file=sys.stderr)\n")
+        chunks = []
+        assert pool.run(path, lambda text, name: chunks.append(name)) == ("hello\n", "err\n")
+        assert "stdout" in chunks and "stderr" in chunks
+        assert len(pool.idle) == 1
+
+        stdout, stderr = pool.run(write_tmp("import time\ntime.sleep(30)\n"))
+        assert "Timeout" in stderr
+        assert len(pool.idle) == 1  # replaced
+
+        stdout, stderr = pool.run(write_tmp("raise ValueError('broken')\n"))
+        assert "ValueError: broken" in stderr
+    finally:
+        pool.shutdown()
+
+
+def test_pool_run_isolation():
+    """Test user modules and environment changes do not leak to next run"""
+    pool = make_pool(python_pool_max_runs=0)
+    try:
+        name = "pygpt_helper_{}".format(uuid.uuid4().hex[:8])
+        main = write_tmp("import os\nimport {}\nprint({}.X, os.environ.get('PYGPT_TEST'))\n"
+                         "os.environ['PYGPT_TEST'] = '1'\n".format(name, name))
+        write_tmp("X = 1\n", name)
+        assert pool.run(main)[0] == "1 None\n"
+        write_tmp("X = 2\n", name)
+        assert pool.run(main)[0] == "2 None\n"
+    finally:
+        pool.shutdown()
+
+
+def test_pool_shutdown():
+    """Test interpreters are not reused after shutdown until pool is opened again"""
+    pool = make_pool()
+    try:
+        path = write_tmp("print('ok')\n")
+        pool.shutdown()
+        assert pool.run(path)[0] == "ok\n"
+        assert pool.idle == []  # killed, not returned to pool
+
+        pool.open()
+        assert pool.run(path)[0] == "ok\n"
+        assert len(pool.idle) == 1
+    finally:
+        pool.shutdown()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 12:00:00                  #
+# ================================================== #
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+from pygpt_net.item.model import ModelItem
+from pygpt_net.plugin.cmd_web.websearch import WebSearch
+
+
+def make_websearch(options: dict) -> WebSearch:
+    plugin = MagicMock()
+    plugin.get_option_value.side_effect = lambda name: options.get(name)
+    plugin.window.core.tokens.from_str.side_effect = lambda text, model: len(text.split())
+    plugin.window.core.models.has.return_value = False
+    plugin.window.core.models.from_defaults.return_value = ModelItem()
+    return WebSearch(plugin)
+
+
+def test_to_token_chunks():
+    """Test chunks are split on sentence boundaries within token and char limits"""
+    web = make_websearch({})
+    text = "One two three. Four five. Six seven eight nine. Ten."
+    chunks = web.to_token_chunks(text, 5)
+    assert chunks == ["One two three. Four five.", "Six seven eight nine. Ten."]
+
+    chunks = web.to_token_chunks("a b c d e f g", 2)
+    assert chunks == ["a b", "c d", "e f", "g"]
+
+    chunks = web.to_token_chunks(text, 100, max_chars=30)
+    assert all(len(chunk) <= 30 for chunk in chunks)
+    assert " ".join(chunks) == text
+
+    assert web.to_token_chunks("abcdef", 0, 4) == ["abcd", "ef"]
+    assert web.to_token_chunks("", 10) == []
+
+
+def test_get_summary_map_reduce():
+    """Test chunks are summarized in parallel, in order, then combined"""
+    web = make_websearch({
+        "summary_max_tokens": 100,
+        "max_parallel_summary": 3,
+        "summary_reduce": True,
+    })
+    prompts = []
+    threads = set()
+
+    def dispatch(event):
+        prompt = event.data["context"].prompt
+        prompts.append(prompt)
+        threads.add(threading.get_ident())
+        if prompt.startswith("chunk"):
+            time.sleep(0.05)
+            event.data["response"] = "S" + prompt[-1]
+        else:
+            event.data["response"] = "combined: " + prompt
+
+    web.plugin.window.dispatch.side_effect = dispatch
+    result = web.get_summary(["chunk1", "chunk2", "chunk3"], "query")
+    assert result == "combined: S1\n\nS2\n\nS3"
+    assert len(prompts) == 4
+    assert len(threads) > 1
+
+    web.plugin.get_option_value.side_effect = lambda name: {
+        "summary_max_tokens": 100,
+        "max_parallel_summary": 1,
+    }.get(name)
+    prompts.clear()
+    assert web.get_summary(["chunk1", "chunk2"], "query") == "S1S2"
+    assert prompts == ["chunk1", "chunk2"]
+
+
+def test_make_query_fetch_fallback():
+    """Test pages are fetched in parallel and first non-empty page is used"""
+    web = make_websearch({
+        "raw": True,
+        "max_page_content_length": 0,
+        "max_result_length": 0,
+        "max_parallel_fetch": 2,
+    })
+    urls = ["u1", "", "u2", "u3", "u4", "u5"]
+    web.get_urls = MagicMock(return_value=urls)
+    fetched = []
+    lock = threading.Lock()
+
+    def query_url(url):
+        with lock:
+            fetched.append(url)
+        return {"u3": "page 3", "u4": "page 4"}.get(url, "")
+
+    web.query_url = query_url
+    result, total, current, url, img = web.make_query("query", page_no=2)
+    assert (result, total, current, url) == ("page 3", 6, 2, "u3")
+    assert "u1" not in fetched
+
+    result, total, current, url, img = web.make_query("query", page_no=9)
+    assert (result, current) == ("", 6)
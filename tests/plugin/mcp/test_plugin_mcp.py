@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 12:00:00                  #
+# ================================================== #
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import anyio
+
+from pygpt_net.plugin.mcp.pool import SessionPool
+from pygpt_net.plugin.mcp.worker import Worker
+
+
+class FakeSession:
+    def __init__(self, address: str):
+        self.address = address
+        self.closed = False
+        self.calls = []
+
+    async def call_tool(self, name, arguments=None):
+        if self.closed:
+            raise anyio.ClosedResourceError()
+        self.calls.append(name)
+        await asyncio.sleep(0.2)
+        return f"{self.address}:{name}"
+
+    async def send_ping(self):
+        if self.closed:
+            raise anyio.ClosedResourceError()
+
+
+def make_pool(idle_timeout: int = 300):
+    plugin = MagicMock()
+    plugin.get_option_value = MagicMock(return_value=idle_timeout)
+    pool = SessionPool(plugin)
+    opened = []
+
+    @asynccontextmanager
+    async def open_session(address, transport, headers=None):
+        session = FakeSession(address)
+        opened.append(session)
+        try:
+            yield session
+        finally:
+            session.closed = True
+
+    pool.open_session = open_session
+    return pool, opened
+
+
+def call(pool, key, name):
+    return pool.call(key, key, "stdio", None, lambda session: session.call_tool(name))
+
+
+def test_pool_reuses_session():
+    """Test session is kept open between calls"""
+    pool, opened = make_pool()
+    try:
+        assert pool.run(call(pool, "a", "one")) == "a:one"
+        assert pool.run(call(pool, "a", "two")) == "a:two"
+        assert len(opened) == 1
+        assert opened[0].calls == ["one", "two"]
+        assert not opened[0].closed
+    finally:
+        pool.shutdown()
+    assert opened[0].closed
+    assert pool.loop is None
+
+
+def test_pool_concurrent_servers():
+    """Test calls to different servers run concurrently"""
+    pool, opened = make_pool()
+
+    async def run_all():
+        return await asyncio.gather(call(pool, "a", "x"), call(pool, "b", "y"))
+
+    try:
+        start = time.perf_counter()
+        assert pool.run(run_all()) == ["a:x", "b:y"]
+        assert time.perf_counter() - start < 0.35  # 2 x 0.2s in parallel
+        assert len(opened) == 2
+    finally:
+        pool.shutdown()
+
+
+def test_pool_reconnect():
+    """Test closed session is reopened and request is retried"""
+    pool, opened = make_pool()
+    try:
+        pool.run(call(pool, "a", "one"))
+        opened[0].closed = True  # server died
+        assert pool.run(call(pool, "a", "two")) == "a:two"
+        assert len(opened) == 2
+        assert opened[1].calls == ["two"]
+    finally:
+        pool.shutdown()
+
+
+def test_pool_idle_timeout_disabled():
+    """Test sessions are closed after use if idle timeout is 0"""
+    pool, opened = make_pool(idle_timeout=0)
+    try:
+        pool.run(call(pool, "a", "one"))
+        pool.run(call(pool, "a", "two"))
+        assert len(opened) == 2
+        assert opened[0].closed
+    finally:
+        pool.shutdown()
+
+
+def test_worker_run_servers_concurrently():
+    """Test worker groups commands per server and runs servers with pooled sessions"""
+    pool, opened = make_pool()
+    server_a = {"server_address": "stdio: a"}
+    server_b = {"server_address": "stdio: b"}
+    worker = Worker()
+    worker.plugin = SimpleNamespace(pool=pool)
+    worker.is_stopped = MagicMock(return_value=False)
+    worker.make_response = lambda item, text: {"cmd": item["cmd"], "result": text}
+    worker._extract_text_result = lambda result: result
+    worker.tools_index = {
+        "a_one": {"server": server_a, "transport": "stdio", "tool_name": "one"},
+        "a_two": {"server": server_a, "transport": "stdio", "tool_name": "two"},
+        "b_one": {"server": server_b, "transport": "stdio", "tool_name": "one"},
+    }
+    worker.cmds = [{"cmd": "a_one"}, {"cmd": "b_one"}, {"cmd": "a_two"}]
+    try:
+        responses = pool.run(worker._run_async())
+    finally:
+        pool.shutdown()
+    assert responses == [
+        {"cmd": "a_one", "result": "stdio: a:one"},
+        {"cmd": "a_two", "result": "stdio: a:two"},
+        {"cmd": "b_one", "result": "stdio: b:one"},
+    ]
+    assert len(opened) == 2
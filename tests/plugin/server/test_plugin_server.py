@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 12:00:00                  #
+# ================================================== #
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from pygpt_net.plugin.server.pool import ConnectionPool
+from pygpt_net.plugin.server.worker import Worker
+
+
+class FakeTransport:
+    def __init__(self):
+        self.active = True
+
+    def is_active(self):
+        return self.active
+
+
+class FakeSSHClient:
+    def __init__(self):
+        self.transport = FakeTransport()
+        self.sftp_opened = 0
+        self.closed = False
+
+    def get_transport(self):
+        return self.transport
+
+    def open_sftp(self):
+        self.sftp_opened += 1
+        return SimpleNamespace(
+            stat=lambda path: SimpleNamespace(st_mode=0o100644, st_size=10, st_mtime=1),
+            close=lambda: None,
+        )
+
+    def close(self):
+        self.closed = True
+        self.transport.active = False
+
+
+def make_worker(options: dict = None):
+    values = {"pool_idle_timeout": 300, "pool_max_per_host": 2, "ssh_keepalive": 0}
+    values.update(options or {})
+    plugin = MagicMock()
+    plugin.get_option_value = MagicMock(side_effect=lambda key: values.get(key))
+    plugin.pool = ConnectionPool(plugin)
+    worker = Worker()
+    worker.plugin = plugin
+    worker.is_stopped = MagicMock(return_value=False)
+    worker.make_response = lambda item, result: result
+    worker.prepare_path = lambda path: "/local/" + path
+    clients = []
+
+    def connect(host, port, user, password):
+        client = FakeSSHClient()
+        clients.append(client)
+        return client
+
+    worker._ssh_connect = connect
+    return worker, clients
+
+
+def test_pool_reuses_connection():
+    """Test SSH connection and SFTP channel are reused between calls"""
+    worker, clients = make_worker()
+    try:
+        for _ in range(3):
+            res = worker._sftp_stat("host", 22, "user", None, "/file")
+            assert res["type"] == "file"
+        assert len(clients) == 1
+        assert clients[0].sftp_opened == 1
+        assert worker.plugin.pool.count() == 1
+    finally:
+        worker.plugin.pool.shutdown()
+    assert clients[0].closed
+    assert worker.plugin.pool.count() == 0
+
+
+def test_pool_key_credentials():
+    """Test connection opened with other password is not reused"""
+    worker, clients = make_worker()
+    pool = worker.plugin.pool
+    try:
+        worker._sftp_stat("host", 22, "user", "secret", "/file")
+        worker._sftp_stat("host", 22, "user", "secret", "/file")
+        assert len(clients) == 1
+        worker._sftp_stat("host", 22, "user", "changed", "/file")
+        assert len(clients) == 2
+        assert pool.count() == 2
+        assert all("secret" not in key for key in pool.idle)  # plain password is not kept
+    finally:
+        pool.shutdown()
+
+
+def test_pool_drops_dead_connection():
+    """Test dead or broken connections are not reused"""
+    worker, clients = make_worker()
+    pool = worker.plugin.pool
+    try:
+        worker._sftp_stat("host", 22, "user", None, "/file")
+        clients[0].transport.active = False  # connection lost
+        worker._sftp_stat("host", 22, "user", None, "/file")
+        assert len(clients) == 2
+
+        # connection error while in use
+        try:
+            with worker._ssh_connection("host", 22, "user", None):
+                raise EOFError()
+        except EOFError:
+            pass
+        assert clients[1].closed
+        assert pool.count() == 0
+
+        # application error keeps connection
+        try:
+            with worker._ssh_connection("host", 22, "user", None):
+                raise FileNotFoundError()
+        except FileNotFoundError:
+            pass
+        assert pool.count() == 1
+    finally:
+        pool.shutdown()
+
+
+def test_pool_idle_eviction():
+    """Test idle connections are closed"""
+    worker, clients = make_worker()
+    pool = worker.plugin.pool
+    try:
+        worker._sftp_stat("host", 22, "user", None, "/file")
+        assert pool.evict() == 0
+        assert pool.evict(max_idle=0) == 1
+        assert clients[0].closed
+    finally:
+        pool.shutdown()
+
+    # pooling disabled
+    worker, clients = make_worker({"pool_idle_timeout": 0})
+    worker._sftp_stat("host", 22, "user", None, "/file")
+    worker._sftp_stat("host", 22, "user", None, "/file")
+    assert len(clients) == 2
+    assert clients[0].closed
+    assert worker.plugin.pool.count() == 0
+
+
+def test_get_batch_per_host_limit():
+    """Test batch download runs in parallel on pooled connections within per-host limit"""
+    worker, clients = make_worker()
+    worker.get_server_config = MagicMock(return_value={"server": "host", "login": "user", "password": None})
+    lock = threading.Lock()
+    state = {"active": 0, "max": 0}
+
+    def get_file(cfg, port, remote_path, local_path):
+        with worker._ssh_connection(cfg["server"], port, cfg["login"], None):
+            with lock:
+                state["active"] += 1
+                state["max"] = max(state["max"], state["active"])
+            time.sleep(0.05)
+            with lock:
+                state["active"] -= 1
+        if remote_path == "/bad":
+            raise RuntimeError("not found")
+        return {"saved_path": local_path}
+
+    worker._get_file = get_file
+    item = {"cmd": "srv_get_batch", "params": {
+        "server": "host",
+        "port": 22,
+        "files": ["/a", "/b", {"remote_path": "/c", "local_path": "c.txt"}, "/bad", "/e", "/f"],
+    }}
+    try:
+        res = worker.cmd_srv_get_batch(item)
+    finally:
+        worker.plugin.pool.shutdown()
+    assert res["ok"] == 5
+    assert res["failed"] == 1
+    assert res["results"][2] == {"saved_path": "/local/c.txt"}
+    assert res["results"][3] == {"error": "not found"}
+    assert state["max"] == 2
+    assert len(clients) == 2
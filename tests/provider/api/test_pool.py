@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 12:00:00                  #
+# ================================================== #
+
+from unittest.mock import MagicMock
+
+import httpx
+
+from pygpt_net.provider.api.pool import ClientPool
+
+
+def make_pool():
+    window = MagicMock()
+    window.core.config.get.side_effect = lambda key, default=None: default
+    return ClientPool(window)
+
+
+def test_get_reuses_client():
+    """Test client is reused for the same args and recreated on key change"""
+    pool = make_pool()
+    factory = MagicMock(side_effect=lambda args: MagicMock())
+    a = pool.get("openai", {"api_key": "k1", "base_url": "https://x"}, factory)
+    b = pool.get("openai", {"base_url": "https://x", "api_key": "k1"}, factory)
+    assert a is b
+    assert factory.call_count == 1
+
+    c = pool.get("openai", {"api_key": "k2", "base_url": "https://x"}, factory)
+    assert c is not a
+    assert pool.count("openai") == 2
+
+    d = pool.get("anthropic", {"api_key": "k1", "base_url": "https://x"}, factory)
+    assert d is not a
+    assert factory.call_count == 3
+
+
+def test_signature_hides_secrets():
+    """Test API keys are hashed in signature"""
+    pool = make_pool()
+    sig = pool.signature("openai", {"api_key": "secret", "http_client": object()})
+    assert "secret" not in repr(sig)
+    assert "http_client" not in repr(sig)
+
+
+def test_invalidate_and_evict():
+    """Test invalidation and LRU eviction close clients"""
+    pool = make_pool()
+    pool.MAX_CLIENTS = 2
+    clients = [pool.get("openai", {"api_key": str(i)}, lambda args: MagicMock()) for i in range(3)]
+    clients[0].close.assert_called_once()
+    assert pool.count() == 2
+
+    google = pool.get("google", {"api_key": "g"}, lambda args: MagicMock())
+    pool.invalidate("openai")
+    clients[2].close.assert_called_once()
+    google.close.assert_not_called()
+    assert pool.count() == 1
+
+    pool.close()
+    google.close.assert_called_once()
+    assert pool.count() == 0
+
+
+def test_create_http_client():
+    """Test HTTP client is created with configured limits"""
+    pool = make_pool()
+    client = pool.create_http_client()
+    assert isinstance(client, httpx.Client)
+    client.close()
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.26 19:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from unittest.mock import MagicMock, patch, mock_open, Mock
@@ -157,6 +157,41 @@ def test_get_items(mock_window):
     assert result[0].internal is False
 
 
+def test_prepare_query_fts(mock_window):
+    """Test prepare query with full-text index"""
+    storage = Storage(mock_window)
+    storage.has_fts = MagicMock(return_value=True)
+    where, join, params, group_items = storage.prepare_query(search_string="hello wor", search_content=True)
+    assert "ctx_item_fts MATCH :fts_query" in join
+    assert group_items is False  # FTS subquery returns one row per meta
+    assert "LEFT JOIN ctx_item i ON m.id = i.meta_id" not in join
+    assert params['fts_query'] == '"hello"* "wor"*'
+    assert params['search_string'] == '%hello wor%'
+
+
+def test_prepare_query_fts_fallback(mock_window):
+    """Test prepare query without full-text index"""
+    storage = Storage(mock_window)
+    storage.has_fts = MagicMock(return_value=False)
+    where, join, params, group_items = storage.prepare_query(search_string="hello", search_content=True)
+    assert "LEFT JOIN ctx_item i ON m.id = i.meta_id" in join
+    assert group_items is True
+    assert "i.input LIKE :search_string" in where
+    assert 'fts_query' not in params
+
+
+def test_prepare_query_keyset(mock_window):
+    """Test prepare query with keyset paging filter"""
+    storage = Storage(mock_window)
+    filters = {
+        'updated_ts': {"mode": "BEFORE", "value": (100, 5)},
+    }
+    where, join, params, group_items = storage.prepare_query(filters=filters)
+    assert "(m.updated_ts < :before_ts OR (m.updated_ts = :before_ts AND m.id < :before_id))" in where
+    assert params['before_ts'] == 100
+    assert params['before_id'] == 5
+
+
 def test_truncate_all(mock_window):
     """Test truncate all"""
     storage = Storage(mock_window)
@@ -231,6 +266,25 @@ def test_update_item(mock_window):
     assert conn.execute.called_once()
 
 
+def test_update_items_tokens_cache(mock_window):
+    """Test update items tokens cache"""
+    storage = Storage(mock_window)
+    conn = Mock()
+    item = CtxItem()
+    item.id = 1
+    item.tokens_cache = {"cl100k_base:chat:3:1": {"hash": "abc", "tokens": 10}}
+    item.tokens_cache_dirty = True
+    with patch('pygpt_net.core.db.database.Database.get_db') as mock_get_db:
+        mock_window.core.db.get_db = mock_get_db
+        mock_get_db.return_value.begin.return_value.__enter__.return_value = conn
+        result = storage.update_items_tokens_cache([item])
+
+    assert result is True
+    assert item.tokens_cache_dirty is False
+    params = conn.execute.call_args[0][1]
+    assert params == [{"id": 1, "tokens_cache_json": '{"cl100k_base:chat:3:1": {"hash": "abc", "tokens": 10}}'}]
+
+
 def test_insert_meta(mock_window):
     """Test insert meta"""
     storage = Storage(mock_window)
@@ -408,3 +462,10 @@ def test_unpack_item_value():
     assert unpack_item_value('1') == 1
     assert unpack_item_value('[1, 2, 3]') == [1, 2, 3]
     assert unpack_item_value('{"a": 1, "b": 2}') == {'a': 1, 'b': 2}
+
+
+def test_build_fts_query():
+    """Test build FTS query"""
+    assert build_fts_query('hello world') == '"hello"* "world"*'
+    assert build_fts_query('say "hi"') == '"say"* """hi"""*'
+    assert build_fts_query(' - % ') == ''
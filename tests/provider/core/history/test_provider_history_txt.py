@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.01.04 13:00:00                  #
+# Updated Date: 2026.10.18 12:00:00                  #
 # ================================================== #
 
 from unittest.mock import MagicMock, patch, mock_open
@@ -37,7 +37,51 @@ def test_append(mock_window):
         with patch('builtins.open', mock_open()) as mocked_file:
             mocked_file.return_value.write = MagicMock()
             provider.append(ctx, 'input')
-            mocked_file.assert_called_once()
+            provider.append(ctx, 'output')
+            mocked_file.assert_not_called()  # buffered
+            provider.flush()
+            mocked_file.assert_called_once()  # one write per day file
+            mocked_file.return_value.write.assert_called_once_with(bytearray(b"test\ntest\n"))
+
+
+def test_remove(mock_window):
+    """Test remove, entries are grouped by day file"""
+    provider = TxtFileProvider(mock_window)
+    provider.remove_from_file = MagicMock()
+    items = []
+    for i in range(3):
+        ctx = CtxItem()
+        ctx.id = i + 1
+        ctx.input = "question"
+        ctx.output = "answer"
+        ctx.input_timestamp = 0
+        ctx.output_timestamp = 0
+        items.append(ctx)
+    with patch('os.path.exists') as os_path_exists:
+        os_path_exists.return_value = True
+        provider.remove(items)
+    provider.remove_from_file.assert_called_once()
+    entries = provider.remove_from_file.call_args[0][1]
+    assert len(entries) == 6
+    assert entries[0][0] == "1:input"
+
+
+def test_remove_from_file(mock_window):
+    """Test remove entries from day file by index and by text"""
+    provider = TxtFileProvider(mock_window)
+    data = b"10:00:00: a\n10:00:01: b\n10:00:02: c\nd\n"
+    provider.load_index = MagicMock(return_value={
+        "1:input": [12, 12],  # b
+        "2:input": [24, 12],  # c
+    })
+    provider.save_index = MagicMock()
+    with patch('builtins.open', mock_open(read_data=data)) as mocked_file:
+        provider.remove_from_file("2024_01_01.txt", [
+            ("1:input", "b", "10:00:01: "),
+            (None, "d", "10:00:03: "),  # not indexed, no time prefix
+        ])
+        mocked_file.return_value.write.assert_called_once_with(b"10:00:00: a\n10:00:02: c\n")
+    provider.save_index.assert_called_once_with("2024_01_01.txt", {"2:input": [12, 12]})
 
 
 def test_truncate(mock_window):
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 12:00:00                  #
+# ================================================== #
+
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy import create_engine, text
+
+from pygpt_net.provider.core.index.db_sqlite.storage import Storage
+
+
+def make_storage() -> Storage:
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text("""
+        CREATE TABLE idx_embedding (
+            model TEXT NOT NULL,
+            hash TEXT NOT NULL,
+            vector BLOB NOT NULL,
+            created_ts INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (model, hash)
+        ) WITHOUT ROWID;
+        """))
+    window = MagicMock()
+    window.core.db.get_db.return_value = engine
+    return Storage(window)
+
+
+def test_evict_embeddings():
+    """Test expired and oldest embeddings above limit are removed"""
+    storage = make_storage()
+    for ts in range(1, 6):
+        with patch("pygpt_net.provider.core.index.db_sqlite.storage.time.time", return_value=ts * 100):
+            storage.insert_embeddings("model", {"h" + str(ts): b"\x00"})
+
+    assert storage.evict_embeddings(max_items=0, min_ts=200) == 1  # h1 expired
+    assert storage.evict_embeddings(max_items=2) == 2  # h2, h3 oldest
+    assert list(storage.get_embeddings("model", ["h1", "h2", "h3", "h4", "h5"]).keys()) == ["h4", "h5"]
+    assert storage.evict_embeddings(max_items=2, min_ts=0) == 0
+
+    storage.truncate_embeddings()
+    assert storage.get_embeddings("model", ["h4", "h5"]) == {}
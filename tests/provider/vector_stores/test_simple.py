@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 12:00:00                  #
+# ================================================== #
+
+import os
+import tempfile
+import uuid
+from unittest.mock import MagicMock, patch
+
+from llama_index.core.vector_stores.simple import SimpleVectorStoreData
+
+from tests.mocks import mock_window
+from pygpt_net.provider.vector_stores.simple import SimpleProvider
+
+
+def make_store(mock_window) -> SimpleProvider:
+    store = SimpleProvider(window=mock_window)
+    store.exists = MagicMock(return_value=True)
+    store.get_path = MagicMock(side_effect=lambda id: "/idx/" + id)
+    store.get_storage_context = MagicMock()
+    store.signature = (1, 100)
+    store.get_signature = MagicMock(side_effect=lambda path: store.signature)
+    return store
+
+
+def test_get_cached(mock_window):
+    """Test index is loaded once and reloaded after change on disk"""
+    store = make_store(mock_window)
+    embed = MagicMock()
+    embed.model_name = "model-a"
+    with patch("pygpt_net.provider.vector_stores.simple.load_index_from_storage") as load:
+        load.side_effect = lambda *args, **kwargs: MagicMock()
+        index = store.get("base", embed_model=embed)
+        assert store.get("base", embed_model=embed) is index
+        assert store.get("base") is index  # no embed model
+        assert load.call_count == 1
+
+        # modified on disk
+        store.signature = (2, 120)
+        assert store.get("base", embed_model=embed) is not index
+        assert load.call_count == 2
+
+
+def test_get_for_update(mock_window):
+    """Test modified index is not shared with readers until stored"""
+    store = make_store(mock_window)
+    store.persist = MagicMock()
+    store.is_binary = MagicMock(return_value=True)
+    embed = MagicMock()
+    embed.model_name = "model-a"
+    with patch("pygpt_net.provider.vector_stores.simple.load_index_from_storage") as load:
+        load.side_effect = lambda *args, **kwargs: MagicMock()
+        index = store.get("base", embed_model=embed)
+        writer = store.get_for_update("base", embed_model=embed)
+        assert writer is not index
+        assert store.get("base", embed_model=embed) is index  # failed/unsaved changes are not visible
+
+        writer._embed_model = embed
+        store.signature = (2, 120)
+        store.store("base", writer)
+        assert store.get("base", embed_model=embed) is writer
+        assert load.call_count == 2
+
+
+def test_get_lru(mock_window):
+    """Test LRU eviction of loaded indexes"""
+    mock_window.core.config.set("llama.idx.storage.cache", 2)
+    store = make_store(mock_window)
+    with patch("pygpt_net.provider.vector_stores.simple.load_index_from_storage") as load:
+        load.side_effect = lambda *args, **kwargs: MagicMock()
+        store.get("a")
+        store.get("b")
+        store.get("a")
+        store.get("c")  # evicts "b"
+        assert list(store.indexes.keys()) == ["a", "c"]
+        assert load.call_count == 3
+
+
+def test_save_load_vectors(mock_window):
+    """Test binary vectors persistence"""
+    store = SimpleProvider(window=mock_window)
+    data = SimpleVectorStoreData(
+        embedding_dict={"n1": [0.5, 0.25], "n2": [1.0, -2.0]},
+        text_id_to_ref_doc_id={"n1": "d1", "n2": "d1"},
+        metadata_dict={"n1": {"path": "a.txt"}},
+    )
+    path = os.path.join(tempfile.gettempdir(), "pygpt-test-" + str(uuid.uuid4()) + ".npz")
+    try:
+        assert store.save_vectors(data, path) is True
+        vector_store = store.load_vectors(path)
+    finally:
+        os.remove(path)
+    assert vector_store.data.embedding_dict == data.embedding_dict
+    assert vector_store.data.text_id_to_ref_doc_id == data.text_id_to_ref_doc_id
+    assert vector_store.data.metadata_dict == data.metadata_dict
+
+    # mixed dimensions are not stored as matrix
+    data.embedding_dict["n3"] = [1.0]
+    assert store.save_vectors(data, path) is False
+
+
+def test_get_storage_context_mixed(mock_window):
+    """Test JSON namespaces are loaded together with binary ones"""
+    store = SimpleProvider(window=mock_window)
+    files = {
+        "*__vector_store.npz": ["/idx/base/default__vector_store.npz"],
+        "*__vector_store.json": ["/idx/base/default__vector_store.json", "/idx/base/image__vector_store.json"],
+    }
+    store.load_vectors = MagicMock(return_value="npz")
+    with patch("pygpt_net.provider.vector_stores.simple.glob.glob",
+               side_effect=lambda pattern: files[os.path.basename(pattern)]), \
+            patch("pygpt_net.provider.vector_stores.simple.SimpleVectorStore.from_persist_path",
+                  return_value="json") as from_json, \
+            patch("pygpt_net.provider.vector_stores.simple.StorageContext.from_defaults") as from_defaults:
+        store.get_storage_context("/idx/base")
+    from_json.assert_called_once_with("/idx/base/image__vector_store.json")
+    assert from_defaults.call_args.kwargs["vector_stores"] == {"default": "npz", "image": "json"}
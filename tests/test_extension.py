@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 12:00:00                  #
+# ================================================== #
+
+import copy
+import sys
+import types
+
+import pytest
+
+from pygpt_net import profiler
+from pygpt_net.extension import LazyExtension
+
+
+class BaseProvider:
+    pass
+
+
+class FakeProvider(BaseProvider):
+    created = 0
+
+    def __init__(self):
+        FakeProvider.created += 1
+        self.id = "fake"
+        self.name = "Fake"
+        self.window = None
+        self.items = []
+
+    def attach(self, window=None):
+        self.window = window
+
+
+@pytest.fixture
+def fake_module(monkeypatch):
+    module = types.ModuleType("fake_extension_module")
+    module.FakeProvider = FakeProvider
+    monkeypatch.setitem(sys.modules, "fake_extension_module", module)
+    FakeProvider.created = 0
+    return module
+
+
+def test_lazy_extension_meta(fake_module):
+    """Test metadata and setters are served without loading"""
+    ext = LazyExtension("fake_extension_module", "FakeProvider", id="fake", name="Fake",
+                        setters={"attach": "window"})
+    ext.lazy_expect(BaseProvider)
+    assert ext.id == "fake"
+    assert ext.name == "Fake"
+    ext.attach(window="win")
+    assert ext.window == "win"
+    assert not ext.lazy_loaded()
+    assert FakeProvider.created == 0
+
+    # first access to other attribute loads extension and replays setters
+    assert ext.items == []
+    assert ext.lazy_loaded()
+    assert FakeProvider.created == 1
+    assert ext.lazy_load().window == "win"
+    ext.attach(window="other")
+    assert ext.lazy_load().window == "other"
+    assert FakeProvider.created == 1
+
+
+def test_lazy_extension_load_errors(fake_module):
+    """Test base class and id are checked on load"""
+    ext = LazyExtension("fake_extension_module", "FakeProvider", id="other")
+    with pytest.raises(ValueError):
+        ext.lazy_load()
+
+    class OtherBase:
+        pass
+
+    ext = LazyExtension("fake_extension_module", "FakeProvider", id="fake")
+    ext.lazy_expect(OtherBase)
+    with pytest.raises(TypeError):
+        ext.lazy_load()
+
+
+def test_lazy_extension_deepcopy(fake_module):
+    """Test copy returns copy of real instance"""
+    ext = LazyExtension("fake_extension_module", "FakeProvider", id="fake")
+    ext.name = "Renamed"  # deferred
+    cloned = copy.deepcopy(ext)
+    assert isinstance(cloned, FakeProvider)
+    assert cloned.name == "Renamed"
+    assert cloned is not ext.lazy_load()
+
+
+def test_import_profiler():
+    """Test profiler records module import times"""
+    assert profiler.start([]) is None
+    prof = profiler.ImportProfiler()
+    prof.install()
+    try:
+        sys.modules.pop("colorsys", None)
+        import colorsys  # noqa: F401
+    finally:
+        prof.uninstall()
+    assert prof not in sys.meta_path
+    assert "colorsys" in prof.times
+    self_time, cumulative = prof.times["colorsys"]
+    assert 0 <= self_time <= cumulative
+    prof.mark("done")
+    report = prof.report()
+    assert "colorsys" in report
+    assert "done" in report
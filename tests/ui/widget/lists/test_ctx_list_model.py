@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 12:00:00                  #
+# ================================================== #
+
+from unittest.mock import MagicMock
+
+from PySide6.QtGui import QIcon
+
+from pygpt_net.ui.widget.lists.context import CtxListModel, Item, GroupItem
+
+
+def row(id, name, children=None):
+    """Build row spec"""
+    if children is not None:
+        return ("g:" + str(id), name, lambda: GroupItem(QIcon(), name, id), children)
+    return ("i:" + str(id), name, lambda: Item(name, id), None)
+
+
+def texts(parent):
+    """Get texts of child rows"""
+    return [parent.child(r).text() for r in range(parent.rowCount())]
+
+
+def test_sync():
+    """Test sync rows with keyed diff"""
+    model = CtxListModel()
+    root = model.invisibleRootItem()
+    model.sync([
+        row(1, "a"),
+        row(2, "b"),
+        row(10, "group", [row(3, "c"), row(4, "d")]),
+    ])
+    assert texts(root) == ["a", "b", "group"]
+    assert texts(root.child(2)) == ["c", "d"]
+    item_a = root.child(0)
+    item_b = root.child(1)
+    group = root.child(2)
+    item_d = group.child(1)
+
+    # move, remove, rename and insert
+    model.sync([
+        row(2, "b"),
+        row(5, "e"),
+        row(1, "a2"),
+        row(10, "group", [row(4, "d")]),
+    ])
+    assert texts(root) == ["b", "e", "a2", "group"]
+    assert texts(root.child(3)) == ["d"]
+    assert root.child(0) is item_b  # existing rows are kept, not rebuilt
+    assert root.child(2) is item_a
+    assert item_a.name == "a2"
+    assert root.child(3) is group
+    assert group.child(0) is item_d
+    assert model.syncing is False
+
+    # remove all
+    model.sync([])
+    assert root.rowCount() == 0
+
+
+def test_fetch_more():
+    """Test fetch more delegated to controller"""
+    window = MagicMock()
+    window.controller.ctx.can_load_more.return_value = True
+    model = CtxListModel(window)
+    assert model.canFetchMore() is True
+    model.fetchMore()
+    window.controller.ctx.load_more.assert_called_once_with()
+
+    model.syncing = True  # no fetching while rows are synced
+    assert model.canFetchMore() is False
+    model.fetchMore()
+    assert window.controller.ctx.load_more.call_count == 1